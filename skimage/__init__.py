@@ -135,4 +135,14 @@ else:
     from .data import data_dir
     from .util.lookfor import lookfor
 
+    from ._shared import lazy
+    __getattr__, __dir__ = lazy.attach(
+        __name__,
+        submodules={'color', 'data', 'draw', 'exposure', 'feature', 'filters',
+                    'future', 'graph', 'io', 'measure', 'metrics',
+                    'morphology', 'registration', 'restoration',
+                    'segmentation', 'transform', 'util'}
+    )
+    del lazy
+
 del sys
@@ -0,0 +1,82 @@
+"""Lazy loading of the names exported by a package.
+
+A package ``__init__`` using :func:`attach` only lists the names it exports;
+the submodules that define them are imported the first time a name is
+accessed, so that ``import skimage.feature`` does not pay for every
+dependency of every function in ``skimage.feature``.
+"""
+
+import importlib
+
+
+def attach(package_name, submodules=(), submod_attrs=None):
+    """Attach lazily loaded submodules and functions to a package.
+
+    Parameters
+    ----------
+    package_name : str
+        The name of the package, typically ``__name__``.
+    submodules : iterable of str, optional
+        Submodules of the package that should be available as attributes,
+        e.g. ``{'rank'}`` for ``skimage.filters.rank``.
+    submod_attrs : dict, optional
+        Mapping from a module name to the names it exports, e.g.
+        ``{'_gaussian': ['gaussian']}`` makes ``gaussian`` an attribute of
+        the package, imported from ``<package_name>._gaussian``. Module names
+        are relative to the package; a leading dot refers to a sibling
+        package, e.g. ``'.measure._label'`` for ``skimage.measure._label``
+        when attaching to ``skimage.morphology``.
+
+    Returns
+    -------
+    __getattr__ : function
+        Module-level ``__getattr__`` (see PEP 562) importing the requested
+        submodule or attribute on first access.
+    __dir__ : function
+        Module-level ``__dir__`` listing the lazily loaded names as well.
+
+    Notes
+    -----
+    Importing a submodule makes it an attribute of its package. A function
+    sharing its name with the submodule that defines it, e.g.
+    ``skimage.util.apply_parallel``, would then be shadowed by the module, so
+    such functions must be imported eagerly rather than attached.
+
+    Examples
+    --------
+    In the ``__init__.py`` of a package::
+
+        from .._shared import lazy
+
+        __getattr__, __dir__ = lazy.attach(
+            __name__,
+            submodules={'rank'},
+            submod_attrs={'_gaussian': ['gaussian']}
+        )
+    """
+    submodules = set(submodules)
+    if submod_attrs is None:
+        submod_attrs = {}
+
+    attr_to_module = {attr: module
+                      for module, attrs in submod_attrs.items()
+                      for attr in attrs}
+
+    def __getattr__(name):
+        if name in attr_to_module:
+            module = importlib.import_module(f'.{attr_to_module[name]}',
+                                             package_name)
+            attr = getattr(module, name)
+            # cache the attribute so that later accesses are plain lookups
+            setattr(importlib.import_module(package_name), name, attr)
+            return attr
+        elif name in submodules:
+            return importlib.import_module(f'{package_name}.{name}')
+        raise AttributeError(f"module '{package_name}' has no attribute "
+                             f"'{name}'")
+
+    def __dir__():
+        package = importlib.import_module(package_name)
+        return sorted(set(vars(package)) | submodules | set(attr_to_module))
+
+    return __getattr__, __dir__
@@ -0,0 +1,43 @@
+import subprocess
+import sys
+
+import pytest
+
+from skimage._shared import lazy
+
+
+def test_lazy_subpackage_import():
+    # importing a subpackage must not import the modules it re-exports
+    code = ("import sys; import skimage.filters; "
+            "print('skimage.filters.thresholding' in sys.modules)")
+    out = subprocess.run([sys.executable, '-c', code], check=True,
+                         stdout=subprocess.PIPE, universal_newlines=True)
+    assert out.stdout.strip() == 'False'
+
+
+def test_lazy_attributes():
+    import skimage
+    from skimage import filters, morphology, util
+
+    assert filters.gaussian is filters._gaussian.gaussian
+    assert filters.rank.mean.__module__ == 'skimage.filters.rank.generic'
+    assert morphology.label is skimage.measure.label
+    assert callable(morphology.max_tree)
+    assert callable(util.apply_parallel)
+    assert skimage.segmentation.flood is morphology.flood
+    for name in filters.__all__:
+        assert name in dir(filters)
+
+    with pytest.raises(AttributeError):
+        filters.not_a_filter
+
+
+def test_attach():
+    getattr_, dir_ = lazy.attach('skimage.filters', submodules={'rank'},
+                                 submod_attrs={'_gaussian': ['gaussian']})
+    from skimage.filters._gaussian import gaussian
+    assert getattr_('gaussian') is gaussian
+    assert getattr_('rank').__name__ == 'skimage.filters.rank'
+    assert {'gaussian', 'rank'} <= set(dir_())
+    with pytest.raises(AttributeError):
+        getattr_('sobel')
@@ -235,9 +235,10 @@ class channel_as_last_axis():
         multichannel arrays.
     multichannel_output : bool, optional
         A boolean that should be True if the output of the function is not a
-        multichannel array and False otherwise. This decorator does not
-        currently support the general case of functions with multiple outputs
-        where some or all are multichannel.
+        multichannel array and False otherwise. For functions returning a
+        tuple, only the first output is treated as multichannel. This
+        decorator does not currently support the general case of functions
+        with multiple outputs where several are multichannel.
 
     """
     def __init__(self, channel_arg_positions=(0,), channel_kwarg_names=(),
@@ -288,7 +289,12 @@ class channel_as_last_axis():
             # Call the function with the fixed arguments
             out = func(*new_args, **kwargs)
             if self.multichannel_output:
-                out = np.moveaxis(out, -1, channel_axis[0])
+                if isinstance(out, tuple):
+                    # only the first output is a multichannel array
+                    out = ((np.moveaxis(out[0], -1, channel_axis[0]),)
+                           + out[1:])
+                else:
+                    out = np.moveaxis(out, -1, channel_axis[0])
             return out
 
         return fixed_func
@@ -51,6 +51,7 @@ References
 
 
 import functools
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from warnings import warn
 from scipy import linalg
@@ -115,17 +116,52 @@ def convert_colorspace(arr, fromspace, tospace):
     return todict[tospace](fromdict[fromspace](arr))
 
 
-def _prepare_colorarray(arr, force_copy=False):
-    """Check the shape of the array and convert it to
-    floating point representation.
-    """
+def _check_colorarray(arr):
+    """Check that the last axis of the array holds 3 channels."""
     arr = np.asanyarray(arr)
 
     if arr.shape[-1] != 3:
         raise ValueError("Input array must have a shape == (..., 3)), "
                          f"got {arr.shape}")
 
-    return dtype.img_as_float(arr, force_copy=force_copy)
+    return arr
+
+
+def _prepare_colorarray(arr, force_copy=False):
+    """Check the shape of the array and convert it to
+    floating point representation.
+    """
+    return dtype.img_as_float(_check_colorarray(arr), force_copy=force_copy)
+
+
+def _color_pixels(arr):
+    """View a float color image as a contiguous (N, 3) float32/64 array."""
+    arr = _prepare_colorarray(arr)
+    if arr.dtype != np.float32:
+        arr = arr.astype(np.float64, copy=False)
+    return np.ascontiguousarray(arr).reshape(-1, 3)
+
+
+# Number of pixels converted at once by the fused conversions, so that the
+# temporaries of a block stay in cache.
+_BLOCK_SIZE = 2 ** 14
+
+
+def _convert_blocks(convert, pixels, out, num_workers):
+    """Apply ``convert(pixels[block], out[block])`` to blocks of pixels.
+
+    Returns the sum of the values returned by `convert`.
+    """
+    blocks = [slice(start, start + _BLOCK_SIZE)
+              for start in range(0, len(pixels), _BLOCK_SIZE)]
+
+    def convert_block(block):
+        return convert(pixels[block], out[block])
+
+    if num_workers == 1:
+        return sum(map(convert_block, blocks))
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        return sum(executor.map(convert_block, blocks))
 
 
 def rgba2rgb(rgba, background=(1, 1, 1)):
@@ -1050,7 +1086,7 @@ def lab2xyz(lab, illuminant="D65", observer="2"):
     return out
 
 
-def rgb2lab(rgb, illuminant="D65", observer="2"):
+def rgb2lab(rgb, illuminant="D65", observer="2", *, num_workers=1):
     """Conversion from the sRGB color space (IEC 61966-2-1:1999)
     to the CIE Lab colorspace under the given illuminant and observer.
 
@@ -1062,6 +1098,9 @@ def rgb2lab(rgb, illuminant="D65", observer="2"):
         The name of the illuminant (the function is NOT case sensitive).
     observer : {"2", "10", "R"}, optional
         The aperture angle of the observer.
+    num_workers : int or None, optional
+        The number of parallel threads converting blocks of pixels. If set to
+        ``None``, the full set of available cores are used.
 
     Returns
     -------
@@ -1079,7 +1118,10 @@ def rgb2lab(rgb, illuminant="D65", observer="2"):
     sure that the image you are analyzing has been mapped to the sRGB color
     space.
 
-    This function uses rgb2xyz and xyz2lab.
+    This function computes rgb2xyz and xyz2lab on blocks of pixels small
+    enough for the temporaries to stay in cache, without intermediate images.
+    For uint8 input, the linear intensity of each of the 256 levels of a
+    channel is computed once and looked up.
     By default Observer="2", Illuminant="D65". CIE XYZ tristimulus values
     x_ref=95.047, y_ref=100., z_ref=108.883. See function `get_xyz_coords` for
     a list of supported illuminants.
@@ -1088,10 +1130,59 @@ def rgb2lab(rgb, illuminant="D65", observer="2"):
     ----------
     .. [1] https://en.wikipedia.org/wiki/Standard_illuminant
     """
-    return xyz2lab(rgb2xyz(rgb), illuminant, observer)
+    rgb = _check_colorarray(rgb)
+    white = get_xyz_coords(illuminant, observer)
+
+    if rgb.dtype == np.uint8:
+        pixels = np.ascontiguousarray(rgb).reshape(-1, 3)
+        out = np.empty(pixels.shape)
+        linear = _srgb_uint8_table()
+    else:
+        pixels = _color_pixels(rgb)
+        out = np.empty_like(pixels)
+        linear = None
+    # XYZ scaled by the reference white, from linear RGB
+    matrix = (xyz_from_rgb / white[:, np.newaxis]).astype(out.dtype)
+
+    def convert(rgb, lab):
+        # channels along the first axis, for contiguous operations
+        if linear is None:
+            arr = _srgb_to_linear(rgb.T)
+        else:
+            arr = linear[rgb.T]
+        x, y, z = _lab_f(matrix @ arr)
+        lab[:, 0] = 116. * y - 16.
+        lab[:, 1] = 500. * (x - y)
+        lab[:, 2] = 200. * (y - z)
+        return 0
 
+    _convert_blocks(convert, pixels, out, num_workers)
+    return out.reshape(rgb.shape)
 
-def lab2rgb(lab, illuminant="D65", observer="2"):
+
+def _srgb_to_linear(arr):
+    """Linear intensity of sRGB values, as in `rgb2xyz`."""
+    # clamped so that the power is only evaluated where it is used
+    out = np.maximum(arr, 0.04045)
+    out += 0.055
+    out /= 1.055
+    np.power(out, 2.4, out=out)
+    return np.where(arr > 0.04045, out, arr / 12.92)
+
+
+@functools.lru_cache(maxsize=None)
+def _srgb_uint8_table():
+    """Linear intensity of the 256 levels of a uint8 sRGB channel."""
+    levels = dtype.img_as_float(np.arange(256, dtype=np.uint8))
+    return _srgb_to_linear(levels)
+
+
+def _lab_f(arr):
+    """Nonlinear distortion of XYZ coordinates, as in `xyz2lab`."""
+    return np.where(arr > 0.008856, np.cbrt(arr), 7.787 * arr + 16. / 116.)
+
+
+def lab2rgb(lab, illuminant="D65", observer="2", *, num_workers=1):
     """Lab to RGB color space conversion.
 
     Parameters
@@ -1102,6 +1193,9 @@ def lab2rgb(lab, illuminant="D65", observer="2"):
         The name of the illuminant (the function is NOT case sensitive).
     observer : {"2", "10", "R"}, optional
         The aperture angle of the observer.
+    num_workers : int or None, optional
+        The number of parallel threads converting blocks of pixels. If set to
+        ``None``, the full set of available cores are used.
 
     Returns
     -------
@@ -1115,7 +1209,8 @@ def lab2rgb(lab, illuminant="D65", observer="2"):
 
     Notes
     -----
-    This function uses lab2xyz and xyz2rgb.
+    This function computes lab2xyz and xyz2rgb on blocks of pixels small
+    enough for the temporaries to stay in cache, without intermediate images.
     By default Observer="2", Illuminant="D65". CIE XYZ tristimulus values
     x_ref=95.047, y_ref=100., z_ref=108.883. See function `get_xyz_coords` for
     a list of supported illuminants.
@@ -1124,7 +1219,43 @@ def lab2rgb(lab, illuminant="D65", observer="2"):
     ----------
     .. [1] https://en.wikipedia.org/wiki/Standard_illuminant
     """
-    return xyz2rgb(lab2xyz(lab, illuminant, observer))
+    lab = _check_colorarray(lab)
+    white = get_xyz_coords(illuminant, observer)
+
+    pixels = _color_pixels(lab)
+    out = np.empty_like(pixels)
+    # linear RGB from XYZ scaled by the reference white
+    matrix = (rgb_from_xyz * white).astype(out.dtype)
+
+    def convert(lab, rgb):
+        # channels along the first axis, for contiguous operations
+        arr = np.empty(lab.shape[::-1], dtype=lab.dtype)
+        x, y, z = arr
+        np.add(lab[:, 0], 16., out=y)
+        y /= 116.
+        np.divide(lab[:, 1], 500., out=x)
+        x += y
+        np.divide(lab[:, 2], 200., out=z)
+        np.subtract(y, z, out=z)
+        n_invalid = np.count_nonzero(z < 0)
+        np.maximum(z, 0, out=z)
+
+        arr = np.where(arr > 0.2068966, np.power(arr, 3.),
+                       (arr - 16. / 116.) / 7.787)
+        arr = matrix @ arr
+        gamma = np.maximum(arr, 0.0031308)
+        np.power(gamma, 1 / 2.4, out=gamma)
+        gamma *= 1.055
+        gamma -= 0.055
+        arr = np.where(arr > 0.0031308, gamma, 12.92 * arr)
+        np.clip(arr, 0, 1, out=rgb.T)
+        return n_invalid
+
+    n_invalid = _convert_blocks(convert, pixels, out, num_workers)
+    if n_invalid:
+        warn('Color data out of range: Z < 0 in %s pixels' % n_invalid,
+             stacklevel=2)
+    return out.reshape(lab.shape)
 
 
 def xyz2luv(xyz, illuminant="D65", observer="2"):
@@ -785,3 +785,40 @@ def test_rgba2rgb_nD(shape):
     expected_shape = shape[:-1] + (3, )
 
     assert out.shape == expected_shape
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.float32, np.float64])
+@pytest.mark.parametrize("num_workers", [1, 3])
+def test_rgb2lab_blocks(monkeypatch, dtype, num_workers):
+    from skimage.color import colorconv
+
+    monkeypatch.setattr(colorconv, '_BLOCK_SIZE', 100)
+    rng = np.random.default_rng(0)
+    img = rng.random((27, 31, 3))
+    img[0, 0] = [0, 0.01, 1]  # low values, on the linear part of sRGB
+    if dtype == np.uint8:
+        img = img_as_ubyte(img)
+    else:
+        img = img.astype(dtype)
+
+    lab = rgb2lab(img, num_workers=num_workers)
+    expected = xyz2lab(rgb2xyz(img))
+    assert lab.dtype == expected.dtype
+    decimal = 3 if dtype == np.float32 else 10
+    assert_array_almost_equal(lab, expected, decimal=decimal)
+
+    rgb = lab2rgb(lab, num_workers=num_workers)
+    expected = xyz2rgb(lab2xyz(lab))
+    assert rgb.dtype == expected.dtype
+    assert_array_almost_equal(rgb, expected, decimal=decimal - 2)
+
+
+def test_lab2rgb_out_of_range_count():
+    lab = np.zeros((4, 3))
+    lab[:, 0] = 50
+    lab[1:3, 2] = 300
+    with expected_warnings(['Z < 0 in 2 pixels']):
+        rgb = lab2rgb(lab)
+    with expected_warnings(['Z < 0 in 2 pixels']):
+        expected = xyz2rgb(lab2xyz(lab))
+    assert_array_almost_equal(rgb, expected)
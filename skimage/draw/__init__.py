@@ -1,14 +1,21 @@
-from .draw import (circle, ellipse, set_color, polygon_perimeter,
-                   line, line_aa, polygon, ellipse_perimeter,
-                   circle_perimeter, circle_perimeter_aa,
-                   disk,
-                   bezier_curve, rectangle, rectangle_perimeter)
-from .draw3d import ellipsoid, ellipsoid_stats
-from ._draw import _bezier_segment
-from ._random_shapes import random_shapes
-from ._polygon2mask import polygon2mask
+from .._shared import lazy
+
+__getattr__, __dir__ = lazy.attach(
+    __name__,
+    submodules={'draw', 'draw3d', 'draw_nd'},
+    submod_attrs={
+        'draw': ['circle', 'ellipse', 'set_color', 'polygon_perimeter', 'line',
+                 'line_aa', 'polygon', 'ellipse_perimeter', 'circle_perimeter',
+                 'circle_perimeter_aa', 'disk', 'bezier_curve', 'rectangle',
+                 'rectangle_perimeter'],
+        'draw3d': ['ellipsoid', 'ellipsoid_stats'],
+        '_draw': ['_bezier_segment'],
+        '_random_shapes': ['random_shapes'],
+        '_polygon2mask': ['polygon2mask'],
+        'draw_nd': ['line_nd'],
+    }
+)
 
-from .draw_nd import line_nd
 
 __all__ = ['line',
            'line_aa',
@@ -1,10 +1,16 @@
-from .exposure import histogram, equalize_hist, \
-                      rescale_intensity, cumulative_distribution, \
-                      adjust_gamma, adjust_sigmoid, adjust_log, \
-                      is_low_contrast
+from .._shared import lazy
 
-from ._adapthist import equalize_adapthist
-from .histogram_matching import match_histograms
+__getattr__, __dir__ = lazy.attach(
+    __name__,
+    submodules={'exposure', 'histogram_matching'},
+    submod_attrs={
+        'exposure': ['histogram', 'equalize_hist', 'rescale_intensity',
+                     'cumulative_distribution', 'adjust_gamma',
+                     'adjust_sigmoid', 'adjust_log', 'is_low_contrast'],
+        '_adapthist': ['equalize_adapthist'],
+        'histogram_matching': ['match_histograms'],
+    }
+)
 
 
 __all__ = ['histogram',
@@ -14,6 +14,9 @@ responsible.  Basically, don't be a jerk, and remember that anything free
 comes with no guarantee.
 """
 import numbers
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from ..util import img_as_float, img_as_uint
 from ..color.adapt_rgb import adapt_rgb, hsv_value
@@ -22,10 +25,12 @@ from ..exposure import rescale_intensity
 
 NR_OF_GRAY = 2 ** 14  # number of grayscale levels to use in CLAHE algorithm
 
+_CHUNK_SIZE = 2 ** 20  # number of pixels converted at a time
+
 
 @adapt_rgb(hsv_value)
 def equalize_adapthist(image, kernel_size=None,
-                       clip_limit=0.01, nbins=256):
+                       clip_limit=0.01, nbins=256, *, num_workers=1):
     """Contrast Limited Adaptive Histogram Equalization (CLAHE).
 
     An algorithm for local contrast enhancement, that uses histograms computed
@@ -47,6 +52,10 @@ def equalize_adapthist(image, kernel_size=None,
         contrast).
     nbins : int, optional
         Number of gray bins for histogram ("data range").
+    num_workers : int or None, optional
+        The number of parallel threads computing the histograms of the
+        contextual regions. If set to ``None``, the full set of available
+        cores are used.
 
     Returns
     -------
@@ -64,6 +73,9 @@ def equalize_adapthist(image, kernel_size=None,
        - The CLAHE algorithm is run on the V (Value) channel
        - The image is converted back to RGB space and returned
     * For RGBA images, the original alpha channel is removed.
+    * The image is processed in strips along its first axis, holding the
+      gray level mappings of two rows of contextual regions at a time, so
+      that apart from the output, memory use does not grow with the image.
 
     .. versionchanged:: 0.17
         The values returned by this function are slightly shifted upwards
@@ -74,12 +86,6 @@ def equalize_adapthist(image, kernel_size=None,
     .. [1] http://tog.acm.org/resources/GraphicsGems/
     .. [2] https://en.wikipedia.org/wiki/CLAHE#CLAHE
     """
-
-    image = img_as_uint(image)
-    image = np.round(
-        rescale_intensity(image, out_range=(0, NR_OF_GRAY - 1))
-    ).astype(np.uint16)
-
     if kernel_size is None:
         kernel_size = tuple([image.shape[dim] // 8
                              for dim in range(image.ndim)])
@@ -90,12 +96,25 @@ def equalize_adapthist(image, kernel_size=None,
 
     kernel_size = [int(k) for k in kernel_size]
 
-    image = _clahe(image, kernel_size, clip_limit, nbins)
-    image = img_as_float(image)
-    return rescale_intensity(image)
+    # the conversion to uint16 being monotonic, it maps the extrema of the
+    # image to those of the converted image
+    in_range = tuple(img_as_uint(np.array([image.min(), image.max()],
+                                          dtype=image.dtype)))
+
+    out = _clahe(image, kernel_size, clip_limit, nbins, in_range,
+                 num_workers)
+
+    # rescale_intensity(out), in place
+    imin, imax = float(out.min()), float(out.max())
+    if imin != imax:
+        out -= imin
+        out /= imax - imin
+    else:
+        np.clip(out, 0, 1, out=out)
+    return out
 
 
-def _clahe(image, kernel_size, clip_limit, nbins):
+def _clahe(image, kernel_size, clip_limit, nbins, in_range, num_workers=1):
     """Contrast Limited Adaptive Histogram Equalization.
 
     Parameters
@@ -109,126 +128,166 @@ def _clahe(image, kernel_size, clip_limit, nbins):
         contrast).
     nbins : int
         Number of gray bins for histogram ("data range").
+    in_range : 2-tuple of int
+        Minimum and maximum of the image converted to uint16, which are
+        stretched to the range of the ``NR_OF_GRAY`` gray levels.
+    num_workers : int or None, optional
+        Number of threads computing the histograms of contextual regions.
 
     Returns
     -------
-    out : (N1,...,NN) ndarray
-        Equalized image.
+    out : (N1,...,NN) ndarray of float64
+        Equalized image, as a float image with the uint16 precision.
 
     The number of "effective" graylevels in the output image is set by `nbins`;
     selecting a small value (e.g. 128) speeds up processing and still produces
     an output image of good quality. A clip limit of 0 or larger than or equal
     to 1 results in standard (non-contrast limited) AHE.
+
+    The image is padded by reflection such that the shape in each dimension
+    is a multiple of the kernel_size, and is preceded by half a kernel size.
+    The padding is never built: positions in the padded image are mapped to
+    positions in the image, and the image is processed in strips of rows,
+    converted ``_CHUNK_SIZE`` pixels at a time.
     """
     ndim = image.ndim
-    dtype = image.dtype
 
-    # pad the image such that the shape in each dimension
-    # - is a multiple of the kernel_size and
-    # - is preceded by half a kernel size
     pad_start_per_dim = [k // 2 for k in kernel_size]
-
     pad_end_per_dim = [(k - s % k) % k + int(np.ceil(k / 2.))
                        for k, s in zip(kernel_size, image.shape)]
-
-    image = np.pad(image, [[p_i, p_f] for p_i, p_f in
-                           zip(pad_start_per_dim, pad_end_per_dim)],
-                   mode='reflect')
+    # index in `image` of each position of the padded image, along each axis
+    padded_indices = [np.pad(np.arange(s), (p_i, p_f), mode='reflect')
+                      for s, p_i, p_f in zip(image.shape, pad_start_per_dim,
+                                             pad_end_per_dim)]
+    ns_hist = [len(ix) // k - 1 for ix, k in zip(padded_indices, kernel_size)]
 
     # determine gray value bins
     bin_size = 1 + NR_OF_GRAY // nbins
-    lut = np.arange(NR_OF_GRAY)
-    lut //= bin_size
-
-    image = lut[image]
-
-    # calculate graylevel mappings for each contextual region
-    # rearrange image into flattened contextual regions
-    ns_hist = [int(s / k) - 1 for s, k in zip(image.shape, kernel_size)]
-    hist_blocks_shape = np.array([ns_hist, kernel_size]).T.flatten()
-    hist_blocks_axis_order = np.array([np.arange(0, ndim * 2, 2),
-                                       np.arange(1, ndim * 2, 2)]).flatten()
-    hist_slices = [slice(k // 2, k // 2 + n * k)
-                   for k, n in zip(kernel_size, ns_hist)]
-    hist_blocks = image[tuple(hist_slices)].reshape(hist_blocks_shape)
-    hist_blocks = np.transpose(hist_blocks, axes=hist_blocks_axis_order)
-    hist_block_assembled_shape = hist_blocks.shape
-    hist_blocks = hist_blocks.reshape((np.product(ns_hist), -1))
+    lut = np.arange(NR_OF_GRAY) // bin_size
+
+    def to_bins(block):
+        block = rescale_intensity(img_as_uint(block), in_range=in_range,
+                                  out_range=(0, NR_OF_GRAY - 1))
+        return lut[np.round(block).astype(np.uint16)]
 
     # Calculate actual clip limit
+    n_pixels = int(np.prod(kernel_size))
     if clip_limit > 0.0:
-        clim = int(np.clip(clip_limit * np.product(kernel_size), 1, None))
+        clim = int(np.clip(clip_limit * n_pixels, 1, None))
     else:
         # largest possible value, i.e., do not clip (AHE)
-        clim = np.product(kernel_size)
-
-    hist = np.apply_along_axis(np.bincount, -1, hist_blocks, minlength=nbins)
-    hist = np.apply_along_axis(clip_histogram, -1, hist, clip_limit=clim)
-    hist = map_histogram(hist, 0, NR_OF_GRAY - 1, np.product(kernel_size))
-    hist = hist.reshape(hist_block_assembled_shape[:ndim] + (-1,))
-
-    # duplicate leading mappings in each dim
-    map_array = np.pad(hist,
-                       [[1, 1] for _ in range(ndim)] + [[0, 0]],
-                       mode='edge')
+        clim = n_pixels
+
+    # calculate graylevel mappings for each contextual region, one row of
+    # regions along the first axis at a time; the regions of a row are
+    # split along the second axis between the workers
+    region_indices = [ix[p_i:p_i + n * k] for ix, p_i, n, k in
+                      zip(padded_indices, pad_start_per_dim, ns_hist,
+                          kernel_size)]
+    region_tiles = [np.arange(n * k) // k
+                    for n, k in zip(ns_hist, kernel_size)]
+    if num_workers is None:
+        num_workers = os.cpu_count()
+    n_groups = min(num_workers, ns_hist[1]) if ndim > 1 else 1
+    groups = np.array_split(np.arange(ns_hist[1] if ndim > 1 else 1),
+                            n_groups)
+
+    def group_maps(rows, group):
+        if ndim > 1:
+            cols = slice(group[0] * kernel_size[1],
+                         (group[-1] + 1) * kernel_size[1])
+            indices = [region_indices[1][cols]] + region_indices[2:]
+            tiles = [region_tiles[1][cols] - group[0]] + region_tiles[2:]
+            shape = [len(group)] + ns_hist[2:]
+            tiles = np.ravel_multi_index(np.ix_(*tiles), shape) * nbins
+        else:
+            indices, tiles, shape = [], np.zeros((), dtype=np.intp), []
+        hist = np.zeros(int(np.prod(shape)) * nbins, dtype=np.intp)
+        n_rows = max(1, _CHUNK_SIZE // max(1, tiles.size))
+        for start in range(0, len(rows), n_rows):
+            block = image[np.ix_(rows[start:start + n_rows], *indices)]
+            hist += np.bincount((tiles + to_bins(block)).ravel(),
+                                minlength=hist.size)
+        hist = hist.reshape(-1, nbins)
+        for region_hist in hist:
+            clip_histogram(region_hist, clip_limit=clim)
+        return map_histogram(hist, 0, NR_OF_GRAY - 1, n_pixels)
+
+    def row_maps(executor, j):
+        k = kernel_size[0]
+        rows = region_indices[0][j * k:(j + 1) * k]
+        maps = executor.map(lambda group: group_maps(rows, group), groups)
+        return np.concatenate(list(maps)).ravel()
 
     # Perform multilinear interpolation of graylevel mappings
     # using the convention described here:
     # https://en.wikipedia.org/w/index.php?title=Adaptive_histogram_
     # equalization&oldid=936814673#Efficient_computation_by_interpolation
 
-    # rearrange image into blocks for vectorized processing
-    ns_proc = [int(s / k) for s, k in zip(image.shape, kernel_size)]
-    blocks_shape = np.array([ns_proc, kernel_size]).T.flatten()
-    blocks_axis_order = np.array([np.arange(0, ndim * 2, 2),
-                                  np.arange(1, ndim * 2, 2)]).flatten()
-    blocks = image.reshape(blocks_shape)
-    blocks = np.transpose(blocks, axes=blocks_axis_order)
-    blocks_flattened_shape = blocks.shape
-    blocks = np.reshape(blocks, (np.product(ns_proc),
-                                 np.product(blocks.shape[ndim:])))
-
-    # calculate interpolation coefficients
-    coeffs = np.meshgrid(*tuple([np.arange(k) / k
-                                 for k in kernel_size[::-1]]), indexing='ij')
-    coeffs = [np.transpose(c).flatten() for c in coeffs]
-    inv_coeffs = [1 - c for dim, c in enumerate(coeffs)]
-
-    # sum over contributions of neighboring contextual
-    # regions in each direction
-    result = np.zeros(blocks.shape, dtype=np.float32)
-    for iedge, edge in enumerate(np.ndindex(*([2] * ndim))):
-
-        edge_maps = map_array[tuple([slice(e, e + n)
-                                     for e, n in zip(edge, ns_proc)])]
-        edge_maps = edge_maps.reshape((np.product(ns_proc), -1))
-
-        # apply map
-        edge_mapped = np.take_along_axis(edge_maps, blocks, axis=-1)
-
-        # interpolate
-        edge_coeffs = np.product([[inv_coeffs, coeffs][e][d]
-                                  for d, e in enumerate(edge[::-1])], 0)
-
-        result += (edge_mapped * edge_coeffs).astype(result.dtype)
-
-    result = result.astype(dtype)
-
-    # rebuild result image from blocks
-    result = result.reshape(blocks_flattened_shape)
-    blocks_axis_rebuild_order =\
-        np.array([np.arange(0, ndim),
-                  np.arange(ndim, ndim * 2)]).T.flatten()
-    result = np.transpose(result, axes=blocks_axis_rebuild_order)
-    result = result.reshape(image.shape)
-
-    # undo padding
-    unpad_slices = tuple([slice(p_i, s - p_f) for p_i, p_f, s in
-                          zip(pad_start_per_dim, pad_end_per_dim,
-                              image.shape)])
-    result = result[unpad_slices]
-
-    return result
+    # contextual regions on each side of each position, and interpolation
+    # coefficients, along the axes other than the first one
+    side_tiles = []
+    side_coeffs = []
+    for axis in range(1, ndim):
+        k = kernel_size[axis]
+        shape = [1] * ndim
+        shape[axis] = -1
+        positions = np.arange(image.shape[axis]) + pad_start_per_dim[axis]
+        coeffs = (positions % k) / k
+        tiles = positions // k
+        side_tiles.append([
+            np.clip(tiles - 1, 0, ns_hist[axis] - 1).reshape(shape),
+            np.clip(tiles, 0, ns_hist[axis] - 1).reshape(shape)])
+        side_coeffs.append([(1 - coeffs).reshape(shape),
+                            coeffs.reshape(shape)])
+
+    # offset in the flattened row of mappings and product of the
+    # coefficients, for each combination of sides along these axes
+    edge_offsets = {}
+    edge_coeffs = {}
+    for edge in np.ndindex(*([2] * (ndim - 1))):
+        tiles = [side_tiles[d][e] for d, e in enumerate(edge)]
+        edge_offsets[edge] = (np.ravel_multi_index(tiles, ns_hist[1:]) * nbins
+                              if tiles else 0)
+        # same order of the factors as in the product over all axes
+        coeffs = 1.0
+        for d, e in enumerate(edge[::-1]):
+            coeffs = coeffs * side_coeffs[ndim - 2 - d][e]
+        edge_coeffs[edge] = coeffs
+
+    out = np.empty(image.shape, dtype=np.float64)
+    k = kernel_size[0]
+    pad_start = pad_start_per_dim[0]
+    n_rows = max(1, _CHUNK_SIZE // max(1, int(np.prod(image.shape[1:]))))
+    maps = {}
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        for b in range(ns_hist[0] + 1):
+            # rows of the padded image in the strip, cropped to the image
+            strip_start = max(b * k, pad_start)
+            strip_stop = min((b + 1) * k, pad_start + image.shape[0])
+            if strip_start >= strip_stop:
+                continue
+            sides = (max(b - 1, 0), min(b, ns_hist[0] - 1))
+            maps = {j: maps[j] if j in maps else row_maps(executor, j)
+                    for j in sides}
+            for start in range(strip_start, strip_stop, n_rows):
+                stop = min(start + n_rows, strip_stop)
+                coeffs = ((np.arange(start, stop) - b * k) / k).reshape(
+                    (-1,) + (1,) * (ndim - 1))
+                side_coeffs_0 = (1 - coeffs, coeffs)
+                block = to_bins(image[start - pad_start:stop - pad_start])
+                result = np.zeros(block.shape, dtype=np.float32)
+                # sum over contributions of neighboring contextual
+                # regions in each direction
+                for edge in np.ndindex(*([2] * ndim)):
+                    edge_maps = maps[sides[edge[0]]]
+                    edge_mapped = edge_maps[edge_offsets[edge[1:]] + block]
+                    coeffs = edge_coeffs[edge[1:]] * side_coeffs_0[edge[0]]
+                    result += (edge_mapped * coeffs).astype(result.dtype)
+                out[start - pad_start:stop - pad_start] = img_as_float(
+                    result.astype(np.uint16))
+
+    return out
 
 
 def clip_histogram(hist, clip_limit):
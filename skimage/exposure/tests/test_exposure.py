@@ -489,6 +489,22 @@ def test_adapthist_clip_limit():
     assert_array_equal(img_clahe0, img_clahe1)
 
 
+@pytest.mark.parametrize('shape, kernel_size', [((75, 62), (16, 9)),
+                                                ((20, 13, 11), 5)])
+def test_adapthist_strips(monkeypatch, shape, kernel_size):
+    """The result does not depend on the chunks and the number of workers"""
+    img = np.random.default_rng(0).random(shape)
+    expected = exposure.equalize_adapthist(img, kernel_size, clip_limit=0.05)
+
+    # a few rows per chunk
+    monkeypatch.setattr(exposure._adapthist, '_CHUNK_SIZE', 50)
+    for num_workers in [1, 3, None]:
+        adapted = exposure.equalize_adapthist(img, kernel_size,
+                                              clip_limit=0.05,
+                                              num_workers=num_workers)
+        assert_array_equal(adapted, expected)
+
+
 def peak_snr(img1, img2):
     """Peak signal to noise ratio of two images
 
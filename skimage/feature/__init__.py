@@ -1,33 +1,37 @@
+from .._shared import lazy
 from .._shared.utils import deprecated
 
-from ._canny import canny
-from ._cascade import Cascade
-from ._daisy import daisy
-from ._hog import hog
-from .texture import (graycomatrix, graycoprops,
-                      local_binary_pattern,
-                      multiblock_lbp,
-                      draw_multiblock_lbp)
-
-from .peak import peak_local_max
-from .corner import (corner_kitchen_rosenfeld, corner_harris,
-                     corner_shi_tomasi, corner_foerstner, corner_subpix,
-                     corner_peaks, corner_fast, structure_tensor,
-                     structure_tensor_eigenvalues,
-                     structure_tensor_eigvals, hessian_matrix,
-                     hessian_matrix_eigvals, hessian_matrix_det,
-                     corner_moravec, corner_orientations,
-                     shape_index)
-from .template import match_template
-from .brief import BRIEF
-from .censure import CENSURE
-from .orb import ORB
-from .match import match_descriptors
-from .util import plot_matches
-from .blob import blob_dog, blob_log, blob_doh
-from .haar import (haar_like_feature, haar_like_feature_coord,
-                   draw_haar_like_feature)
-from ._basic_features import multiscale_basic_features
+__getattr__, __dir__ = lazy.attach(
+    __name__,
+    submodules={'texture', 'peak', 'corner', 'template', 'brief', 'censure',
+                'orb', 'match', 'util', 'blob', 'haar'},
+    submod_attrs={
+        '_canny': ['canny'],
+        '_cascade': ['Cascade'],
+        '_daisy': ['daisy'],
+        '_hog': ['hog'],
+        'texture': ['graycomatrix', 'graycoprops', 'local_binary_pattern',
+                    'multiblock_lbp', 'draw_multiblock_lbp'],
+        'peak': ['peak_local_max'],
+        'corner': ['corner_kitchen_rosenfeld', 'corner_harris',
+                   'corner_shi_tomasi', 'corner_foerstner', 'corner_subpix',
+                   'corner_peaks', 'corner_fast', 'structure_tensor',
+                   'structure_tensor_eigenvalues', 'structure_tensor_eigvals',
+                   'hessian_matrix', 'hessian_matrix_eigvals',
+                   'hessian_matrix_det', 'corner_moravec',
+                   'corner_orientations', 'shape_index'],
+        'template': ['match_template', 'match_template_batch'],
+        'brief': ['BRIEF'],
+        'censure': ['CENSURE'],
+        'orb': ['ORB'],
+        'match': ['match_descriptors'],
+        'util': ['plot_matches'],
+        'blob': ['blob_dog', 'blob_log', 'blob_doh'],
+        'haar': ['haar_like_feature', 'haar_like_feature_coord',
+                 'draw_haar_like_feature'],
+        '_basic_features': ['multiscale_basic_features'],
+    }
+)
 
 
 @deprecated(alt_func='skimage.registration.phase_cross_correlation',
@@ -55,12 +59,14 @@ def register_translation(src_image, target_image, upsample_factor=1,
             removed_version='1.0')
 def greycomatrix(image, distances, angles, levels=None, symmetric=False,
                  normed=False):
+    from .texture import graycomatrix
     return graycomatrix(image, distances, angles, levels, symmetric, normed)
 
 
 @deprecated(alt_func='skimage.feature.graycoprops',
             removed_version='1.0')
 def greycoprops(P, prop='contrast'):
+    from .texture import graycoprops
     return graycoprops(P, prop)
 
 
@@ -93,6 +99,7 @@ __all__ = ['canny',
            'corner_fast',
            'corner_orientations',
            'match_template',
+           'match_template_batch',
            'register_translation',
            'masked_register_translation',
            'BRIEF',
@@ -0,0 +1,80 @@
+#cython: cdivision=True
+#cython: boundscheck=False
+#cython: nonecheck=False
+#cython: wraparound=False
+
+cimport numpy as cnp
+cnp.import_array()
+
+
+cdef inline Py_ssize_t _popcount(cnp.uint64_t x) nogil:
+    """Number of set bits of `x` (SWAR algorithm, portable across compilers).
+    """
+    x = x - ((x >> 1) & 0x5555555555555555ULL)
+    x = (x & 0x3333333333333333ULL) + ((x >> 2) & 0x3333333333333333ULL)
+    x = (x + (x >> 4)) & 0x0f0f0f0f0f0f0f0fULL
+    return <Py_ssize_t>((x * 0x0101010101010101ULL) >> 56)
+
+
+def _hamming_nearest(cnp.uint64_t[:, ::1] packed1,
+                     cnp.uint64_t[:, ::1] packed2,
+                     Py_ssize_t[::1] best_indices2,
+                     Py_ssize_t[::1] best_counts,
+                     Py_ssize_t[::1] second_counts,
+                     Py_ssize_t[::1] best_indices1,
+                     Py_ssize_t[::1] col_counts):
+    """Nearest neighbours between two sets of bit-packed binary descriptors.
+
+    The Hamming distance of every pair is computed with a popcount of the
+    XOR of the packed words, without storing the distance matrix.
+
+    Parameters
+    ----------
+    packed1 : (M, W) array of uint64
+        First set of descriptors, packed into W 64-bit words.
+    packed2 : (N, W) array of uint64
+        Second set of descriptors.
+    best_indices2 : (M,) array of intp
+        Output: index of the closest descriptor of the second set for each
+        descriptor of the first set (the first one in case of ties).
+    best_counts : (M,) array of intp
+        Output: number of differing bits to that descriptor.
+    second_counts : (M,) array of intp
+        Output: second smallest number of differing bits, or the number of
+        bits plus one if N < 2.
+    best_indices1 : (N,) array of intp
+        Output: index of the closest descriptor of the first set for each
+        descriptor of the second set (the first one in case of ties).
+    col_counts : (N,) array of intp
+        Output: number of differing bits to that descriptor.
+    """
+    cdef Py_ssize_t m = packed1.shape[0]
+    cdef Py_ssize_t n = packed2.shape[0]
+    cdef Py_ssize_t n_words = packed1.shape[1]
+    cdef Py_ssize_t no_match = 64 * n_words + 1
+    cdef Py_ssize_t i, j, w, count, best, second, best_j
+
+    with nogil:
+        for j in range(n):
+            col_counts[j] = no_match
+            best_indices1[j] = 0
+        for i in range(m):
+            best = no_match
+            second = no_match
+            best_j = 0
+            for j in range(n):
+                count = 0
+                for w in range(n_words):
+                    count = count + _popcount(packed1[i, w] ^ packed2[j, w])
+                if count < best:
+                    second = best
+                    best = count
+                    best_j = j
+                elif count < second:
+                    second = count
+                if count < col_counts[j]:
+                    col_counts[j] = count
+                    best_indices1[j] = i
+            best_indices2[i] = best_j
+            best_counts[i] = best
+            second_counts[i] = second
@@ -1,6 +1,80 @@
 import numpy as np
 from scipy.spatial.distance import cdist
 
+from ._match_cy import _hamming_nearest
+
+
+# Number of distances computed at once by the blocked matcher (32 MB of
+# float64 distances).
+_BLOCK_SIZE = 2 ** 22
+
+
+def _pack_bits(descriptors):
+    """Pack binary descriptors into rows of 64-bit words."""
+    packed = np.packbits(descriptors, axis=1)
+    n_bytes = -(-packed.shape[1] // 8) * 8
+    packed = np.pad(packed, ((0, 0), (0, n_bytes - packed.shape[1])))
+    return np.ascontiguousarray(packed).view(np.uint64)
+
+
+def _nearest_hamming(descriptors1, descriptors2):
+    """Nearest neighbours of binary descriptors using popcounts.
+
+    Distances are returned as the fraction of differing bits, as the
+    'hamming' metric of `scipy.spatial.distance.cdist`.
+    """
+    m, n = len(descriptors1), len(descriptors2)
+    best_indices2 = np.empty(m, dtype=np.intp)
+    best_counts = np.empty(m, dtype=np.intp)
+    second_counts = np.empty(m, dtype=np.intp)
+    best_indices1 = np.empty(n, dtype=np.intp)
+    col_counts = np.empty(n, dtype=np.intp)
+    _hamming_nearest(_pack_bits(descriptors1), _pack_bits(descriptors2),
+                     best_indices2, best_counts, second_counts,
+                     best_indices1, col_counts)
+    n_bits = descriptors1.shape[1]
+    best_distances = best_counts / n_bits
+    second_distances = second_counts / n_bits
+    if n < 2:
+        second_distances[:] = np.inf
+    return best_indices2, best_distances, second_distances, best_indices1
+
+
+def _nearest_blocked(descriptors1, descriptors2, metric, kwargs):
+    """Nearest neighbours computing the distance matrix a block at a time.
+
+    Only blocks of rows of the distance matrix are held in memory; the
+    column-wise minima needed for cross-checking are accumulated across
+    blocks.
+    """
+    m, n = len(descriptors1), len(descriptors2)
+    best_indices2 = np.empty(m, dtype=np.intp)
+    best_distances = np.empty(m)
+    second_distances = np.full(m, np.inf)
+    best_indices1 = np.zeros(n, dtype=np.intp)
+    col_distances = np.full(n, np.inf)
+    columns = np.arange(n)
+
+    block_rows = max(1, _BLOCK_SIZE // n)
+    for start in range(0, m, block_rows):
+        stop = min(start + block_rows, m)
+        distances = cdist(descriptors1[start:stop], descriptors2,
+                          metric=metric, **kwargs)
+        rows = np.arange(stop - start)
+        indices2 = np.argmin(distances, axis=1)
+        best_indices2[start:stop] = indices2
+        best_distances[start:stop] = distances[rows, indices2]
+        if n > 1:
+            second_distances[start:stop] = np.partition(distances, 1,
+                                                        axis=1)[:, 1]
+        indices1 = np.argmin(distances, axis=0)
+        block_col_distances = distances[indices1, columns]
+        # strict comparison: ties keep the earliest row, as np.argmin does
+        closer = block_col_distances < col_distances
+        col_distances[closer] = block_col_distances[closer]
+        best_indices1[closer] = indices1[closer] + start
+    return best_indices2, best_distances, second_distances, best_indices1
+
 
 def match_descriptors(descriptors1, descriptors2, metric=None, p=2,
                       max_distance=np.inf, cross_check=True, max_ratio=1.0):
@@ -48,6 +122,13 @@ def match_descriptors(descriptors1, descriptors2, metric=None, p=2,
         descriptors, where ``matches[:, 0]`` denote the indices in the first
         and ``matches[:, 1]`` the indices in the second set of descriptors.
 
+    Notes
+    -----
+    The full matrix of distances between the two sets is never stored.
+    Binary descriptors compared with the Hamming distance are packed into
+    64-bit words and compared with population counts; other descriptors are
+    compared one block of rows of the distance matrix at a time.
+
     """
 
     if descriptors1.shape[1] != descriptors2.shape[1]:
@@ -59,39 +140,36 @@ def match_descriptors(descriptors1, descriptors2, metric=None, p=2,
         else:
             metric = 'euclidean'
 
-    kwargs = {}
-    # Scipy raises an error if p is passed as an extra argument when it isn't
-    # necessary for the chosen metric.
-    if metric == 'minkowski':
-        kwargs['p'] = p
-    distances = cdist(descriptors1, descriptors2, metric=metric, **kwargs)
+    if len(descriptors1) == 0 or len(descriptors2) == 0:
+        return np.empty((0, 2), dtype=np.intp)
+
+    if (metric == 'hamming' and np.issubdtype(descriptors1.dtype, bool)
+            and np.issubdtype(descriptors2.dtype, bool)):
+        nearest = _nearest_hamming(descriptors1, descriptors2)
+    else:
+        kwargs = {}
+        # Scipy raises an error if p is passed as an extra argument when it
+        # isn't necessary for the chosen metric.
+        if metric == 'minkowski':
+            kwargs['p'] = p
+        nearest = _nearest_blocked(descriptors1, descriptors2, metric, kwargs)
+    indices2, best_distances, second_best_distances, matches1 = nearest
 
     indices1 = np.arange(descriptors1.shape[0])
-    indices2 = np.argmin(distances, axis=1)
+    mask = np.ones(len(indices1), dtype=bool)
 
     if cross_check:
-        matches1 = np.argmin(distances, axis=0)
-        mask = indices1 == matches1[indices2]
-        indices1 = indices1[mask]
-        indices2 = indices2[mask]
+        mask &= indices1 == matches1[indices2]
 
     if max_distance < np.inf:
-        mask = distances[indices1, indices2] < max_distance
-        indices1 = indices1[mask]
-        indices2 = indices2[mask]
+        mask &= best_distances < max_distance
 
     if max_ratio < 1.0:
-        best_distances = distances[indices1, indices2]
-        distances[indices1, indices2] = np.inf
-        second_best_indices2 = np.argmin(distances[indices1], axis=1)
-        second_best_distances = distances[indices1, second_best_indices2]
         second_best_distances[second_best_distances == 0] \
             = np.finfo(np.double).eps
         ratio = best_distances / second_best_distances
-        mask = ratio < max_ratio
-        indices1 = indices1[mask]
-        indices2 = indices2[mask]
+        mask &= ratio < max_ratio
 
-    matches = np.column_stack((indices1, indices2))
+    matches = np.column_stack((indices1[mask], indices2[mask]))
 
     return matches
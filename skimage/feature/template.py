@@ -1,4 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
+from scipy import fft
 from scipy.signal import fftconvolve
 
 from .._shared.utils import check_nD
@@ -119,10 +122,36 @@ def match_template(image, template, pad_input=False, mode='constant',
         raise ValueError("Image must be larger than template.")
 
     image_shape = image.shape
+    image, image_window_sum, image_ssd = _image_statistics(
+        image, template.shape, mode, constant_values)
+
+    if image.ndim == 2:
+        xcorr = fftconvolve(image, template[::-1, ::-1],
+                            mode="valid")[1:-1, 1:-1]
+    elif image.ndim == 3:
+        xcorr = fftconvolve(image, template[::-1, ::-1, ::-1],
+                            mode="valid")[1:-1, 1:-1, 1:-1]
 
+    slices = _response_slices(image_shape, template.shape, pad_input)
+    return _response(xcorr[slices], image_window_sum[slices],
+                     image_ssd[slices], template)
+
+
+def _image_statistics(image, template_shape, mode, constant_values):
+    """Pad `image` and compute its sums over windows of `template_shape`.
+
+    Returns
+    -------
+    image : ndarray of float64
+        The padded image.
+    image_window_sum : ndarray of float64
+        Sum of the padded image over each window.
+    image_ssd : ndarray of float64
+        Sum of squared deviations from the mean over each window.
+    """
     image = np.array(image, dtype=np.float64, copy=False)
 
-    pad_width = tuple((width, width) for width in template.shape)
+    pad_width = tuple((width, width) for width in template_shape)
     if mode == 'constant':
         image = np.pad(image, pad_width=pad_width, mode=mode,
                        constant_values=constant_values)
@@ -132,30 +161,40 @@ def match_template(image, template, pad_input=False, mode='constant',
     # Use special case for 2-D images for much better performance in
     # computation of integral images
     if image.ndim == 2:
-        image_window_sum = _window_sum_2d(image, template.shape)
-        image_window_sum2 = _window_sum_2d(image ** 2, template.shape)
+        image_window_sum = _window_sum_2d(image, template_shape)
+        image_ssd = _window_sum_2d(image ** 2, template_shape)
     elif image.ndim == 3:
-        image_window_sum = _window_sum_3d(image, template.shape)
-        image_window_sum2 = _window_sum_3d(image ** 2, template.shape)
+        image_window_sum = _window_sum_3d(image, template_shape)
+        image_ssd = _window_sum_3d(image ** 2, template_shape)
+
+    window_sum_sq = image_window_sum * image_window_sum
+    window_sum_sq /= np.prod(template_shape)
+    image_ssd -= window_sum_sq
+    return image, image_window_sum, image_ssd
+
 
+def _response_slices(image_shape, template_shape, pad_input):
+    """Slices of the full response returned by `match_template`."""
+    slices = []
+    for i in range(len(template_shape)):
+        if pad_input:
+            d0 = (template_shape[i] - 1) // 2
+            d1 = d0 + image_shape[i]
+        else:
+            d0 = template_shape[i] - 1
+            d1 = d0 + image_shape[i] - template_shape[i] + 1
+        slices.append(slice(d0, d1))
+    return tuple(slices)
+
+
+def _response(xcorr, image_window_sum, image_ssd, template):
+    """Normalize the cross-correlation of the image with `template`."""
     template_mean = template.mean()
-    template_volume = np.prod(template.shape)
     template_ssd = np.sum((template - template_mean) ** 2)
 
-    if image.ndim == 2:
-        xcorr = fftconvolve(image, template[::-1, ::-1],
-                            mode="valid")[1:-1, 1:-1]
-    elif image.ndim == 3:
-        xcorr = fftconvolve(image, template[::-1, ::-1, ::-1],
-                            mode="valid")[1:-1, 1:-1, 1:-1]
-
     numerator = xcorr - image_window_sum * template_mean
 
-    denominator = image_window_sum2
-    np.multiply(image_window_sum, image_window_sum, out=image_window_sum)
-    np.divide(image_window_sum, template_volume, out=image_window_sum)
-    denominator -= image_window_sum
-    denominator *= template_ssd
+    denominator = image_ssd * template_ssd
     np.maximum(denominator, 0, out=denominator)  # sqrt of negative number not allowed
     np.sqrt(denominator, out=denominator)
 
@@ -165,15 +204,96 @@ def match_template(image, template, pad_input=False, mode='constant',
     mask = denominator > np.finfo(np.float64).eps
 
     response[mask] = numerator[mask] / denominator[mask]
+    return response
 
-    slices = []
-    for i in range(template.ndim):
-        if pad_input:
-            d0 = (template.shape[i] - 1) // 2
-            d1 = d0 + image_shape[i]
-        else:
-            d0 = template.shape[i] - 1
-            d1 = d0 + image_shape[i] - template.shape[i] + 1
-        slices.append(slice(d0, d1))
 
-    return response[tuple(slices)]
+def match_template_batch(image, templates, pad_input=False, mode='constant',
+                         constant_values=0, *, num_workers=1):
+    """Match a stack of templates to a 2-D or 3-D image.
+
+    This is equivalent to calling :func:`match_template` for each template,
+    but the padded image, its Fourier transform and its window sums are only
+    computed once for the whole stack.
+
+    Parameters
+    ----------
+    image : (M, N[, D]) array
+        2-D or 3-D input image.
+    templates : (K, m, n[, d]) array or sequence of (m, n[, d]) arrays
+        Templates to locate, all of the same shape. It must be
+        `(m <= M, n <= N[, d <= D])`.
+    pad_input : bool
+        If True, pad `image` so that each response is the same size as the
+        image, and response values correspond to the template center.
+        Otherwise, each response has shape `(M - m + 1, N - n + 1)` for an
+        `(M, N)` image and `(m, n)` templates, and matches correspond to the
+        origin (top-left corner) of the template.
+    mode : see `numpy.pad`, optional
+        Padding mode.
+    constant_values : see `numpy.pad`, optional
+        Constant values used in conjunction with ``mode='constant'``.
+    num_workers : int or None, optional
+        The number of parallel threads matching templates. If set to
+        ``None``, the full set of available cores are used.
+
+    Returns
+    -------
+    output : (K, ...) array
+        Response images with correlation coefficients, one per template.
+
+    See Also
+    --------
+    match_template
+
+    Examples
+    --------
+    >>> image = np.zeros((6, 6))
+    >>> image[1, 1] = 1
+    >>> image[3:5, 3:5] = -1
+    >>> templates = np.zeros((2, 3, 3))
+    >>> templates[0, 1, 1] = 1
+    >>> templates[1, 1:, 1:] = -1
+    >>> result = match_template_batch(image, templates)
+    >>> result.shape
+    (2, 4, 4)
+    >>> [np.unravel_index(np.argmax(r), r.shape) for r in result]
+    [(0, 0), (2, 2)]
+    """
+    check_nD(image, (2, 3))
+    templates = np.asarray(templates, dtype=np.float64)
+    if templates.ndim != image.ndim + 1:
+        raise ValueError("templates must be a stack of templates with the "
+                         "same number of dimensions as image.")
+    template_shape = templates.shape[1:]
+    if np.any(np.less(image.shape, template_shape)):
+        raise ValueError("Image must be larger than template.")
+
+    image_shape = image.shape
+    image, image_window_sum, image_ssd = _image_statistics(
+        image, template_shape, mode, constant_values)
+    slices = _response_slices(image_shape, template_shape, pad_input)
+    image_window_sum = image_window_sum[slices]
+    image_ssd = image_ssd[slices]
+
+    # Cross-correlations are computed from the Fourier transform of the
+    # image, shared by all templates. A response pixel at `slices` of the
+    # cross-correlation lies at the same index shifted by the template shape
+    # in the full convolution of the image with the flipped template.
+    fshape = [fft.next_fast_len(s + t - 1, True)
+              for s, t in zip(image.shape, template_shape)]
+    image_fft = fft.rfftn(image, fshape)
+    full_slices = tuple(slice(sl.start + t, sl.stop + t)
+                        for sl, t in zip(slices, template_shape))
+    flip = (slice(None, None, -1),) * image.ndim
+
+    def match(template):
+        template_fft = fft.rfftn(template[flip], fshape)
+        template_fft *= image_fft
+        xcorr = fft.irfftn(template_fft, fshape)[full_slices]
+        return _response(xcorr, image_window_sum, image_ssd, template)
+
+    output = np.empty((len(templates),) + image_window_sum.shape)
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        for i, response in enumerate(executor.map(match, templates)):
+            output[i] = response
+    return output
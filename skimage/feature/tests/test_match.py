@@ -1,10 +1,12 @@
 import numpy as np
+from scipy.spatial.distance import cdist
 from skimage._shared.testing import assert_equal
 from skimage import data
 from skimage import transform
 from skimage.color import rgb2gray
 from skimage.feature import (BRIEF, match_descriptors,
                              corner_peaks, corner_harris)
+from skimage.feature import match
 from skimage._shared import testing
 
 
@@ -177,3 +179,47 @@ def test_max_ratio():
     matches = match_descriptors(descs1, descs2, metric='euclidean',
                                 max_ratio=0.5, cross_check=False)
     assert_equal(len(matches), 1)
+
+
+def _match_descriptors_full(descriptors1, descriptors2, metric, **kwargs):
+    """Reference matcher working on the full distance matrix."""
+    distances = cdist(descriptors1, descriptors2, metric=metric)
+    indices1 = np.arange(len(descriptors1))
+    indices2 = np.argmin(distances, axis=1)
+    mask = np.ones(len(indices1), dtype=bool)
+    if kwargs.get('cross_check', True):
+        mask &= np.argmin(distances, axis=0)[indices2] == indices1
+    best = distances[indices1, indices2]
+    mask &= best < kwargs.get('max_distance', np.inf)
+    if kwargs.get('max_ratio', 1.0) < 1.0:
+        distances[indices1, indices2] = np.inf
+        second = np.maximum(distances.min(axis=1), np.finfo(np.double).eps)
+        mask &= best / second < kwargs['max_ratio']
+    return np.column_stack((indices1[mask], indices2[mask]))
+
+
+@testing.parametrize('binary', [True, False])
+@testing.parametrize('kwargs', [{}, {'cross_check': False},
+                                {'max_ratio': 0.8},
+                                {'max_distance': 0.4, 'max_ratio': 0.9}])
+def test_match_descriptors_blocked(monkeypatch, binary, kwargs):
+    # small blocks and many ties between distances
+    monkeypatch.setattr(match, '_BLOCK_SIZE', 50)
+    rng = np.random.default_rng(0)
+    if binary:
+        descs1 = rng.random((40, 70)) < 0.5
+        descs2 = rng.random((30, 70)) < 0.5
+        metric = 'hamming'
+    else:
+        descs1 = rng.integers(0, 2, (40, 3)) / 4
+        descs2 = rng.integers(0, 2, (30, 3)) / 4
+        metric = 'euclidean'
+    matches = match_descriptors(descs1, descs2, **kwargs)
+    expected = _match_descriptors_full(descs1, descs2, metric, **kwargs)
+    assert_equal(matches, expected)
+
+
+def test_match_descriptors_empty():
+    descs = np.zeros((3, 8), dtype=bool)
+    assert match_descriptors(descs[:0], descs).shape == (0, 2)
+    assert match_descriptors(descs, descs[:0]).shape == (0, 2)
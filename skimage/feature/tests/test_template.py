@@ -3,7 +3,8 @@ from skimage._shared.testing import assert_almost_equal, assert_equal
 
 from skimage import data, img_as_float
 from skimage.morphology import diamond
-from skimage.feature import match_template, peak_local_max
+from skimage.feature import (match_template, match_template_batch,
+                             peak_local_max)
 from skimage._shared import testing
 
 
@@ -184,3 +185,40 @@ def test_bounding_values():
     print(result.max())
     assert result.max() < 1 + 1e-7
     assert result.min() > -1 - 1e-7
+
+
+@testing.parametrize('pad_input', [False, True])
+@testing.parametrize('mode', ['constant', 'reflect'])
+@testing.parametrize('num_workers', [1, 3])
+def test_match_template_batch(pad_input, mode, num_workers):
+    rng = np.random.default_rng(0)
+    image = rng.random((60, 70))
+    templates = [image[10:19, 20:27], image[40:49, 5:12],
+                 rng.random((9, 7))]
+    result = match_template_batch(image, templates, pad_input=pad_input,
+                                  mode=mode, num_workers=num_workers)
+    assert result.shape[0] == 3
+    for template, response in zip(templates, result):
+        expected = match_template(image, template, pad_input=pad_input,
+                                  mode=mode)
+        np.testing.assert_allclose(response, expected, atol=1e-10)
+
+
+def test_match_template_batch_3d():
+    rng = np.random.default_rng(0)
+    image = rng.random((20, 21, 22))
+    templates = np.stack([image[2:7, 3:6, 4:8], image[10:15, 1:4, 9:13]])
+    result = match_template_batch(image, templates)
+    for template, response in zip(templates, result):
+        np.testing.assert_allclose(response, match_template(image, template),
+                                   atol=1e-10)
+
+
+def test_match_template_batch_invalid():
+    image = np.zeros((10, 10))
+    with testing.raises(ValueError):
+        match_template_batch(image, np.zeros((3, 3)))
+    with testing.raises(ValueError):
+        match_template_batch(image, np.zeros((2, 11, 3)))
+    with testing.raises(ValueError):
+        match_template_batch(image, [np.zeros((3, 3)), np.zeros((4, 3))])
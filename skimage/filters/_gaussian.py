@@ -3,8 +3,9 @@ import numpy as np
 from scipy import ndimage as ndi
 
 from ..util import img_as_float
+from ..util.dtype import _as_float_dtype
 from .._shared import utils
-from .._shared.utils import warn, convert_to_float
+from .._shared.utils import warn
 
 
 __all__ = ['gaussian', 'difference_of_gaussians']
@@ -14,7 +15,7 @@ __all__ = ['gaussian', 'difference_of_gaussians']
 @utils.deprecate_multichannel_kwarg(multichannel_position=5)
 def gaussian(image, sigma=1, output=None, mode='nearest', cval=0,
              multichannel=None, preserve_range=False, truncate=4.0, *,
-             channel_axis=None):
+             channel_axis=None, dtype=None):
     """Multi-dimensional Gaussian filter.
 
     Parameters
@@ -58,6 +59,11 @@ def gaussian(image, sigma=1, output=None, mode='nearest', cval=0,
 
         .. versionadded:: 0.19
            ``channel_axis`` was added in 0.19.
+    dtype : {None, np.float32, np.float64}, optional
+        Floating point precision of the computation and of the result. If
+        None, it is chosen by the float policy (see
+        :func:`skimage.util.set_float_policy`), which by default keeps single
+        precision inputs in ``float32`` and uses ``float64`` otherwise.
 
     Returns
     -------
@@ -123,7 +129,7 @@ def gaussian(image, sigma=1, output=None, mode='nearest', cval=0,
             sigma = [sigma] * (image.ndim - 1)
         if len(sigma) != image.ndim:
             sigma = np.concatenate((np.asarray(sigma), [0]))
-    image = convert_to_float(image, preserve_range)
+    image = _as_float_dtype(image, dtype, preserve_range)
     if (output is not None) and (not np.issubdtype(output.dtype, np.floating)):
         raise ValueError("Provided output data type is not float")
     return ndi.gaussian_filter(image, sigma, output=output,
@@ -10,8 +10,8 @@ Original author: Lee Kamentsky
 
 """
 import numpy as np
-from .. import img_as_float
 from .._shared.utils import check_nD
+from ..util.dtype import _as_float_dtype
 from scipy import ndimage as ndi
 from scipy.ndimage import convolve, binary_erosion
 
@@ -168,24 +168,28 @@ def _generic_edge_filter(image, *, smooth_weights, edge_weights=[1, 0, -1],
         axes = axis
     return_magnitude = (len(axes) > 1)
 
-    output = np.zeros(image.shape, dtype=float)
+    # scratch and output buffers share the floating point dtype of the image
+    output = np.zeros(image.shape, dtype=image.dtype)
 
     for edge_dim in axes:
         kernel = _reshape_nd(edge_weights, ndim, edge_dim)
         smooth_axes = list(set(range(ndim)) - {edge_dim})
         for smooth_dim in smooth_axes:
             kernel = kernel * _reshape_nd(smooth_weights, ndim, smooth_dim)
+        kernel = kernel.astype(image.dtype, copy=False)
         ax_output = ndi.convolve(image, kernel, mode=mode)
         if return_magnitude:
             ax_output *= ax_output
         output += ax_output
 
     if return_magnitude:
-        output = np.sqrt(output) / np.sqrt(ndim)
+        np.sqrt(output, out=output)
+        output /= np.sqrt(ndim)
     return output
 
 
-def sobel(image, mask=None, *, axis=None, mode='reflect', cval=0.0):
+def sobel(image, mask=None, *, axis=None, mode='reflect', cval=0.0,
+          dtype=None):
     """Find edges in an image using the Sobel filter.
 
     Parameters
@@ -210,6 +214,11 @@ def sobel(image, mask=None, *, axis=None, mode='reflect', cval=0.0):
     cval : float, optional
         When `mode` is ``'constant'``, this is the constant used in values
         outside the boundary of the image data.
+    dtype : {None, np.float32, np.float64}, optional
+        Floating point precision of the computation and of the result. If
+        None, it is chosen by the float policy (see
+        :func:`skimage.util.set_float_policy`), which by default keeps single
+        precision inputs in ``float32`` and uses ``float64`` otherwise.
 
     Returns
     -------
@@ -235,14 +244,14 @@ def sobel(image, mask=None, *, axis=None, mode='reflect', cval=0.0):
     >>> camera = data.camera()
     >>> edges = filters.sobel(camera)
     """
-    image = img_as_float(image)
+    image = _as_float_dtype(image, dtype)
     output = _generic_edge_filter(image, smooth_weights=SOBEL_SMOOTH,
                                   axis=axis, mode=mode, cval=cval)
     output = _mask_filter_result(output, mask)
     return output
 
 
-def sobel_h(image, mask=None):
+def sobel_h(image, mask=None, *, dtype=None):
     """Find the horizontal edges of an image using the Sobel transform.
 
     Parameters
@@ -253,6 +262,11 @@ def sobel_h(image, mask=None):
         An optional mask to limit the application to a certain area.
         Note that pixels surrounding masked regions are also masked to
         prevent masked regions from affecting the result.
+    dtype : {None, np.float32, np.float64}, optional
+        Floating point precision of the computation and of the result. If
+        None, it is chosen by the float policy (see
+        :func:`skimage.util.set_float_policy`), which by default keeps single
+        precision inputs in ``float32`` and uses ``float64`` otherwise.
 
     Returns
     -------
@@ -269,10 +283,10 @@ def sobel_h(image, mask=None):
 
     """
     check_nD(image, 2)
-    return sobel(image, mask=mask, axis=0)
+    return sobel(image, mask=mask, axis=0, dtype=dtype)
 
 
-def sobel_v(image, mask=None):
+def sobel_v(image, mask=None, *, dtype=None):
     """Find the vertical edges of an image using the Sobel transform.
 
     Parameters
@@ -283,6 +297,11 @@ def sobel_v(image, mask=None):
         An optional mask to limit the application to a certain area.
         Note that pixels surrounding masked regions are also masked to
         prevent masked regions from affecting the result.
+    dtype : {None, np.float32, np.float64}, optional
+        Floating point precision of the computation and of the result. If
+        None, it is chosen by the float policy (see
+        :func:`skimage.util.set_float_policy`), which by default keeps single
+        precision inputs in ``float32`` and uses ``float64`` otherwise.
 
     Returns
     -------
@@ -299,10 +318,11 @@ def sobel_v(image, mask=None):
 
     """
     check_nD(image, 2)
-    return sobel(image, mask=mask, axis=1)
+    return sobel(image, mask=mask, axis=1, dtype=dtype)
 
 
-def scharr(image, mask=None, *, axis=None, mode='reflect', cval=0.0):
+def scharr(image, mask=None, *, axis=None, mode='reflect', cval=0.0,
+           dtype=None):
     """Find the edge magnitude using the Scharr transform.
 
     Parameters
@@ -327,6 +347,11 @@ def scharr(image, mask=None, *, axis=None, mode='reflect', cval=0.0):
     cval : float, optional
         When `mode` is ``'constant'``, this is the constant used in values
         outside the boundary of the image data.
+    dtype : {None, np.float32, np.float64}, optional
+        Floating point precision of the computation and of the result. If
+        None, it is chosen by the float policy (see
+        :func:`skimage.util.set_float_policy`), which by default keeps single
+        precision inputs in ``float32`` and uses ``float64`` otherwise.
 
     Returns
     -------
@@ -357,14 +382,14 @@ def scharr(image, mask=None, *, axis=None, mode='reflect', cval=0.0):
     >>> camera = data.camera()
     >>> edges = filters.scharr(camera)
     """
-    image = img_as_float(image)
+    image = _as_float_dtype(image, dtype)
     output = _generic_edge_filter(image, smooth_weights=SCHARR_SMOOTH,
                                   axis=axis, mode=mode, cval=cval)
     output = _mask_filter_result(output, mask)
     return output
 
 
-def scharr_h(image, mask=None):
+def scharr_h(image, mask=None, *, dtype=None):
     """Find the horizontal edges of an image using the Scharr transform.
 
     Parameters
@@ -375,6 +400,11 @@ def scharr_h(image, mask=None):
         An optional mask to limit the application to a certain area.
         Note that pixels surrounding masked regions are also masked to
         prevent masked regions from affecting the result.
+    dtype : {None, np.float32, np.float64}, optional
+        Floating point precision of the computation and of the result. If
+        None, it is chosen by the float policy (see
+        :func:`skimage.util.set_float_policy`), which by default keeps single
+        precision inputs in ``float32`` and uses ``float64`` otherwise.
 
     Returns
     -------
@@ -396,10 +426,10 @@ def scharr_h(image, mask=None):
 
     """
     check_nD(image, 2)
-    return scharr(image, mask=mask, axis=0)
+    return scharr(image, mask=mask, axis=0, dtype=dtype)
 
 
-def scharr_v(image, mask=None):
+def scharr_v(image, mask=None, *, dtype=None):
     """Find the vertical edges of an image using the Scharr transform.
 
     Parameters
@@ -410,6 +440,11 @@ def scharr_v(image, mask=None):
         An optional mask to limit the application to a certain area.
         Note that pixels surrounding masked regions are also masked to
         prevent masked regions from affecting the result.
+    dtype : {None, np.float32, np.float64}, optional
+        Floating point precision of the computation and of the result. If
+        None, it is chosen by the float policy (see
+        :func:`skimage.util.set_float_policy`), which by default keeps single
+        precision inputs in ``float32`` and uses ``float64`` otherwise.
 
     Returns
     -------
@@ -430,10 +465,11 @@ def scharr_v(image, mask=None):
            Optimization of Kernel Based Image Derivatives.
     """
     check_nD(image, 2)
-    return scharr(image, mask=mask, axis=1)
+    return scharr(image, mask=mask, axis=1, dtype=dtype)
 
 
-def prewitt(image, mask=None, *, axis=None, mode='reflect', cval=0.0):
+def prewitt(image, mask=None, *, axis=None, mode='reflect', cval=0.0,
+            dtype=None):
     """Find the edge magnitude using the Prewitt transform.
 
     Parameters
@@ -458,6 +494,11 @@ def prewitt(image, mask=None, *, axis=None, mode='reflect', cval=0.0):
     cval : float, optional
         When `mode` is ``'constant'``, this is the constant used in values
         outside the boundary of the image data.
+    dtype : {None, np.float32, np.float64}, optional
+        Floating point precision of the computation and of the result. If
+        None, it is chosen by the float policy (see
+        :func:`skimage.util.set_float_policy`), which by default keeps single
+        precision inputs in ``float32`` and uses ``float64`` otherwise.
 
     Returns
     -------
@@ -485,14 +526,14 @@ def prewitt(image, mask=None, *, axis=None, mode='reflect', cval=0.0):
     >>> camera = data.camera()
     >>> edges = filters.prewitt(camera)
     """
-    image = img_as_float(image)
+    image = _as_float_dtype(image, dtype)
     output = _generic_edge_filter(image, smooth_weights=PREWITT_SMOOTH,
                                   axis=axis, mode=mode, cval=cval)
     output = _mask_filter_result(output, mask)
     return output
 
 
-def prewitt_h(image, mask=None):
+def prewitt_h(image, mask=None, *, dtype=None):
     """Find the horizontal edges of an image using the Prewitt transform.
 
     Parameters
@@ -503,6 +544,11 @@ def prewitt_h(image, mask=None):
         An optional mask to limit the application to a certain area.
         Note that pixels surrounding masked regions are also masked to
         prevent masked regions from affecting the result.
+    dtype : {None, np.float32, np.float64}, optional
+        Floating point precision of the computation and of the result. If
+        None, it is chosen by the float policy (see
+        :func:`skimage.util.set_float_policy`), which by default keeps single
+        precision inputs in ``float32`` and uses ``float64`` otherwise.
 
     Returns
     -------
@@ -519,10 +565,10 @@ def prewitt_h(image, mask=None):
 
     """
     check_nD(image, 2)
-    return prewitt(image, mask=mask, axis=0)
+    return prewitt(image, mask=mask, axis=0, dtype=dtype)
 
 
-def prewitt_v(image, mask=None):
+def prewitt_v(image, mask=None, *, dtype=None):
     """Find the vertical edges of an image using the Prewitt transform.
 
     Parameters
@@ -533,6 +579,11 @@ def prewitt_v(image, mask=None):
         An optional mask to limit the application to a certain area.
         Note that pixels surrounding masked regions are also masked to
         prevent masked regions from affecting the result.
+    dtype : {None, np.float32, np.float64}, optional
+        Floating point precision of the computation and of the result. If
+        None, it is chosen by the float policy (see
+        :func:`skimage.util.set_float_policy`), which by default keeps single
+        precision inputs in ``float32`` and uses ``float64`` otherwise.
 
     Returns
     -------
@@ -549,10 +600,10 @@ def prewitt_v(image, mask=None):
 
     """
     check_nD(image, 2)
-    return prewitt(image, mask=mask, axis=1)
+    return prewitt(image, mask=mask, axis=1, dtype=dtype)
 
 
-def roberts(image, mask=None):
+def roberts(image, mask=None, *, dtype=None):
     """Find the edge magnitude using Roberts' cross operator.
 
     Parameters
@@ -563,6 +614,11 @@ def roberts(image, mask=None):
         An optional mask to limit the application to a certain area.
         Note that pixels surrounding masked regions are also masked to
         prevent masked regions from affecting the result.
+    dtype : {None, np.float32, np.float64}, optional
+        Floating point precision of the computation and of the result. If
+        None, it is chosen by the float policy (see
+        :func:`skimage.util.set_float_policy`), which by default keeps single
+        precision inputs in ``float32`` and uses ``float64`` otherwise.
 
     Returns
     -------
@@ -583,13 +639,14 @@ def roberts(image, mask=None):
 
     """
     check_nD(image, 2)
-    out = np.sqrt(roberts_pos_diag(image, mask) ** 2 +
-                  roberts_neg_diag(image, mask) ** 2)
+    out = roberts_pos_diag(image, mask, dtype=dtype) ** 2
+    out += roberts_neg_diag(image, mask, dtype=dtype) ** 2
+    np.sqrt(out, out=out)
     out /= np.sqrt(2)
     return out
 
 
-def roberts_pos_diag(image, mask=None):
+def roberts_pos_diag(image, mask=None, *, dtype=None):
     """Find the cross edges of an image using Roberts' cross operator.
 
     The kernel is applied to the input image to produce separate measurements
@@ -603,6 +660,11 @@ def roberts_pos_diag(image, mask=None):
         An optional mask to limit the application to a certain area.
         Note that pixels surrounding masked regions are also masked to
         prevent masked regions from affecting the result.
+    dtype : {None, np.float32, np.float64}, optional
+        Floating point precision of the computation and of the result. If
+        None, it is chosen by the float policy (see
+        :func:`skimage.util.set_float_policy`), which by default keeps single
+        precision inputs in ``float32`` and uses ``float64`` otherwise.
 
     Returns
     -------
@@ -618,12 +680,12 @@ def roberts_pos_diag(image, mask=None):
 
     """
     check_nD(image, 2)
-    image = img_as_float(image)
-    result = convolve(image, ROBERTS_PD_WEIGHTS)
+    image = _as_float_dtype(image, dtype)
+    result = convolve(image, ROBERTS_PD_WEIGHTS.astype(image.dtype))
     return _mask_filter_result(result, mask)
 
 
-def roberts_neg_diag(image, mask=None):
+def roberts_neg_diag(image, mask=None, *, dtype=None):
     """Find the cross edges of an image using the Roberts' Cross operator.
 
     The kernel is applied to the input image to produce separate measurements
@@ -637,6 +699,11 @@ def roberts_neg_diag(image, mask=None):
         An optional mask to limit the application to a certain area.
         Note that pixels surrounding masked regions are also masked to
         prevent masked regions from affecting the result.
+    dtype : {None, np.float32, np.float64}, optional
+        Floating point precision of the computation and of the result. If
+        None, it is chosen by the float policy (see
+        :func:`skimage.util.set_float_policy`), which by default keeps single
+        precision inputs in ``float32`` and uses ``float64`` otherwise.
 
     Returns
     -------
@@ -652,12 +719,12 @@ def roberts_neg_diag(image, mask=None):
 
     """
     check_nD(image, 2)
-    image = img_as_float(image)
-    result = convolve(image, ROBERTS_ND_WEIGHTS)
+    image = _as_float_dtype(image, dtype)
+    result = convolve(image, ROBERTS_ND_WEIGHTS.astype(image.dtype))
     return _mask_filter_result(result, mask)
 
 
-def laplace(image, ksize=3, mask=None):
+def laplace(image, ksize=3, mask=None, *, dtype=None):
     """Find the edges of an image using the Laplace operator.
 
     Parameters
@@ -671,6 +738,11 @@ def laplace(image, ksize=3, mask=None):
         An optional mask to limit the application to a certain area.
         Note that pixels surrounding masked regions are also masked to
         prevent masked regions from affecting the result.
+    dtype : {None, np.float32, np.float64}, optional
+        Floating point precision of the computation and of the result. If
+        None, it is chosen by the float policy (see
+        :func:`skimage.util.set_float_policy`), which by default keeps single
+        precision inputs in ``float32`` and uses ``float64`` otherwise.
 
     Returns
     -------
@@ -683,15 +755,15 @@ def laplace(image, ksize=3, mask=None):
     skimage.restoration.uft.laplacian().
 
     """
-    image = img_as_float(image)
+    image = _as_float_dtype(image, dtype)
     # Create the discrete Laplacian operator - We keep only the real part of
     # the filter
     _, laplace_op = laplacian(image.ndim, (ksize,) * image.ndim)
-    result = convolve(image, laplace_op)
+    result = convolve(image, laplace_op.astype(image.dtype))
     return _mask_filter_result(result, mask)
 
 
-def farid(image, *, mask=None):
+def farid(image, *, mask=None, dtype=None):
     """Find the edge magnitude using the Farid transform.
 
     Parameters
@@ -702,6 +774,11 @@ def farid(image, *, mask=None):
         An optional mask to limit the application to a certain area.
         Note that pixels surrounding masked regions are also masked to
         prevent masked regions from affecting the result.
+    dtype : {None, np.float32, np.float64}, optional
+        Floating point precision of the computation and of the result. If
+        None, it is chosen by the float policy (see
+        :func:`skimage.util.set_float_policy`), which by default keeps single
+        precision inputs in ``float32`` and uses ``float64`` otherwise.
 
     Returns
     -------
@@ -736,13 +813,14 @@ def farid(image, *, mask=None):
     >>> edges = filters.farid(camera)
     """
     check_nD(image, 2)
-    out = np.sqrt(farid_h(image, mask=mask) ** 2
-                  + farid_v(image, mask=mask) ** 2)
+    out = farid_h(image, mask=mask, dtype=dtype) ** 2
+    out += farid_v(image, mask=mask, dtype=dtype) ** 2
+    np.sqrt(out, out=out)
     out /= np.sqrt(2)
     return out
 
 
-def farid_h(image, *, mask=None):
+def farid_h(image, *, mask=None, dtype=None):
     """Find the horizontal edges of an image using the Farid transform.
 
     Parameters
@@ -753,6 +831,11 @@ def farid_h(image, *, mask=None):
         An optional mask to limit the application to a certain area.
         Note that pixels surrounding masked regions are also masked to
         prevent masked regions from affecting the result.
+    dtype : {None, np.float32, np.float64}, optional
+        Floating point precision of the computation and of the result. If
+        None, it is chosen by the float policy (see
+        :func:`skimage.util.set_float_policy`), which by default keeps single
+        precision inputs in ``float32`` and uses ``float64`` otherwise.
 
     Returns
     -------
@@ -773,12 +856,12 @@ def farid_h(image, *, mask=None):
            Computer Analysis of Images and Patterns, Kiel, Germany. Sep, 1997.
     """
     check_nD(image, 2)
-    image = img_as_float(image)
-    result = convolve(image, HFARID_WEIGHTS)
+    image = _as_float_dtype(image, dtype)
+    result = convolve(image, HFARID_WEIGHTS.astype(image.dtype))
     return _mask_filter_result(result, mask)
 
 
-def farid_v(image, *, mask=None):
+def farid_v(image, *, mask=None, dtype=None):
     """Find the vertical edges of an image using the Farid transform.
 
     Parameters
@@ -789,6 +872,11 @@ def farid_v(image, *, mask=None):
         An optional mask to limit the application to a certain area.
         Note that pixels surrounding masked regions are also masked to
         prevent masked regions from affecting the result.
+    dtype : {None, np.float32, np.float64}, optional
+        Floating point precision of the computation and of the result. If
+        None, it is chosen by the float policy (see
+        :func:`skimage.util.set_float_policy`), which by default keeps single
+        precision inputs in ``float32`` and uses ``float64`` otherwise.
 
     Returns
     -------
@@ -806,6 +894,6 @@ def farid_v(image, *, mask=None):
            13(4): 496-508, 2004. :DOI:`10.1109/TIP.2004.823819`
     """
     check_nD(image, 2)
-    image = img_as_float(image)
-    result = convolve(image, VFARID_WEIGHTS)
+    image = _as_float_dtype(image, dtype)
+    result = convolve(image, VFARID_WEIGHTS.astype(image.dtype))
     return _mask_filter_result(result, mask)
@@ -25,7 +25,7 @@ References
 from ..._shared.utils import check_nD
 
 from . import percentile_cy
-from .generic import _preprocess_input
+from .generic import _preprocess_input, _apply_in_bands
 
 __all__ = ['autolevel_percentile', 'gradient_percentile',
            'mean_percentile', 'subtract_mean_percentile',
@@ -34,19 +34,19 @@ __all__ = ['autolevel_percentile', 'gradient_percentile',
 
 
 def _apply(func, image, selem, out, mask, shift_x, shift_y, p0, p1,
-           out_dtype=None):
+           out_dtype=None, num_workers=1):
     check_nD(image, 2)
     image, selem, out, mask, n_bins = _preprocess_input(image, selem, out, mask,
                                                     out_dtype)
 
-    func(image, selem, shift_x=shift_x, shift_y=shift_y, mask=mask,
-         out=out, n_bins=n_bins, p0=p0, p1=p1)
+    _apply_in_bands(func, image, selem, out, mask, shift_x, shift_y,
+                    num_workers=num_workers, n_bins=n_bins, p0=p0, p1=p1)
 
     return out.reshape(out.shape[:2])
 
 
 def autolevel_percentile(image, selem, out=None, mask=None, shift_x=False,
-                         shift_y=False, p0=0, p1=1):
+                         shift_y=False, p0=0, p1=1, num_workers=1):
     """Return grayscale local autolevel of an image.
 
     This filter locally stretches the histogram of grayvalues to cover the
@@ -72,6 +72,11 @@ def autolevel_percentile(image, selem, out=None, mask=None, shift_x=False,
     p0, p1 : float in [0, ..., 1]
         Define the [p0, p1] percentile interval to be considered for computing
         the value.
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Default is 1.
 
     Returns
     -------
@@ -82,11 +87,11 @@ def autolevel_percentile(image, selem, out=None, mask=None, shift_x=False,
 
     return _apply(percentile_cy._autolevel,
                   image, selem, out=out, mask=mask, shift_x=shift_x,
-                  shift_y=shift_y, p0=p0, p1=p1)
+                  shift_y=shift_y, p0=p0, p1=p1, num_workers=num_workers)
 
 
 def gradient_percentile(image, selem, out=None, mask=None, shift_x=False,
-                        shift_y=False, p0=0, p1=1):
+                        shift_y=False, p0=0, p1=1, num_workers=1):
     """Return local gradient of an image (i.e. local maximum - local minimum).
 
     Only grayvalues between percentiles [p0, p1] are considered in the filter.
@@ -109,6 +114,11 @@ def gradient_percentile(image, selem, out=None, mask=None, shift_x=False,
     p0, p1 : float in [0, ..., 1]
         Define the [p0, p1] percentile interval to be considered for computing
         the value.
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Default is 1.
 
     Returns
     -------
@@ -119,11 +129,11 @@ def gradient_percentile(image, selem, out=None, mask=None, shift_x=False,
 
     return _apply(percentile_cy._gradient,
                   image, selem, out=out, mask=mask, shift_x=shift_x,
-                  shift_y=shift_y, p0=p0, p1=p1)
+                  shift_y=shift_y, p0=p0, p1=p1, num_workers=num_workers)
 
 
 def mean_percentile(image, selem, out=None, mask=None, shift_x=False,
-                    shift_y=False, p0=0, p1=1):
+                    shift_y=False, p0=0, p1=1, num_workers=1):
     """Return local mean of an image.
 
     Only grayvalues between percentiles [p0, p1] are considered in the filter.
@@ -146,6 +156,11 @@ def mean_percentile(image, selem, out=None, mask=None, shift_x=False,
     p0, p1 : float in [0, ..., 1]
         Define the [p0, p1] percentile interval to be considered for computing
         the value.
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Default is 1.
 
     Returns
     -------
@@ -156,11 +171,12 @@ def mean_percentile(image, selem, out=None, mask=None, shift_x=False,
 
     return _apply(percentile_cy._mean,
                   image, selem, out=out, mask=mask, shift_x=shift_x,
-                  shift_y=shift_y, p0=p0, p1=p1)
+                  shift_y=shift_y, p0=p0, p1=p1, num_workers=num_workers)
 
 
 def subtract_mean_percentile(image, selem, out=None, mask=None,
-                             shift_x=False, shift_y=False, p0=0, p1=1):
+                             shift_x=False, shift_y=False, p0=0, p1=1,
+                             num_workers=1):
     """Return image subtracted from its local mean.
 
     Only grayvalues between percentiles [p0, p1] are considered in the filter.
@@ -183,6 +199,11 @@ def subtract_mean_percentile(image, selem, out=None, mask=None,
     p0, p1 : float in [0, ..., 1]
         Define the [p0, p1] percentile interval to be considered for computing
         the value.
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Default is 1.
 
     Returns
     -------
@@ -193,11 +214,12 @@ def subtract_mean_percentile(image, selem, out=None, mask=None,
 
     return _apply(percentile_cy._subtract_mean,
                   image, selem, out=out, mask=mask, shift_x=shift_x,
-                  shift_y=shift_y, p0=p0, p1=p1)
+                  shift_y=shift_y, p0=p0, p1=p1, num_workers=num_workers)
 
 
 def enhance_contrast_percentile(image, selem, out=None, mask=None,
-                                shift_x=False, shift_y=False, p0=0, p1=1):
+                                shift_x=False, shift_y=False, p0=0, p1=1,
+                                num_workers=1):
     """Enhance contrast of an image.
 
     This replaces each pixel by the local maximum if the pixel grayvalue is
@@ -224,6 +246,11 @@ def enhance_contrast_percentile(image, selem, out=None, mask=None,
     p0, p1 : float in [0, ..., 1]
         Define the [p0, p1] percentile interval to be considered for computing
         the value.
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Default is 1.
 
     Returns
     -------
@@ -234,11 +261,11 @@ def enhance_contrast_percentile(image, selem, out=None, mask=None,
 
     return _apply(percentile_cy._enhance_contrast,
                   image, selem, out=out, mask=mask, shift_x=shift_x,
-                  shift_y=shift_y, p0=p0, p1=p1)
+                  shift_y=shift_y, p0=p0, p1=p1, num_workers=num_workers)
 
 
 def percentile(image, selem, out=None, mask=None, shift_x=False, shift_y=False,
-               p0=0):
+               p0=0, num_workers=1):
     """Return local percentile of an image.
 
     Returns the value of the p0 lower percentile of the local grayvalue
@@ -263,6 +290,11 @@ def percentile(image, selem, out=None, mask=None, shift_x=False, shift_y=False,
         structuring element).
     p0 : float in [0, ..., 1]
         Set the percentile value.
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Default is 1.
 
     Returns
     -------
@@ -273,11 +305,11 @@ def percentile(image, selem, out=None, mask=None, shift_x=False, shift_y=False,
 
     return _apply(percentile_cy._percentile,
                   image, selem, out=out, mask=mask, shift_x=shift_x,
-                  shift_y=shift_y, p0=p0, p1=0.)
+                  shift_y=shift_y, p0=p0, p1=0., num_workers=num_workers)
 
 
 def pop_percentile(image, selem, out=None, mask=None, shift_x=False,
-                   shift_y=False, p0=0, p1=1):
+                   shift_y=False, p0=0, p1=1, num_workers=1):
     """Return the local number (population) of pixels.
 
     The number of pixels is defined as the number of pixels which are included
@@ -303,6 +335,11 @@ def pop_percentile(image, selem, out=None, mask=None, shift_x=False,
     p0, p1 : float in [0, ..., 1]
         Define the [p0, p1] percentile interval to be considered for computing
         the value.
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Default is 1.
 
     Returns
     -------
@@ -313,11 +350,11 @@ def pop_percentile(image, selem, out=None, mask=None, shift_x=False,
 
     return _apply(percentile_cy._pop,
                   image, selem, out=out, mask=mask, shift_x=shift_x,
-                  shift_y=shift_y, p0=p0, p1=p1)
+                  shift_y=shift_y, p0=p0, p1=p1, num_workers=num_workers)
 
 
 def sum_percentile(image, selem, out=None, mask=None, shift_x=False,
-                   shift_y=False, p0=0, p1=1):
+                   shift_y=False, p0=0, p1=1, num_workers=1):
     """Return the local sum of pixels.
 
     Only grayvalues between percentiles [p0, p1] are considered in the filter.
@@ -343,6 +380,11 @@ def sum_percentile(image, selem, out=None, mask=None, shift_x=False,
     p0, p1 : float in [0, ..., 1]
         Define the [p0, p1] percentile interval to be considered for computing
         the value.
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Default is 1.
 
     Returns
     -------
@@ -353,11 +395,11 @@ def sum_percentile(image, selem, out=None, mask=None, shift_x=False,
 
     return _apply(percentile_cy._sum,
                   image, selem, out=out, mask=mask, shift_x=shift_x,
-                  shift_y=shift_y, p0=p0, p1=p1)
+                  shift_y=shift_y, p0=p0, p1=p1, num_workers=num_workers)
 
 
 def threshold_percentile(image, selem, out=None, mask=None, shift_x=False,
-                         shift_y=False, p0=0):
+                         shift_y=False, p0=0, num_workers=1):
     """Local threshold of an image.
 
     The resulting binary mask is True if the grayvalue of the center pixel is
@@ -382,6 +424,11 @@ def threshold_percentile(image, selem, out=None, mask=None, shift_x=False,
         structuring element).
     p0 : float in [0, ..., 1]
         Set the percentile value.
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Default is 1.
 
     Returns
     -------
@@ -392,4 +439,4 @@ def threshold_percentile(image, selem, out=None, mask=None, shift_x=False,
 
     return _apply(percentile_cy._threshold,
                   image, selem, out=out, mask=mask, shift_x=shift_x,
-                  shift_y=shift_y, p0=p0, p1=0)
+                  shift_y=shift_y, p0=p0, p1=0, num_workers=num_workers)
@@ -27,25 +27,25 @@ import numpy as np
 
 from ..._shared.utils import check_nD
 from . import bilateral_cy
-from .generic import _preprocess_input
+from .generic import _preprocess_input, _apply_in_bands
 
 __all__ = ['mean_bilateral', 'pop_bilateral', 'sum_bilateral']
 
 
 def _apply(func, image, selem, out, mask, shift_x, shift_y, s0, s1,
-           out_dtype=None):
+           out_dtype=None, num_workers=1):
     check_nD(image, 2)
     image, selem, out, mask, n_bins = _preprocess_input(image, selem, out, mask,
                                                     out_dtype)
 
-    func(image, selem, shift_x=shift_x, shift_y=shift_y, mask=mask,
-         out=out, n_bins=n_bins, s0=s0, s1=s1)
+    _apply_in_bands(func, image, selem, out, mask, shift_x, shift_y,
+                    num_workers=num_workers, n_bins=n_bins, s0=s0, s1=s1)
 
     return out.reshape(out.shape[:2])
 
 
 def mean_bilateral(image, selem, out=None, mask=None, shift_x=False,
-                   shift_y=False, s0=10, s1=10):
+                   shift_y=False, s0=10, s1=10, num_workers=1):
     """Apply a flat kernel bilateral filter.
 
     This is an edge-preserving and noise reducing denoising filter. It averages
@@ -78,6 +78,11 @@ def mean_bilateral(image, selem, out=None, mask=None, shift_x=False,
     s0, s1 : int
         Define the [s0, s1] interval around the grayvalue of the center pixel
         to be considered for computing the value.
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Default is 1.
 
     Returns
     -------
@@ -99,11 +104,12 @@ def mean_bilateral(image, selem, out=None, mask=None, shift_x=False,
     """
 
     return _apply(bilateral_cy._mean, image, selem, out=out,
-                  mask=mask, shift_x=shift_x, shift_y=shift_y, s0=s0, s1=s1)
+                  mask=mask, shift_x=shift_x, shift_y=shift_y, s0=s0, s1=s1,
+                  num_workers=num_workers)
 
 
 def pop_bilateral(image, selem, out=None, mask=None, shift_x=False,
-                  shift_y=False, s0=10, s1=10):
+                  shift_y=False, s0=10, s1=10, num_workers=1):
     """Return the local number (population) of pixels.
 
 
@@ -130,6 +136,11 @@ def pop_bilateral(image, selem, out=None, mask=None, shift_x=False,
     s0, s1 : int
         Define the [s0, s1] interval around the grayvalue of the center pixel
         to be considered for computing the value.
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Default is 1.
 
     Returns
     -------
@@ -155,11 +166,12 @@ def pop_bilateral(image, selem, out=None, mask=None, shift_x=False,
     """
 
     return _apply(bilateral_cy._pop, image, selem, out=out,
-                  mask=mask, shift_x=shift_x, shift_y=shift_y, s0=s0, s1=s1)
+                  mask=mask, shift_x=shift_x, shift_y=shift_y, s0=s0, s1=s1,
+                  num_workers=num_workers)
 
 
 def sum_bilateral(image, selem, out=None, mask=None, shift_x=False,
-                  shift_y=False, s0=10, s1=10):
+                  shift_y=False, s0=10, s1=10, num_workers=1):
     """Apply a flat kernel bilateral filter.
 
     This is an edge-preserving and noise reducing denoising filter. It averages
@@ -195,6 +207,11 @@ def sum_bilateral(image, selem, out=None, mask=None, shift_x=False,
     s0, s1 : int
         Define the [s0, s1] interval around the grayvalue of the center pixel
         to be considered for computing the value.
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Default is 1.
 
     Returns
     -------
@@ -216,4 +233,5 @@ def sum_bilateral(image, selem, out=None, mask=None, shift_x=False,
     """
 
     return _apply(bilateral_cy._sum, image, selem, out=out,
-                  mask=mask, shift_x=shift_x, shift_y=shift_y, s0=s0, s1=s1)
+                  mask=mask, shift_x=shift_x, shift_y=shift_y, s0=s0, s1=s1,
+                  num_workers=num_workers)
@@ -49,7 +49,10 @@ References
 """
 
 
+import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from scipy import ndimage as ndi
 from ...util import img_as_ubyte
@@ -235,8 +238,74 @@ def _handle_input_3D(image, selem=None, out=None, mask=None, out_dtype=None,
     return image, selem, out, mask, n_bins
 
 
+def _apply_in_bands(func, image, selem, out, mask, shift_x, shift_y,
+                    num_workers=1, **kwargs):
+    """Apply a 2-D cython rank function, optionally on several threads.
+
+    With more than one worker, the image is split in horizontal bands that are
+    filtered concurrently (the cython core releases the GIL). Each band is
+    extended by halo rows covering the structuring element, so that every
+    pixel of the band sees exactly the same neighborhood, and thus the same
+    histogram, as in a single pass over the whole image: the output does not
+    depend on the number of workers.
+
+    Parameters
+    ----------
+    func : function
+        Cython function to apply.
+    image : 2-D array (np.uint8 or np.uint16)
+        Preprocessed input image.
+    selem : 2-D array (np.uint8)
+        The neighborhood expressed as a binary 2-D array.
+    out : 3-D array
+        Preallocated output array.
+    mask : 2-D array (np.uint8) or None
+        Preprocessed mask array.
+    shift_x, shift_y : int
+        Offset added to the structuring element center point.
+    num_workers : int or None, optional
+        Number of threads. If None, the number of CPUs is used.
+    **kwargs
+        Extra keyword arguments passed to ``func`` (e.g. ``n_bins``).
+
+    """
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    rows = image.shape[0]
+    srows = selem.shape[0]
+    # at least one structuring element height per band, to bound the halo
+    # overhead
+    n_bands = min(num_workers, max(1, rows // srows))
+    if n_bands <= 1:
+        func(image, selem, shift_x=shift_x, shift_y=shift_y, mask=mask,
+             out=out, **kwargs)
+        return out
+
+    # rows of the neighborhood above and below its center
+    centre_r = srows // 2 + int(shift_y)
+    halo_top = centre_r
+    halo_bottom = srows - 1 - centre_r
+    bounds = np.linspace(0, rows, n_bands + 1).astype(int)
+
+    def _filter_band(start, stop):
+        lo = max(start - halo_top, 0)
+        hi = min(stop + halo_bottom, rows)
+        band_mask = None if mask is None else mask[lo:hi]
+        band_out = np.empty((hi - lo,) + out.shape[1:], dtype=out.dtype)
+        func(image[lo:hi], selem, shift_x=shift_x, shift_y=shift_y,
+             mask=band_mask, out=band_out, **kwargs)
+        out[start:stop] = band_out[start - lo:stop - lo]
+
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        futures = [executor.submit(_filter_band, start, stop)
+                   for start, stop in zip(bounds[:-1], bounds[1:])]
+        for future in futures:
+            future.result()
+    return out
+
+
 def _apply_scalar_per_pixel(func, image, selem, out, mask, shift_x, shift_y,
-                            out_dtype=None):
+                            out_dtype=None, num_workers=1):
     """Process the specific cython function to the image.
 
     Parameters
@@ -259,6 +328,8 @@ def _apply_scalar_per_pixel(func, image, selem, out, mask, shift_x, shift_y,
     out_dtype : data-type, optional
         Desired output data-type. Default is None, which means we cast output
         in input dtype.
+    num_workers : int or None, optional
+        Number of threads used to process the image in horizontal bands.
 
     """
     # preprocess and verify the input
@@ -267,8 +338,8 @@ def _apply_scalar_per_pixel(func, image, selem, out, mask, shift_x, shift_y,
                                                         out_dtype)
 
     # apply cython function
-    func(image, selem, shift_x=shift_x, shift_y=shift_y, mask=mask,
-         out=out, n_bins=n_bins)
+    _apply_in_bands(func, image, selem, out, mask, shift_x, shift_y,
+                    num_workers=num_workers, n_bins=n_bins)
 
     return np.squeeze(out, axis=-1)
 
@@ -286,7 +357,7 @@ def _apply_scalar_per_pixel_3D(func, image, selem, out, mask, shift_x, shift_y,
 
 
 def _apply_vector_per_pixel(func, image, selem, out, mask, shift_x, shift_y,
-                            out_dtype=None, pixel_size=1):
+                            out_dtype=None, pixel_size=1, num_workers=1):
     """
 
     Parameters
@@ -311,6 +382,8 @@ def _apply_vector_per_pixel(func, image, selem, out, mask, shift_x, shift_y,
         in input dtype.
     pixel_size : int, optional
         Dimension of each pixel.
+    num_workers : int or None, optional
+        Number of threads used to process the image in horizontal bands.
 
     Returns
     -------
@@ -330,13 +403,13 @@ def _apply_vector_per_pixel(func, image, selem, out, mask, shift_x, shift_y,
                                                         pixel_size)
 
     # apply cython function
-    func(image, selem, shift_x=shift_x, shift_y=shift_y, mask=mask,
-         out=out, n_bins=n_bins)
+    _apply_in_bands(func, image, selem, out, mask, shift_x, shift_y,
+                    num_workers=num_workers, n_bins=n_bins)
 
     return out
 
 def autolevel(image, selem, out=None, mask=None,
-              shift_x=False, shift_y=False, shift_z=False):
+              shift_x=False, shift_y=False, shift_z=False, num_workers=1):
     """Auto-level image using local histogram.
 
     This filter locally stretches the histogram of gray values to cover the
@@ -357,6 +430,11 @@ def autolevel(image, selem, out=None, mask=None,
         Offset added to the structuring element center point. Shift is bounded
         to the structuring element sizes (center must be inside the given
         structuring element).
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Ignored for 3-D images. Default is 1.
 
     Returns
     -------
@@ -380,7 +458,8 @@ def autolevel(image, selem, out=None, mask=None,
     if np_image.ndim == 2:
         return _apply_scalar_per_pixel(generic_cy._autolevel, image, selem,
                                        out=out, mask=mask,
-                                       shift_x=shift_x, shift_y=shift_y)
+                                       shift_x=shift_x, shift_y=shift_y,
+                                       num_workers=num_workers)
     else:
         return _apply_scalar_per_pixel_3D(generic_cy._autolevel_3D, image,
                                           selem, out=out, mask=mask,
@@ -389,7 +468,7 @@ def autolevel(image, selem, out=None, mask=None,
 
 
 def equalize(image, selem, out=None, mask=None,
-             shift_x=False, shift_y=False, shift_z=False):
+             shift_x=False, shift_y=False, shift_z=False, num_workers=1):
     """Equalize image using local histogram.
 
     Parameters
@@ -407,6 +486,11 @@ def equalize(image, selem, out=None, mask=None,
         Offset added to the structuring element center point. Shift is bounded
         to the structuring element sizes (center must be inside the given
         structuring element).
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Ignored for 3-D images. Default is 1.
 
     Returns
     -------
@@ -430,7 +514,8 @@ def equalize(image, selem, out=None, mask=None,
     if np_image.ndim == 2:
         return _apply_scalar_per_pixel(generic_cy._equalize, image, selem,
                                        out=out, mask=mask,
-                                       shift_x=shift_x, shift_y=shift_y)
+                                       shift_x=shift_x, shift_y=shift_y,
+                                       num_workers=num_workers)
     else:
         return _apply_scalar_per_pixel_3D(generic_cy._equalize_3D, image,
                                           selem, out=out, mask=mask,
@@ -439,7 +524,7 @@ def equalize(image, selem, out=None, mask=None,
 
 
 def gradient(image, selem, out=None, mask=None,
-             shift_x=False, shift_y=False, shift_z=False):
+             shift_x=False, shift_y=False, shift_z=False, num_workers=1):
     """Return local gradient of an image (i.e. local maximum - local minimum).
 
     Parameters
@@ -457,6 +542,11 @@ def gradient(image, selem, out=None, mask=None,
         Offset added to the structuring element center point. Shift is bounded
         to the structuring element sizes (center must be inside the given
         structuring element).
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Ignored for 3-D images. Default is 1.
 
     Returns
     -------
@@ -480,7 +570,8 @@ def gradient(image, selem, out=None, mask=None,
     if np_image.ndim == 2:
         return _apply_scalar_per_pixel(generic_cy._gradient, image, selem,
                                        out=out, mask=mask,
-                                       shift_x=shift_x, shift_y=shift_y)
+                                       shift_x=shift_x, shift_y=shift_y,
+                                       num_workers=num_workers)
     else:
         return _apply_scalar_per_pixel_3D(generic_cy._gradient_3D, image,
                                           selem, out=out, mask=mask,
@@ -489,7 +580,7 @@ def gradient(image, selem, out=None, mask=None,
 
 
 def maximum(image, selem, out=None, mask=None,
-            shift_x=False, shift_y=False, shift_z=False):
+            shift_x=False, shift_y=False, shift_z=False, num_workers=1):
     """Return local maximum of an image.
 
     Parameters
@@ -507,6 +598,11 @@ def maximum(image, selem, out=None, mask=None,
         Offset added to the structuring element center point. Shift is bounded
         to the structuring element sizes (center must be inside the given
         structuring element).
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Ignored for 3-D images. Default is 1.
 
     Returns
     -------
@@ -539,7 +635,8 @@ def maximum(image, selem, out=None, mask=None,
     if np_image.ndim == 2:
         return _apply_scalar_per_pixel(generic_cy._maximum, image, selem,
                                        out=out, mask=mask,
-                                       shift_x=shift_x, shift_y=shift_y)
+                                       shift_x=shift_x, shift_y=shift_y,
+                                       num_workers=num_workers)
     else:
         return _apply_scalar_per_pixel_3D(generic_cy._maximum_3D, image,
                                           selem, out=out, mask=mask,
@@ -548,7 +645,7 @@ def maximum(image, selem, out=None, mask=None,
 
 
 def mean(image, selem, out=None, mask=None,
-         shift_x=False, shift_y=False, shift_z=False):
+         shift_x=False, shift_y=False, shift_z=False, num_workers=1):
     """Return local mean of an image.
 
     Parameters
@@ -566,6 +663,11 @@ def mean(image, selem, out=None, mask=None,
         Offset added to the structuring element center point. Shift is bounded
         to the structuring element sizes (center must be inside the given
         structuring element).
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Ignored for 3-D images. Default is 1.
 
     Returns
     -------
@@ -589,7 +691,8 @@ def mean(image, selem, out=None, mask=None,
     if np_image.ndim == 2:
         return _apply_scalar_per_pixel(generic_cy._mean, image, selem,
                                        out=out, mask=mask,
-                                       shift_x=shift_x, shift_y=shift_y)
+                                       shift_x=shift_x, shift_y=shift_y,
+                                       num_workers=num_workers)
     else:
         return _apply_scalar_per_pixel_3D(generic_cy._mean_3D, image,
                                           selem, out=out, mask=mask,
@@ -598,7 +701,7 @@ def mean(image, selem, out=None, mask=None,
 
 
 def geometric_mean(image, selem, out=None, mask=None,
-                   shift_x=False, shift_y=False, shift_z=False):
+                   shift_x=False, shift_y=False, shift_z=False, num_workers=1):
     """Return local geometric mean of an image.
 
     Parameters
@@ -616,6 +719,11 @@ def geometric_mean(image, selem, out=None, mask=None,
         Offset added to the structuring element center point. Shift is bounded
         to the structuring element sizes (center must be inside the given
         structuring element).
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Ignored for 3-D images. Default is 1.
 
     Returns
     -------
@@ -644,7 +752,8 @@ def geometric_mean(image, selem, out=None, mask=None,
     if np_image.ndim == 2:
         return _apply_scalar_per_pixel(generic_cy._geometric_mean, image, selem,
                                        out=out, mask=mask,
-                                       shift_x=shift_x, shift_y=shift_y)
+                                       shift_x=shift_x, shift_y=shift_y,
+                                       num_workers=num_workers)
     else:
         return _apply_scalar_per_pixel_3D(generic_cy._geometric_mean_3D, image,
                                           selem, out=out, mask=mask,
@@ -653,7 +762,7 @@ def geometric_mean(image, selem, out=None, mask=None,
 
 
 def subtract_mean(image, selem, out=None, mask=None,
-                  shift_x=False, shift_y=False, shift_z=False):
+                  shift_x=False, shift_y=False, shift_z=False, num_workers=1):
     """Return image subtracted from its local mean.
 
     Parameters
@@ -671,6 +780,11 @@ def subtract_mean(image, selem, out=None, mask=None,
         Offset added to the structuring element center point. Shift is bounded
         to the structuring element sizes (center must be inside the given
         structuring element).
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Ignored for 3-D images. Default is 1.
 
     Returns
     -------
@@ -702,7 +816,8 @@ def subtract_mean(image, selem, out=None, mask=None,
     if np_image.ndim == 2:
         return _apply_scalar_per_pixel(generic_cy._subtract_mean, image, selem,
                                        out=out, mask=mask,
-                                       shift_x=shift_x, shift_y=shift_y)
+                                       shift_x=shift_x, shift_y=shift_y,
+                                       num_workers=num_workers)
     else:
         return _apply_scalar_per_pixel_3D(generic_cy._subtract_mean_3D, image,
                                           selem, out=out, mask=mask,
@@ -711,7 +826,7 @@ def subtract_mean(image, selem, out=None, mask=None,
 
 
 def median(image, selem=None, out=None, mask=None,
-           shift_x=False, shift_y=False, shift_z=False):
+           shift_x=False, shift_y=False, shift_z=False, num_workers=1):
     """Return local median of an image.
 
     Parameters
@@ -730,6 +845,11 @@ def median(image, selem=None, out=None, mask=None,
         Offset added to the structuring element center point. Shift is bounded
         to the structuring element sizes (center must be inside the given
         structuring element).
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Ignored for 3-D images. Default is 1.
 
     Returns
     -------
@@ -760,7 +880,8 @@ def median(image, selem=None, out=None, mask=None,
     if np_image.ndim == 2:
         return _apply_scalar_per_pixel(generic_cy._median, image, selem,
                                        out=out, mask=mask,
-                                       shift_x=shift_x, shift_y=shift_y)
+                                       shift_x=shift_x, shift_y=shift_y,
+                                       num_workers=num_workers)
     else:
         return _apply_scalar_per_pixel_3D(generic_cy._median_3D, image,
                                           selem, out=out, mask=mask,
@@ -769,7 +890,7 @@ def median(image, selem=None, out=None, mask=None,
 
 
 def minimum(image, selem, out=None, mask=None,
-            shift_x=False, shift_y=False, shift_z=False):
+            shift_x=False, shift_y=False, shift_z=False, num_workers=1):
     """Return local minimum of an image.
 
     Parameters
@@ -787,6 +908,11 @@ def minimum(image, selem, out=None, mask=None,
         Offset added to the structuring element center point. Shift is bounded
         to the structuring element sizes (center must be inside the given
         structuring element).
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Ignored for 3-D images. Default is 1.
 
     Returns
     -------
@@ -819,7 +945,8 @@ def minimum(image, selem, out=None, mask=None,
     if np_image.ndim == 2:
         return _apply_scalar_per_pixel(generic_cy._minimum, image, selem,
                                        out=out, mask=mask,
-                                       shift_x=shift_x, shift_y=shift_y)
+                                       shift_x=shift_x, shift_y=shift_y,
+                                       num_workers=num_workers)
     else:
         return _apply_scalar_per_pixel_3D(generic_cy._minimum_3D, image,
                                           selem, out=out, mask=mask,
@@ -828,7 +955,7 @@ def minimum(image, selem, out=None, mask=None,
 
 
 def modal(image, selem, out=None, mask=None,
-          shift_x=False, shift_y=False, shift_z=False):
+          shift_x=False, shift_y=False, shift_z=False, num_workers=1):
     """Return local mode of an image.
 
     The mode is the value that appears most often in the local histogram.
@@ -848,6 +975,11 @@ def modal(image, selem, out=None, mask=None,
         Offset added to the structuring element center point. Shift is bounded
         to the structuring element sizes (center must be inside the given
         structuring element).
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Ignored for 3-D images. Default is 1.
 
     Returns
     -------
@@ -871,7 +1003,8 @@ def modal(image, selem, out=None, mask=None,
     if np_image.ndim == 2:
         return _apply_scalar_per_pixel(generic_cy._modal, image, selem,
                                        out=out, mask=mask,
-                                       shift_x=shift_x, shift_y=shift_y)
+                                       shift_x=shift_x, shift_y=shift_y,
+                                       num_workers=num_workers)
     else:
         return _apply_scalar_per_pixel_3D(generic_cy._modal_3D, image,
                                           selem, out=out, mask=mask,
@@ -880,7 +1013,8 @@ def modal(image, selem, out=None, mask=None,
 
 
 def enhance_contrast(image, selem, out=None, mask=None,
-                     shift_x=False, shift_y=False, shift_z=False):
+                     shift_x=False, shift_y=False, shift_z=False,
+                     num_workers=1):
     """Enhance contrast of an image.
 
     This replaces each pixel by the local maximum if the pixel gray value is
@@ -902,6 +1036,11 @@ def enhance_contrast(image, selem, out=None, mask=None,
         Offset added to the structuring element center point. Shift is bounded
         to the structuring element sizes (center must be inside the given
         structuring element).
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Ignored for 3-D images. Default is 1.
 
     Returns
     -------
@@ -925,7 +1064,8 @@ def enhance_contrast(image, selem, out=None, mask=None,
     if np_image.ndim == 2:
         return _apply_scalar_per_pixel(generic_cy._enhance_contrast, image,
                                        selem, out=out, mask=mask,
-                                       shift_x=shift_x, shift_y=shift_y)
+                                       shift_x=shift_x, shift_y=shift_y,
+                                       num_workers=num_workers)
     else:
         return _apply_scalar_per_pixel_3D(generic_cy._enhance_contrast_3D,
                                           image, selem, out=out, mask=mask,
@@ -934,7 +1074,7 @@ def enhance_contrast(image, selem, out=None, mask=None,
 
 
 def pop(image, selem, out=None, mask=None,
-        shift_x=False, shift_y=False, shift_z=False):
+        shift_x=False, shift_y=False, shift_z=False, num_workers=1):
     """Return the local number (population) of pixels.
 
     The number of pixels is defined as the number of pixels which are included
@@ -955,6 +1095,11 @@ def pop(image, selem, out=None, mask=None,
         Offset added to the structuring element center point. Shift is bounded
         to the structuring element sizes (center must be inside the given
         structuring element).
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Ignored for 3-D images. Default is 1.
 
     Returns
     -------
@@ -983,7 +1128,8 @@ def pop(image, selem, out=None, mask=None,
     if np_image.ndim == 2:
         return _apply_scalar_per_pixel(generic_cy._pop, image, selem,
                                        out=out, mask=mask,
-                                       shift_x=shift_x, shift_y=shift_y)
+                                       shift_x=shift_x, shift_y=shift_y,
+                                       num_workers=num_workers)
     else:
         return _apply_scalar_per_pixel_3D(generic_cy._pop_3D, image,
                                           selem, out=out, mask=mask,
@@ -992,7 +1138,7 @@ def pop(image, selem, out=None, mask=None,
 
 
 def sum(image, selem, out=None, mask=None,
-        shift_x=False, shift_y=False, shift_z=False):
+        shift_x=False, shift_y=False, shift_z=False, num_workers=1):
     """Return the local sum of pixels.
 
     Note that the sum may overflow depending on the data type of the input
@@ -1013,6 +1159,11 @@ def sum(image, selem, out=None, mask=None,
         Offset added to the structuring element center point. Shift is bounded
         to the structuring element sizes (center must be inside the given
         structuring element).
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Ignored for 3-D images. Default is 1.
 
     Returns
     -------
@@ -1041,7 +1192,8 @@ def sum(image, selem, out=None, mask=None,
     if np_image.ndim == 2:
         return _apply_scalar_per_pixel(generic_cy._sum, image, selem,
                                        out=out, mask=mask,
-                                       shift_x=shift_x, shift_y=shift_y)
+                                       shift_x=shift_x, shift_y=shift_y,
+                                       num_workers=num_workers)
     else:
         return _apply_scalar_per_pixel_3D(generic_cy._sum_3D, image,
                                           selem, out=out, mask=mask,
@@ -1050,7 +1202,7 @@ def sum(image, selem, out=None, mask=None,
 
 
 def threshold(image, selem, out=None, mask=None,
-              shift_x=False, shift_y=False, shift_z=False):
+              shift_x=False, shift_y=False, shift_z=False, num_workers=1):
     """Local threshold of an image.
 
     The resulting binary mask is True if the gray value of the center pixel is
@@ -1071,6 +1223,11 @@ def threshold(image, selem, out=None, mask=None,
         Offset added to the structuring element center point. Shift is bounded
         to the structuring element sizes (center must be inside the given
         structuring element).
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Ignored for 3-D images. Default is 1.
 
     Returns
     -------
@@ -1099,7 +1256,8 @@ def threshold(image, selem, out=None, mask=None,
     if np_image.ndim == 2:
         return _apply_scalar_per_pixel(generic_cy._threshold, image, selem,
                                        out=out, mask=mask,
-                                       shift_x=shift_x, shift_y=shift_y)
+                                       shift_x=shift_x, shift_y=shift_y,
+                                       num_workers=num_workers)
     else:
         return _apply_scalar_per_pixel_3D(generic_cy._threshold_3D, image,
                                           selem, out=out, mask=mask,
@@ -1108,7 +1266,7 @@ def threshold(image, selem, out=None, mask=None,
 
 
 def noise_filter(image, selem, out=None, mask=None,
-                 shift_x=False, shift_y=False, shift_z=False):
+                 shift_x=False, shift_y=False, shift_z=False, num_workers=1):
     """Noise feature.
 
     Parameters
@@ -1131,6 +1289,11 @@ def noise_filter(image, selem, out=None, mask=None,
     ----------
     .. [1] N. Hashimoto et al. Referenceless image quality evaluation
                      for whole slide imaging. J Pathol Inform 2012;3:9.
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Ignored for 3-D images. Default is 1.
 
     Returns
     -------
@@ -1161,7 +1324,8 @@ def noise_filter(image, selem, out=None, mask=None,
 
         return _apply_scalar_per_pixel(generic_cy._noise_filter, image,
                                        selem_cpy, out=out, mask=mask,
-                                       shift_x=shift_x, shift_y=shift_y)
+                                       shift_x=shift_x, shift_y=shift_y,
+                                       num_workers=num_workers)
     else:
         # ensure that the central pixel in the structuring element is empty
         centre_r = int(selem.shape[0] / 2) + shift_y
@@ -1178,7 +1342,7 @@ def noise_filter(image, selem, out=None, mask=None,
 
 
 def entropy(image, selem, out=None, mask=None,
-            shift_x=False, shift_y=False, shift_z=False):
+            shift_x=False, shift_y=False, shift_z=False, num_workers=1):
     """Local entropy.
 
     The entropy is computed using base 2 logarithm i.e. the filter returns the
@@ -1200,6 +1364,11 @@ def entropy(image, selem, out=None, mask=None,
         Offset added to the structuring element center point. Shift is bounded
         to the structuring element sizes (center must be inside the given
         structuring element).
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Ignored for 3-D images. Default is 1.
 
     Returns
     -------
@@ -1228,7 +1397,8 @@ def entropy(image, selem, out=None, mask=None,
         return _apply_scalar_per_pixel(generic_cy._entropy, image, selem,
                                        out=out, mask=mask,
                                        shift_x=shift_x, shift_y=shift_y,
-                                       out_dtype=np.double)
+                                       out_dtype=np.double,
+                                       num_workers=num_workers)
     else:
         return _apply_scalar_per_pixel_3D(generic_cy._entropy_3D, image,
                                           selem, out=out, mask=mask,
@@ -1237,7 +1407,7 @@ def entropy(image, selem, out=None, mask=None,
 
 
 def otsu(image, selem, out=None, mask=None,
-         shift_x=False, shift_y=False, shift_z=False):
+         shift_x=False, shift_y=False, shift_z=False, num_workers=1):
     """Local Otsu's threshold value for each pixel.
 
     Parameters
@@ -1255,6 +1425,11 @@ def otsu(image, selem, out=None, mask=None,
         Offset added to the structuring element center point. Shift is bounded
         to the structuring element sizes (center must be inside the given
         structuring element).
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Ignored for 3-D images. Default is 1.
 
     Returns
     -------
@@ -1284,7 +1459,8 @@ def otsu(image, selem, out=None, mask=None,
     if np_image.ndim == 2:
         return _apply_scalar_per_pixel(generic_cy._otsu, image, selem,
                                        out=out, mask=mask,
-                                       shift_x=shift_x, shift_y=shift_y)
+                                       shift_x=shift_x, shift_y=shift_y,
+                                       num_workers=num_workers)
     else:
         return _apply_scalar_per_pixel_3D(generic_cy._otsu_3D, image,
                                           selem, out=out, mask=mask,
@@ -1293,7 +1469,8 @@ def otsu(image, selem, out=None, mask=None,
 
 
 def windowed_histogram(image, selem, out=None, mask=None,
-                       shift_x=False, shift_y=False, n_bins=None):
+                       shift_x=False, shift_y=False, n_bins=None,
+                       num_workers=1):
     """Normalized sliding window histogram
 
     Parameters
@@ -1314,6 +1491,11 @@ def windowed_histogram(image, selem, out=None, mask=None,
     n_bins : int or None
         The number of histogram bins. Will default to ``image.max() + 1``
         if None is passed.
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Default is 1.
 
     Returns
     -------
@@ -1344,11 +1526,11 @@ def windowed_histogram(image, selem, out=None, mask=None,
                                    out=out, mask=mask,
                                    shift_x=shift_x, shift_y=shift_y,
                                    out_dtype=np.double,
-                                   pixel_size=n_bins)
+                                   pixel_size=n_bins, num_workers=num_workers)
 
 
 def majority(image, selem, *, out=None, mask=None,
-             shift_x=False, shift_y=False, shift_z=False):
+             shift_x=False, shift_y=False, shift_z=False, num_workers=1):
     """Majority filter assign to each pixel the most occuring value within
     its neighborhood.
 
@@ -1367,6 +1549,11 @@ def majority(image, selem, *, out=None, mask=None,
         Offset added to the structuring element center point. Shift is bounded
         to the structuring element sizes (center must be inside the given
         structuring element).
+    num_workers : int or None, optional
+        Number of threads used to filter the image. The image is split in
+        horizontal bands that are processed concurrently; the result is
+        identical to the single-threaded one. If None, all CPUs are used.
+        Ignored for 3-D images. Default is 1.
 
     Returns
     -------
@@ -1390,7 +1577,8 @@ def majority(image, selem, *, out=None, mask=None,
     if np_image.ndim == 2:
         return _apply_scalar_per_pixel(generic_cy._majority, image,
                                        selem, out=out, mask=mask,
-                                       shift_x=shift_x, shift_y=shift_y)
+                                       shift_x=shift_x, shift_y=shift_y,
+                                       num_workers=num_workers)
     else:
         return _apply_scalar_per_pixel_3D(generic_cy._majority_3D,
                                           image, selem, out=out, mask=mask,
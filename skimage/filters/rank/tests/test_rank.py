@@ -56,6 +56,35 @@ def test_subtract_mean_underflow_correction(dtype):
     assert np.all(result == expected_val)
 
 
+@pytest.mark.parametrize('filter', all_rank_filters)
+@pytest.mark.parametrize('shift_x, shift_y', [(0, 0), (1, -2), (-1, 3)])
+@pytest.mark.parametrize('use_mask', [False, True])
+def test_num_workers_same_result(filter, shift_x, shift_y, use_mask):
+    rng = np.random.default_rng(0)
+    image = rng.integers(0, 256, size=(61, 37), dtype=np.uint8)
+    mask = rng.random(image.shape) > 0.3 if use_mask else None
+    # asymmetric neighborhood, so that the band halos differ above and below
+    selem = np.ones((7, 5), dtype=np.uint8)
+    selem[0, 0] = selem[6, 4] = 0
+    func = getattr(rank, filter)
+    expected = func(image, selem, mask=mask, shift_x=shift_x,
+                    shift_y=shift_y)
+    for num_workers in (2, 4, 60, None):
+        result = func(image, selem, mask=mask, shift_x=shift_x,
+                      shift_y=shift_y, num_workers=num_workers)
+        assert_array_equal(result, expected)
+
+
+def test_num_workers_16bit_out():
+    rng = np.random.default_rng(0)
+    image = rng.integers(0, 4000, size=(40, 50), dtype=np.uint16)
+    expected = rank.median(image, disk(3))
+    out = np.empty_like(image)
+    result = rank.median(image, disk(3), out=out, num_workers=3)
+    assert_array_equal(out, expected)
+    assert_array_equal(result, expected)
+
+
 # Note: Explicitly read all values into a dict. Otherwise, stochastic test
 #       failures related to I/O can occur during parallel test cases.
 ref_data = dict(np.load(fetch("data/rank_filter_tests.npz")))
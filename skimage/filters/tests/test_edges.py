@@ -1,8 +1,10 @@
 import numpy as np
 from skimage import data
 from skimage import filters
+from skimage import img_as_ubyte
 from skimage.filters.edges import _mask_filter_result
 
+from skimage.util import float_policy
 from skimage._shared import testing
 from skimage._shared.testing import (assert_array_almost_equal,
                                      assert_, assert_allclose)
@@ -566,3 +568,40 @@ def test_range(detector):
     assert_(
         out.max() <= 1, f'Maximum of `{detector.__name__}` is larger than 1.'
     )
+
+
+@testing.parametrize(
+    'detector',
+    [filters.sobel, filters.sobel_h, filters.sobel_v,
+     filters.scharr, filters.scharr_h, filters.scharr_v,
+     filters.prewitt, filters.prewitt_h, filters.prewitt_v,
+     filters.roberts, filters.roberts_pos_diag, filters.roberts_neg_diag,
+     filters.laplace, filters.farid, filters.farid_h, filters.farid_v]
+)
+def test_float_dtype(detector):
+    image = np.random.random((20, 20))
+    expected = detector(image)
+    assert expected.dtype == np.float64
+
+    # single precision inputs stay in single precision by default
+    out32 = detector(image.astype(np.float32))
+    assert out32.dtype == np.float32
+    assert_allclose(out32, expected, atol=1e-5)
+
+    out32 = detector(image, dtype=np.float32)
+    assert out32.dtype == np.float32
+    assert_allclose(out32, expected, atol=1e-5)
+    assert detector(image.astype(np.float32),
+                    dtype=np.float64).dtype == np.float64
+
+    image_u8 = img_as_ubyte(image)
+    assert detector(image_u8).dtype == np.float64
+    with float_policy('float32'):
+        out32 = detector(image_u8)
+    assert out32.dtype == np.float32
+    assert_allclose(out32, detector(image_u8), atol=1e-5)
+
+
+def test_float_dtype_invalid():
+    with testing.raises(ValueError):
+        filters.sobel(np.zeros((5, 5)), dtype=np.int32)
@@ -3,6 +3,7 @@ import pytest
 import numpy as np
 from skimage.filters._gaussian import (gaussian, _guess_spatial_dimensions,
                                        difference_of_gaussians)
+from skimage.util import float_policy
 from skimage._shared import testing
 from skimage._shared._warnings import expected_warnings
 
@@ -169,3 +170,30 @@ def test_dog_invalid_sigma2():
         difference_of_gaussians(image, 3, 2)
     with testing.raises(ValueError):
         difference_of_gaussians(image, (1, 5), (2, 4))
+
+
+@pytest.mark.parametrize('preserve_range', [False, True])
+def test_float_dtype(preserve_range):
+    image = np.random.random((16, 16, 4)) * 100
+    image_u8 = image.astype(np.uint8)
+    expected = gaussian(image, preserve_range=preserve_range)
+
+    out = gaussian(image.astype(np.float32), preserve_range=preserve_range)
+    assert out.dtype == np.float32
+    np.testing.assert_allclose(out, expected, rtol=1e-5)
+
+    out = gaussian(image, preserve_range=preserve_range, dtype=np.float32)
+    assert out.dtype == np.float32
+    np.testing.assert_allclose(out, expected, rtol=1e-5)
+
+    expected = gaussian(image_u8, preserve_range=preserve_range)
+    assert expected.dtype == np.float64
+    with float_policy('float32'):
+        out = gaussian(image_u8, preserve_range=preserve_range)
+    assert out.dtype == np.float32
+    np.testing.assert_allclose(out, expected, rtol=1e-5)
+
+    with float_policy('float64'):
+        out = gaussian(image.astype(np.float32),
+                       preserve_range=preserve_range)
+    assert out.dtype == np.float64
@@ -20,6 +20,7 @@ from skimage.filters.thresholding import (threshold_local,
                                           threshold_minimum,
                                           threshold_multiotsu,
                                           try_all_threshold,
+                                          WindowStatistics,
                                           _mean_std,
                                           _cross_entropy)
 from skimage.filters._multiotsu import (_get_multiotsu_thresh_indices_lut,
@@ -613,6 +614,47 @@ def test_mean_std_3d(window_size, mean_kernel):
     np.testing.assert_allclose(s, expected_s)
 
 
+@pytest.mark.parametrize('mode', ['reflect', 'mirror', 'nearest', 'wrap',
+                                  'constant'])
+def test_window_statistics_modes(mode):
+    image = np.random.rand(32, 40) * 100
+    stats = WindowStatistics(image, mode=mode, cval=3)
+    for window_size in [(3, 7), 5, (1, 9)]:
+        expected_m = ndi.uniform_filter(image, window_size, mode=mode, cval=3)
+        np.testing.assert_allclose(stats.mean(window_size), expected_m)
+        expected_s = ndi.generic_filter(image, np.std, size=window_size,
+                                        mode=mode, cval=3)
+        m, s = stats.mean_std(window_size)
+        np.testing.assert_allclose(m, expected_m)
+        np.testing.assert_allclose(s, expected_s, atol=1e-9)
+
+
+def test_window_statistics_reuse():
+    image = data.page()
+    stats = WindowStatistics(image, max_window_size=31, mode='mirror')
+    for window_size in [3, 15, 31, (5, 31), 45]:
+        assert_equal(threshold_niblack(stats, window_size, k=0.1),
+                     threshold_niblack(image, window_size, k=0.1))
+        assert_equal(threshold_sauvola(stats, window_size),
+                     threshold_sauvola(image, window_size))
+    assert_equal(threshold_local(stats, 15, method='mean', offset=10),
+                 stats.mean(15) - 10)
+    np.testing.assert_allclose(
+        threshold_local(stats, 15, method='mean'),
+        threshold_local(image, 15, method='mean', mode='mirror'))
+    # methods other than 'mean' use the image
+    assert_equal(threshold_local(stats, 15, method='median'),
+                 threshold_local(image, 15, method='median'))
+
+
+def test_window_statistics_invalid():
+    stats = WindowStatistics(np.zeros((5, 5)))
+    with testing.raises(ValueError):
+        stats.mean(4)
+    with testing.raises(ValueError):
+        stats.mean((3, 3, 3))
+
+
 def test_niblack_sauvola_pathological_image():
     # For certain values, floating point error can cause
     # E(X^2) - (E(X))^2 to be negative, and taking the square root of this
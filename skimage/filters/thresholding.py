@@ -5,13 +5,13 @@ from scipy import ndimage as ndi
 from collections import OrderedDict
 from collections.abc import Iterable
 from ..exposure import histogram
-from .._shared.utils import check_nD, warn
+from .._shared.utils import check_nD, warn, _to_np_mode
 from ..transform import integral_image
 from ..util import dtype_limits
 from ..filters._multiotsu import (_get_multiotsu_thresh_indices_lut,
                                   _get_multiotsu_thresh_indices)
 
-from ._sparse import _validate_window_size, _correlate_sparse
+from ._sparse import _validate_window_size
 
 
 __all__ = ['try_all_threshold',
@@ -25,6 +25,7 @@ __all__ = ['try_all_threshold',
            'threshold_niblack',
            'threshold_sauvola',
            'threshold_triangle',
+           'WindowStatistics',
            'apply_hysteresis_threshold',
            'threshold_multiotsu']
 
@@ -153,8 +154,11 @@ def threshold_local(image, block_size, method='gaussian', offset=0,
 
     Parameters
     ----------
-    image : (N, M[, ..., P]) ndarray
-        Grayscale input image.
+    image : (N, M[, ..., P]) ndarray or WindowStatistics
+        Grayscale input image. With the 'mean' method, the precomputed
+        statistics of the image (see :class:`WindowStatistics`) can be
+        given instead to reuse them; their boundary mode is then used
+        instead of ``mode`` and ``cval``.
     block_size : int or sequence of int
         Odd size of pixel neighborhood which is used to calculate the
         threshold value (e.g. 3, 5, 7, ..., 21, ...).
@@ -206,6 +210,9 @@ def threshold_local(image, block_size, method='gaussian', offset=0,
     ...                                         param=func)
 
     """
+    stats = None
+    if isinstance(image, WindowStatistics):
+        stats, image = image, image.image
     if np.isscalar(block_size):
         block_size = (block_size,) * image.ndim
     elif len(block_size) != image.ndim:
@@ -227,8 +234,11 @@ def threshold_local(image, block_size, method='gaussian', offset=0,
         ndi.gaussian_filter(image, sigma, output=thresh_image, mode=mode,
                             cval=cval)
     elif method == 'mean':
-        ndi.uniform_filter(image, block_size, output=thresh_image, mode=mode,
-                           cval=cval)
+        if stats is not None:
+            thresh_image = stats.mean(block_size)
+        else:
+            ndi.uniform_filter(image, block_size, output=thresh_image,
+                               mode=mode, cval=cval)
     elif method == 'median':
         ndi.median_filter(image, block_size, output=thresh_image, mode=mode,
                           cval=cval)
@@ -910,6 +920,180 @@ def threshold_triangle(image, nbins=256):
     return bin_centers[arg_level]
 
 
+class WindowStatistics:
+    """Local mean and standard deviation over rectangular windows.
+
+    Summed-area tables (integral images) of the image and of its square are
+    computed once; the local mean and standard deviation for any odd window
+    size are then obtained in constant time per pixel, whatever the window
+    size. An instance can be passed in place of the image to
+    :func:`threshold_niblack`, :func:`threshold_sauvola` and
+    :func:`threshold_local` (with ``method='mean'``) to share the tables
+    between calls with different window sizes.
+
+    Parameters
+    ----------
+    image : (N, M[, ..., P]) ndarray
+        Grayscale input image.
+    max_window_size : int, or iterable of int, optional
+        Largest window size that will be requested. The tables are padded
+        to cover it. If a larger window is requested later, the tables are
+        recomputed with a larger padding.
+    mode : {'reflect', 'constant', 'nearest', 'mirror', 'wrap'}, optional
+        How the image is extended past its borders, as in
+        `scipy.ndimage.uniform_filter`. ``threshold_niblack`` and
+        ``threshold_sauvola`` use ``'mirror'``.
+    cval : float, optional
+        Value to fill past edges of input if mode is 'constant'.
+
+    Attributes
+    ----------
+    image : ndarray
+        The input image.
+
+    References
+    ----------
+    .. [1] F. Shafait, D. Keysers, and T. M. Breuel, "Efficient
+           implementation of local adaptive thresholding techniques
+           using integral images." in Document Recognition and
+           Retrieval XV, (San Jose, USA), Jan. 2008.
+           :DOI:`10.1117/12.767755`
+
+    Examples
+    --------
+    >>> from skimage import data
+    >>> image = data.page()
+    >>> stats = WindowStatistics(image, max_window_size=51, mode='mirror')
+    >>> thresholds = [threshold_sauvola(stats, window_size=w)
+    ...               for w in range(11, 52, 10)]
+    """
+
+    def __init__(self, image, max_window_size=None, *, mode='reflect',
+                 cval=0):
+        self.image = np.asarray(image)
+        self.mode = mode
+        self.cval = cval
+        # Tables are built from the image minus its rounded mean, which
+        # reduces the cancellation error of large box sums of squares while
+        # keeping the sums of integer images exact.
+        self._shift = float(np.round(np.mean(self.image))) \
+            if self.image.size else 0.
+        self._half = (-1,) * self.image.ndim
+        self._integral = None
+        self._integral_sq = None
+        if max_window_size is not None:
+            self._build(self._window_shape(max_window_size))
+
+    def _window_shape(self, window_size):
+        if not isinstance(window_size, Iterable):
+            window_size = (window_size,) * self.image.ndim
+        window_size = tuple(int(w) for w in window_size)
+        if len(window_size) != self.image.ndim:
+            raise ValueError("The window size must have one value per "
+                             "image dimension.")
+        _validate_window_size(window_size)
+        return window_size
+
+    def _build(self, window_size):
+        """Compute the tables for windows up to `window_size`."""
+        half = tuple(max(w // 2, h) for w, h in zip(window_size, self._half))
+        pad_width = tuple((h + 1, h) for h in half)
+        np_mode = _to_np_mode(self.mode)
+        kwargs = {'constant_values': self.cval} if np_mode == 'constant' \
+            else {}
+        padded = np.pad(self.image.astype(np.float64), pad_width,
+                        mode=np_mode, **kwargs)
+        padded -= self._shift
+        self._integral = integral_image(padded)
+        padded *= padded
+        self._integral_sq = integral_image(padded)
+        self._half = half
+
+    def _box_mean(self, table, window_size):
+        """Mean of the tabulated values in the window around each pixel."""
+        shape = self.image.shape
+        # for each axis, the start of the views at the lower and upper corner
+        # of the window
+        starts = [(h_max - w // 2, h_max + 1 + w // 2)
+                  for w, h_max in zip(window_size, self._half)]
+        out = None
+        for corner in itertools.product((0, 1), repeat=self.image.ndim):
+            view = table[tuple(slice(start[c], start[c] + n)
+                               for start, c, n in zip(starts, corner, shape))]
+            if out is None:
+                # the first corner is the lower one on every axis
+                out = view.copy()
+                if self.image.ndim % 2:
+                    np.negative(out, out=out)
+            elif (self.image.ndim - sum(corner)) % 2:
+                out -= view
+            else:
+                out += view
+        out /= np.prod(window_size)
+        return out
+
+    def _ensure(self, window_size):
+        window_size = self._window_shape(window_size)
+        if (self._integral is None
+                or any(w // 2 > h for w, h in zip(window_size, self._half))):
+            self._build(window_size)
+        return window_size
+
+    def mean(self, window_size):
+        """Local mean of each pixel.
+
+        Parameters
+        ----------
+        window_size : int, or iterable of int
+            Window size specified as a single odd integer (3, 5, 7, …),
+            or an iterable of length ``image.ndim`` containing only odd
+            integers (e.g. ``(1, 5, 5)``).
+
+        Returns
+        -------
+        m : ndarray of float, same shape as ``image``
+            Local mean of the image.
+        """
+        window_size = self._ensure(window_size)
+        m = self._box_mean(self._integral, window_size)
+        m += self._shift
+        return m
+
+    def mean_std(self, window_size):
+        """Local mean and standard deviation of each pixel.
+
+        Parameters
+        ----------
+        window_size : int, or iterable of int
+            Window size specified as a single odd integer (3, 5, 7, …),
+            or an iterable of length ``image.ndim`` containing only odd
+            integers (e.g. ``(1, 5, 5)``).
+
+        Returns
+        -------
+        m : ndarray of float, same shape as ``image``
+            Local mean of the image.
+        s : ndarray of float, same shape as ``image``
+            Local standard deviation of the image.
+        """
+        window_size = self._ensure(window_size)
+        m = self._box_mean(self._integral, window_size)
+        g2 = self._box_mean(self._integral_sq, window_size)
+        # Note: we use np.clip because g2 is not guaranteed to be greater than
+        # m*m when floating point error is considered
+        g2 -= m * m
+        s = np.sqrt(np.clip(g2, 0, None, out=g2), out=g2)
+        m += self._shift
+        return m, s
+
+
+def _window_statistics(image, window_size):
+    """Return `image` if it is a `WindowStatistics`, else its statistics."""
+    if isinstance(image, WindowStatistics):
+        return image
+    return WindowStatistics(image, window_size, mode='mirror')
+
+
 def _mean_std(image, w):
     """Return local mean and standard deviation of each pixel using a
     neighborhood defined by a rectangular window size ``w``.
@@ -931,44 +1115,8 @@ def _mean_std(image, w):
         Local mean of the image.
     s : ndarray of float, same shape as ``image``
         Local standard deviation of the image.
-
-    References
-    ----------
-    .. [1] F. Shafait, D. Keysers, and T. M. Breuel, "Efficient
-           implementation of local adaptive thresholding techniques
-           using integral images." in Document Recognition and
-           Retrieval XV, (San Jose, USA), Jan. 2008.
-           :DOI:`10.1117/12.767755`
     """
-    if not isinstance(w, Iterable):
-        w = (w,) * image.ndim
-    _validate_window_size(w)
-
-    pad_width = tuple((k // 2 + 1, k // 2) for k in w)
-    padded = np.pad(image.astype('float'), pad_width,
-                    mode='reflect')
-
-    integral = integral_image(padded)
-    padded *= padded
-    integral_sq = integral_image(padded)
-
-    # Create lists of non-zero kernel indices and values
-    kernel_indices = list(itertools.product(*tuple([(0, _w) for _w in w])))
-    kernel_values = [(-1) ** (image.ndim % 2 != np.sum(indices) % 2)
-                     for indices in kernel_indices]
-
-    total_window_size = np.prod(w)
-    kernel_shape = tuple(_w + 1 for _w in w)
-    m = _correlate_sparse(integral, kernel_shape, kernel_indices,
-                          kernel_values)
-    m /= total_window_size
-    g2 = _correlate_sparse(integral_sq, kernel_shape, kernel_indices,
-                           kernel_values)
-    g2 /= total_window_size
-    # Note: we use np.clip because g2 is not guaranteed to be greater than
-    # m*m when floating point error is considered
-    s = np.sqrt(np.clip(g2 - m * m, 0, None))
-    return m, s
+    return _window_statistics(image, w).mean_std(w)
 
 
 def threshold_niblack(image, window_size=15, k=0.2):
@@ -986,8 +1134,9 @@ def threshold_niblack(image, window_size=15, k=0.2):
 
     Parameters
     ----------
-    image : (N, M[, ..., P]) ndarray
-        Grayscale input image.
+    image : (N, M[, ..., P]) ndarray or WindowStatistics
+        Grayscale input image, or the precomputed statistics of the image
+        (see :class:`WindowStatistics`), which are then reused.
     window_size : int, or iterable of int, optional
         Window size specified as a single odd integer (3, 5, 7, …),
         or an iterable of length ``image.ndim`` containing only odd
@@ -1005,6 +1154,11 @@ def threshold_niblack(image, window_size=15, k=0.2):
     -----
     This algorithm is originally designed for text recognition.
 
+    The local mean and standard deviation are computed from summed-area
+    tables, in constant time per pixel for any window size. The image is
+    mirrored past its borders (``mode='mirror'`` in
+    :class:`WindowStatistics`).
+
     The Bradley threshold is a particular case of the Niblack
     one, being equivalent to
 
@@ -1030,7 +1184,7 @@ def threshold_niblack(image, window_size=15, k=0.2):
     >>> image = data.page()
     >>> threshold_image = threshold_niblack(image, window_size=7, k=0.1)
     """
-    m, s = _mean_std(image, window_size)
+    m, s = _window_statistics(image, window_size).mean_std(window_size)
     return m - k * s
 
 
@@ -1051,8 +1205,9 @@ def threshold_sauvola(image, window_size=15, k=0.2, r=None):
 
     Parameters
     ----------
-    image : (N, M[, ..., P]) ndarray
-        Grayscale input image.
+    image : (N, M[, ..., P]) ndarray or WindowStatistics
+        Grayscale input image, or the precomputed statistics of the image
+        (see :class:`WindowStatistics`), which are then reused.
     window_size : int, or iterable of int, optional
         Window size specified as a single odd integer (3, 5, 7, …),
         or an iterable of length ``image.ndim`` containing only odd
@@ -1073,6 +1228,11 @@ def threshold_sauvola(image, window_size=15, k=0.2, r=None):
     -----
     This algorithm is originally designed for text recognition.
 
+    The local mean and standard deviation are computed from summed-area
+    tables, in constant time per pixel for any window size. The image is
+    mirrored past its borders (``mode='mirror'`` in
+    :class:`WindowStatistics`).
+
     References
     ----------
     .. [1] J. Sauvola and M. Pietikainen, "Adaptive document image
@@ -1087,10 +1247,11 @@ def threshold_sauvola(image, window_size=15, k=0.2, r=None):
     >>> t_sauvola = threshold_sauvola(image, window_size=15, k=0.2)
     >>> binary_image = image > t_sauvola
     """
+    stats = _window_statistics(image, window_size)
     if r is None:
-        imin, imax = dtype_limits(image, clip_negative=False)
+        imin, imax = dtype_limits(stats.image, clip_negative=False)
         r = 0.5 * (imax - imin)
-    m, s = _mean_std(image, window_size)
+    m, s = stats.mean_std(window_size)
     return m * (1 + k * ((s / r) - 1))
 
 
@@ -5,10 +5,18 @@ path**. Therefore, use the functions herein with care, and do not use them in
 production code that will depend on updated skimage versions.
 """
 
-from . import graph
-from .manual_segmentation import manual_polygon_segmentation
-from .manual_segmentation import manual_lasso_segmentation
-from .trainable_segmentation import fit_segmenter, predict_segmenter, TrainableSegmenter
+from .._shared import lazy
+
+__getattr__, __dir__ = lazy.attach(
+    __name__,
+    submodules={'graph', 'manual_segmentation', 'trainable_segmentation'},
+    submod_attrs={
+        'manual_segmentation': ['manual_polygon_segmentation',
+                                'manual_lasso_segmentation'],
+        'trainable_segmentation': ['fit_segmenter', 'predict_segmenter',
+                                   'TrainableSegmenter'],
+    }
+)
 
 
 __all__ = [
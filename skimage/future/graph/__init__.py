@@ -1,6 +1,7 @@
 from .graph_cut import cut_threshold, cut_normalized
-from .rag import rag_mean_color, RAG, show_rag, rag_boundary
-from .graph_merge import merge_hierarchical
+from .rag import rag_mean_color, RAG, ArrayRAG, show_rag, rag_boundary
+from .graph_merge import (merge_hierarchical, merge_hierarchical_tree,
+                          MergeTree)
 ncut = cut_normalized
 
 __all__ = ['rag_mean_color',
@@ -9,5 +10,8 @@ __all__ = ['rag_mean_color',
            'ncut',
            'show_rag',
            'merge_hierarchical',
+           'merge_hierarchical_tree',
+           'MergeTree',
            'rag_boundary',
-           'RAG']
+           'RAG',
+           'ArrayRAG']
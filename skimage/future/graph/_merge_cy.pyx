@@ -0,0 +1,315 @@
+# cython: cdivision=True
+# cython: boundscheck=False
+# cython: nonecheck=False
+# cython: wraparound=False
+cimport numpy as cnp
+import numpy as np
+from libc.math cimport sqrt
+cnp.import_array()
+
+
+cdef enum:
+    MEAN_COLOR = 0
+    BOUNDARY = 1
+
+
+cdef class _IndexedHeap:
+    """Binary min-heap of the edges of a graph, keyed by their weight.
+
+    The position of each edge in the heap is tracked, so that the weight of
+    any edge can be changed, and any edge removed, in logarithmic time.
+    Ties are broken by edge index, for reproducibility.
+    """
+    cdef Py_ssize_t[::1] heap
+    cdef Py_ssize_t[::1] pos
+    cdef double[::1] keys
+    cdef Py_ssize_t size
+
+    def __init__(self, double[::1] keys):
+        cdef Py_ssize_t i
+        self.keys = keys
+        self.size = keys.shape[0]
+        self.heap = np.arange(self.size, dtype=np.intp)
+        self.pos = np.arange(self.size, dtype=np.intp)
+        for i in range(self.size // 2 - 1, -1, -1):
+            self._sift_down(i)
+
+    cdef inline bint _less(self, Py_ssize_t a, Py_ssize_t b) nogil:
+        return (self.keys[a] < self.keys[b]
+                or (self.keys[a] == self.keys[b] and a < b))
+
+    cdef void _sift_up(self, Py_ssize_t i) nogil:
+        cdef Py_ssize_t e = self.heap[i]
+        cdef Py_ssize_t parent
+        while i > 0:
+            parent = (i - 1) // 2
+            if not self._less(e, self.heap[parent]):
+                break
+            self.heap[i] = self.heap[parent]
+            self.pos[self.heap[i]] = i
+            i = parent
+        self.heap[i] = e
+        self.pos[e] = i
+
+    cdef void _sift_down(self, Py_ssize_t i) nogil:
+        cdef Py_ssize_t e = self.heap[i]
+        cdef Py_ssize_t child
+        while True:
+            child = 2 * i + 1
+            if child >= self.size:
+                break
+            if (child + 1 < self.size
+                    and self._less(self.heap[child + 1], self.heap[child])):
+                child += 1
+            if not self._less(self.heap[child], e):
+                break
+            self.heap[i] = self.heap[child]
+            self.pos[self.heap[i]] = i
+            i = child
+        self.heap[i] = e
+        self.pos[e] = i
+
+    cdef inline Py_ssize_t top(self) nogil:
+        return self.heap[0]
+
+    cdef Py_ssize_t pop(self) nogil:
+        cdef Py_ssize_t e = self.heap[0]
+        self.remove(e)
+        return e
+
+    cdef void remove(self, Py_ssize_t e) nogil:
+        cdef Py_ssize_t i = self.pos[e]
+        cdef Py_ssize_t last
+        self.size -= 1
+        self.pos[e] = -1
+        if i == self.size:
+            return
+        last = self.heap[self.size]
+        self.heap[i] = last
+        self.pos[last] = i
+        self._sift_up(i)
+        self._sift_down(self.pos[last])
+
+    cdef void update(self, Py_ssize_t e, double key) nogil:
+        self.keys[e] = key
+        self._sift_up(self.pos[e])
+        self._sift_down(self.pos[e])
+
+
+cdef class _Adjacency:
+    """Adjacency lists of a graph whose nodes are merged.
+
+    Edge ``e`` is made of the half-edges ``2 * e`` and ``2 * e + 1``, each in
+    the doubly linked list of one of its ends, so that edges are moved from
+    a node to another, or removed, in constant time.
+    """
+    cdef Py_ssize_t[::1] head
+    cdef Py_ssize_t[::1] nxt
+    cdef Py_ssize_t[::1] prv
+    cdef Py_ssize_t[::1] owner
+    cdef Py_ssize_t[::1] degree
+
+    def __init__(self, Py_ssize_t n_nodes, Py_ssize_t[:, ::1] edges):
+        cdef Py_ssize_t e
+        self.head = np.full(n_nodes, -1, dtype=np.intp)
+        self.nxt = np.empty(2 * edges.shape[0], dtype=np.intp)
+        self.prv = np.empty(2 * edges.shape[0], dtype=np.intp)
+        self.owner = np.empty(2 * edges.shape[0], dtype=np.intp)
+        self.degree = np.zeros(n_nodes, dtype=np.intp)
+        for e in range(edges.shape[0]):
+            self.link(2 * e, edges[e, 0])
+            self.link(2 * e + 1, edges[e, 1])
+
+    cdef void link(self, Py_ssize_t h, Py_ssize_t node) nogil:
+        self.owner[h] = node
+        self.prv[h] = -1
+        self.nxt[h] = self.head[node]
+        if self.head[node] >= 0:
+            self.prv[self.head[node]] = h
+        self.head[node] = h
+        self.degree[node] += 1
+
+    cdef void unlink(self, Py_ssize_t h) nogil:
+        if self.prv[h] >= 0:
+            self.nxt[self.prv[h]] = self.nxt[h]
+        else:
+            self.head[self.owner[h]] = self.nxt[h]
+        if self.nxt[h] >= 0:
+            self.prv[self.nxt[h]] = self.prv[h]
+        self.degree[self.owner[h]] -= 1
+
+
+cdef inline double _color_distance(double[:, ::1] mean_color, Py_ssize_t a,
+                                   Py_ssize_t b) nogil:
+    cdef double diff, total = 0
+    cdef Py_ssize_t c
+    for c in range(mean_color.shape[1]):
+        diff = mean_color[a, c] - mean_color[b, c]
+        total += diff * diff
+    return sqrt(total)
+
+
+def _merge_tree(Py_ssize_t n_nodes, Py_ssize_t[:, ::1] edges,
+                double[::1] weights, double thresh, int weight_mode,
+                double[:, ::1] total_color=None, double[::1] pixel_count=None,
+                double[::1] edge_count=None):
+    """Greedily merge the nodes joined by the edge of smallest weight.
+
+    Parameters
+    ----------
+    n_nodes : int
+        Number of nodes of the graph.
+    edges : (E, 2) array of intp
+        The two ends of each edge.
+    weights : (E,) array of float64
+        Initial edge weights. Modified in place.
+    thresh : float
+        Merging stops when the smallest weight is not less than `thresh`.
+    weight_mode : int
+        ``MEAN_COLOR`` (0): the weight of an edge is the Euclidean distance
+        between the mean colors of its ends, recomputed for all the edges of
+        a merged node. ``BOUNDARY`` (1): the weight is the mean along the
+        boundary, and the weights of the two edges joining the merged nodes
+        to a common neighbor are averaged, weighted by their counts.
+    total_color : (N, C) array of float64, optional
+        Sum of the colors of the pixels of each node, for ``MEAN_COLOR``.
+        Modified in place.
+    pixel_count : (N,) array of float64, optional
+        Number of pixels of each node, for ``MEAN_COLOR``. Modified in place.
+    edge_count : (E,) array of float64, optional
+        Number of boundary pixels of each edge, for ``BOUNDARY``. Modified in
+        place.
+
+    Returns
+    -------
+    merges : (M, 2) array of intp
+        For each merge, in order, the merged node and the node it is merged
+        into, which represents both afterwards.
+    merge_weights : (M,) array of float64
+        Weight of the edge joining the two nodes when merged.
+    exhausted : bool
+        True if merging stopped because no edges remained.
+    """
+    cdef _IndexedHeap heap = _IndexedHeap(weights)
+    cdef _Adjacency adj = _Adjacency(n_nodes, edges)
+    cdef Py_ssize_t[::1] mark = np.full(n_nodes, -1, dtype=np.intp)
+    cdef Py_ssize_t[:, ::1] merges = np.empty((max(n_nodes - 1, 0), 2),
+                                              dtype=np.intp)
+    cdef double[::1] merge_weights = np.empty(max(n_nodes - 1, 0))
+    cdef double[:, ::1] mean_color
+    cdef Py_ssize_t n_merges = 0
+    cdef Py_ssize_t e, e1, h, h_next, a, b, src, dst, n, c
+    cdef double count
+
+    if weight_mode == MEAN_COLOR:
+        mean_color = np.asarray(total_color) / np.asarray(pixel_count)[:, None]
+
+    with nogil:
+        while heap.size > 0 and weights[heap.top()] < thresh:
+            e = heap.pop()
+            a = adj.owner[2 * e]
+            b = adj.owner[2 * e + 1]
+            adj.unlink(2 * e)
+            adj.unlink(2 * e + 1)
+            # move the shortest list of edges
+            if adj.degree[a] <= adj.degree[b]:
+                src, dst = a, b
+            else:
+                src, dst = b, a
+            merges[n_merges, 0] = src
+            merges[n_merges, 1] = dst
+            merge_weights[n_merges] = weights[e]
+            n_merges += 1
+
+            h = adj.head[dst]
+            while h >= 0:
+                mark[adj.owner[h ^ 1]] = h >> 1
+                h = adj.nxt[h]
+
+            h = adj.head[src]
+            while h >= 0:
+                h_next = adj.nxt[h]
+                n = adj.owner[h ^ 1]
+                e1 = mark[n]
+                if e1 >= 0:
+                    # both nodes are adjacent to `n`: keep a single edge
+                    if weight_mode == BOUNDARY:
+                        count = edge_count[e1] + edge_count[h >> 1]
+                        heap.update(e1, (weights[e1] * edge_count[e1]
+                                         + weights[h >> 1]
+                                         * edge_count[h >> 1]) / count)
+                        edge_count[e1] = count
+                    adj.unlink(h)
+                    adj.unlink(h ^ 1)
+                    heap.remove(h >> 1)
+                else:
+                    adj.unlink(h)
+                    adj.link(h, dst)
+                    mark[n] = h >> 1
+                h = h_next
+
+            if weight_mode == MEAN_COLOR:
+                pixel_count[dst] += pixel_count[src]
+                for c in range(total_color.shape[1]):
+                    total_color[dst, c] += total_color[src, c]
+                    mean_color[dst, c] = (total_color[dst, c]
+                                          / pixel_count[dst])
+
+            h = adj.head[dst]
+            while h >= 0:
+                n = adj.owner[h ^ 1]
+                mark[n] = -1
+                if weight_mode == MEAN_COLOR:
+                    heap.update(h >> 1, _color_distance(mean_color, dst, n))
+                h = adj.nxt[h]
+
+    return (np.asarray(merges[:n_merges]),
+            np.asarray(merge_weights[:n_merges]), heap.size == 0)
+
+
+cdef inline Py_ssize_t _find_root(Py_ssize_t[::1] parent,
+                                  Py_ssize_t i) nogil:
+    # path halving
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def _union_find_labels(Py_ssize_t n_nodes, Py_ssize_t[:, ::1] merges):
+    """Label the nodes of a graph after a sequence of merges.
+
+    Parameters
+    ----------
+    n_nodes : int
+        Number of nodes of the graph.
+    merges : (M, 2) array of intp
+        Pairs of nodes merged.
+
+    Returns
+    -------
+    node_labels : (N,) array of intp
+        Label of each node, from 0, consecutive, in the order of the smallest
+        node of each region.
+    """
+    cdef Py_ssize_t[::1] parent = np.arange(n_nodes, dtype=np.intp)
+    cdef Py_ssize_t[::1] node_labels = np.empty(n_nodes, dtype=np.intp)
+    cdef Py_ssize_t i, a, b, n_labels = 0
+
+    with nogil:
+        for i in range(merges.shape[0]):
+            a = _find_root(parent, merges[i, 0])
+            b = _find_root(parent, merges[i, 1])
+            # the smallest node is the root, so that it is labelled first
+            if a < b:
+                parent[b] = a
+            else:
+                parent[a] = b
+        for i in range(n_nodes):
+            a = _find_root(parent, i)
+            if a == i:
+                node_labels[i] = n_labels
+                n_labels += 1
+            else:
+                node_labels[i] = node_labels[a]
+    return np.asarray(node_labels)
@@ -23,10 +23,25 @@ def DW_matrices(graph):
     """
     # sparse.eighsh is most efficient with CSC-formatted input
     W = nx.to_scipy_sparse_matrix(graph, format='csc')
-    entries = W.sum(axis=0)
-    D = sparse.dia_matrix((entries, 0), shape=W.shape).tocsc()
+    return D_matrix(W), W
+
+
+def D_matrix(W):
+    """Returns the diagonal matrix of a graph from its weight matrix.
+
+    Parameters
+    ----------
+    W : csc_matrix
+        The weight matrix of the graph.
 
-    return D, W
+    Returns
+    -------
+    D : csc_matrix
+        The diagonal matrix of the graph. ``D[i, i]`` is the sum of weights of
+        all edges incident on `i`. All other entries are `0`.
+    """
+    entries = W.sum(axis=0)
+    return sparse.dia_matrix((entries, 0), shape=W.shape).tocsc()
 
 
 def ncut_cost(cut, D, W):
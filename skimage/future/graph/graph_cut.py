@@ -2,8 +2,11 @@ import networkx as nx
 import numpy as np
 from . import _ncut
 from . import _ncut_cy
+from .rag import ArrayRAG
 from ..._shared.utils import check_random_state
-from scipy.sparse import linalg
+from ...util._map_array import map_array
+from scipy import sparse
+from scipy.sparse import csgraph, linalg
 
 
 def cut_threshold(labels, rag, thresh, in_place=True):
@@ -17,7 +20,7 @@ def cut_threshold(labels, rag, thresh, in_place=True):
     ----------
     labels : ndarray
         The array of labels.
-    rag : RAG
+    rag : RAG or ArrayRAG
         The region adjacency graph.
     thresh : float
         The threshold. Regions connected by edges with smaller weights are
@@ -48,6 +51,9 @@ def cut_threshold(labels, rag, thresh, in_place=True):
            :DOI:`10.1109/83.841950`
 
     """
+    if isinstance(rag, ArrayRAG):
+        return _cut_threshold_array(labels, rag, thresh, in_place)
+
     if not in_place:
         rag = rag.copy()
 
@@ -61,13 +67,30 @@ def cut_threshold(labels, rag, thresh, in_place=True):
     # We construct an array which can map old labels to the new ones.
     # All the labels within a connected component are assigned to a single
     # label in the output.
-    map_array = np.arange(labels.max() + 1, dtype=labels.dtype)
+    in_labels = []
+    out_labels = []
     for i, nodes in enumerate(comps):
         for node in nodes:
-            for label in rag.nodes[node]['labels']:
-                map_array[label] = i
+            node_labels = rag.nodes[node]['labels']
+            in_labels.extend(node_labels)
+            out_labels.extend([i] * len(node_labels))
+
+    return map_array(labels, np.array(in_labels),
+                     np.array(out_labels, dtype=labels.dtype))
+
 
-    return map_array[labels]
+def _cut_threshold_array(labels, rag, thresh, in_place):
+    """`cut_threshold` of an `ArrayRAG`."""
+    cut = rag.edge_data['weight'] >= thresh
+    edges = rag.edges[~cut]
+    if in_place:
+        rag.remove_edges(cut)
+    n = rag.number_of_nodes()
+    adjacency = sparse.coo_matrix(
+        (np.ones(edges.shape[0], dtype=np.int8), (edges[:, 0], edges[:, 1])),
+        shape=(n, n))
+    _, components = csgraph.connected_components(adjacency, directed=False)
+    return map_array(labels, rag.nodes, components.astype(labels.dtype))
 
 
 def cut_normalized(labels, rag, thresh=0.001, num_cuts=10, in_place=True,
@@ -86,7 +109,7 @@ def cut_normalized(labels, rag, thresh=0.001, num_cuts=10, in_place=True,
     ----------
     labels : ndarray
         The array of labels.
-    rag : RAG
+    rag : RAG or ArrayRAG
         The region adjacency graph.
     thresh : float
         The threshold. A subgraph won't be further subdivided if the
@@ -95,7 +118,8 @@ def cut_normalized(labels, rag, thresh=0.001, num_cuts=10, in_place=True,
         The number or N-cuts to perform before determining the optimal one.
     in_place : bool
         If set, modifies `rag` in place. For each node `n` the function will
-        set a new attribute ``rag.nodes[n]['ncut label']``.
+        set a new attribute ``rag.nodes[n]['ncut label']``, or
+        ``rag.node_data['ncut label']`` for an `ArrayRAG`.
     max_edge : float, optional
         The maximum possible value of an edge in the RAG. This corresponds to
         an edge between identical regions. This is used to put self
@@ -129,6 +153,10 @@ def cut_normalized(labels, rag, thresh=0.001, num_cuts=10, in_place=True,
 
     """
     random_state = check_random_state(random_state)
+    if isinstance(rag, ArrayRAG):
+        return _cut_normalized_array(labels, rag, thresh, num_cuts, in_place,
+                                     max_edge, random_state)
+
     if not in_place:
         rag = rag.copy()
 
@@ -137,12 +165,30 @@ def cut_normalized(labels, rag, thresh=0.001, num_cuts=10, in_place=True,
 
     _ncut_relabel(rag, thresh, num_cuts, random_state)
 
-    map_array = np.zeros(labels.max() + 1, dtype=labels.dtype)
     # Mapping from old labels to new
+    in_labels = []
+    out_labels = []
     for n, d in rag.nodes(data=True):
-        map_array[d['labels']] = d['ncut label']
+        in_labels.extend(d['labels'])
+        out_labels.extend([d['ncut label']] * len(d['labels']))
+
+    return map_array(labels, np.array(in_labels),
+                     np.array(out_labels, dtype=labels.dtype))
 
-    return map_array[labels]
+
+def _cut_normalized_array(labels, rag, thresh, num_cuts, in_place, max_edge,
+                          random_state):
+    """`cut_normalized` of an `ArrayRAG`."""
+    n = rag.number_of_nodes()
+    # self edges, as added to a `RAG`
+    w = (rag.adjacency('weight', format='csc')
+         + max_edge * sparse.identity(n, format='csc'))
+    ncut_labels = np.empty(n, dtype=rag.nodes.dtype)
+    _ncut_relabel_matrix(w, np.arange(n), rag.nodes, ncut_labels, thresh,
+                         num_cuts, random_state)
+    if in_place:
+        rag.node_data['ncut label'] = ncut_labels
+    return map_array(labels, rag.nodes, ncut_labels.astype(labels.dtype))
 
 
 def partition_by_cut(cut, rag):
@@ -263,6 +309,81 @@ def _ncut_relabel(rag, thresh, num_cuts, random_state):
         Provides initial values for eigenvalue solver.
     """
     d, w = _ncut.DW_matrices(rag)
+    cut = _min_ncut(d, w, thresh, num_cuts, random_state)
+    if cut is not None:
+        # Sub divide and perform N-cut again
+        # Refer Shi & Malik 2001, Section 3.2.5, Page 893
+        sub1, sub2 = partition_by_cut(cut, rag)
+
+        _ncut_relabel(sub1, thresh, num_cuts, random_state)
+        _ncut_relabel(sub2, thresh, num_cuts, random_state)
+        return
+
+    # The N-cut wasn't small enough, or could not be computed.
+    # The remaining graph is a region.
+    # Assign `ncut label` by picking any label from the existing nodes, since
+    # `labels` are unique, `new_label` is also unique.
+    _label_all(rag, 'ncut label')
+
+
+def _ncut_relabel_matrix(w, indices, nodes, ncut_labels, thresh, num_cuts,
+                         random_state):
+    """Perform Normalized Graph cut on a weight matrix.
+
+    Same as `_ncut_relabel`, for the subgraph of an `ArrayRAG` given by its
+    weight matrix.
+
+    Parameters
+    ----------
+    w : csc_matrix
+        The weight matrix of the subgraph.
+    indices : array of int
+        Indices of the nodes of the subgraph in the graph.
+    nodes : array of int
+        Ids of the nodes of the graph.
+    ncut_labels : array of int
+        Output, the `ncut label` of each node of the graph.
+    thresh : float
+        The threshold. A subgraph won't be further subdivided if the
+        value of the N-cut exceeds `thresh`.
+    num_cuts : int
+        The number or N-cuts to perform before determining the optimal one.
+    random_state : RandomState instance
+        Provides initial values for eigenvalue solver.
+    """
+    cut = _min_ncut(_ncut.D_matrix(w), w, thresh, num_cuts, random_state)
+    if cut is not None:
+        for mask in (cut, ~cut):
+            _ncut_relabel_matrix(w[mask][:, mask], indices[mask], nodes,
+                                 ncut_labels, thresh, num_cuts, random_state)
+        return
+
+    # the nodes of an `ArrayRAG` are sorted, the first one is the smallest
+    ncut_labels[indices] = nodes[indices[0]]
+
+
+def _min_ncut(d, w, thresh, num_cuts, random_state):
+    """Bi-partition of a graph with a N-cut less than `thresh`, if any.
+
+    Parameters
+    ----------
+    d : csc_matrix
+        The diagonal matrix of the graph.
+    w : csc_matrix
+        The weight matrix of the graph.
+    thresh : float
+        The threshold. A subgraph won't be further subdivided if the
+        value of the N-cut exceeds `thresh`.
+    num_cuts : int
+        The number or N-cuts to perform before determining the optimal one.
+    random_state : RandomState instance
+        Provides initial values for eigenvalue solver.
+
+    Returns
+    -------
+    cut_mask : array of bool or None
+        The bi-partition, or None if the graph should not be subdivided.
+    """
     m = w.shape[0]
 
     if m > 2:
@@ -286,16 +407,6 @@ def _ncut_relabel(rag, thresh, num_cuts, random_state):
 
         cut_mask, mcut = get_min_ncut(ev, d, w, num_cuts)
         if (mcut < thresh):
-            # Sub divide and perform N-cut again
-            # Refer Shi & Malik 2001, Section 3.2.5, Page 893
-            sub1, sub2 = partition_by_cut(cut_mask, rag)
+            return cut_mask
 
-            _ncut_relabel(sub1, thresh, num_cuts, random_state)
-            _ncut_relabel(sub2, thresh, num_cuts, random_state)
-            return
-
-    # The N-cut wasn't small enough, or could not be computed.
-    # The remaining graph is a region.
-    # Assign `ncut label` by picking any label from the existing nodes, since
-    # `labels` are unique, `new_label` is also unique.
-    _label_all(rag, 'ncut label')
+    return None
@@ -1,6 +1,158 @@
 import numpy as np
 import heapq
 
+from . import _merge_cy
+from .rag import ArrayRAG
+from ...util._map_array import map_array
+
+_WEIGHT_MODES = {'mean color': 0, 'boundary': 1}
+
+
+class MergeTree:
+
+    """Sequence of merges performed by hierarchical merging.
+
+    Since merging greedily picks the edge of smallest weight, the merges
+    performed for a threshold are the ones preceding the first merge whose
+    weight is not less than it. The segmentation for any threshold up to
+    the one used to build the tree is therefore obtained with `cut`, without
+    merging again.
+
+    Parameters
+    ----------
+    nodes : (N,) array of int
+        Node ids, that is the labels of the initial regions.
+    merges : (M, 2) array of intp
+        Indices in `nodes` of the two nodes joined by each merge, in order.
+        Once merged, a region is represented by the second node.
+    weights : (M,) array of float
+        Weight of the edge joining the two nodes of each merge.
+    thresh : float
+        The threshold up to which merging was performed.
+
+    Attributes
+    ----------
+    nodes, merges, weights, thresh
+        As given above.
+    """
+
+    def __init__(self, nodes, merges, weights, thresh):
+        self.nodes = nodes
+        self.merges = merges
+        self.weights = weights
+        self.thresh = thresh
+
+    def __len__(self):
+        return self.merges.shape[0]
+
+    def node_labels(self, thresh):
+        """Region of each node after merging with a given threshold.
+
+        Parameters
+        ----------
+        thresh : float
+            Regions connected by an edge with weight smaller than `thresh`
+            are merged. It cannot exceed the threshold of the tree.
+
+        Returns
+        -------
+        node_labels : (N,) array of intp
+            Label of the region of each node, from 0, consecutive.
+        """
+        if thresh > self.thresh:
+            raise ValueError(f'The merge tree was built up to a threshold of '
+                             f'{self.thresh}, it cannot be cut at {thresh}.')
+        stop = np.flatnonzero(self.weights >= thresh)
+        stop = stop[0] if stop.size else len(self)
+        return _merge_cy._union_find_labels(self.nodes.shape[0],
+                                            self.merges[:stop])
+
+    def cut(self, labels, thresh):
+        """Relabel an image after merging with a given threshold.
+
+        Parameters
+        ----------
+        labels : ndarray
+            The array of labels the graph was built from.
+        thresh : float
+            Regions connected by an edge with weight smaller than `thresh`
+            are merged. It cannot exceed the threshold of the tree.
+
+        Returns
+        -------
+        out : ndarray
+            The new labeled array.
+        """
+        return map_array(labels, self.nodes, self.node_labels(thresh))
+
+
+def merge_hierarchical_tree(rag, thresh=np.inf, weight_func='mean color'):
+    """Perform hierarchical merging of an `ArrayRAG` and record the merges.
+
+    Greedily merges the most similar pair of nodes until no edges lower than
+    `thresh` remain, like `merge_hierarchical`, with a compiled engine: an
+    indexed heap of the edges, updated as their weights change, and
+    adjacency lists in arrays.
+
+    Parameters
+    ----------
+    rag : ArrayRAG
+        The Region Adjacency Graph. It is not modified.
+    thresh : float, optional
+        Regions connected by an edge with weight smaller than `thresh` are
+        merged. By default, merging continues until no edges remain.
+    weight_func : {'mean color', 'boundary'}, optional
+        The weight of the edges incident on merged nodes.
+
+            'mean color' : The Euclidean distance between the mean colors of
+            the regions, as in the graph built by `rag_mean_color` with
+            ``backend='array'``, whose node attributes ``'total color'`` and
+            ``'pixel count'`` are used.
+
+            'boundary' : The mean of the edge map along the boundary, as in
+            the graph built by `rag_boundary` with ``backend='array'``, whose
+            edge attribute ``'count'`` is used.
+
+    Returns
+    -------
+    tree : MergeTree
+        The merges performed, from which `MergeTree.cut` computes the
+        segmentation for any threshold up to `thresh`.
+
+    Examples
+    --------
+    >>> from skimage import data, segmentation
+    >>> from skimage.future import graph
+    >>> img = data.astronaut()
+    >>> labels = segmentation.slic(img)
+    >>> rag = graph.rag_mean_color(img, labels, backend='array')
+    >>> tree = graph.merge_hierarchical_tree(rag)
+    >>> coarse = tree.cut(labels, 40)
+    >>> fine = tree.cut(labels, 20)
+    """
+    if not isinstance(rag, ArrayRAG):
+        raise ValueError('A compiled `weight_func` requires an `ArrayRAG`, '
+                         'see the `backend` parameter of the RAG builders.')
+    if weight_func not in _WEIGHT_MODES:
+        raise ValueError(f"The weight function '{weight_func}' is not "
+                         f"recognised")
+    kwargs = {}
+    if weight_func == 'mean color':
+        kwargs['total_color'] = np.array(
+            rag.node_data['total color'], dtype=np.double, order='C', ndmin=2)
+        kwargs['pixel_count'] = np.array(rag.node_data['pixel count'],
+                                         dtype=np.double)
+    else:
+        kwargs['edge_count'] = np.array(rag.edge_data['count'],
+                                        dtype=np.double)
+    merges, weights, exhausted = _merge_cy._merge_tree(
+        rag.number_of_nodes(), np.ascontiguousarray(rag.edges, dtype=np.intp),
+        np.array(rag.edge_data['weight'], dtype=np.double), thresh,
+        _WEIGHT_MODES[weight_func], **kwargs)
+    # without edges left, merging would go on the same for any threshold
+    return MergeTree(rag.nodes, merges, weights,
+                     np.inf if exhausted else thresh)
+
 
 def _revalidate_node_edges(rag, node, heap_list):
     """Handles validation and invalidation of edges incident to a node.
@@ -67,24 +219,30 @@ def merge_hierarchical(labels, rag, thresh, rag_copy, in_place_merge,
     ----------
     labels : ndarray
         The array of labels.
-    rag : RAG
-        The Region Adjacency Graph.
+    rag : RAG or ArrayRAG
+        The Region Adjacency Graph. With callbacks, an `ArrayRAG` is
+        converted with `ArrayRAG.to_networkx`, as they use the `RAG`
+        interface.
     thresh : float
         Regions connected by an edge with weight smaller than `thresh` are
         merged.
     rag_copy : bool
-        If set, the RAG copied before modifying.
+        If set, the RAG copied before modifying. An `ArrayRAG` is never
+        modified.
     in_place_merge : bool
         If set, the nodes are merged in place. Otherwise, a new node is
         created for each merge..
-    merge_func : callable
+    merge_func : callable or None
         This function is called before merging two nodes. For the RAG `graph`
         while merging `src` and `dst`, it is called as follows
-        ``merge_func(graph, src, dst)``.
-    weight_func : callable
+        ``merge_func(graph, src, dst)``. Not used if `weight_func` is a
+        string.
+    weight_func : callable or {'mean color', 'boundary'}
         The function to compute the new weights of the nodes adjacent to the
         merged node. This is directly supplied as the argument `weight_func`
-        to `merge_nodes`.
+        to `merge_nodes`. A string selects a compiled weight function for an
+        `ArrayRAG`, see `merge_hierarchical_tree`, which avoids calling
+        Python code for each merge.
 
     Returns
     -------
@@ -92,7 +250,13 @@ def merge_hierarchical(labels, rag, thresh, rag_copy, in_place_merge,
         The new labeled array.
 
     """
-    if rag_copy:
+    if isinstance(weight_func, str):
+        tree = merge_hierarchical_tree(rag, thresh, weight_func)
+        return tree.cut(labels, thresh)
+
+    if isinstance(rag, ArrayRAG):
+        rag = rag.to_networkx()
+    elif rag_copy:
         rag = rag.copy()
 
     edge_heap = []
@@ -129,9 +293,11 @@ def merge_hierarchical(labels, rag, thresh, rag_copy, in_place_merge,
             new_id = rag.merge_nodes(src, dst, weight_func)
             _revalidate_node_edges(rag, new_id, edge_heap)
 
-    label_map = np.arange(labels.max() + 1)
+    in_labels = []
+    out_labels = []
     for ix, (n, d) in enumerate(rag.nodes(data=True)):
-        for label in d['labels']:
-            label_map[label] = ix
+        in_labels.extend(d['labels'])
+        out_labels.extend([ix] * len(d['labels']))
 
-    return label_map[labels]
+    return map_array(labels, np.array(in_labels),
+                     np.array(out_labels, dtype=np.intp))
@@ -292,8 +292,246 @@ class RAG(nx.Graph):
         super(RAG, self).add_node(n)
 
 
+# number of pixels compared at once when looking for adjacent regions
+_CHUNK_SIZE = 2**20
+
+
+def _label_indices(labels):
+    """Sorted distinct values of a label image, and their index at each pixel.
+
+    Parameters
+    ----------
+    labels : ndarray of int
+        The labelled image.
+
+    Returns
+    -------
+    nodes : (N,) array
+        The distinct values of `labels`, in increasing order.
+    index_image : ndarray of intp
+        Array of the same shape as `labels`, holding the index in `nodes` of
+        the label of each pixel.
+    """
+    flat = labels.ravel()
+    if flat.size and flat.min() >= 0 and flat.max() < 2 * flat.size:
+        # small non-negative labels: a lookup table avoids sorting the image
+        present = np.bincount(flat) > 0
+        nodes = np.flatnonzero(present).astype(labels.dtype)
+        lut = np.cumsum(present) - 1
+        index_image = lut[flat]
+    else:
+        nodes, index_image = np.unique(flat, return_inverse=True)
+    return nodes, index_image.reshape(labels.shape)
+
+
+def _adjacent_pairs(index_image, connectivity):
+    """Distinct pairs of different values held by neighboring pixels.
+
+    Parameters
+    ----------
+    index_image : ndarray of intp
+        Node index of each pixel, as returned by `_label_indices`.
+    connectivity : int in {1, ..., ``index_image.ndim``}
+        The connectivity between pixels.
+
+    Returns
+    -------
+    edges : (E, 2) array of intp
+        The pairs ``(i, j)``, with ``i < j``, in lexicographic order.
+    """
+    n_nodes = int(index_image.max()) + 1 if index_image.size else 0
+    fp = ndi.generate_binary_structure(index_image.ndim, connectivity)
+    keys = [np.empty(0, dtype=np.int64)]
+    for offset in np.argwhere(fp) - 1:
+        # the footprint is symmetric: visit each pair of neighbors once
+        if tuple(offset.tolist()) <= (0,) * index_image.ndim:
+            continue
+        src = tuple(slice(max(0, -o), s - max(0, o))
+                    for o, s in zip(offset, index_image.shape))
+        dst = tuple(slice(max(0, o), s - max(0, -o))
+                    for o, s in zip(offset, index_image.shape))
+        src_image = index_image[src]
+        dst_image = index_image[dst]
+        # bound the temporaries by working on slabs along the first axis
+        step = max(1, _CHUNK_SIZE // max(1, src_image[0].size))
+        for start in range(0, src_image.shape[0], step):
+            a = src_image[start:start + step]
+            b = dst_image[start:start + step]
+            different = a != b
+            a = a[different]
+            b = b[different]
+            key = np.minimum(a, b).astype(np.int64, copy=False)
+            key *= n_nodes
+            key += np.maximum(a, b)
+            # deduplicate early, as most boundary pixels repeat an edge
+            keys.append(np.unique(key))
+    keys = np.unique(np.concatenate(keys))
+    return np.stack(np.divmod(keys, max(n_nodes, 1)), axis=1).astype(np.intp)
+
+
+class ArrayRAG:
+
+    """
+    The Region Adjacency Graph (RAG) of an image, stored in NumPy arrays.
+
+    Unlike `RAG`, nodes and edges are not Python objects: the graph is an
+    edge list, with node and edge attributes held in arrays, so that it is
+    built with array operations and takes a few tens of bytes per edge.
+    `cut_threshold`, `cut_normalized` and `merge_hierarchical` accept it in
+    place of a `RAG`, which can be obtained with `to_networkx`.
+
+    Parameters
+    ----------
+    label_image : array of int, optional
+        An initial segmentation, with each region labeled as a different
+        integer. Every unique value in ``label_image`` will correspond to
+        a node in the graph.
+    connectivity : int in {1, ..., ``label_image.ndim``}, optional
+        The connectivity between pixels in ``label_image``. For a 2D image,
+        a connectivity of 1 corresponds to immediate neighbors up, down,
+        left, and right, while a connectivity of 2 also includes diagonal
+        neighbors. See `scipy.ndimage.generate_binary_structure`.
+    nodes : (N,) array of int, optional
+        Node ids, in increasing order, used if `label_image` is not given.
+    edges : (E, 2) array of int, optional
+        Edges as pairs of indices into `nodes`, used if `label_image` is not
+        given.
+
+    Attributes
+    ----------
+    nodes : (N,) array of int
+        Node ids, that is the labels of the regions, in increasing order.
+    edges : (E, 2) array of intp
+        Indices in `nodes` of the two ends of each edge, the first one being
+        smaller, in lexicographic order for graphs built from an image.
+    node_data : dict
+        Node attributes, as arrays whose first dimension has length N.
+    edge_data : dict
+        Edge attributes, as arrays whose first dimension has length E, for
+        instance ``edge_data['weight']``.
+
+    Examples
+    --------
+    >>> labels = np.array([[1, 1, 2],
+    ...                    [3, 3, 2]])
+    >>> rag = ArrayRAG(labels)
+    >>> rag.nodes
+    array([1, 2, 3])
+    >>> rag.nodes[rag.edges]
+    array([[1, 2],
+           [1, 3],
+           [2, 3]])
+    """
+
+    def __init__(self, label_image=None, connectivity=1, *, nodes=None,
+                 edges=None):
+        if label_image is not None:
+            nodes, index_image = _label_indices(label_image)
+            edges = _adjacent_pairs(index_image, connectivity)
+        if nodes is None:
+            nodes = np.empty(0, dtype=np.intp)
+        if edges is None:
+            edges = np.empty((0, 2), dtype=np.intp)
+        self.nodes = np.asarray(nodes)
+        self.edges = np.asarray(edges, dtype=np.intp).reshape(-1, 2)
+        self.node_data = {}
+        self.edge_data = {}
+
+    def number_of_nodes(self):
+        """Returns the number of nodes."""
+        return self.nodes.shape[0]
+
+    def number_of_edges(self):
+        """Returns the number of edges."""
+        return self.edges.shape[0]
+
+    def adjacency(self, attr='weight', format='csr'):
+        """Symmetric sparse matrix of an edge attribute.
+
+        Parameters
+        ----------
+        attr : str, optional
+            The edge attribute held by the matrix.
+        format : str, optional
+            The sparse matrix format, e.g. ``'csr'`` or ``'csc'``.
+
+        Returns
+        -------
+        matrix : (N, N) sparse matrix
+            ``matrix[i, j]`` and ``matrix[j, i]`` hold the attribute of the
+            edge between nodes ``nodes[i]`` and ``nodes[j]``.
+        """
+        n = self.number_of_nodes()
+        rows = np.concatenate((self.edges[:, 0], self.edges[:, 1]))
+        cols = np.concatenate((self.edges[:, 1], self.edges[:, 0]))
+        data = np.tile(self.edge_data[attr], 2)
+        matrix = sparse.coo_matrix((data, (rows, cols)), shape=(n, n))
+        return matrix.asformat(format)
+
+    def remove_edges(self, mask):
+        """Remove edges, along with their attributes.
+
+        Parameters
+        ----------
+        mask : (E,) array of bool
+            True for the edges to remove.
+        """
+        keep = ~np.asarray(mask, dtype=bool)
+        self.edges = self.edges[keep]
+        self.edge_data = {key: value[keep]
+                          for key, value in self.edge_data.items()}
+
+    def copy(self):
+        """Copy the graph and its attributes."""
+        g = ArrayRAG(nodes=self.nodes.copy(), edges=self.edges.copy())
+        g.node_data = {key: value.copy()
+                       for key, value in self.node_data.items()}
+        g.edge_data = {key: value.copy()
+                       for key, value in self.edge_data.items()}
+        return g
+
+    def to_networkx(self):
+        """Convert to a `RAG`.
+
+        Returns
+        -------
+        rag : RAG
+            A graph with the same nodes, edges and attributes, each node
+            also having a ``'labels'`` attribute holding its id.
+        """
+        def rows(values):
+            # copies, so that merging nodes does not modify this graph
+            if values.ndim == 1:
+                return values.tolist()
+            return list(values.copy())
+
+        nodes = self.nodes.tolist()
+        node_data = {key: rows(value)
+                     for key, value in self.node_data.items()}
+        edge_data = {key: rows(value)
+                     for key, value in self.edge_data.items()}
+
+        rag = RAG()
+        rag.add_nodes_from(
+            (n, dict({key: value[i] for key, value in node_data.items()},
+                     labels=[n]))
+            for i, n in enumerate(nodes))
+        rag.add_edges_from(
+            (nodes[u], nodes[v],
+             {key: value[i] for key, value in edge_data.items()})
+            for i, (u, v) in enumerate(self.edges.tolist()))
+        if nodes:
+            rag.max_id = max(nodes)
+        return rag
+
+
+def _check_backend(backend):
+    if backend not in ('networkx', 'array'):
+        raise ValueError(f"The backend '{backend}' is not recognised")
+
+
 def rag_mean_color(image, labels, connectivity=2, mode='distance',
-                   sigma=255.0):
+                   sigma=255.0, *, backend='networkx'):
     """Compute the Region Adjacency Graph using mean colors.
 
     Given an image and its initial segmentation, this method constructs the
@@ -332,11 +570,17 @@ def rag_mean_color(image, labels, connectivity=2, mode='distance',
         close to each other two colors should be, for their corresponding edge
         weight to be significant. A very large value of `sigma` could make
         any two colors behave as though they were similar.
+    backend : {'networkx', 'array'}, optional
+        The type of graph to return. ``'array'`` builds an `ArrayRAG` with
+        array operations, which is much faster and more compact for large
+        numbers of regions.
 
     Returns
     -------
-    out : RAG
-        The region adjacency graph.
+    out : RAG or ArrayRAG
+        The region adjacency graph. Node attributes are ``'pixel count'``,
+        ``'total color'`` and ``'mean color'``; edge attribute is
+        ``'weight'``.
 
     Examples
     --------
@@ -352,6 +596,11 @@ def rag_mean_color(image, labels, connectivity=2, mode='distance',
            "Regions Adjacency Graph Applied To Color Image Segmentation"
            :DOI:`10.1109/83.841950`
     """
+    _check_backend(backend)
+    if backend == 'array':
+        return _rag_mean_color_array(image, labels, connectivity, mode,
+                                     sigma)
+
     graph = RAG(labels, connectivity=connectivity)
 
     for n in graph:
@@ -382,7 +631,39 @@ def rag_mean_color(image, labels, connectivity=2, mode='distance',
     return graph
 
 
-def rag_boundary(labels, edge_map, connectivity=2):
+def _rag_mean_color_array(image, labels, connectivity, mode, sigma):
+    """Build the `ArrayRAG` of `rag_mean_color`."""
+    if mode not in ('distance', 'similarity'):
+        raise ValueError("The mode '%s' is not recognised" % mode)
+    nodes, index_image = _label_indices(labels)
+    graph = ArrayRAG(nodes=nodes,
+                     edges=_adjacent_pairs(index_image, connectivity))
+
+    n_nodes = nodes.shape[0]
+    index_image = index_image.ravel()
+    if image.ndim == labels.ndim:
+        # grayscale image: single channel
+        image = image[..., np.newaxis]
+    image = image.reshape(-1, image.shape[-1])
+    pixel_count = np.bincount(index_image, minlength=n_nodes)
+    total_color = np.stack([np.bincount(index_image, weights=channel,
+                                        minlength=n_nodes)
+                            for channel in image.T], axis=-1)
+    mean_color = total_color / pixel_count[:, np.newaxis]
+    graph.node_data.update({'pixel count': pixel_count,
+                            'total color': total_color,
+                            'mean color': mean_color})
+
+    diff = np.linalg.norm(mean_color[graph.edges[:, 0]]
+                          - mean_color[graph.edges[:, 1]], axis=-1)
+    if mode == 'similarity':
+        graph.edge_data['weight'] = np.exp(-(diff ** 2) / sigma)
+    else:
+        graph.edge_data['weight'] = diff
+    return graph
+
+
+def rag_boundary(labels, edge_map, connectivity=2, *, backend='networkx'):
     """ Comouter RAG based on region boundaries
 
     Given an image's initial segmentation and its edge map this method
@@ -402,6 +683,16 @@ def rag_boundary(labels, edge_map, connectivity=2):
         are considered adjacent. It can range from 1 to `labels.ndim`. Its
         behavior is the same as `connectivity` parameter in
         `scipy.ndimage.filters.generate_binary_structure`.
+    backend : {'networkx', 'array'}, optional
+        The type of graph to return. ``'array'`` builds an `ArrayRAG` with
+        array operations, which is much faster and more compact for large
+        numbers of regions.
+
+    Returns
+    -------
+    out : RAG or ArrayRAG
+        The region adjacency graph, with edge attributes ``'weight'`` and
+        ``'count'``, the number of boundary pixels.
 
     Examples
     --------
@@ -414,6 +705,7 @@ def rag_boundary(labels, edge_map, connectivity=2):
 
     """
 
+    _check_backend(backend)
     conn = ndi.generate_binary_structure(labels.ndim, connectivity)
     eroded = ndi.grey_erosion(labels, footprint=conn)
     dilated = ndi.grey_dilation(labels, footprint=conn)
@@ -421,6 +713,24 @@ def rag_boundary(labels, edge_map, connectivity=2):
     boundaries1 = (dilated != labels)
     labels_small = np.concatenate((eroded[boundaries0], labels[boundaries1]))
     labels_large = np.concatenate((labels[boundaries0], dilated[boundaries1]))
+    data = np.concatenate((edge_map[boundaries0], edge_map[boundaries1]))
+
+    if backend == 'array':
+        nodes, inverse = np.unique(np.concatenate((labels_small,
+                                                   labels_large)),
+                                   return_inverse=True)
+        n_nodes = max(nodes.shape[0], 1)
+        small, large = np.split(inverse, 2)
+        keys, inverse = np.unique(small.astype(np.int64) * n_nodes + large,
+                                  return_inverse=True)
+        rag = ArrayRAG(nodes=nodes,
+                       edges=np.stack(np.divmod(keys, n_nodes), axis=1))
+        count = np.bincount(inverse, minlength=keys.shape[0])
+        rag.edge_data['weight'] = np.bincount(
+            inverse, weights=data, minlength=keys.shape[0]) / count
+        rag.edge_data['count'] = count
+        return rag
+
     n = np.max(labels_large) + 1
 
     # use a dummy broadcast array as data for RAG
@@ -428,7 +738,6 @@ def rag_boundary(labels, edge_map, connectivity=2):
                       strides=(0,))
     count_matrix = sparse.coo_matrix((ones, (labels_small, labels_large)),
                                      dtype=int, shape=(n, n)).tocsr()
-    data = np.concatenate((edge_map[boundaries0], edge_map[boundaries1]))
 
     data_coo = sparse.coo_matrix((data, (labels_small, labels_large)))
     graph_matrix = data_coo.tocsr()
@@ -458,8 +767,9 @@ def show_rag(labels, rag, image, border_color='black', edge_width=1.5,
     ----------
     labels : ndarray, shape (M, N)
         The labelled image.
-    rag : RAG
-        The Region Adjacency Graph.
+    rag : RAG or ArrayRAG
+        The Region Adjacency Graph. An `ArrayRAG` is converted with
+        `ArrayRAG.to_networkx`.
     image : ndarray, shape (M, N[, 3])
         Input image. If `colormap` is `None`, the image should be in RGB
         format.
@@ -474,7 +784,8 @@ def show_rag(labels, rag, image, border_color='black', edge_width=1.5,
         the image is drawn as it is.
     in_place : bool, optional
         If set, the RAG is modified in place. For each node `n` the function
-        will set a new attribute ``rag.nodes[n]['centroid']``.
+        will set a new attribute ``rag.nodes[n]['centroid']``. An
+        `ArrayRAG` is never modified.
     ax : :py:class:`matplotlib.axes.Axes`, optional
         The axes to draw on. If not specified, new axes are created and drawn
         on.
@@ -501,7 +812,9 @@ def show_rag(labels, rag, image, border_color='black', edge_width=1.5,
     from matplotlib import pyplot as plt
     from matplotlib.collections import LineCollection
 
-    if not in_place:
+    if isinstance(rag, ArrayRAG):
+        rag = rag.to_networkx()
+    elif not in_place:
         rag = rag.copy()
 
     if ax is None:
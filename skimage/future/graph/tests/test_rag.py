@@ -2,7 +2,7 @@ from numpy.testing import assert_array_equal
 import numpy as np
 from skimage.future import graph
 from skimage._shared.version_requirements import is_installed
-from skimage import segmentation, data
+from skimage import segmentation, data, filters, color
 from skimage._shared import testing
 
 
@@ -226,3 +226,272 @@ def test_rag_boundary():
     assert g[1][3]['weight'] == 0.25
     assert g[2][4]['weight'] == 0.34375
     assert g[1][3]['count'] == 16
+
+
+def _same_partition(labels1, labels2):
+    pairs = np.unique(np.stack((labels1.ravel(), labels2.ravel())), axis=1)
+    return (pairs.shape[1] == np.unique(labels1).size
+            == np.unique(labels2).size)
+
+
+def _edge_set(rag):
+    if isinstance(rag, graph.ArrayRAG):
+        return {tuple(edge) for edge in rag.nodes[rag.edges].tolist()}
+    return {tuple(sorted(edge)) for edge in rag.edges()}
+
+
+@testing.parametrize('connectivity', [1, 2, 3])
+def test_array_rag_edges(connectivity):
+    rng = np.random.default_rng(0)
+    labels = rng.integers(0, 20, size=(6, 7, 5))
+    assert (_edge_set(graph.ArrayRAG(labels, connectivity))
+            == _edge_set(graph.RAG(labels, connectivity)))
+
+    labels_2d = rng.integers(-5, 1000, size=(8, 9))
+    if connectivity <= 2:
+        g = graph.ArrayRAG(labels_2d, connectivity)
+        assert_array_equal(g.nodes, np.unique(labels_2d))
+        assert np.all(g.edges[:, 0] < g.edges[:, 1])
+        assert (_edge_set(g)
+                == _edge_set(graph.RAG(labels_2d, connectivity)))
+
+
+def test_array_rag_slabs(monkeypatch):
+    rng = np.random.default_rng(0)
+    labels = rng.integers(0, 50, size=(9, 10, 11))
+    expected = graph.ArrayRAG(labels, 2)
+    monkeypatch.setattr(graph.rag, '_CHUNK_SIZE', 7)
+    g = graph.ArrayRAG(labels, 2)
+    assert_array_equal(g.edges, expected.edges)
+
+
+@testing.parametrize('mode', ['distance', 'similarity'])
+def test_array_rag_mean_color(mode):
+    img = data.astronaut()[:64, :64]
+    labels = segmentation.slic(img, n_segments=50, start_label=1)
+    g = graph.rag_mean_color(img, labels, mode=mode)
+    h = graph.rag_mean_color(img, labels, mode=mode, backend='array')
+    assert _edge_set(g) == _edge_set(h)
+    for (u, v), weight in zip(h.nodes[h.edges].tolist(),
+                              h.edge_data['weight']):
+        np.testing.assert_allclose(g[u][v]['weight'], weight)
+    for i, n in enumerate(h.nodes):
+        np.testing.assert_allclose(g.nodes[n]['mean color'],
+                                   h.node_data['mean color'][i])
+        assert g.nodes[n]['pixel count'] == h.node_data['pixel count'][i]
+
+    with testing.raises(ValueError):
+        graph.rag_mean_color(img, labels, 2, 'non existent mode',
+                             backend='array')
+    with testing.raises(ValueError):
+        graph.rag_mean_color(img, labels, backend='igraph')
+
+
+def test_array_rag_mean_color_gray():
+    img = data.camera()[:64, :64]
+    labels = segmentation.slic(img, n_segments=50, start_label=1,
+                               channel_axis=None)
+    g = graph.rag_mean_color(img, labels)
+    h = graph.rag_mean_color(img, labels, backend='array')
+    assert _edge_set(g) == _edge_set(h)
+    assert h.node_data['mean color'].shape == (h.number_of_nodes(), 1)
+    for i, n in enumerate(h.nodes):
+        np.testing.assert_allclose(g.nodes[n]['mean color'][0],
+                                   h.node_data['mean color'][i, 0])
+    h3 = graph.rag_mean_color(img[..., np.newaxis], labels, backend='array')
+    assert_array_equal(h.edge_data['weight'], h3.edge_data['weight'])
+
+
+def test_array_rag_boundary():
+    labels = np.zeros((16, 16), dtype='uint8')
+    edge_map = np.zeros_like(labels, dtype=float)
+
+    edge_map[8, :] = 0.5
+    edge_map[:, 8] = 1.0
+
+    labels[:8, :8] = 1
+    labels[:8, 8:] = 2
+    labels[8:, :8] = 3
+    labels[8:, 8:] = 4
+
+    g = graph.rag_boundary(labels, edge_map, connectivity=1, backend='array')
+    assert_array_equal(g.nodes, [1, 2, 3, 4])
+    assert_array_equal(g.nodes[g.edges], [[1, 2], [1, 3], [2, 4], [3, 4]])
+    h = graph.rag_boundary(labels, edge_map, connectivity=1)
+    for (u, v), weight, count in zip(g.nodes[g.edges].tolist(),
+                                     g.edge_data['weight'],
+                                     g.edge_data['count']):
+        assert h[u][v]['weight'] == weight
+        assert h[u][v]['count'] == count
+
+
+def test_array_rag_to_networkx():
+    img = np.zeros((10, 10, 3))
+    labels = np.zeros((10, 10), dtype=int)
+    labels[5:] = 3
+    labels[:, 5:] += 1
+    img[labels == 3] = 1
+    h = graph.rag_mean_color(img, labels, connectivity=1, backend='array')
+    g = h.to_networkx()
+    assert isinstance(g, graph.RAG)
+    assert sorted(g.nodes()) == [0, 1, 3, 4]
+    assert g.next_id() == 5
+    assert _edge_set(g) == {(0, 1), (0, 3), (1, 4), (3, 4)}
+    assert g[0][3]['weight'] == np.sqrt(3)
+    assert g.nodes[3]['labels'] == [3]
+    assert g.nodes[3]['pixel count'] == 25
+    # attributes are copied
+    g.nodes[3]['total color'] += 1
+    assert_array_equal(h.node_data['total color'][2], [25, 25, 25])
+
+
+def test_array_rag_cuts():
+    img = np.zeros((100, 100, 3), dtype='uint8')
+    img[:50, :50] = 255, 255, 255
+    img[:50, 50:] = 254, 254, 254
+    img[50:, :50] = 2, 2, 2
+    img[50:, 50:] = 1, 1, 1
+
+    labels = np.zeros((100, 100), dtype='uint8')
+    labels[:50, :50] = 0
+    labels[:50, 50:] = 1
+    labels[50:, :50] = 2
+    labels[50:, 50:] = 3
+
+    rag = graph.rag_mean_color(img, labels, backend='array')
+    new_labels = graph.cut_threshold(labels, rag, 10, in_place=False)
+    assert new_labels.dtype == labels.dtype
+    assert_array_equal(np.unique(new_labels), [0, 1])
+    assert rag.number_of_edges() == 6
+    new_labels = graph.cut_threshold(labels, rag, 10)
+    assert_array_equal(np.unique(new_labels), [0, 1])
+    assert rag.number_of_edges() == 2
+
+    rag = graph.rag_mean_color(img, labels, mode='similarity',
+                               backend='array')
+    new_labels = graph.cut_normalized(labels, rag, in_place=False,
+                                      random_state=0)
+    assert _same_partition(new_labels, labels // 2)
+    assert 'ncut label' not in rag.node_data
+    new_labels = graph.cut_normalized(labels, rag, random_state=0)
+    assert _same_partition(new_labels, labels // 2)
+    assert_array_equal(rag.node_data['ncut label'], [0, 0, 2, 2])
+
+
+def test_array_rag_cut_normalized_reproducibility():
+    img = data.coffee()
+    labels = segmentation.slic(img, compactness=30, n_segments=400,
+                               start_label=0)
+    g = graph.rag_mean_color(img, labels, mode='similarity', backend='array')
+    results = [graph.cut_normalized(labels, g, thresh=1e-3,
+                                    random_state=1234)
+               for _ in range(2)]
+    assert_array_equal(results[0], results[1])
+    assert 1 < np.unique(results[0]).size < np.unique(labels).size
+
+
+def test_array_rag_hierarchical():
+    img = np.zeros((8, 8, 3), dtype='uint8')
+    labels = np.zeros((8, 8), dtype='uint8')
+
+    img[:, :, :] = 31
+    labels[:, :] = 1
+
+    img[0:4, 0:4, :] = 10, 10, 10
+    labels[0:4, 0:4] = 2
+
+    img[4:, 0:4, :] = 20, 20, 20
+    labels[4:, 0:4] = 3
+
+    g = graph.rag_mean_color(img, labels, backend='array')
+    result = merge_hierarchical_mean_color(labels, g, 20)
+    assert np.all(result[:, :4] == result[0, 0])
+    assert np.all(result[:, 4:] == result[-1, -1])
+    assert g.number_of_nodes() == 3
+
+
+def _weight_boundary(graph, src, dst, n):
+    default = {'weight': 0.0, 'count': 0}
+    count_src = graph[src].get(n, default)['count']
+    count_dst = graph[dst].get(n, default)['count']
+    weight_src = graph[src].get(n, default)['weight']
+    weight_dst = graph[dst].get(n, default)['weight']
+    count = count_src + count_dst
+    return {'count': count,
+            'weight': (count_src * weight_src + count_dst * weight_dst)
+            / count}
+
+
+def _pre_merge_boundary(graph, src, dst):
+    pass
+
+
+@testing.parametrize('thresh', [10, 25, 40])
+def test_merge_hierarchical_compiled_mean_color(thresh):
+    img = data.coffee()[:200, :200]
+    labels = segmentation.slic(img, n_segments=200, compactness=30,
+                               start_label=1)
+    expected = merge_hierarchical_mean_color(
+        labels, graph.rag_mean_color(img, labels), thresh)
+    rag = graph.rag_mean_color(img, labels, backend='array')
+    result = graph.merge_hierarchical(labels, rag, thresh, False, False,
+                                      None, 'mean color')
+    assert result.dtype == np.intp
+    assert _same_partition(result, expected)
+    assert 1 < np.unique(result).size < np.unique(labels).size
+
+
+def test_merge_hierarchical_compiled_boundary():
+    img = data.coffee()[:200, :200]
+    labels = segmentation.slic(img, n_segments=200, compactness=30,
+                               start_label=1)
+    edge_map = filters.sobel(color.rgb2gray(img))
+    expected = graph.merge_hierarchical(
+        labels, graph.rag_boundary(labels, edge_map), 0.08, False, True,
+        _pre_merge_boundary, _weight_boundary)
+    rag = graph.rag_boundary(labels, edge_map, backend='array')
+    result = graph.merge_hierarchical(labels, rag, 0.08, False, False,
+                                      None, 'boundary')
+    assert _same_partition(result, expected)
+    assert 1 < np.unique(result).size < np.unique(labels).size
+
+
+def test_merge_hierarchical_tree():
+    img = data.coffee()[:200, :200]
+    labels = segmentation.slic(img, n_segments=200, compactness=30,
+                               start_label=1)
+    rag = graph.rag_mean_color(img, labels, backend='array')
+    weights = rag.edge_data['weight'].copy()
+
+    tree = graph.merge_hierarchical_tree(rag)
+    assert isinstance(tree, graph.MergeTree)
+    assert len(tree) == rag.number_of_nodes() - 1
+    assert tree.thresh == np.inf
+    # the graph is not modified
+    assert_array_equal(rag.edge_data['weight'], weights)
+
+    partial = graph.merge_hierarchical_tree(rag, 25)
+    assert partial.thresh == 25
+    assert len(partial) < len(tree)
+    assert_array_equal(partial.merges, tree.merges[:len(partial)])
+    for thresh in [5, 15, 25]:
+        expected = graph.merge_hierarchical(labels, rag, thresh, False,
+                                            False, None, 'mean color')
+        assert_array_equal(tree.cut(labels, thresh), expected)
+        assert_array_equal(partial.cut(labels, thresh), expected)
+    assert np.all(tree.cut(labels, np.inf) == 0)
+    node_labels = tree.node_labels(15)
+    assert_array_equal(np.unique(node_labels), np.arange(node_labels.max()
+                                                         + 1))
+    with testing.raises(ValueError):
+        partial.cut(labels, 30)
+
+
+def test_merge_hierarchical_tree_errors():
+    labels = np.array([[1, 1, 2], [3, 3, 2]])
+    img = np.zeros(labels.shape + (3,))
+    with testing.raises(ValueError):
+        graph.merge_hierarchical_tree(graph.rag_mean_color(img, labels))
+    rag = graph.rag_mean_color(img, labels, backend='array')
+    with testing.raises(ValueError):
+        graph.merge_hierarchical_tree(rag, weight_func='max')
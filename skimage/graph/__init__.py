@@ -1,5 +1,14 @@
-from .spath import shortest_path
-from .mcp import MCP, MCP_Geometric, MCP_Connect, MCP_Flexible, route_through_array
+from .._shared import lazy
+
+__getattr__, __dir__ = lazy.attach(
+    __name__,
+    submodules={'spath', 'mcp'},
+    submod_attrs={
+        'spath': ['shortest_path'],
+        'mcp': ['MCP', 'MCP_Geometric', 'MCP_Connect', 'MCP_Flexible',
+                'route_through_array'],
+    }
+)
 
 
 __all__ = ['shortest_path',
@@ -4,6 +4,7 @@
 import os
 from glob import glob
 import re
+from collections import OrderedDict
 from collections.abc import Sequence
 from copy import copy
 
@@ -117,6 +118,15 @@ class ImageCollection(object):
     conserve_memory : bool, optional
         If True, `ImageCollection` does not keep more than one in memory at a
         specific time. Otherwise, images will be cached once they are loaded.
+    cache_size : int or None, optional
+        If given, loaded images are kept in a least-recently-used cache
+        holding at most this many bytes, and `conserve_memory` is ignored.
+        Images are evicted, least recently accessed first, until the cache
+        fits; an image larger than `cache_size` is returned but not cached.
+    prefetch : int, optional
+        Number of upcoming images to load in the background on a thread pool
+        while iterating over the collection. The default, 0, disables
+        prefetching. Prefetching requires `load_func` to be thread-safe.
 
     Other parameters
     ----------------
@@ -135,6 +145,14 @@ class ImageCollection(object):
     Note that files are always returned in alphanumerical order. Also note
     that slicing returns a new ImageCollection, *not* a view into the data.
 
+    When iterating over a collection whose frames are expensive to read, a
+    bounded cache combined with prefetching overlaps disk I/O with the
+    processing of the current frame::
+
+      ic = ImageCollection('/tmp/*.tif', cache_size=2**30, prefetch=4)
+      for image in ic:
+          process(image)  # the next 4 frames are read meanwhile
+
     ImageCollection can be modified to load images from an arbitrary
     source by specifying a combination of `load_pattern` and
     `load_func`.  For an ImageCollection ``ic``, ``ic[5]`` uses
@@ -178,8 +196,13 @@ class ImageCollection(object):
     >>> ic = io.ImageCollection(['/tmp/work/*.png', '/tmp/other/*.jpg'])
     """
     def __init__(self, load_pattern, conserve_memory=True, load_func=None,
-                 **load_func_kwargs):
+                 *, cache_size=None, prefetch=0, **load_func_kwargs):
         """Load and manage a collection of images."""
+        if cache_size is not None and cache_size < 0:
+            raise ValueError('cache_size must be non-negative')
+        if prefetch < 0:
+            raise ValueError('prefetch must be non-negative')
+
         self._files = []
         if _is_multipattern(load_pattern):
             if isinstance(load_pattern, str):
@@ -210,6 +233,12 @@ class ImageCollection(object):
         self._conserve_memory = conserve_memory
         self._cached = None
 
+        self._cache_size = cache_size
+        self._cache = OrderedDict()
+        self._cache_nbytes = 0
+        self._prefetch = prefetch
+        self._pending = {}
+
         self.load_func_kwargs = load_func_kwargs
         self.data = np.empty(memory_slots, dtype=object)
 
@@ -221,6 +250,14 @@ class ImageCollection(object):
     def conserve_memory(self):
         return self._conserve_memory
 
+    @property
+    def cache_size(self):
+        return self._cache_size
+
+    @property
+    def prefetch(self):
+        return self._prefetch
+
     def _find_images(self):
         index = []
         for fname in self._files:
@@ -272,26 +309,19 @@ class ImageCollection(object):
 
         if type(n) is int:
             n = self._check_imgnum(n)
+
+            if self._cache_size is not None:
+                if n in self._cache:
+                    self._cache.move_to_end(n)
+                    return self._cache[n]
+                img = self._fetch(n)
+                self._cache_insert(n, img)
+                return img
+
             idx = n % len(self.data)
 
-            if ((self.conserve_memory and n != self._cached) or
-                    (self.data[idx] is None)):
-                kwargs = self.load_func_kwargs
-                if self._frame_index:
-                    fname, img_num = self._frame_index[n]
-                    if img_num is not None:
-                        kwargs['img_num'] = img_num
-                    try:
-                        self.data[idx] = self.load_func(fname, **kwargs)
-                    # Account for functions that do not accept an img_num kwarg
-                    except TypeError as e:
-                        if "unexpected keyword argument 'img_num'" in str(e):
-                            del kwargs['img_num']
-                            self.data[idx] = self.load_func(fname, **kwargs)
-                        else:
-                            raise
-                else:
-                    self.data[idx] = self.load_func(self.files[n], **kwargs)
+            if not self._is_loaded(n):
+                self.data[idx] = self._fetch(n)
                 self._cached = n
 
             return self.data[idx]
@@ -310,8 +340,15 @@ class ImageCollection(object):
                 new_ic._files = [self._files[i] for i in fidx]
 
             new_ic._numframes = len(fidx)
-
-            if self.conserve_memory:
+            new_ic._pending = {}
+
+            if self._cache_size is not None:
+                new_ic._cache = OrderedDict(
+                    (fidx.index(i), img) for i, img in self._cache.items()
+                    if i in fidx)
+                new_ic._cache_nbytes = sum(
+                    _nbytes(img) for img in new_ic._cache.values())
+            elif self.conserve_memory:
                 if self._cached in fidx:
                     new_ic._cached = fidx.index(self._cached)
                     new_ic.data = np.copy(self.data)
@@ -321,6 +358,56 @@ class ImageCollection(object):
                 new_ic.data = self.data[fidx]
             return new_ic
 
+    def _load(self, n):
+        """Read the `n`-th image with `load_func`.
+
+        This method does not modify the collection, so that it can run in a
+        background thread.
+        """
+        kwargs = dict(self.load_func_kwargs)
+        if self._frame_index:
+            fname, img_num = self._frame_index[n]
+            if img_num is not None:
+                kwargs['img_num'] = img_num
+            try:
+                return self.load_func(fname, **kwargs)
+            # Account for functions that do not accept an img_num kwarg
+            except TypeError as e:
+                if "unexpected keyword argument 'img_num'" in str(e):
+                    del kwargs['img_num']
+                    return self.load_func(fname, **kwargs)
+                else:
+                    raise
+        else:
+            return self.load_func(self.files[n], **kwargs)
+
+    def _fetch(self, n):
+        """Return the `n`-th image, from the prefetch queue if possible."""
+        future = self._pending.pop(n, None)
+        if future is not None:
+            return future.result()
+        return self._load(n)
+
+    def _is_loaded(self, n):
+        """Whether the `n`-th image is available without reading it."""
+        if self._cache_size is not None:
+            return n in self._cache
+        idx = n % len(self.data)
+        if self.conserve_memory and n != self._cached:
+            return False
+        return self.data[idx] is not None
+
+    def _cache_insert(self, n, img):
+        """Add an image to the LRU cache, evicting old images to fit."""
+        nbytes = _nbytes(img)
+        if nbytes > self._cache_size:
+            return
+        self._cache[n] = img
+        self._cache_nbytes += nbytes
+        while self._cache_nbytes > self._cache_size:
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_nbytes -= _nbytes(evicted)
+
     def _check_imgnum(self, n):
         """Check that the given image number is valid."""
         num = self._numframes
@@ -332,9 +419,30 @@ class ImageCollection(object):
         return n
 
     def __iter__(self):
-        """Iterate over the images."""
-        for i in range(len(self)):
-            yield self[i]
+        """Iterate over the images.
+
+        If `prefetch` is set, the following images are loaded in the
+        background while the current one is processed.
+        """
+        if not self._prefetch:
+            for i in range(len(self)):
+                yield self[i]
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        executor = ThreadPoolExecutor(max_workers=self._prefetch)
+        try:
+            for i in range(len(self)):
+                for j in range(i + 1, min(i + 1 + self._prefetch, len(self))):
+                    if j not in self._pending and not self._is_loaded(j):
+                        self._pending[j] = executor.submit(self._load, j)
+                yield self[i]
+        finally:
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+            executor.shutdown(wait=True)
 
     def __len__(self):
         """Number of images in collection."""
@@ -354,6 +462,8 @@ class ImageCollection(object):
 
         """
         self.data = np.empty_like(self.data)
+        self._cache.clear()
+        self._cache_nbytes = 0
 
     def concatenate(self):
         """Concatenate all images in the collection into an array.
@@ -375,6 +485,15 @@ class ImageCollection(object):
         return concatenate_images(self)
 
 
+def _nbytes(img):
+    """Memory used by an image returned by ``load_func``, in bytes."""
+    if hasattr(img, 'nbytes'):
+        return img.nbytes
+    if isinstance(img, (list, tuple)):
+        return sum(_nbytes(i) for i in img)
+    return 0
+
+
 def imread_collection_wrapper(imread):
     def imread_collection(load_pattern, conserve_memory=True):
         """Return an `ImageCollection` from files matching the given pattern.
@@ -413,6 +532,11 @@ class MultiImage(ImageCollection):
     conserve_memory : bool, optional
         Whether to conserve memory by only caching a single frame. Default is
         True.
+    cache_size : int or None, optional
+        Size in bytes of a least-recently-used frame cache. If given,
+        `conserve_memory` is ignored. See `ImageCollection`.
+    prefetch : int, optional
+        Number of upcoming frames to read in the background while iterating.
 
     Other parameters
     ----------------
@@ -445,14 +569,16 @@ class MultiImage(ImageCollection):
 
     """
 
-    def __init__(self, filename, conserve_memory=True, dtype=None,
-                 **imread_kwargs):
+    def __init__(self, filename, conserve_memory=True, dtype=None, *,
+                 cache_size=None, prefetch=0, **imread_kwargs):
         """Load a multi-img."""
         from ._io import imread
 
         self._filename = filename
         super(MultiImage, self).__init__(filename, conserve_memory,
-                                         load_func=imread, **imread_kwargs)
+                                         load_func=imread,
+                                         cache_size=cache_size,
+                                         prefetch=prefetch, **imread_kwargs)
 
     @property
     def filename(self):
@@ -129,3 +129,76 @@ class TestImageCollection(TestCase):
     def test_multiimage_imagecollection(self):
         assert_equal(self.images_matched[0], self.frames_matched[0])
         assert_equal(self.images_matched[1], self.frames_matched[1])
+
+    def test_lru_cache_size(self):
+        loaded = []
+
+        def load_fn(f):
+            loaded.append(f)
+            return np.zeros(100, dtype=np.uint8)
+
+        pattern = self.pattern + self.pattern_matched[1:]
+        ic = ImageCollection(pattern, load_func=load_fn, cache_size=250)
+        assert ic.cache_size == 250
+        ic[0]
+        ic[1]
+        ic[0]
+        assert len(loaded) == 2
+        # loading a third image evicts the least recently used one, ic[1]
+        ic[2]
+        ic[0]
+        assert len(loaded) == 3
+        ic[1]
+        assert len(loaded) == 4
+        assert ic._cache_nbytes <= 250
+
+        # images larger than the cache are returned but not kept
+        ic = ImageCollection(pattern, load_func=load_fn, cache_size=50)
+        assert ic[0].shape == (100,)
+        assert len(ic._cache) == 0
+
+        ic = ImageCollection(pattern, load_func=load_fn, cache_size=1000)
+        ic[0]
+        ic[1]
+        sliced = ic[1:]
+        assert list(sliced._cache) == [0]
+        ic.reload()
+        assert len(ic._cache) == 0 and ic._cache_nbytes == 0
+
+    def test_prefetch(self):
+        files = sorted(self.pattern + self.pattern_matched[1:])
+        expected = ImageCollection(files)
+        for cache_size in (None, 10 ** 8):
+            ic = ImageCollection(files, prefetch=2, cache_size=cache_size)
+            assert ic.prefetch == 2
+            images = list(ic)
+            assert len(images) == len(expected)
+            for image, expected_image in zip(images, expected):
+                assert_equal(image, expected_image)
+            assert not ic._pending
+
+        # stopping early cancels the outstanding loads
+        ic = ImageCollection(files, prefetch=2)
+        for image in ic:
+            break
+        del image
+        assert_equal(ic[0], expected[0])
+
+    def test_prefetch_loads_each_image_once(self):
+        loaded = []
+
+        def load_fn(f):
+            loaded.append(f)
+            return f
+
+        files = self.pattern + self.pattern_matched[1:]
+        ic = ImageCollection(files, load_func=load_fn, prefetch=3,
+                             conserve_memory=False)
+        assert list(ic) == sorted(files)
+        assert sorted(loaded) == sorted(files)
+
+    def test_cache_prefetch_errors(self):
+        with testing.raises(ValueError):
+            ImageCollection(self.pattern, cache_size=-1)
+        with testing.raises(ValueError):
+            ImageCollection(self.pattern, prefetch=-1)
@@ -1,19 +1,29 @@
-from ._find_contours import find_contours
-from ._marching_cubes_lewiner import marching_cubes_lewiner, marching_cubes
-from ._marching_cubes_classic import (marching_cubes_classic,
-                                      mesh_surface_area)
-from ._regionprops import (regionprops, perimeter,
-                           perimeter_crofton, euler_number, regionprops_table)
-from ._polygon import approximate_polygon, subdivide_polygon
-from .pnpoly import points_in_poly, grid_points_in_poly
-from ._moments import (moments, moments_central, moments_coords,
-                       moments_coords_central, moments_normalized, centroid,
-                       moments_hu, inertia_tensor, inertia_tensor_eigvals)
-from .profile import profile_line
-from .fit import LineModelND, CircleModel, EllipseModel, ransac
-from .block import block_reduce
-from ._label import label
-from .entropy import shannon_entropy
+from .._shared import lazy
+
+__getattr__, __dir__ = lazy.attach(
+    __name__,
+    submodules={'pnpoly', 'profile', 'fit', 'block', 'entropy'},
+    submod_attrs={
+        '_find_contours': ['find_contours'],
+        '_marching_cubes_lewiner': ['marching_cubes_lewiner',
+                                    'marching_cubes'],
+        '_marching_cubes_classic': ['marching_cubes_classic',
+                                    'mesh_surface_area'],
+        '_regionprops': ['regionprops', 'perimeter', 'perimeter_crofton',
+                         'euler_number', 'regionprops_table'],
+        '_polygon': ['approximate_polygon', 'subdivide_polygon'],
+        'pnpoly': ['points_in_poly', 'grid_points_in_poly'],
+        '_moments': ['moments', 'moments_central', 'moments_coords',
+                     'moments_coords_central', 'moments_normalized',
+                     'centroid', 'moments_hu', 'inertia_tensor',
+                     'inertia_tensor_eigvals'],
+        'profile': ['profile_line'],
+        'fit': ['LineModelND', 'CircleModel', 'EllipseModel', 'ransac'],
+        'block': ['block_reduce'],
+        '_label': ['label'],
+        'entropy': ['shannon_entropy'],
+    }
+)
 
 
 __all__ = ['find_contours',
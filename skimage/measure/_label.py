@@ -1,3 +1,6 @@
+import itertools
+
+import numpy as np
 from scipy import ndimage
 from ._ccomp import label_cython as clabel
 from .._shared.utils import deprecate_kwarg
@@ -30,8 +33,172 @@ def _label_bool(image, background=None, return_num=False, connectivity=None):
         return result[0]
 
 
+def _label_block(block, background, connectivity):
+    if block.dtype == bool:
+        return _label_bool(block, background=background, return_num=True,
+                           connectivity=connectivity)
+    return clabel(block, background, True, connectivity)
+
+
+def _union_find(n, pairs):
+    """Resolve label equivalences.
+
+    Parameters
+    ----------
+    n : int
+        Number of labels; labels are ``1, ..., n`` and 0 is the background.
+    pairs : (M, 2) ndarray of int
+        Pairs of equivalent labels.
+
+    Returns
+    -------
+    roots : (n + 1,) ndarray of int
+        ``roots[i]`` is the smallest label equivalent to ``i``.
+    """
+    parent = np.arange(n + 1, dtype=np.intp)
+
+    def compress():
+        # pointer jumping until every label points to its root
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                return
+            parent[:] = grandparent
+
+    while len(pairs):
+        roots_a = parent[pairs[:, 0]]
+        roots_b = parent[pairs[:, 1]]
+        low = np.minimum(roots_a, roots_b)
+        high = np.maximum(roots_a, roots_b)
+        unmerged = low != high
+        if not unmerged.any():
+            break
+        # hook each root onto the smallest root it is equivalent to
+        np.minimum.at(parent, high[unmerged], low[unmerged])
+        compress()
+        pairs = pairs[unmerged]
+    return parent
+
+
+def _face_pairs(labels_a, labels_b, values_a, values_b, connectivity):
+    """Equivalent labels across two adjacent hyperplanes of the image.
+
+    `labels_b` is the plane following `labels_a` along the axis orthogonal to
+    both planes. Pixels are connected if they are neighbors for the given
+    connectivity, both foreground, and have the same value.
+    """
+    ndim = labels_a.ndim
+    pairs = []
+    # crossing the face costs one hop, the in-plane offset the others
+    for offset in itertools.product((-1, 0, 1), repeat=ndim):
+        if 1 + np.count_nonzero(offset) > connectivity:
+            continue
+        sl_a = tuple(slice(max(-o, 0), n - max(o, 0))
+                     for o, n in zip(offset, labels_a.shape))
+        sl_b = tuple(slice(max(o, 0), n - max(-o, 0))
+                     for o, n in zip(offset, labels_a.shape))
+        la, lb = labels_a[sl_a], labels_b[sl_b]
+        connected = (la > 0) & (lb > 0) & (values_a[sl_a] == values_b[sl_b])
+        if connected.any():
+            pairs.append(np.stack([la[connected], lb[connected]], axis=1))
+    if not pairs:
+        return np.empty((0, 2), dtype=np.intp)
+    return np.unique(np.concatenate(pairs), axis=0)
+
+
+def _label_chunked(label_image, background, return_num, connectivity,
+                   chunks, out):
+    """Label an image one block at a time.
+
+    Every block is labeled independently and written to `out` with labels
+    that are unique across blocks. Equivalences between labels touching
+    across block faces are then resolved with a union-find pass, and a second
+    pass over the blocks replaces the provisional labels by the final,
+    consecutive ones. Only one block, one pair of hyperplanes at a block
+    face and a few arrays with one entry per provisional label are held in
+    memory at any time.
+    """
+    from ..util.apply_parallel import _normalize_chunks
+
+    shape = label_image.shape
+    ndim = len(shape)
+    if connectivity is None:
+        connectivity = ndim
+    if not 1 <= connectivity <= ndim:
+        raise ValueError(
+            f'Connectivity for {ndim}D image should '
+            f'be in [1, ..., {ndim}]. Got {connectivity}.'
+        )
+    if out is None:
+        out = np.empty(shape, dtype=np.intp)
+    elif out.shape != shape:
+        raise ValueError(f'out has shape {out.shape}, expected {shape}')
+    elif not np.issubdtype(out.dtype, np.integer):
+        raise ValueError('out must have an integer dtype')
+
+    chunks = _normalize_chunks(chunks, shape)
+    bounds = [np.concatenate(([0], np.cumsum(c))) for c in chunks]
+    blocks = [tuple(slice(b[i], b[i + 1]) for b, i in zip(bounds, index))
+              for index in itertools.product(*(range(len(c))
+                                               for c in chunks))]
+
+    # first pass: label each block, offsetting its labels by the number of
+    # labels found so far, and record where each label is first seen
+    n_labels = 0
+    first_seen = [np.zeros(1, dtype=np.intp)]
+    for block in blocks:
+        labels, num = _label_block(np.asarray(label_image[block]),
+                                   background, connectivity)
+        flat = labels.ravel()
+        positions = np.flatnonzero(flat)
+        first = np.full(num + 1, flat.size, dtype=np.intp)
+        np.minimum.at(first, flat[positions], positions)
+        coords = np.unravel_index(first[1:], labels.shape)
+        coords = tuple(c + sl.start for c, sl in zip(coords, block))
+        first_seen.append(np.ravel_multi_index(coords, shape))
+        labels[labels > 0] += n_labels
+        out[block] = labels
+        n_labels += num
+    first_seen = np.concatenate(first_seen)
+
+    # merge labels across every block face
+    pairs = []
+    for axis in range(ndim):
+        for position in bounds[axis][1:-1]:
+            before = (slice(None),) * axis + (position - 1,)
+            after = (slice(None),) * axis + (position,)
+            pairs.append(_face_pairs(
+                np.asarray(out[before]), np.asarray(out[after]),
+                np.asarray(label_image[before]),
+                np.asarray(label_image[after]), connectivity))
+    pairs = (np.concatenate(pairs) if pairs
+             else np.empty((0, 2), dtype=np.intp))
+    roots = _union_find(n_labels, pairs)
+
+    # number the merged labels in the order in which the unchunked
+    # algorithm encounters them, i.e. by their first pixel in raster order
+    root_first = np.full(n_labels + 1, np.iinfo(np.intp).max, dtype=np.intp)
+    np.minimum.at(root_first, roots, first_seen)
+    is_root = roots == np.arange(n_labels + 1)
+    is_root[0] = False
+    root_labels = np.flatnonzero(is_root)
+    final = np.zeros(n_labels + 1, dtype=np.intp)
+    final[root_labels[np.argsort(root_first[root_labels], kind='stable')]] = (
+        np.arange(1, len(root_labels) + 1))
+    relabel = final[roots].astype(out.dtype, copy=False)
+
+    # second pass: write the final labels
+    for block in blocks:
+        out[block] = relabel[np.asarray(out[block])]
+
+    if return_num:
+        return out, len(root_labels)
+    return out
+
+
 @deprecate_kwarg({"input": "label_image"}, removed_version="1.0")
-def label(label_image, background=None, return_num=False, connectivity=None):
+def label(label_image, background=None, return_num=False, connectivity=None,
+          *, chunks=None, out=None):
     r"""Label connected regions of an integer array.
 
     Two pixels are connected when they are neighbors and have the same value.
@@ -62,6 +229,18 @@ def label(label_image, background=None, return_num=False, connectivity=None):
         as a neighbor.
         Accepted values are ranging from  1 to input.ndim. If ``None``, a full
         connectivity of ``input.ndim`` is used.
+    chunks : int, tuple, or tuple of tuples, optional
+        If given, label the image one block at a time, for images that do not
+        fit in memory. `label_image` then only needs to support slicing, as
+        memory-mapped arrays, dask arrays or zarr and HDF5 datasets do. The
+        block shape is given as in `skimage.util.apply_parallel`. The result
+        is identical to labeling the whole image at once.
+    out : array-like of int, optional
+        Array, e.g. a memory-mapped array, in which to write the labels when
+        `chunks` is given. It must be large enough to hold the provisional
+        labels, whose number is the sum of the numbers of components found
+        in each block. By default, a new array of dtype ``np.intp`` is
+        created. Ignored if `chunks` is None.
 
     Returns
     -------
@@ -77,6 +256,14 @@ def label(label_image, background=None, return_num=False, connectivity=None):
     regionprops
     regionprops_table
 
+    Notes
+    -----
+    With `chunks`, each block is labeled independently, labels touching
+    across block faces are merged with a union-find pass and the merged
+    labels are written in a second pass over the blocks. Besides one block
+    and the two hyperplanes on either side of a block face, memory is only
+    needed for a few arrays with one entry per provisional label.
+
     References
     ----------
     .. [1] Christophe Fiorio and Jens Gustedt, "Two linear time Union-Find
@@ -111,10 +298,17 @@ def label(label_image, background=None, return_num=False, connectivity=None):
     ...               [1, 1, 5],
     ...               [0, 0, 0]])
     >>> print(label(x))
+    [[1 0 0]
+     [1 1 2]
+     [0 0 0]]
+    >>> print(label(x, chunks=2))
     [[1 0 0]
      [1 1 2]
      [0 0 0]]
     """
+    if chunks is not None:
+        return _label_chunked(label_image, background, return_num,
+                              connectivity, chunks, out)
     if label_image.dtype == bool:
         return _label_bool(label_image, background=background,
                            return_num=return_num, connectivity=connectivity)
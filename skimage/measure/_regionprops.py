@@ -1,6 +1,7 @@
 import inspect
+import itertools
 from warnings import warn
-from math import sqrt, atan2, pi as PI
+from math import sqrt, pi as PI
 import numpy as np
 from scipy import ndimage as ndi
 from scipy.spatial.distance import pdist
@@ -190,6 +191,41 @@ def _cached(f):
     return wrapper
 
 
+def _check_label_image(label_image):
+    """Raise a TypeError if ``label_image`` is not a 2D or 3D label image."""
+    if label_image.ndim not in (2, 3):
+        raise TypeError('Only 2-D and 3-D images supported.')
+
+    if not np.issubdtype(label_image.dtype, np.integer):
+        if np.issubdtype(label_image.dtype, bool):
+            raise TypeError(
+                    'Non-integer image types are ambiguous: '
+                    'use skimage.measure.label to label the connected'
+                    'components of label_image,'
+                    'or label_image.astype(np.uint8) to interpret'
+                    'the True values as a single label.')
+        else:
+            raise TypeError(
+                    'Non-integer label_image types are ambiguous')
+
+
+def _orientation(a, b, c):
+    """Orientation of the 2D inertia tensor ``[[a, b], [b, c]]``.
+
+    ``a - c`` and ``b`` below the rounding noise of the central moments are
+    snapped to zero, the value they take in exact arithmetic, as the branch
+    taken otherwise depends on the order in which the moments were
+    accumulated.
+    """
+    tol = 1e-10 * (np.abs(a) + np.abs(c))
+    diff = np.where(np.abs(c - a) <= tol, 0., c - a)
+    # with zero central moments, the off-diagonal term ``-mu11 / mu0`` is -0
+    b = np.where(np.abs(b) <= tol, -0., b)
+    return np.where(diff == 0,
+                    np.where(b < 0, -PI / 4., PI / 4.),
+                    0.5 * np.arctan2(-2 * b, diff))
+
+
 def only2d(method):
     @wraps(method)
     def func2d(self, *args, **kwargs):
@@ -454,13 +490,7 @@ class RegionProperties:
     @only2d
     def orientation(self):
         a, b, b, c = self.inertia_tensor.flat
-        if a - c == 0:
-            if b < 0:
-                return -PI / 4.
-            else:
-                return PI / 4.
-        else:
-            return 0.5 * atan2(-2 * b, c - a)
+        return float(_orientation(a, b, c))
 
     @property
     @only2d
@@ -592,6 +622,341 @@ class RegionProperties:
 _RegionProperties = RegionProperties
 
 
+class _RegionPropertiesTable:
+    """Columnar counterpart of `RegionProperties`.
+
+    Each supported property is computed for all regions at once with a
+    small number of bincount-style reductions over the foreground pixels,
+    instead of slicing out every region separately. Properties are returned
+    as arrays whose first axis indexes the regions in increasing label
+    order, matching the order of :func:`regionprops`.
+
+    Only properties listed in ``VECTORIZED_PROPS`` are available; the others
+    must be computed through `RegionProperties`.
+    """
+
+    VECTORIZED_PROPS = {
+        'area', 'bbox', 'bbox_area', 'centroid', 'eccentricity',
+        'equivalent_diameter', 'extent', 'inertia_tensor',
+        'inertia_tensor_eigvals', 'label', 'local_centroid',
+        'major_axis_length', 'max_intensity', 'mean_intensity',
+        'min_intensity', 'minor_axis_length', 'moments', 'moments_central',
+        'moments_normalized', 'orientation', 'weighted_centroid',
+        'weighted_local_centroid', 'weighted_moments',
+        'weighted_moments_central', 'weighted_moments_normalized',
+    }
+
+    # Number of image pixels (in raveled order) processed at once by the
+    # reductions, which bounds the size of the per-pixel temporaries
+    # independently of the image size.
+    _block_size = 2 ** 20
+
+    def __init__(self, label_image, intensity_image=None):
+        _check_label_image(label_image)
+        if intensity_image is not None:
+            ndim = label_image.ndim
+            if not (
+                    intensity_image.shape[:ndim] == label_image.shape
+                    and intensity_image.ndim in [ndim, ndim + 1]
+                    ):
+                raise ValueError('Label and intensity image shapes must match,'
+                                 ' except for channel (last) axis.')
+            multichannel = label_image.shape < intensity_image.shape
+        else:
+            multichannel = False
+
+        self._label_image = label_image
+        self._intensity_image = intensity_image
+        self._cache_active = True
+        self._cache = {}
+        self._ndim = label_image.ndim
+        self._multichannel = multichannel
+
+        objects = ndi.find_objects(label_image)
+        self.slice = [sl for sl in objects if sl is not None]
+        self.label = np.array([i + 1 for i, sl in enumerate(objects)
+                               if sl is not None], dtype=np.intp)
+        self._n_regions = len(self.label)
+
+        # maps a label to its region index (position in ``self.label``)
+        self._region_index = np.zeros(len(objects) + 1, dtype=np.intp)
+        self._region_index[self.label] = np.arange(self._n_regions)
+
+    def __len__(self):
+        return self._n_regions
+
+    def is_vectorized(self, prop):
+        """Whether ``prop`` can be computed by this table."""
+        if prop not in self.VECTORIZED_PROPS:
+            return False
+        # multichannel weighted moments are left to the per-region path
+        return not (self._multichannel and prop.startswith('weighted'))
+
+    def columns(self, prop, separator='-'):
+        """Return the table columns of ``prop``, as in `_props_to_dict`."""
+        values = np.asarray(getattr(self, prop), dtype=COL_DTYPES[prop])
+        shape = values.shape[1:]
+        if not shape:
+            return {prop: values}
+        out = {}
+        for ind in np.ndindex(shape):
+            key = separator.join(map(str, (prop,) + ind))
+            out[key] = values[(slice(None),) + ind]
+        return out
+
+    def _blocks(self, local=True):
+        """Iterate over the foreground pixels, one image block at a time.
+
+        Yields the region index of every foreground pixel in the block, its
+        bounding box (local) coordinates if ``local`` is True, and its
+        intensity, if available.
+        """
+        labels_flat = self._label_image.ravel()
+        if self._intensity_image is not None:
+            nchannels = (self._intensity_image.shape[-1]
+                         if self._multichannel else 1)
+            intensity_flat = self._intensity_image.reshape(-1, nchannels)
+        starts = self.bbox[:, :self._ndim] if local else None
+        for start in range(0, labels_flat.size, self._block_size):
+            block = labels_flat[start:start + self._block_size]
+            offsets = np.flatnonzero(block > 0)
+            if len(offsets) == 0:
+                continue
+            index = self._region_index[block[offsets]]
+            pixels = offsets + start
+            coords = None
+            if local:
+                coords = [c - starts[index, dim] for dim, c in
+                          enumerate(np.unravel_index(pixels,
+                                                     self._label_image.shape))]
+            if self._intensity_image is None:
+                values = None
+            else:
+                values = intensity_flat[pixels]
+                if not self._multichannel:
+                    values = values[:, 0]
+            yield index, coords, values
+
+    def _moments(self, center=None, weighted=False, order=3):
+        """Moments of all regions, in bounding box coordinates."""
+        n = self._n_regions
+        powers_list = list(itertools.product(range(order + 1),
+                                             repeat=self._ndim))
+        out = np.zeros((n,) + (order + 1,) * self._ndim, dtype=np.double)
+        for index, local, values in self._blocks():
+            if center is not None:
+                local = [c - center[index, dim]
+                         for dim, c in enumerate(local)]
+            deltas = [c.astype(np.double)[:, np.newaxis]
+                      ** np.arange(order + 1, dtype=np.double)
+                      for c in local]
+            if weighted:
+                base = values.astype(np.double)
+            else:
+                base = np.ones(len(index), dtype=np.double)
+            for powers in powers_list:
+                weights = base.copy()
+                for dim, p in enumerate(powers):
+                    if p:
+                        weights *= deltas[dim][:, p]
+                out[(slice(None),) + powers] += np.bincount(
+                    index, weights=weights, minlength=n
+                )
+        return out
+
+    def _normalized(self, mu, order=3):
+        nu = np.zeros_like(mu)
+        mu0 = mu[(slice(None),) + (0,) * self._ndim]
+        for powers in itertools.product(range(order + 1), repeat=self._ndim):
+            idx = (slice(None),) + powers
+            if sum(powers) < 2:
+                nu[idx] = np.nan
+            else:
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    nu[idx] = mu[idx] / (mu0 ** (sum(powers) / self._ndim
+                                                 + 1))
+        return nu
+
+    def _local_centroid(self, M):
+        first_order = [M[(slice(None),) + tuple(row)]
+                       for row in np.eye(self._ndim, dtype=int)]
+        M0 = M[(slice(None),) + (0,) * self._ndim]
+        # regions with zero total weight have an undefined centroid (NaN)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.stack(first_order, axis=-1) / M0[:, np.newaxis]
+
+    def _intensity_reduce(self, ufunc, initial):
+        if self._intensity_image is None:
+            raise AttributeError('No intensity image specified.')
+        shape = (self._n_regions,)
+        if self._multichannel:
+            shape += (self._intensity_image.shape[-1],)
+        out = np.full(shape, initial, dtype=np.double)
+        for index, _, values in self._blocks(local=False):
+            ufunc.at(out, index, values.astype(np.double))
+        return out
+
+    @property
+    @_cached
+    def area(self):
+        area = np.zeros(self._n_regions, dtype=np.intp)
+        for index, _, _ in self._blocks(local=False):
+            area += np.bincount(index, minlength=self._n_regions)
+        return area
+
+    @property
+    @_cached
+    def bbox(self):
+        bbox = np.empty((self._n_regions, 2 * self._ndim), dtype=np.intp)
+        for i, sl in enumerate(self.slice):
+            bbox[i] = ([s.start for s in sl] + [s.stop for s in sl])
+        return bbox
+
+    @property
+    def bbox_area(self):
+        return np.prod(self.bbox[:, self._ndim:] - self.bbox[:, :self._ndim],
+                       axis=1)
+
+    @property
+    def centroid(self):
+        return self.local_centroid + self.bbox[:, :self._ndim]
+
+    @property
+    @only2d
+    def eccentricity(self):
+        l1, l2 = self.inertia_tensor_eigvals.T
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ecc = np.sqrt(1 - l2 / l1)
+        return np.where(l1 == 0, 0, ecc)
+
+    @property
+    def equivalent_diameter(self):
+        return (2 * self._ndim * self.area / PI) ** (1 / self._ndim)
+
+    @property
+    def extent(self):
+        return self.area / self.bbox_area
+
+    @property
+    @_cached
+    def inertia_tensor(self):
+        if 'moments_central' in self._cache:
+            mu = self.moments_central
+        else:
+            mu = self._moments(center=self.local_centroid, order=2)
+        mu0 = mu[(slice(None),) + (0,) * self._ndim]
+        ndim = self._ndim
+        result = np.zeros((self._n_regions, ndim, ndim), dtype=mu.dtype)
+        corners2 = [tuple(row) for row in 2 * np.eye(ndim, dtype=int)]
+        mu2 = np.stack([mu[(slice(None),) + c] for c in corners2], axis=-1)
+        diag = (np.sum(mu2, axis=-1)[:, np.newaxis] - mu2) / mu0[:, np.newaxis]
+        result[:, np.arange(ndim), np.arange(ndim)] = diag
+        for dims in itertools.combinations(range(ndim), 2):
+            mu_index = np.zeros(ndim, dtype=int)
+            mu_index[list(dims)] = 1
+            value = -mu[(slice(None),) + tuple(mu_index)] / mu0
+            result[:, dims[0], dims[1]] = value
+            result[:, dims[1], dims[0]] = value
+        return result
+
+    @property
+    @_cached
+    def inertia_tensor_eigvals(self):
+        eigvals = np.linalg.eigvalsh(self.inertia_tensor)
+        eigvals = np.clip(eigvals, 0, None, out=eigvals)
+        return eigvals[:, ::-1]
+
+    @property
+    @_cached
+    def local_centroid(self):
+        # first order moments are enough, avoid computing all of them
+        return self._local_centroid(self._moments(order=1))
+
+    @property
+    def major_axis_length(self):
+        return 4 * np.sqrt(self.inertia_tensor_eigvals[:, 0])
+
+    @property
+    def max_intensity(self):
+        return self._intensity_reduce(np.maximum, -np.inf)
+
+    @property
+    def mean_intensity(self):
+        if self._intensity_image is None:
+            raise AttributeError('No intensity image specified.')
+        sums = 0
+        for index, _, values in self._blocks(local=False):
+            if self._multichannel:
+                sums = sums + np.stack(
+                    [np.bincount(index, weights=values[:, c],
+                                 minlength=self._n_regions)
+                     for c in range(values.shape[1])],
+                    axis=-1,
+                )
+            else:
+                sums = sums + np.bincount(index, weights=values,
+                                          minlength=self._n_regions)
+        area = self.area if not self._multichannel else self.area[:, None]
+        return sums / area
+
+    @property
+    def min_intensity(self):
+        return self._intensity_reduce(np.minimum, np.inf)
+
+    @property
+    def minor_axis_length(self):
+        return 4 * np.sqrt(self.inertia_tensor_eigvals[:, -1])
+
+    @property
+    @_cached
+    def moments(self):
+        return self._moments()
+
+    @property
+    @_cached
+    def moments_central(self):
+        return self._moments(center=self.local_centroid)
+
+    @property
+    @_cached
+    def moments_normalized(self):
+        return self._normalized(self.moments_central)
+
+    @property
+    @only2d
+    def orientation(self):
+        T = self.inertia_tensor
+        return _orientation(T[:, 0, 0], T[:, 0, 1], T[:, 1, 1])
+
+    @property
+    def weighted_centroid(self):
+        return self.weighted_local_centroid + self.bbox[:, :self._ndim]
+
+    @property
+    def weighted_local_centroid(self):
+        return self._local_centroid(self.weighted_moments)
+
+    @property
+    @_cached
+    def weighted_moments(self):
+        if self._intensity_image is None:
+            raise AttributeError('No intensity image specified.')
+        return self._moments(weighted=True)
+
+    @property
+    @_cached
+    def weighted_moments_central(self):
+        # For regions with zero total intensity the weighted centroid is
+        # undefined, and so are all central moments but the zeroth (NaN).
+        return self._moments(center=self.weighted_local_centroid,
+                             weighted=True)
+
+    @property
+    @_cached
+    def weighted_moments_normalized(self):
+        return self._normalized(self.weighted_moments_central)
+
+
 def _props_to_dict(regions, properties=('label', 'bbox'), separator='-'):
     """Convert image region properties list into a column dictionary.
 
@@ -793,6 +1158,16 @@ def regionprops_table(label_image, intensity_image=None,
     size), an object array will be used, with the corresponding property name
     as the key.
 
+    Properties that only depend on per-region sums, extrema and moments (such
+    as "area", "bbox", "centroid", "moments", "inertia_tensor" or
+    "mean_intensity") are computed for all regions at once, in a single pass
+    over the label image. The remaining properties, as well as
+    ``extra_properties``, are computed region by region as in
+    :func:`regionprops`. Values computed column-wise agree with those of
+    :func:`regionprops` up to floating point rounding. For regions with zero
+    total intensity, the weighted central and normalized moments of nonzero
+    order are NaN.
+
     Examples
     --------
     >>> from skimage import data, util, measure
@@ -847,13 +1222,12 @@ def regionprops_table(label_image, intensity_image=None,
     4      5       112.50        113.0        114.0
 
     """
-    regions = regionprops(label_image, intensity_image=intensity_image,
-                          cache=cache, extra_properties=extra_properties)
+    table = _RegionPropertiesTable(label_image, intensity_image)
     if extra_properties is not None:
         properties = (
             list(properties) + [prop.__name__ for prop in extra_properties]
         )
-    if len(regions) == 0:
+    if len(table) == 0:
         ndim = label_image.ndim
         label_image = np.zeros((3,) * ndim, dtype=int)
         label_image[(1,) * ndim] = 1
@@ -869,9 +1243,22 @@ def regionprops_table(label_image, intensity_image=None,
                                separator=separator)
         return {k: v[:0] for k, v in out_d.items()}
 
-    return _props_to_dict(
-        regions, properties=properties, separator=separator
-    )
+    # Properties that cannot be computed column-wise, as well as extra
+    # properties, fall back to the per-region path.
+    regions = None
+    if extra_properties is not None or not all(
+            table.is_vectorized(prop) for prop in properties):
+        regions = regionprops(label_image, intensity_image=intensity_image,
+                              cache=cache, extra_properties=extra_properties)
+
+    out = {}
+    for prop in properties:
+        if table.is_vectorized(prop):
+            out.update(table.columns(prop, separator=separator))
+        else:
+            out.update(_props_to_dict(regions, properties=(prop,),
+                                      separator=separator))
+    return out
 
 
 def regionprops(label_image, intensity_image=None, cache=True,
@@ -1123,20 +1510,7 @@ def regionprops(label_image, intensity_image=None, cache=True,
 
     """
 
-    if label_image.ndim not in (2, 3):
-        raise TypeError('Only 2-D and 3-D images supported.')
-
-    if not np.issubdtype(label_image.dtype, np.integer):
-        if np.issubdtype(label_image.dtype, bool):
-            raise TypeError(
-                    'Non-integer image types are ambiguous: '
-                    'use skimage.measure.label to label the connected'
-                    'components of label_image,'
-                    'or label_image.astype(np.uint8) to interpret'
-                    'the True values as a single label.')
-        else:
-            raise TypeError(
-                    'Non-integer label_image types are ambiguous')
+    _check_label_image(label_image)
 
     if coordinates is not None:
         if coordinates == 'rc':
@@ -57,3 +57,55 @@ def test_zero_size(dtype):
 
     assert lab.shape == img.shape
     assert num == 0
+
+
+@pytest.mark.parametrize("connectivity", [1, 2, 3])
+@pytest.mark.parametrize("chunks", [7, (16, 5, 40), ((3, 50, 11), 32, 32)])
+def test_chunked_bool(connectivity, chunks):
+    img = data.binary_blobs(length=64, blob_size_fraction=0.1, n_dim=3,
+                            volume_fraction=0.3, seed=0)
+    expected, num = label(img, connectivity=connectivity, return_num=True)
+    lab, num_chunked = label(img, connectivity=connectivity, chunks=chunks,
+                             return_num=True)
+    testing.assert_equal(lab, expected)
+    assert num_chunked == num
+
+
+@pytest.mark.parametrize("connectivity", [1, 2])
+@pytest.mark.parametrize("background", [None, 0, 2])
+def test_chunked_int(connectivity, background):
+    rng = np.random.default_rng(0)
+    img = rng.integers(0, 4, size=(50, 61))
+    expected = label(img, background=background, connectivity=connectivity)
+    for chunks in (1, 4, (13, 9), (50, 61)):
+        lab = label(img, background=background, connectivity=connectivity,
+                    chunks=chunks)
+        testing.assert_equal(lab, expected)
+
+
+def test_chunked_out(tmp_path):
+    img = data.binary_blobs(length=64, blob_size_fraction=0.05, n_dim=2,
+                            seed=1)
+    image_map = np.lib.format.open_memmap(tmp_path / 'image.npy', mode='w+',
+                                          dtype=img.dtype, shape=img.shape)
+    image_map[:] = img
+    out = np.lib.format.open_memmap(tmp_path / 'labels.npy', mode='w+',
+                                    dtype=np.uint32, shape=img.shape)
+    lab = label(image_map, chunks=10, out=out)
+    assert lab is out
+    testing.assert_equal(lab, label(img))
+
+    with pytest.raises(ValueError):
+        label(img, chunks=10, out=np.empty((3, 3), dtype=np.intp))
+    with pytest.raises(ValueError):
+        label(img, chunks=10, out=np.empty(img.shape))
+    with pytest.raises(ValueError):
+        label(img, chunks=10, connectivity=3)
+
+
+def test_chunked_dask():
+    da = pytest.importorskip('dask.array')
+    img = data.binary_blobs(length=64, blob_size_fraction=0.1, n_dim=2,
+                            seed=2)
+    lab = label(da.from_array(img, chunks=20), chunks=20)
+    testing.assert_equal(lab, label(img))
@@ -1,16 +1,19 @@
+import itertools
 import math
 
 import numpy as np
+import pytest
 from numpy import array
 
 from skimage import data
+from skimage.measure import label
 from skimage.segmentation import slic
 from skimage._shared._warnings import expected_warnings
 from skimage.measure._regionprops import (regionprops, PROPS, perimeter,
                                           perimeter_crofton, euler_number,
                                           _parse_docs, _props_to_dict,
                                           regionprops_table, OBJECT_COLUMNS,
-                                          COL_DTYPES)
+                                          COL_DTYPES, _RegionPropertiesTable)
 from skimage._shared import testing
 from skimage._shared.testing import (assert_array_equal, assert_almost_equal,
                                      assert_array_almost_equal, assert_equal)
@@ -576,24 +579,141 @@ def test_regionprops_table():
                    'bbox+2': array([10]), 'bbox+3': array([18])}
 
 
+# Float properties accumulated over the pixels of a region (central moments
+# and their derived quantities, intensity-weighted moments and the mean
+# intensity) are summed in a different order by the column-wise engine of
+# `regionprops_table`. They only agree with `regionprops` up to rounding, and
+# are compared to 7 decimals. All other columns must match exactly.
+ACCUMULATED_FLOAT_PROPS = {
+    'eccentricity', 'inertia_tensor', 'inertia_tensor_eigvals',
+    'major_axis_length', 'mean_intensity', 'minor_axis_length',
+    'moments_central', 'moments_normalized', 'moments_hu', 'orientation',
+    'weighted_centroid', 'weighted_local_centroid', 'weighted_moments',
+    'weighted_moments_central', 'weighted_moments_normalized',
+    'weighted_moments_hu',
+}
+
+
 def test_regionprops_table_equal_to_original():
     regions = regionprops(SAMPLE, INTENSITY_FLOAT_SAMPLE)
     out_table = regionprops_table(SAMPLE, INTENSITY_FLOAT_SAMPLE,
                                   properties=COL_DTYPES.keys())
 
     for prop, dtype in COL_DTYPES.items():
+        if prop in ACCUMULATED_FLOAT_PROPS:
+            compare = assert_almost_equal
+        else:
+            compare = assert_equal
         for i, reg in enumerate(regions):
             rp = reg[prop]
             if np.isscalar(rp) or \
                     prop in OBJECT_COLUMNS or \
                     dtype is np.object_:
-                assert_array_equal(rp, out_table[prop][i])
+                if prop in ACCUMULATED_FLOAT_PROPS:
+                    compare(rp, out_table[prop][i])
+                else:
+                    assert_array_equal(rp, out_table[prop][i])
             else:
                 shape = rp.shape if isinstance(rp, np.ndarray) else (len(rp),)
                 for ind in np.ndindex(shape):
                     modified_prop = "-".join(map(str, (prop,) + ind))
                     loc = ind if len(ind) > 1 else ind[0]
-                    assert_equal(rp[loc], out_table[modified_prop][i])
+                    compare(rp[loc], out_table[modified_prop][i])
+
+
+@pytest.mark.parametrize(
+    'label_image, intensity_image',
+    [(SAMPLE_MULTIPLE, INTENSITY_SAMPLE_MULTIPLE),
+     (SAMPLE_3D, INTENSITY_SAMPLE_3D),
+     (SAMPLE_MULTIPLE, np.stack([INTENSITY_SAMPLE_MULTIPLE] * 3, axis=-1))]
+)
+def test_regionprops_table_vectorized_equal_to_per_region(
+        label_image, intensity_image, monkeypatch):
+    # use tiny blocks so that the reductions have to be accumulated
+    monkeypatch.setattr(_RegionPropertiesTable, '_block_size', 3)
+    table = _RegionPropertiesTable(label_image, intensity_image)
+    properties = sorted(
+        prop for prop in table.VECTORIZED_PROPS
+        if table.is_vectorized(prop)
+        and not (label_image.ndim == 3
+                 and prop in ('eccentricity', 'orientation'))
+    )
+    out_table = regionprops_table(label_image, intensity_image,
+                                  properties=properties)
+    regions = regionprops(label_image, intensity_image)
+    expected = _props_to_dict(regions, properties=properties)
+    assert list(out_table) == list(expected)
+    for key in expected:
+        assert out_table[key].dtype == expected[key].dtype
+        assert_array_almost_equal(out_table[key], expected[key])
+
+
+def test_regionprops_table_orientation_degenerate():
+    label_image = np.zeros((12, 12), dtype=int)
+    # symmetric regions, with equal second moments along both axes
+    label_image[1, 1:4] = 1
+    label_image[2, 2] = 1
+    label_image[0:3, 7] = 2
+    label_image[1, 6:9] = 2
+    label_image[np.arange(5, 8), np.arange(5, 8)] = 3
+    label_image[np.arange(5, 8), np.arange(11, 8, -1)] = 4
+    # axis-aligned regions
+    label_image[9, 1:6] = 5
+    label_image[8:11, 8] = 6
+    label_image[4, 0] = 7
+    # equal second moments along both axes, with rounding noise in a - c
+    label_image[8:11, 9:12] = [[8, 8, 0], [0, 8, 8], [0, 0, 8]]
+    # region with rounding noise in its central moments
+    rng = np.random.default_rng(0)
+    noisy = label(rng.random((300, 300)) > 0.6)
+
+    out = regionprops_table(label_image, properties=('orientation',))
+    expected = [np.pi / 2, np.pi / 4, -np.pi / 4, np.pi / 4, np.pi / 2, 0,
+                np.pi / 4, -np.pi / 4]
+    assert_array_almost_equal(out['orientation'], expected)
+    for image in (label_image, noisy):
+        out = regionprops_table(image, properties=('orientation',))
+        expected = [r.orientation for r in regionprops(image)]
+        # branch flips would show up as differences of pi / 4 or pi / 2
+        assert_array_almost_equal(out['orientation'], expected)
+
+
+def test_regionprops_table_zero_intensity_region():
+    label_image = np.zeros((5, 5), dtype=int)
+    label_image[2, 2] = 1
+    intensity_image = np.zeros((5, 5))
+    with expected_warnings([]):
+        out = regionprops_table(label_image, intensity_image,
+                                properties=('weighted_centroid',
+                                            'weighted_moments_central',
+                                            'weighted_moments_normalized'))
+    assert np.isnan(out['weighted_centroid-0'][0])
+    assert out['weighted_moments_central-0-0'][0] == 0
+    for p, q in itertools.product(range(4), repeat=2):
+        if p + q > 0:
+            assert np.isnan(out[f'weighted_moments_central-{p}-{q}'][0])
+            assert np.isnan(out[f'weighted_moments_normalized-{p}-{q}'][0])
+
+
+def test_regionprops_table_mixed_properties():
+    out = regionprops_table(SAMPLE_MULTIPLE, INTENSITY_SAMPLE_MULTIPLE,
+                            properties=('label', 'solidity', 'area',
+                                        'euler_number', 'centroid'))
+    regions = regionprops(SAMPLE_MULTIPLE, INTENSITY_SAMPLE_MULTIPLE)
+    assert list(out) == ['label', 'solidity', 'area', 'euler_number',
+                         'centroid-0', 'centroid-1']
+    assert_array_equal(out['solidity'], [r.solidity for r in regions])
+    assert_array_equal(out['euler_number'], [r.euler_number for r in regions])
+    assert_array_equal(out['area'], [10, 2])
+
+
+def test_regionprops_table_vectorized_errors():
+    with testing.raises(AttributeError):
+        regionprops_table(SAMPLE, properties=('mean_intensity',))
+    with testing.raises(NotImplementedError):
+        regionprops_table(SAMPLE_3D, properties=('eccentricity',))
+    with testing.raises(TypeError):
+        regionprops_table(SAMPLE.astype(float))
 
 
 def test_regionprops_table_no_regions():
@@ -1,13 +1,21 @@
-from ._adapted_rand_error import adapted_rand_error
-from ._variation_of_information import variation_of_information
-from ._contingency_table import contingency_table
-from .simple_metrics import (mean_squared_error,
-                             normalized_mutual_information,
-                             normalized_root_mse,
-                             peak_signal_noise_ratio)
-from ._structural_similarity import structural_similarity
-from .set_metrics import (hausdorff_distance,
-                          hausdorff_pair)
+from .._shared import lazy
+
+__getattr__, __dir__ = lazy.attach(
+    __name__,
+    submodules={'simple_metrics', 'set_metrics'},
+    submod_attrs={
+        '_adapted_rand_error': ['adapted_rand_error'],
+        '_variation_of_information': ['variation_of_information'],
+        '_contingency_table': ['contingency_table'],
+        'simple_metrics': ['mean_squared_error',
+                           'normalized_mutual_information',
+                           'normalized_root_mse', 'peak_signal_noise_ratio'],
+        '_structural_similarity': ['structural_similarity',
+                                   'StructuralSimilarity'],
+        'set_metrics': ['hausdorff_distance', 'hausdorff_pair'],
+    }
+)
+
 
 __all__ = ['adapted_rand_error',
            'variation_of_information',
@@ -17,6 +25,7 @@ __all__ = ['adapted_rand_error',
            'normalized_root_mse',
            'peak_signal_noise_ratio',
            'structural_similarity',
+           'StructuralSimilarity',
            'hausdorff_distance',
            'hausdorff_pair'
            ]
@@ -10,7 +10,7 @@ from .._shared import utils
 from .._shared.utils import warn, check_shape_equality
 
 
-__all__ = ['structural_similarity']
+__all__ = ['structural_similarity', 'StructuralSimilarity']
 
 
 @utils.deprecate_multichannel_kwarg()
@@ -139,38 +139,8 @@ def structural_similarity(im1, im2,
         else:
             return mssim
 
-    K1 = kwargs.pop('K1', 0.01)
-    K2 = kwargs.pop('K2', 0.03)
-    sigma = kwargs.pop('sigma', 1.5)
-    if K1 < 0:
-        raise ValueError("K1 must be positive")
-    if K2 < 0:
-        raise ValueError("K2 must be positive")
-    if sigma < 0:
-        raise ValueError("sigma must be positive")
-    use_sample_covariance = kwargs.pop('use_sample_covariance', True)
-
-    if gaussian_weights:
-        # Set to give an 11-tap filter with the default sigma of 1.5 to match
-        # Wang et. al. 2004.
-        truncate = 3.5
-
-    if win_size is None:
-        if gaussian_weights:
-            # set win_size used by crop to match the filter size
-            r = int(truncate * sigma + 0.5)  # radius as in ndimage
-            win_size = 2 * r + 1
-        else:
-            win_size = 7   # backwards compatibility
-
-    if np.any((np.asarray(im1.shape) - win_size) < 0):
-        raise ValueError(
-            "win_size exceeds image extent.  If the input is a multichannel "
-            "(color) image, set channel_axis to the axis number corresponding "
-            "to the channels.")
-
-    if not (win_size % 2 == 1):
-        raise ValueError('Window size must be odd.')
+    win_size, filter_func, filter_args, cov_norm, K1, K2 = _ssim_parameters(
+        im1.shape, win_size, gaussian_weights, kwargs)
 
     if data_range is None:
         if im1.dtype != im2.dtype:
@@ -179,27 +149,10 @@ def structural_similarity(im1, im2,
         dmin, dmax = dtype_range[im1.dtype.type]
         data_range = dmax - dmin
 
-    ndim = im1.ndim
-
-    if gaussian_weights:
-        filter_func = gaussian_filter
-        filter_args = {'sigma': sigma, 'truncate': truncate}
-    else:
-        filter_func = uniform_filter
-        filter_args = {'size': win_size}
-
     # ndimage filters need floating point data
     im1 = im1.astype(np.float64)
     im2 = im2.astype(np.float64)
 
-    NP = win_size ** ndim
-
-    # filter has already normalized by NP
-    if use_sample_covariance:
-        cov_norm = NP / (NP - 1)  # sample covariance
-    else:
-        cov_norm = 1.0  # population covariance to match Wang et. al. 2004
-
     # compute (weighted) means
     ux = filter_func(im1, **filter_args)
     uy = filter_func(im2, **filter_args)
@@ -246,3 +199,332 @@ def structural_similarity(im1, im2,
             return mssim, S
         else:
             return mssim
+
+
+def _ssim_parameters(shape, win_size, gaussian_weights, kwargs):
+    """Validate the SSIM parameters and return the filter they define.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of the images, without any channel axis.
+    win_size, gaussian_weights
+        See `structural_similarity`.
+    kwargs : dict
+        The other parameters of `structural_similarity` (K1, K2, sigma and
+        use_sample_covariance). Consumed entries are removed.
+
+    Returns
+    -------
+    win_size : int
+        The window size, derived from sigma with Gaussian weights.
+    filter_func : callable
+        The ndimage filter computing local (weighted) means.
+    filter_args : dict
+        The keyword arguments of `filter_func`.
+    cov_norm : float
+        Normalization factor applied to the local (co)variances.
+    K1, K2 : float
+        The algorithm parameters.
+    """
+    K1 = kwargs.pop('K1', 0.01)
+    K2 = kwargs.pop('K2', 0.03)
+    sigma = kwargs.pop('sigma', 1.5)
+    if K1 < 0:
+        raise ValueError("K1 must be positive")
+    if K2 < 0:
+        raise ValueError("K2 must be positive")
+    if sigma < 0:
+        raise ValueError("sigma must be positive")
+    use_sample_covariance = kwargs.pop('use_sample_covariance', True)
+
+    if gaussian_weights:
+        # Set to give an 11-tap filter with the default sigma of 1.5 to match
+        # Wang et. al. 2004.
+        truncate = 3.5
+
+    if win_size is None:
+        if gaussian_weights:
+            # set win_size used by crop to match the filter size
+            r = int(truncate * sigma + 0.5)  # radius as in ndimage
+            win_size = 2 * r + 1
+        else:
+            win_size = 7   # backwards compatibility
+
+    if np.any((np.asarray(shape) - win_size) < 0):
+        raise ValueError(
+            "win_size exceeds image extent.  If the input is a multichannel "
+            "(color) image, set channel_axis to the axis number corresponding "
+            "to the channels.")
+
+    if not (win_size % 2 == 1):
+        raise ValueError('Window size must be odd.')
+
+    if gaussian_weights:
+        filter_func = gaussian_filter
+        filter_args = {'sigma': sigma, 'truncate': truncate}
+    else:
+        filter_func = uniform_filter
+        filter_args = {'size': win_size}
+
+    NP = win_size ** len(shape)
+
+    # filter has already normalized by NP
+    if use_sample_covariance:
+        cov_norm = NP / (NP - 1)  # sample covariance
+    else:
+        cov_norm = 1.0  # population covariance to match Wang et. al. 2004
+
+    return win_size, filter_func, filter_args, cov_norm, K1, K2
+
+
+class StructuralSimilarity:
+    """Structural similarity index to a fixed reference image.
+
+    The local statistics of the reference are computed once, so that
+    comparing many images to the same reference only filters the compared
+    images. For each compared image, the local mean, second moment and cross
+    moment with the reference are computed in a single filter pass over a
+    stacked buffer, and the buffers are reused between images.
+
+    Parameters
+    ----------
+    reference : ndarray
+        The reference image, `im1` of :func:`structural_similarity`.
+    win_size : int or None, optional
+        The side-length of the sliding window used in comparison. Must be an
+        odd value. If `gaussian_weights` is True, this is ignored and the
+        window size will depend on `sigma`.
+    data_range : float, optional
+        The data range of the input image (distance between minimum and
+        maximum possible values). By default, this is estimated from the
+        reference data-type.
+    channel_axis : int or None, optional
+        If None, the image is assumed to be a grayscale (single channel) image.
+        Otherwise, this parameter indicates which axis of the array corresponds
+        to channels. Similarity calculations are done independently for each
+        channel then averaged.
+    gaussian_weights : bool, optional
+        If True, each patch has its mean and variance spatially weighted by a
+        normalized Gaussian kernel of width sigma=1.5.
+    dtype : {np.float64, np.float32}, optional
+        Floating point precision of the computation. ``float32`` halves the
+        memory traffic; the statistics are computed on data centered on the
+        mean of the reference to limit the loss of precision.
+
+    Other Parameters
+    ----------------
+    use_sample_covariance : bool
+        If True, normalize covariances by N-1 rather than, N where N is the
+        number of pixels within the sliding window.
+    K1 : float
+        Algorithm parameter, K1 (small constant, see [1]_).
+    K2 : float
+        Algorithm parameter, K2 (small constant, see [1]_).
+    sigma : float
+        Standard deviation for the Gaussian when `gaussian_weights` is True.
+
+    See Also
+    --------
+    structural_similarity
+
+    References
+    ----------
+    .. [1] Wang, Z., Bovik, A. C., Sheikh, H. R., & Simoncelli, E. P.
+       (2004). Image quality assessment: From error visibility to
+       structural similarity. IEEE Transactions on Image Processing,
+       13, 600-612.
+       https://ece.uwaterloo.ca/~z70wang/publications/ssim.pdf,
+       :DOI:`10.1109/TIP.2003.819861`
+
+    Examples
+    --------
+    >>> from skimage import data, util
+    >>> reference = data.camera()
+    >>> ssim = StructuralSimilarity(reference)
+    >>> ssim(reference)
+    1.0
+    >>> noisy = [util.img_as_ubyte(util.random_noise(reference, seed=seed))
+    ...          for seed in range(3)]
+    >>> ssim.batch(noisy).shape
+    (3,)
+    """
+
+    def __init__(self, reference, *, win_size=None, data_range=None,
+                 channel_axis=None, gaussian_weights=False,
+                 dtype=np.float64, **kwargs):
+        reference = np.asarray(reference)
+        self.shape = reference.shape
+        self.channel_axis = channel_axis
+        if channel_axis is not None:
+            channel_axis = channel_axis % reference.ndim
+            reference = np.moveaxis(reference, channel_axis, 0)
+        else:
+            reference = reference[np.newaxis]
+        spatial_shape = reference.shape[1:]
+
+        (win_size, filter_func, filter_args, cov_norm,
+         K1, K2) = _ssim_parameters(spatial_shape, win_size,
+                                    gaussian_weights, kwargs)
+        if data_range is None:
+            dmin, dmax = dtype_range[reference.dtype.type]
+            data_range = dmax - dmin
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float64):
+            raise ValueError("dtype must be float32 or float64.")
+
+        # the filters are applied to (3, channels, ...) stacks, and must not
+        # mix the stacked arrays or the channels
+        ndim = len(spatial_shape)
+        if filter_func is uniform_filter:
+            self._filter_args = {'size': (1, 1) + (win_size,) * ndim}
+        else:
+            self._filter_args = {
+                'sigma': (0, 0) + (filter_args['sigma'],) * ndim,
+                'truncate': filter_args['truncate']}
+        self._filter_func = filter_func
+        self._pad = (win_size - 1) // 2
+        self._cov_norm = cov_norm
+        self._C1 = (K1 * data_range) ** 2
+        self._C2 = (K2 * data_range) ** 2
+
+        # Variances and covariances are invariant to a shift of both images,
+        # so they are computed after subtracting the mean of the reference.
+        self._shift = float(np.mean(reference, dtype=np.float64))
+        self._reference = reference.astype(self.dtype)
+        self._reference -= self._shift
+
+        stats = np.stack([self._reference, self._reference ** 2])
+        stats = filter_func(stats, **self._filter_args)
+        ux, uxx = stats
+        # centered mean, used for the covariance
+        self._ux = ux
+        # variance term of B2, and mean and squared mean term of B1
+        self._vx_C2 = uxx - ux * ux
+        self._vx_C2 *= cov_norm
+        self._vx_C2 += self._C2
+        self._mean_x = ux + self._shift
+        self._mean_x_sq_C1 = self._mean_x ** 2
+        self._mean_x_sq_C1 += self._C1
+
+        self._buffer = None
+        self._filtered = None
+
+    def _ssim_map(self, image):
+        """Return the SSIM image of `image`, in a buffer reused by later calls.
+        """
+        image = np.asarray(image)
+        if image.shape != self.shape:
+            raise ValueError(f"Image shape {image.shape} differs from the "
+                             f"reference shape {self.shape}.")
+        if self.channel_axis is not None:
+            image = np.moveaxis(image, self.channel_axis, 0)
+        else:
+            image = image[np.newaxis]
+
+        if self._buffer is None:
+            self._buffer = np.empty((3,) + self._reference.shape,
+                                    dtype=self.dtype)
+            self._filtered = np.empty_like(self._buffer)
+        t0, t1, t2 = self._buffer
+        np.subtract(image, self._shift, out=t0, casting='unsafe')
+        np.multiply(t0, t0, out=t1)
+        np.multiply(t0, self._reference, out=t2)
+        self._filter_func(self._buffer, output=self._filtered,
+                          **self._filter_args)
+        uy, uyy, uxy = self._filtered
+
+        cov_norm = self._cov_norm
+        # B2 = vx + vy + C2
+        np.multiply(uy, uy, out=t0)
+        np.subtract(uyy, t0, out=t1)
+        t1 *= cov_norm
+        t1 += self._vx_C2
+        # A2 = 2 * vxy + C2
+        np.multiply(self._ux, uy, out=t0)
+        np.subtract(uxy, t0, out=t2)
+        t2 *= 2 * cov_norm
+        t2 += self._C2
+        # A1 = 2 * ux * uy + C1, on the uncentered means
+        uy += self._shift
+        np.multiply(self._mean_x, uy, out=t0)
+        t0 *= 2
+        t0 += self._C1
+        t0 *= t2
+        # B1 = ux ** 2 + uy ** 2 + C1
+        np.multiply(uy, uy, out=t2)
+        t2 += self._mean_x_sq_C1
+        t2 *= t1
+        t0 /= t2
+        return t0
+
+    def _mean(self, S):
+        """Mean SSIM, ignoring the filter radius strip around the edges."""
+        inner = (slice(None),) + (slice(self._pad, -self._pad or None),) * (
+            S.ndim - 1)
+        return float(S[inner].mean(dtype=np.float64))
+
+    def _as_input_layout(self, S):
+        """Move the channels of an SSIM image back to the input layout."""
+        if self.channel_axis is not None:
+            return np.moveaxis(S, 0, self.channel_axis)
+        return S[0]
+
+    def __call__(self, image, *, full=False):
+        """Compute the mean structural similarity of `image` to the reference.
+
+        Parameters
+        ----------
+        image : ndarray
+            Image to compare, `im2` of :func:`structural_similarity`, with
+            the shape of the reference.
+        full : bool, optional
+            If True, also return the full structural similarity image.
+
+        Returns
+        -------
+        mssim : float
+            The mean structural similarity index over the image.
+        S : ndarray
+            The full SSIM image. This is only returned if `full` is set to
+            True.
+        """
+        S = self._ssim_map(image)
+        mssim = self._mean(S)
+        if full:
+            return mssim, self._as_input_layout(S.copy())
+        return mssim
+
+    def batch(self, images, *, full=False):
+        """Compute the mean structural similarity of several images.
+
+        Parameters
+        ----------
+        images : iterable of ndarray
+            Images to compare, each with the shape of the reference, e.g. an
+            array of shape ``(K,) + reference.shape`` or a generator. Images
+            are processed one at a time with the same buffers.
+        full : bool, optional
+            If True, also return the full structural similarity images.
+
+        Returns
+        -------
+        mssim : (K,) ndarray
+            The mean structural similarity index of each image.
+        S : (K, ...) ndarray
+            The full SSIM images. This is only returned if `full` is set to
+            True.
+        """
+        mssim = []
+        S_all = []
+        for image in images:
+            S = self._ssim_map(image)
+            mssim.append(self._mean(S))
+            if full:
+                S_all.append(self._as_input_layout(S.copy()))
+        mssim = np.asarray(mssim, dtype=np.float64)
+        if full:
+            S_all = (np.stack(S_all) if S_all else
+                     np.empty((0,) + self.shape, dtype=self.dtype))
+            return mssim, S_all
+        return mssim
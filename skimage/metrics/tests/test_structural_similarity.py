@@ -2,7 +2,7 @@ import os
 import numpy as np
 
 from skimage import data
-from skimage.metrics import structural_similarity
+from skimage.metrics import structural_similarity, StructuralSimilarity
 
 from skimage._shared import testing
 from skimage._shared._warnings import expected_warnings
@@ -239,3 +239,59 @@ def test_invalid_input():
         structural_similarity(X, X, K2=-0.1)
     with testing.raises(ValueError):
         structural_similarity(X, X, sigma=-1.0)
+
+
+@testing.parametrize('kwargs', [{}, {'win_size': 11},
+                                {'gaussian_weights': True, 'sigma': 1.5,
+                                 'use_sample_covariance': False}])
+def test_structural_similarity_reference(kwargs):
+    images = [cam_noisy, cam, cam_noisy[::-1]]
+    expected = [structural_similarity(cam, im, full=True, **kwargs)
+                for im in images]
+
+    ssim = StructuralSimilarity(cam, **kwargs)
+    mssim, S = ssim(cam_noisy, full=True)
+    assert_almost_equal(mssim, expected[0][0])
+    assert_array_almost_equal(S, expected[0][1])
+
+    mssim, S = ssim.batch(iter(images), full=True)
+    assert mssim.shape == (3,)
+    assert S.shape == (3,) + cam.shape
+    for i, (mssim_i, S_i) in enumerate(expected):
+        assert_almost_equal(mssim[i], mssim_i)
+        assert_array_almost_equal(S[i], S_i)
+    assert_equal(ssim.batch(np.stack(images)), mssim)
+
+
+def test_structural_similarity_reference_float32():
+    ssim = StructuralSimilarity(cam, dtype=np.float32)
+    mssim, S = ssim(cam_noisy, full=True)
+    assert S.dtype == np.float32
+    expected, expected_S = structural_similarity(cam, cam_noisy, full=True)
+    assert_almost_equal(mssim, expected, decimal=6)
+    assert_array_almost_equal(S, expected_S, decimal=4)
+
+
+def test_structural_similarity_reference_channel_axis():
+    image = data.astronaut()[:64, :64]
+    noisy = np.clip(image + 20 * np.random.randn(*image.shape), 0, 255)
+    noisy = noisy.astype(image.dtype)
+    for channel_axis in [-1, 0]:
+        im1 = np.moveaxis(image, -1, channel_axis)
+        im2 = np.moveaxis(noisy, -1, channel_axis)
+        expected, expected_S = structural_similarity(
+            im1, im2, channel_axis=channel_axis, full=True)
+        mssim, S = StructuralSimilarity(im1, channel_axis=channel_axis)(
+            im2, full=True)
+        assert_almost_equal(mssim, expected)
+        assert_array_almost_equal(S, expected_S)
+
+
+def test_structural_similarity_reference_invalid():
+    ssim = StructuralSimilarity(cam)
+    with testing.raises(ValueError):
+        ssim(cam[:-1])
+    with testing.raises(ValueError):
+        StructuralSimilarity(cam, dtype=np.float16)
+    with testing.raises(ValueError):
+        StructuralSimilarity(cam, win_size=8)
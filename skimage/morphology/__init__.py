@@ -1,20 +1,34 @@
-from .binary import (binary_erosion, binary_dilation, binary_opening,
-                     binary_closing)
-from .gray import (erosion, dilation, opening, closing, white_tophat,
-                   black_tophat)
-from .selem import (square, rectangle, diamond, disk, cube, octahedron, ball,
-                    octagon, star)
-from ..measure._label import label
-from ._skeletonize import skeletonize, medial_axis, thin, skeletonize_3d
-from .convex_hull import convex_hull_image, convex_hull_object
-from .grayreconstruct import reconstruction
-from .misc import remove_small_objects, remove_small_holes
-from .extrema import h_minima, h_maxima, local_maxima, local_minima
-from ._flood_fill import flood, flood_fill
+from .._shared import lazy
+
+__getattr__, __dir__ = lazy.attach(
+    __name__,
+    submodules={'binary', 'gray', 'selem', 'convex_hull', 'grayreconstruct',
+                'misc', 'extrema'},
+    submod_attrs={
+        'binary': ['binary_erosion', 'binary_dilation', 'binary_opening',
+                   'binary_closing'],
+        'gray': ['erosion', 'dilation', 'opening', 'closing', 'white_tophat',
+                 'black_tophat'],
+        'selem': ['square', 'rectangle', 'diamond', 'disk', 'cube',
+                  'octahedron', 'ball', 'octagon', 'star'],
+        '.measure._label': ['label'],
+        '_skeletonize': ['skeletonize', 'medial_axis', 'thin',
+                         'skeletonize_3d'],
+        'convex_hull': ['convex_hull_image', 'convex_hull_object'],
+        'grayreconstruct': ['reconstruction'],
+        'misc': ['remove_small_objects', 'remove_small_holes'],
+        'extrema': ['h_minima', 'h_maxima', 'local_maxima', 'local_minima'],
+        '_flood_fill': ['flood', 'flood_fill'],
+        '_deprecated': ['watershed'],
+    }
+)
+
+# imported eagerly: a lazily attached attribute would be shadowed by the
+# submodule of the same name once the submodule is imported
 from .max_tree import (max_tree, area_opening, area_closing,
                        diameter_opening, diameter_closing,
                        max_tree_local_maxima)
-from ._deprecated import watershed
+
 
 __all__ = ['binary_erosion',
            'binary_dilation',
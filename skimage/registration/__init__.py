@@ -1,5 +1,13 @@
-from ._optical_flow import optical_flow_tvl1, optical_flow_ilk
-from ._phase_cross_correlation import phase_cross_correlation
+from .._shared import lazy
+
+__getattr__, __dir__ = lazy.attach(
+    __name__,
+    submod_attrs={
+        '_optical_flow': ['optical_flow_tvl1', 'optical_flow_ilk'],
+        '_phase_cross_correlation': ['phase_cross_correlation'],
+    }
+)
+
 
 __all__ = [
     'optical_flow_ilk',
@@ -2,14 +2,26 @@
 
 """
 
-from .deconvolution import wiener, unsupervised_wiener, richardson_lucy
-from .unwrap import unwrap_phase
-from ._denoise import (denoise_tv_chambolle, denoise_tv_bregman,
-                       denoise_bilateral, denoise_wavelet, estimate_sigma)
-from ._cycle_spin import cycle_spin
-from .non_local_means import denoise_nl_means
-from .inpaint import inpaint_biharmonic
-from .j_invariant import calibrate_denoiser
+from .._shared import lazy
+
+__getattr__, __dir__ = lazy.attach(
+    __name__,
+    submodules={'deconvolution', 'unwrap', 'non_local_means', 'inpaint',
+                'j_invariant'},
+    submod_attrs={
+        'deconvolution': ['wiener', 'unsupervised_wiener', 'richardson_lucy'],
+        'unwrap': ['unwrap_phase'],
+        '_denoise': ['denoise_tv_chambolle', 'denoise_tv_bregman',
+                     'denoise_bilateral', 'denoise_wavelet', 'estimate_sigma'],
+        '_cycle_spin': ['cycle_spin'],
+        'non_local_means': ['denoise_nl_means'],
+        'inpaint': ['inpaint_biharmonic'],
+        'j_invariant': ['calibrate_denoiser'],
+    }
+)
+
+# imported eagerly: a lazily attached attribute would be shadowed by the
+# submodule of the same name once the submodule is imported
 from .rolling_ball import rolling_ball, ball_kernel, ellipsoid_kernel
 
 
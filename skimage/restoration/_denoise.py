@@ -4,6 +4,7 @@ import numbers
 
 import scipy.stats
 import numpy as np
+from scipy import ndimage as ndi
 import pywt
 
 from .. import img_as_float
@@ -92,17 +93,141 @@ def _compute_spatial_lut(win_size, sigma, *, dtype=float):
     return _gaussian_weight(distances, sigma**2, dtype=dtype).ravel()
 
 
+_GRID_CHUNK_SIZE = 2 ** 16  # number of pixels sliced at a time
+
+
+def _bilateral_grid(image, sigma_color, sigma_spatial, win_size, mode, cval):
+    """Bilateral filter approximated on a bilateral grid [1]_.
+
+    Pixels are accumulated into the nearest cell of a grid over the spatial
+    and the color dimensions, with cells of `sigma_spatial` pixels and
+    `sigma_color` values. The grid is smoothed with a Gaussian of one cell,
+    and sampled back at the position of each pixel by multilinear
+    interpolation. Pixels with a non-finite value in any channel are left out
+    of the grid and are NaN in the output.
+
+    Parameters
+    ----------
+    image : (M[, N[, ...]], C) ndarray of float
+        Input image, with channels along the last axis.
+    sigma_color, sigma_spatial : float
+        Standard deviations of the color and spatial Gaussians.
+    win_size : int
+        Extent of the spatial Gaussian.
+    mode : {'constant', 'edge', 'symmetric', 'reflect', 'wrap'}
+        How to handle values outside the image borders.
+    cval : float
+        Value outside the image borders with mode 'constant'.
+
+    Returns
+    -------
+    out : ndarray
+        Filtered image, of the same shape and dtype as `image`.
+
+    References
+    ----------
+    .. [1] J. Chen, S. Paris and F. Durand. "Real-time Edge-Aware Image
+           Processing with the Bilateral Grid." ACM Transactions on
+           Graphics 26(3) (2007). :DOI:`10.1145/1276377.1276506`
+    """
+    spatial_ndim = image.ndim - 1
+    radius = win_size // 2
+    pad_width = [(radius, radius)] * spatial_ndim + [(0, 0)]
+    if mode == 'constant':
+        padded = np.pad(image, pad_width, mode=mode, constant_values=cval)
+    else:
+        padded = np.pad(image, pad_width, mode=mode)
+    finite = np.isfinite(padded).all(axis=-1)
+    if not finite.any():
+        return np.full_like(image, np.nan)
+    if not finite.all():
+        padded = np.where(finite[..., np.newaxis], padded, 0)
+    min_values = padded[finite].min(axis=0)
+    max_values = padded[finite].max(axis=0)
+
+    # nearest cell of each pixel
+    # pixels are sampled up to the last position, beyond their nearest cell
+    spatial_shape = [int(ceil((n - 1) / sigma_spatial)) + 1
+                     for n in padded.shape[:-1]]
+    color_shape = [int(ceil(v)) + 1
+                   for v in (max_values - min_values) / sigma_color]
+    grid_shape = spatial_shape + color_shape
+    cells = np.zeros(padded.shape[:-1], dtype=np.intp)
+    stride = int(np.prod(grid_shape))
+    for axis, n in enumerate(padded.shape[:-1]):
+        stride //= grid_shape[axis]
+        shape = [1] * spatial_ndim
+        shape[axis] = n
+        cells += (np.round(np.arange(n) / sigma_spatial).astype(np.intp)
+                  * stride).reshape(shape)
+    for channel in range(padded.shape[-1]):
+        stride //= grid_shape[spatial_ndim + channel]
+        color_cells = padded[..., channel] - min_values[channel]
+        color_cells /= sigma_color
+        # non-finite pixels, zeroed above, may fall outside the color range
+        np.clip(color_cells, 0, color_shape[channel] - 1, out=color_cells)
+        cells += np.round(color_cells).astype(np.intp) * stride
+    cells = cells[finite]
+
+    # accumulate the weights and the weighted values, then smooth them
+    values = padded[finite]
+    n_cells = int(np.prod(grid_shape))
+    grids = [np.bincount(cells, minlength=n_cells)]
+    grids += [np.bincount(cells, weights=values[:, channel],
+                          minlength=n_cells)
+              for channel in range(values.shape[1])]
+    del cells, values
+    # the spatial Gaussian is truncated to the window
+    truncate = [max(1, radius / sigma_spatial)] * spatial_ndim
+    truncate += [3] * len(color_shape)
+    for i, grid in enumerate(grids):
+        grid = grid.reshape(grid_shape).astype(image.dtype)
+        for axis, axis_truncate in enumerate(truncate):
+            ndi.gaussian_filter1d(grid, 1, axis=axis, mode='constant',
+                                  truncate=axis_truncate, output=grid)
+        grids[i] = grid
+
+    # sample the grids at the position of each pixel
+    out = np.empty_like(image)
+    pixels = image.reshape(-1, image.shape[-1])
+    out_pixels = out.reshape(pixels.shape)
+    pixels_finite = np.isfinite(pixels).all(axis=-1)
+    if not pixels_finite.all():
+        pixels = np.where(pixels_finite[:, np.newaxis], pixels, min_values)
+    coords = np.empty((len(grid_shape), _GRID_CHUNK_SIZE))
+    weights = np.empty(_GRID_CHUNK_SIZE, dtype=image.dtype)
+    for start in range(0, len(pixels), _GRID_CHUNK_SIZE):
+        block = slice(start, start + _GRID_CHUNK_SIZE)
+        n = len(pixels[block])
+        block_coords = coords[:, :n]
+        block_coords[:spatial_ndim] = np.unravel_index(
+            np.arange(start, start + n), image.shape[:-1])
+        block_coords[:spatial_ndim] += radius
+        block_coords[:spatial_ndim] /= sigma_spatial
+        block_coords[spatial_ndim:] = (pixels[block] - min_values).T
+        block_coords[spatial_ndim:] /= sigma_color
+        ndi.map_coordinates(grids[0], block_coords, output=weights[:n],
+                            order=1)
+        for channel, grid in enumerate(grids[1:]):
+            ndi.map_coordinates(grid, block_coords,
+                                output=out_pixels[block, channel], order=1)
+        out_pixels[block] /= weights[:n, np.newaxis]
+    out_pixels[~pixels_finite] = np.nan
+    return out
+
+
 @utils.channel_as_last_axis()
 @utils.deprecate_multichannel_kwarg(multichannel_position=7)
 def denoise_bilateral(image, win_size=None, sigma_color=None, sigma_spatial=1,
                       bins=10000, mode='constant', cval=0, multichannel=False,
-                      *, channel_axis=None):
+                      *, channel_axis=None, method='window'):
     """Denoise image using bilateral filter.
 
     Parameters
     ----------
     image : ndarray, shape (M, N[, 3])
-        Input image, 2D grayscale or RGB.
+        Input image, 2D grayscale or RGB. With ``method='grid'``, the image
+        may have any number of spatial dimensions, e.g. a 3D volume.
     win_size : int
         Window size for filtering.
         If win_size is not specified, it is calculated as
@@ -119,7 +244,8 @@ def denoise_bilateral(image, win_size=None, sigma_color=None, sigma_spatial=1,
         averaging of pixels with larger spatial differences.
     bins : int
         Number of discrete values for Gaussian weights of color filtering.
-        A larger value results in improved accuracy.
+        A larger value results in improved accuracy. Unused with
+        ``method='grid'``.
     mode : {'constant', 'edge', 'symmetric', 'reflect', 'wrap'}
         How to handle values outside the image borders. See
         `numpy.pad` for detail.
@@ -137,6 +263,11 @@ def denoise_bilateral(image, win_size=None, sigma_color=None, sigma_spatial=1,
 
         .. versionadded:: 0.19
            ``channel_axis`` was added in 0.19.
+    method : {'window', 'grid'}, optional
+        With 'window', the weights of the pixels of a window of `win_size`
+        pixels around each pixel are computed exactly. With 'grid', the
+        filter is approximated on a bilateral grid [2]_, whose cost does not
+        grow with `sigma_spatial`; see Notes.
 
     Returns
     -------
@@ -156,11 +287,23 @@ def denoise_bilateral(image, win_size=None, sigma_color=None, sigma_spatial=1,
     Euclidean distance between two color values and a certain standard
     deviation (`sigma_color`).
 
+    The bilateral grid accumulates the pixels into cells of `sigma_spatial`
+    pixels along each spatial axis and `sigma_color` along each channel,
+    smooths the grid and samples it back at each pixel. Its cost is linear
+    in the number of pixels plus the number of cells, and is therefore
+    lowest for large sigmas. As the grid has one dimension per channel,
+    its size grows quickly with the number of channels for small values of
+    `sigma_color`. Pixels with non-finite values do not contribute to the
+    grid, and are NaN in its output.
+
     References
     ----------
     .. [1] C. Tomasi and R. Manduchi. "Bilateral Filtering for Gray and Color
            Images." IEEE International Conference on Computer Vision (1998)
            839-846. :DOI:`10.1109/ICCV.1998.710815`
+    .. [2] J. Chen, S. Paris and F. Durand. "Real-time Edge-Aware Image
+           Processing with the Bilateral Grid." ACM Transactions on
+           Graphics 26(3) (2007). :DOI:`10.1145/1276377.1276506`
 
     Examples
     --------
@@ -171,8 +314,18 @@ def denoise_bilateral(image, win_size=None, sigma_color=None, sigma_spatial=1,
     >>> noisy = np.clip(noisy, 0, 1)
     >>> denoised = denoise_bilateral(noisy, sigma_color=0.05, sigma_spatial=15,
     ...                              multichannel=True)
+
+    Smoothing a 3D volume with a large spatial sigma:
+
+    >>> volume = np.random.random((20, 60, 60))
+    >>> smoothed = denoise_bilateral(volume, sigma_color=0.1,
+    ...                              sigma_spatial=10, method='grid')
     """
-    if channel_axis is not None:
+    if method not in ('window', 'grid'):
+        raise ValueError(f"Unknown method {method!r}; use 'window' or "
+                         f"'grid'.")
+    # the window method is restricted to 2D images
+    if method == 'window' and channel_axis is not None:
         if image.ndim != 3:
             if image.ndim == 2:
                 raise ValueError("Use ``multichannel=False`` for 2D grayscale "
@@ -196,7 +349,7 @@ def denoise_bilateral(image, win_size=None, sigma_color=None, sigma_spatial=1,
                 msg = "Input image must be grayscale, RGB, or RGBA; " \
                       "but has shape {0}."
                 warn(msg.format(image.shape))
-    else:
+    elif method == 'window':
         if image.ndim > 2:
             raise ValueError("Bilateral filter is not implemented for "
                              "grayscale images of 3 or more dimensions, "
@@ -213,6 +366,19 @@ def denoise_bilateral(image, win_size=None, sigma_color=None, sigma_spatial=1,
     if min_value == max_value:
         return image
 
+    if method == 'grid':
+        image = img_as_float(image)
+        sigma_color = sigma_color or image[np.isfinite(image)].std()
+        # as in the window method, color distances are divided by the
+        # number of channels
+        if channel_axis is not None:
+            sigma_color *= image.shape[-1]
+        if channel_axis is None:
+            return _bilateral_grid(image[..., np.newaxis], sigma_color,
+                                   sigma_spatial, win_size, mode, cval)[..., 0]
+        return _bilateral_grid(image, sigma_color, sigma_spatial, win_size,
+                               mode, cval)
+
     # if image.max() is 0, then dist_scale can have an unverified value
     # and color_lut[<int>(dist * dist_scale)] may cause a segmentation fault
     # so we verify we have a positive image and that the max is not 0.0.
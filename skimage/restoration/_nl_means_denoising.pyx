@@ -5,14 +5,17 @@
 
 import numpy as np
 cimport numpy as cnp
+from cython.parallel cimport prange
+from libc.math cimport INFINITY
 
 from .._shared.fused_numerics cimport np_floats
 from .._shared.fast_exp cimport _fast_exp
 
 cnp.import_array()
 
-cdef inline np_floats patch_distance_2d(np_floats [:, :, :] p1,
-                                        np_floats [:, :, :] p2,
+cdef inline np_floats patch_distance_2d(np_floats [:, :, ::1] padded,
+                                        Py_ssize_t row1, Py_ssize_t col1,
+                                        Py_ssize_t row2, Py_ssize_t col2,
                                         np_floats [:, ::] w,
                                         Py_ssize_t s, np_floats var,
                                         Py_ssize_t n_channels) nogil:
@@ -21,10 +24,13 @@ cdef inline np_floats patch_distance_2d(np_floats [:, :, :] p1,
 
     Parameters
     ----------
-    p1 : 3-D array_like
-        First patch, 2D image with last dimension corresponding to channels.
-    p2 : 3-D array_like
-        Second patch, 2D image with last dimension corresponding to channels.
+    padded : 3-D array_like
+        2D image with last dimension corresponding to channels.
+    row1, col1 : Py_ssize_t
+        Position of the first patch, whose first pixel is
+        ``padded[row1, col1]``.
+    row2, col2 : Py_ssize_t
+        Position of the second patch.
     w : 2-D array_like
         Array of weights for the different pixels of the patches.
     s : Py_ssize_t
@@ -56,13 +62,16 @@ cdef inline np_floats patch_distance_2d(np_floats [:, :, :] p1,
             return 0.
         for j in range(s):
             for channel in range(n_channels):
-                tmp_diff = p1[i, j, channel] - p2[i, j, channel]
+                tmp_diff = (padded[row1 + i, col1 + j, channel] -
+                            padded[row2 + i, col2 + j, channel])
                 distance += w[i, j] * (tmp_diff * tmp_diff - var)
     return _fast_exp(-max(0.0, distance))
 
 
-cdef inline np_floats patch_distance_3d(np_floats [:, :, :] p1,
-                                        np_floats [:, :, :] p2,
+cdef inline np_floats patch_distance_3d(np_floats [:, :, ::1] padded,
+                                        Py_ssize_t pln1, Py_ssize_t row1,
+                                        Py_ssize_t col1, Py_ssize_t pln2,
+                                        Py_ssize_t row2, Py_ssize_t col2,
                                         np_floats [:, :, ::] w,
                                         Py_ssize_t s, np_floats var) nogil:
     """
@@ -70,10 +79,13 @@ cdef inline np_floats patch_distance_3d(np_floats [:, :, :] p1,
 
     Parameters
     ----------
-    p1 : 3-D array_like
-        First patch.
-    p2 : 3-D array_like
-        Second patch.
+    padded : 3-D array_like
+        Image.
+    pln1, row1, col1 : Py_ssize_t
+        Position of the first patch, whose first pixel is
+        ``padded[pln1, row1, col1]``.
+    pln2, row2, col2 : Py_ssize_t
+        Position of the second patch.
     w : 3-D array_like
         Array of weights for the different pixels of the patches.
     s : Py_ssize_t
@@ -104,13 +116,15 @@ cdef inline np_floats patch_distance_3d(np_floats [:, :, :] p1,
             return 0.
         for j in range(s):
             for k in range(s):
-                tmp_diff = p1[i, j, k] - p2[i, j, k]
+                tmp_diff = (padded[pln1 + i, row1 + j, col1 + k] -
+                            padded[pln2 + i, row2 + j, col2 + k])
                 distance += w[i, j, k] * (tmp_diff * tmp_diff - var)
     return _fast_exp(-max(0.0, distance))
 
 
 def _nl_means_denoising_2d(cnp.ndarray[np_floats, ndim=3] image, Py_ssize_t s,
-                           Py_ssize_t d, double h, double var):
+                           Py_ssize_t d, double h, double var,
+                           int num_threads=1):
     """
     Perform non-local means denoising on 2-D RGB image
 
@@ -128,6 +142,9 @@ def _nl_means_denoising_2d(cnp.ndarray[np_floats, ndim=3] image, Py_ssize_t s,
     var : np_floats
         Expected noise variance.  If non-zero, this is used to reduce the
         apparent patch distances by the expected distance due to the noise.
+    num_threads : int, optional
+        Number of OpenMP threads over which the rows are distributed. If 0,
+        the OpenMP default is used.
 
     Notes
     -----
@@ -153,7 +170,6 @@ def _nl_means_denoising_2d(cnp.ndarray[np_floats, ndim=3] image, Py_ssize_t s,
     n_row, n_col, n_channels = image.shape[0], image.shape[1], image.shape[2]
     cdef Py_ssize_t offset = s / 2
     cdef Py_ssize_t row, col, i, j, channel, i_start, i_end, j_start, j_end
-    cdef np_floats[::1] new_values = np.zeros(n_channels, dtype=dtype)
     cdef np_floats[:, :, ::1] padded = np.ascontiguousarray(
         np.pad(image, ((offset, offset), (offset, offset), (0, 0)),
                mode='reflect'))
@@ -169,23 +185,22 @@ def _nl_means_denoising_2d(cnp.ndarray[np_floats, ndim=3] image, Py_ssize_t s,
         np.exp(-(xg_row * xg_row + xg_col * xg_col) / (2 * A * A)))
     w *= 1. / (n_channels * np.sum(w) * h * h)
 
-    cdef np_floats [:, :, :] central_patch
     var *= 2
 
     # Iterate over rows, taking padding into account
     with nogil:
-        for row in range(n_row):
+        for row in prange(n_row, num_threads=num_threads, schedule='static'):
             # Iterate over columns, taking padding into account
             i_start = row - min(d, row)
             i_end = row + min(d + 1, n_row - row)
 
             for col in range(n_col):
                 # Initialize per-channel bins
-                new_values[:] = 0
+                for channel in range(n_channels):
+                    result[row, col, channel] = 0
                 # Reset weights for each local region
                 weight_sum = 0
 
-                central_patch = padded[row:row+s, col:col+s, :]
                 j_start = col - min(d, col)
                 j_end = col + min(d + 1, n_col - col)
 
@@ -193,28 +208,25 @@ def _nl_means_denoising_2d(cnp.ndarray[np_floats, ndim=3] image, Py_ssize_t s,
                 for i in range(i_start, i_end):
                     for j in range(j_start, j_end):
                         weight = patch_distance_2d[np_floats](
-                            central_patch,
-                            padded[i:i+s, j:j+s, :],
-                            w, s, var, n_channels)
+                            padded, row, col, i, j, w, s, var, n_channels)
 
                         # Collect results in weight sum
-                        weight_sum += weight
+                        weight_sum = weight_sum + weight
                         # Apply to each channel multiplicatively
                         for channel in range(n_channels):
-                            new_values[channel] += weight * padded[i+offset,
-                                                                   j+offset,
-                                                                   channel]
+                            result[row, col, channel] += weight * padded[
+                                i + offset, j + offset, channel]
 
                 # Normalize the result
                 for channel in range(n_channels):
-                    result[row, col, channel] = new_values[channel] / weight_sum
+                    result[row, col, channel] /= weight_sum
 
     return np.squeeze(np.asarray(result))
 
 
 def _nl_means_denoising_3d(cnp.ndarray[np_floats, ndim=3] image,
                            Py_ssize_t s, Py_ssize_t d,
-                           double h, double var):
+                           double h, double var, int num_threads=1):
     """
     Perform non-local means denoising on 3-D array
 
@@ -231,6 +243,9 @@ def _nl_means_denoising_3d(cnp.ndarray[np_floats, ndim=3] image,
     var : np_floats
         Expected noise variance.  If non-zero, this is used to reduce the
         apparent patch distances by the expected distance due to the noise.
+    num_threads : int, optional
+        Number of OpenMP threads over which the planes are distributed. If
+        0, the OpenMP default is used.
 
     Returns
     -------
@@ -268,12 +283,11 @@ def _nl_means_denoising_3d(cnp.ndarray[np_floats, ndim=3] image,
                (2 * A * A)))
     w *= 1. / (np.sum(w) * h * h)
 
-    cdef np_floats [:, :, :] central_patch
     var *= 2
 
     # Iterate over planes, taking padding into account
     with nogil:
-        for pln in range(n_pln):
+        for pln in prange(n_pln, num_threads=num_threads, schedule='static'):
             i_start = pln - min(d, pln)
             i_end = pln + min(d + 1, n_pln - pln)
             # Iterate over rows, taking padding into account
@@ -285,8 +299,6 @@ def _nl_means_denoising_3d(cnp.ndarray[np_floats, ndim=3] image,
                     k_start = col - min(d, col)
                     k_end = col + min(d + 1, n_col - col)
 
-                    central_patch = padded[pln:pln+s, row:row+s, col:col+s]
-
                     new_value = 0
                     weight_sum = 0
 
@@ -295,14 +307,12 @@ def _nl_means_denoising_3d(cnp.ndarray[np_floats, ndim=3] image,
                         for j in range(j_start, j_end):
                             for k in range(k_start, k_end):
                                 weight = patch_distance_3d[np_floats](
-                                    central_patch,
-                                    padded[i:i+s, j:j+s, k:k+s],
+                                    padded, pln, row, col, i, j, k,
                                     w, s, var)
                                 # Collect results in weight sum
-                                weight_sum += weight
-                                new_value += weight * padded[i+offset,
-                                                             j+offset,
-                                                             k+offset]
+                                weight_sum = weight_sum + weight
+                                new_value = new_value + weight * padded[
+                                    i + offset, j + offset, k + offset]
 
                     # Normalize the result
                     result[pln, row, col] = new_value / weight_sum
@@ -311,8 +321,12 @@ def _nl_means_denoising_3d(cnp.ndarray[np_floats, ndim=3] image,
 
 #-------------- Accelerated algorithm of Froment 2015 ------------------
 
+cdef enum:
+    # number of columns cumulated by each thread at a time
+    _BLOCK_SIZE = 256
+
 
-cdef inline double _integral_to_distance_2d(double [:, ::] integral,
+cdef inline double _integral_to_distance_2d(double [:, ::1] integral,
                                             Py_ssize_t row, Py_ssize_t col,
                                             Py_ssize_t offset,
                                             double h2s2) nogil:
@@ -336,7 +350,7 @@ cdef inline double _integral_to_distance_2d(double [:, ::] integral,
     return max(distance, 0.0) / h2s2
 
 
-cdef inline double _integral_to_distance_3d(double[:, :, ::] integral,
+cdef inline double _integral_to_distance_3d(double[:, :, ::1] integral,
                                             Py_ssize_t pln, Py_ssize_t row,
                                             Py_ssize_t col, Py_ssize_t offset,
                                             double s_cube_h_square) nogil:
@@ -365,12 +379,12 @@ cdef inline double _integral_to_distance_3d(double[:, :, ::] integral,
     return max(distance, 0.0) / (s_cube_h_square)
 
 
-cdef inline void _integral_image_2d(double [:, :, ::] padded,
-                                    double [:, ::] integral,
+cdef inline void _integral_image_2d(double [:, :, ::1] padded,
+                                    double [:, ::1] integral,
                                     Py_ssize_t t_row, Py_ssize_t t_col,
                                     Py_ssize_t n_row, Py_ssize_t n_col,
                                     Py_ssize_t n_channels,
-                                    double var_diff) nogil:
+                                    double var_diff, int num_threads) nogil:
     """
     Computes the integral of the squared difference between an image ``padded``
     and the same image shifted by ``(t_row, t_col)``.
@@ -393,6 +407,8 @@ cdef inline void _integral_image_2d(double [:, :, ::] padded,
         The double of the expected noise variance.  If non-zero, this
         is used to reduce the apparent patch distances by the expected
         distance due to the noise.
+    num_threads : int
+        Number of OpenMP threads, 0 for the OpenMP default.
 
     Notes
     -----
@@ -400,32 +416,46 @@ cdef inline void _integral_image_2d(double [:, :, ::] padded,
     The integral computation could be performed using
     ``transform.integral_image``, but this helper function saves memory
     by avoiding copies of ``padded``.
+
+    The squared differences are cumulated along rows, in parallel over
+    rows, then along columns, in parallel over blocks of columns. The first
+    column and the row preceding the first computed one are left untouched:
+    only differences of integral values are used, to which they do not
+    contribute.
     """
-    cdef Py_ssize_t row, col, channel
+    cdef Py_ssize_t row, col, channel, block, col_start, col_end
     cdef Py_ssize_t row_start = max(1, -t_row)
     cdef Py_ssize_t row_end = min(n_row, n_row - t_row)
+    cdef Py_ssize_t n_blocks = (n_col - t_col - 1 + _BLOCK_SIZE - 1) / \
+                               _BLOCK_SIZE
     cdef double t, distance
 
-    for row in range(row_start, row_end):
+    for row in prange(row_start, row_end, num_threads=num_threads,
+                      schedule='static'):
         for col in range(1, n_col - t_col):
             distance = 0
             for channel in range(n_channels):
                 t = (padded[row, col, channel] -
                      padded[row + t_row, col + t_col, channel])
-                distance += t * t
-            distance -= n_channels * var_diff
-            integral[row, col] = (distance +
-                                  integral[row - 1, col] +
-                                  integral[row, col - 1] -
-                                  integral[row - 1, col - 1])
+                distance = distance + t * t
+            distance = distance - n_channels * var_diff
+            integral[row, col] = distance + integral[row, col - 1]
+
+    for block in prange(n_blocks, num_threads=num_threads,
+                        schedule='static'):
+        col_start = 1 + block * _BLOCK_SIZE
+        col_end = min(col_start + _BLOCK_SIZE, n_col - t_col)
+        for row in range(row_start, row_end):
+            for col in range(col_start, col_end):
+                integral[row, col] += integral[row - 1, col]
 
 
-cdef inline void _integral_image_3d(double [:, :, ::] padded,
-                                    double [:, :, ::] integral,
+cdef inline void _integral_image_3d(double [:, :, ::1] padded,
+                                    double [:, :, ::1] integral,
                                     Py_ssize_t t_pln, Py_ssize_t t_row,
                                     Py_ssize_t t_col, Py_ssize_t n_pln,
                                     Py_ssize_t n_row, Py_ssize_t n_col,
-                                    double var_diff) nogil:
+                                    double var_diff, int num_threads) nogil:
     """
     Computes the integral of the squared difference between an image ``padded``
     and the same image shifted by ``(t_pln, t_row, t_col)``.
@@ -450,6 +480,8 @@ cdef inline void _integral_image_3d(double [:, :, ::] padded,
         The double of the expected noise variance.  If non-zero, this
         is used to reduce the apparent patch distances by the expected
         distance due to the noise.
+    num_threads : int
+        Number of OpenMP threads, 0 for the OpenMP default.
 
     Notes
     -----
@@ -457,6 +489,11 @@ cdef inline void _integral_image_3d(double [:, :, ::] padded,
     The integral computation could be performed using
     ``transform.integral_image``, but this helper function saves memory
     by avoiding copies of ``padded``.
+
+    The squared differences are cumulated along columns and rows, in
+    parallel over planes, then along planes, in parallel over rows. As in
+    2D, the values preceding the computed ones along each axis do not
+    contribute to differences of integral values.
     """
     cdef Py_ssize_t pln, row, col
     cdef Py_ssize_t pln_start = max(1, -t_pln)
@@ -465,27 +502,28 @@ cdef inline void _integral_image_3d(double [:, :, ::] padded,
     cdef Py_ssize_t row_end = min(n_row, n_row - t_row)
     cdef double distance
 
-    for pln in range(pln_start, pln_end):
+    for pln in prange(pln_start, pln_end, num_threads=num_threads,
+                      schedule='static'):
         for row in range(row_start, row_end):
             for col in range(1, n_col - t_col):
                 distance = (padded[pln, row, col] -
                             padded[pln + t_pln, row + t_row, col + t_col])
-                distance *= distance
-                distance -= var_diff
-                integral[pln, row, col] = (
-                    distance +
-                    integral[pln - 1, row, col] +
-                    integral[pln, row - 1, col] +
-                    integral[pln, row, col - 1] +
-                    integral[pln - 1, row - 1, col - 1] -
-                    integral[pln - 1, row - 1, col] -
-                    integral[pln, row - 1, col - 1] -
-                    integral[pln - 1, row, col - 1])
+                distance = distance * distance - var_diff
+                integral[pln, row, col] = (distance +
+                                           integral[pln, row, col - 1])
+            for col in range(1, n_col - t_col):
+                integral[pln, row, col] += integral[pln, row - 1, col]
+
+    for row in prange(row_start, row_end, num_threads=num_threads,
+                      schedule='static'):
+        for pln in range(pln_start, pln_end):
+            for col in range(1, n_col - t_col):
+                integral[pln, row, col] += integral[pln - 1, row, col]
 
 
 def _fast_nl_means_denoising_2d(cnp.ndarray[np_floats, ndim=3] image,
                                 Py_ssize_t s, Py_ssize_t d,
-                                double h, double var):
+                                double h, double var, int num_threads=1):
     """
     Perform fast non-local means denoising on 2-D array, with the outer
     loop on patch shifts in order to reduce the number of operations.
@@ -504,6 +542,9 @@ def _fast_nl_means_denoising_2d(cnp.ndarray[np_floats, ndim=3] image,
     var : double
         Expected noise variance.  If non-zero, this is used to reduce the
         apparent patch distances by the expected distance due to the noise.
+    num_threads : int, optional
+        Number of OpenMP threads over which the rows are distributed, for
+        each shift. If 0, the OpenMP default is used.
 
     Returns
     -------
@@ -542,6 +583,8 @@ def _fast_nl_means_denoising_2d(cnp.ndarray[np_floats, ndim=3] image,
                mode='reflect').astype(np.float64))
     cdef double [:, ::1] weights = np.zeros_like(padded[..., 0])
     cdef double [:, ::1] integral = np.zeros_like(weights)
+    # weights of the patches for the current shift
+    cdef double [:, ::1] shift_weights = np.zeros_like(weights)
     cdef double [:, :, ::1] result = np.zeros_like(padded)
     cdef double distance, h2s2, weight, alpha
 
@@ -567,11 +610,15 @@ def _fast_nl_means_denoising_2d(cnp.ndarray[np_floats, ndim=3] image,
                 # Compute integral image of the squared difference between
                 # padded and the same image shifted by (t_row, t_col)
                 _integral_image_2d(padded, integral, t_row, t_col,
-                                   n_row, n_col, n_channels, var)
+                                   n_row, n_col, n_channels, var, num_threads)
 
                 # Inner loops on pixel coordinates
+                # Each weight contributes to the reference pixel and to the
+                # shifted one: the two are accumulated in separate passes, so
+                # that each row of the result is written by a single thread
                 # Iterate over rows, taking offset and shift into account
-                for row in range(row_start, row_end):
+                for row in prange(row_start, row_end, num_threads=num_threads,
+                                  schedule='static'):
                     row_shift = row + t_row
                     # Iterate over columns, taking offset and shift into account
                     for col in range(offset, n_col - offset - t_col):
@@ -580,22 +627,34 @@ def _fast_nl_means_denoising_2d(cnp.ndarray[np_floats, ndim=3] image,
                             integral, row, col, offset, h2s2)
                         # exp of large negative numbers is close to zero
                         if distance > DISTANCE_CUTOFF:
+                            shift_weights[row, col] = 0
                             continue
                         col_shift = col + t_col
                         weight = alpha * _fast_exp(-distance)
+                        shift_weights[row, col] = weight
                         # Accumulate weights corresponding to different shifts
                         weights[row, col] += weight
-                        weights[row_shift, col_shift] += weight
                         # Iterate over channels
                         for channel in range(n_channels):
                             result[row, col, channel] += weight * \
                                 padded[row_shift, col_shift, channel]
+                for row in prange(row_start, row_end, num_threads=num_threads,
+                                  schedule='static'):
+                    row_shift = row + t_row
+                    for col in range(offset, n_col - offset - t_col):
+                        weight = shift_weights[row, col]
+                        if weight == 0:
+                            continue
+                        col_shift = col + t_col
+                        weights[row_shift, col_shift] += weight
+                        for channel in range(n_channels):
                             result[row_shift, col_shift, channel] += \
                                 weight * padded[row, col, channel]
                 alpha = 1
 
         # Normalize pixel values using sum of weights of contributing patches
-        for row in range(pad_size, n_row - pad_size):
+        for row in prange(pad_size, n_row - pad_size, num_threads=num_threads,
+                          schedule='static'):
             for col in range(pad_size, n_col - pad_size):
                 for channel in range(n_channels):
                     # No risk of division by zero, since the contribution
@@ -609,7 +668,7 @@ def _fast_nl_means_denoising_2d(cnp.ndarray[np_floats, ndim=3] image,
 
 def _fast_nl_means_denoising_3d(cnp.ndarray[np_floats, ndim=3] image,
                                 Py_ssize_t s, Py_ssize_t d, double h,
-                                double var):
+                                double var, int num_threads=1):
     """
     Perform fast non-local means denoising on 3-D array, with the outer
     loop on patch shifts in order to reduce the number of operations.
@@ -628,6 +687,9 @@ def _fast_nl_means_denoising_3d(cnp.ndarray[np_floats, ndim=3] image,
     var : double
         Expected noise variance.  If non-zero, this is used to reduce the
         apparent patch distances by the expected distance due to the noise.
+    num_threads : int, optional
+        Number of OpenMP threads over which the planes are distributed, for
+        each shift. If 0, the OpenMP default is used.
 
     Returns
     -------
@@ -662,6 +724,8 @@ def _fast_nl_means_denoising_3d(cnp.ndarray[np_floats, ndim=3] image,
         np.pad(image, pad_size, mode='reflect').astype(np.float64))
     cdef double [:, :, ::1] weights = np.zeros_like(padded)
     cdef double [:, :, ::1] integral = np.zeros_like(padded)
+    # weights of the patches for the current shift
+    cdef double [:, :, ::1] shift_weights = np.zeros_like(padded)
     cdef double [:, :, ::1] result = np.zeros_like(padded)
     cdef Py_ssize_t n_pln, n_row, n_col, t_pln, t_row, t_col, \
              pln, row, col
@@ -702,11 +766,15 @@ def _fast_nl_means_denoising_3d(cnp.ndarray[np_floats, ndim=3] image,
                     # padded and the same image shifted by (t_pln, t_row, t_col)
                     _integral_image_3d(padded, integral, t_pln,
                                        t_row, t_col, n_pln, n_row,
-                                       n_col, var)
+                                       n_col, var, num_threads)
 
                     # Inner loops on pixel coordinates
+                    # As in 2D, the contributions to the reference and to
+                    # the shifted pixels are accumulated in separate passes
                     # Iterate over planes, taking offset and shift into account
-                    for pln in range(pln_dist_min, pln_dist_max):
+                    for pln in prange(pln_dist_min, pln_dist_max,
+                                      num_threads=num_threads,
+                                      schedule='static'):
                         # Iterate over rows, taking offset and shift
                         # into account
                         for row in range(row_dist_min, row_dist_max):
@@ -718,23 +786,34 @@ def _fast_nl_means_denoising_3d(cnp.ndarray[np_floats, ndim=3] image,
                                     pln, row, col, offset, s_cube_h_square)
                                 # exp of large negative numbers is close to zero
                                 if distance > DISTANCE_CUTOFF:
+                                    shift_weights[pln, row, col] = 0
                                     continue
 
                                 weight = alpha * _fast_exp(-distance)
+                                shift_weights[pln, row, col] = weight
                                 # Accumulate weights for the different shifts
                                 weights[pln, row, col] += weight
-                                weights[pln + t_pln, row + t_row,
-                                                     col + t_col] += weight
                                 result[pln, row, col] += weight * \
                                     padded[pln + t_pln, row + t_row,
                                            col + t_col]
+                    for pln in prange(pln_dist_min, pln_dist_max,
+                                      num_threads=num_threads,
+                                      schedule='static'):
+                        for row in range(row_dist_min, row_dist_max):
+                            for col in range(col_dist_min, col_dist_max):
+                                weight = shift_weights[pln, row, col]
+                                if weight == 0:
+                                    continue
+                                weights[pln + t_pln, row + t_row,
+                                        col + t_col] += weight
                                 result[pln + t_pln, row + t_row,
                                        col + t_col] += weight * \
                                                        padded[pln, row, col]
                     alpha = 1.0
 
         # Normalize pixel values using sum of weights of contributing patches
-        for pln in range(pad_size, n_pln - pad_size):
+        for pln in prange(pad_size, n_pln - pad_size, num_threads=num_threads,
+                          schedule='static'):
             for row in range(pad_size, n_row - pad_size):
                 for col in range(pad_size, n_col - pad_size):
                     # No risk of division by zero, since the contribution
@@ -744,3 +823,331 @@ def _fast_nl_means_denoising_3d(cnp.ndarray[np_floats, ndim=3] image,
     # Return cropped result, undoing padding
     return np.asarray(result[pad_size:-pad_size, pad_size:-pad_size,
                              pad_size:-pad_size]).astype(dtype)
+
+
+#-------------- Approximate search of similar patches (PatchMatch) ----------
+
+
+cdef inline cnp.uint64_t _splitmix64(cnp.uint64_t x) nogil:
+    """Hash of `x`, used as a stateless pseudo-random number generator."""
+    x = x + 0x9E3779B97F4A7C15ULL
+    x = (x ^ (x >> 30)) * 0xBF58476D1CE4E5B9ULL
+    x = (x ^ (x >> 27)) * 0x94D049BB133111EBULL
+    return x ^ (x >> 31)
+
+
+cdef inline Py_ssize_t _random_offset(cnp.uint64_t random, Py_ssize_t center,
+                                      Py_ssize_t radius, Py_ssize_t d,
+                                      Py_ssize_t position,
+                                      Py_ssize_t size) nogil:
+    """Random offset within `radius` of `center`, at most `d` in absolute
+    value, and keeping ``position + offset`` within ``[0, size)``."""
+    cdef Py_ssize_t low = max(center - radius, max(-d, -position))
+    cdef Py_ssize_t high = min(center + radius, min(d, size - 1 - position))
+    return low + <Py_ssize_t>(random % <cnp.uint64_t>(high - low + 1))
+
+
+cdef inline double _patch_distance_4d(np_floats [:, :, :, ::1] padded,
+                                      Py_ssize_t pln1, Py_ssize_t row1,
+                                      Py_ssize_t col1, Py_ssize_t pln2,
+                                      Py_ssize_t row2, Py_ssize_t col2,
+                                      np_floats [:, :, ::1] w,
+                                      double var, double bound) nogil:
+    """Weighted squared distance between two patches of a multichannel
+    image, as in ``patch_distance_2d`` and ``patch_distance_3d`` but before
+    the exponential. The computation stops once the distance exceeds
+    `bound`."""
+    cdef Py_ssize_t i, j, k, channel
+    cdef Py_ssize_t n_channels = padded.shape[3]
+    cdef double distance = 0
+    cdef double tmp_diff
+    for i in range(w.shape[0]):
+        for j in range(w.shape[1]):
+            if distance > bound:
+                return distance
+            for k in range(w.shape[2]):
+                for channel in range(n_channels):
+                    tmp_diff = (padded[pln1 + i, row1 + j, col1 + k, channel] -
+                                padded[pln2 + i, row2 + j, col2 + k, channel])
+                    distance += w[i, j, k] * (tmp_diff * tmp_diff - var)
+    return distance
+
+
+cdef inline void _try_offset(np_floats [:, :, :, ::1] padded,
+                             np_floats [:, :, ::1] w, double var,
+                             cnp.int16_t [:, :, ::1] offsets,
+                             cnp.float32_t [:, ::1] distances,
+                             Py_ssize_t pixel, Py_ssize_t pln, Py_ssize_t row,
+                             Py_ssize_t col, Py_ssize_t t_pln,
+                             Py_ssize_t t_row, Py_ssize_t t_col,
+                             Py_ssize_t d_pln, Py_ssize_t d) nogil:
+    """Replace the worst candidate of `pixel`, at ``(pln, row, col)``, by
+    the patch shifted by ``(t_pln, t_row, t_col)`` if the latter is closer
+    and valid.
+
+    The candidates of a pixel are sorted by increasing distance, so that the
+    worst one is the last. A candidate that is already present has exactly
+    the same distance (the computation is deterministic): it is searched
+    among the candidates of equal distance, by bisection."""
+    cdef Py_ssize_t n_candidates = offsets.shape[1]
+    cdef Py_ssize_t k, low, high, middle
+    cdef double distance
+    cdef cnp.float32_t key
+    if t_pln == 0 and t_row == 0 and t_col == 0:
+        return
+    if (t_pln < -d_pln or t_pln > d_pln or t_row < -d or t_row > d or
+            t_col < -d or t_col > d):
+        return
+    # the image is padded by half a patch along each axis
+    if (pln + t_pln < 0 or pln + t_pln > padded.shape[0] - w.shape[0] or
+            row + t_row < 0 or row + t_row > padded.shape[1] - w.shape[1] or
+            col + t_col < 0 or col + t_col > padded.shape[2] - w.shape[2]):
+        return
+    distance = _patch_distance_4d(padded, pln, row, col, pln + t_pln,
+                                  row + t_row, col + t_col, w, var,
+                                  distances[pixel, n_candidates - 1])
+    if not distance < distances[pixel, n_candidates - 1]:
+        return
+    key = <cnp.float32_t>distance
+    # first candidate whose distance is not smaller than `key`
+    low = 0
+    high = n_candidates - 1
+    while low < high:
+        middle = (low + high) / 2
+        if distances[pixel, middle] < key:
+            low = middle + 1
+        else:
+            high = middle
+    k = low
+    while k < n_candidates and distances[pixel, k] == key:
+        if (offsets[pixel, k, 0] == t_pln and offsets[pixel, k, 1] == t_row
+                and offsets[pixel, k, 2] == t_col):
+            return
+        k = k + 1
+    # insert at `low`, dropping the worst candidate
+    k = n_candidates - 1
+    while k > low:
+        distances[pixel, k] = distances[pixel, k - 1]
+        offsets[pixel, k, 0] = offsets[pixel, k - 1, 0]
+        offsets[pixel, k, 1] = offsets[pixel, k - 1, 1]
+        offsets[pixel, k, 2] = offsets[pixel, k - 1, 2]
+        k = k - 1
+    distances[pixel, low] = key
+    offsets[pixel, low, 0] = t_pln
+    offsets[pixel, low, 1] = t_row
+    offsets[pixel, low, 2] = t_col
+
+
+def _patchmatch_nl_means_denoising(cnp.ndarray[np_floats, ndim=4] image,
+                                   Py_ssize_t s, Py_ssize_t d, double h,
+                                   double var, Py_ssize_t n_candidates,
+                                   Py_ssize_t n_iter=4, cnp.uint64_t seed=0,
+                                   int num_threads=1):
+    """
+    Perform non-local means denoising over the most similar patches found
+    by an approximate nearest neighbour search.
+
+    Parameters
+    ----------
+    image : ndarray of shape (n_pln, n_row, n_col, n_channels)
+        Input data to be denoised: a 3-D grayscale image with a channel axis
+        of length 1, or a 2-D image with a plane axis of length 1.
+    s : Py_ssize_t
+        Size of patches used for denoising.
+    d : Py_ssize_t
+        Maximal distance in pixels where to search patches used for denoising.
+    h : double
+        Cut-off distance (in gray levels).
+    var : double
+        Expected noise variance.
+    n_candidates : Py_ssize_t
+        Number of patches averaged for each pixel, besides its own.
+    n_iter : Py_ssize_t, optional
+        Number of iterations of propagation and random search.
+    seed : uint64, optional
+        Seed of the random search.
+    num_threads : int, optional
+        Number of OpenMP threads over which the lines of pixels are
+        distributed. If 0, the OpenMP default is used.
+
+    Returns
+    -------
+    result : ndarray
+        Denoised image, of same shape as input image.
+
+    Notes
+    -----
+    The candidates of each pixel are initialized at random within the search
+    window. Each iteration then proposes to each pixel the candidates of its
+    neighbours, shifted to the pixel (propagation), and random shifts around
+    its best candidate, within a radius halved from `d` down to 1 (random
+    search) [1]_. A candidate replaces the worst one of the pixel if its
+    patch is closer. Lines of pixels ``(pln, row)`` are processed in two
+    phases, according to the parity of ``pln + row``, so that the lines
+    processed in parallel do not propagate candidates between each other:
+    the result does not depend on `num_threads`.
+
+    The weights and the patch distances are those of the original algorithm.
+
+    References
+    ----------
+    .. [1] C. Barnes, E. Shechtman, A. Finkelstein, and D. B. Goldman.
+           PatchMatch: A Randomized Correspondence Algorithm for Structural
+           Image Editing. ACM Transactions on Graphics 28(3) (2009).
+           :DOI:`10.1145/1531326.1531330`
+    """
+    cdef double DISTANCE_CUTOFF = 5.0
+    if s % 2 == 0:
+        s += 1  # odd value for symmetric patch
+
+    if np_floats is cnp.float32_t:
+        dtype = np.float32
+    else:
+        dtype = np.float64
+
+    cdef Py_ssize_t n_pln, n_row, n_col, n_channels
+    n_pln, n_row, n_col, n_channels = (image.shape[0], image.shape[1],
+                                       image.shape[2], image.shape[3])
+    # 2-D images are not searched nor padded along the plane axis
+    cdef Py_ssize_t s_pln = s if n_pln > 1 else 1
+    cdef Py_ssize_t d_pln = d if n_pln > 1 else 0
+    cdef Py_ssize_t offset = s / 2
+    cdef Py_ssize_t offset_pln = s_pln / 2
+    cdef np_floats [:, :, :, ::1] padded = np.ascontiguousarray(
+        np.pad(image, ((offset_pln, offset_pln), (offset, offset),
+                       (offset, offset), (0, 0)), mode='reflect'))
+    cdef np_floats [:, :, :, ::1] result = np.empty_like(image)
+
+    cdef np_floats A = ((s - 1.) / 4.)
+    range_vals = np.arange(-offset, offset + 1, dtype=dtype)
+    xg_pln, xg_row, xg_col = np.meshgrid(range_vals[offset - offset_pln:
+                                                    offset + offset_pln + 1],
+                                         range_vals, range_vals,
+                                         indexing='ij')
+    cdef np_floats [:, :, ::1] w = np.ascontiguousarray(
+        np.exp(-(xg_pln * xg_pln + xg_row * xg_row + xg_col * xg_col) /
+               (2 * A * A)))
+    w *= 1. / (n_channels * np.sum(w) * h * h)
+    var *= 2
+
+    # shifts to the candidates of each pixel, and their patch distances;
+    # unused candidates have an infinite distance and a null shift
+    cdef cnp.int16_t [:, :, ::1] offsets = np.zeros(
+        (n_pln * n_row * n_col, n_candidates, 3), dtype=np.int16)
+    cdef cnp.float32_t [:, ::1] distances = np.full(
+        (n_pln * n_row * n_col, n_candidates), np.inf, dtype=np.float32)
+
+    cdef Py_ssize_t it, phase, line, pln, row, col, i, k, pixel, neighbour
+    cdef Py_ssize_t best, radius, center_pln, center_row, center_col
+    cdef cnp.uint64_t random
+    cdef double weight, weight_sum, distance
+    # shifts to the neighbours of a pixel
+    cdef Py_ssize_t[:, ::1] steps = np.array(
+        [[-1, 0, 0], [1, 0, 0], [0, -1, 0], [0, 1, 0], [0, 0, -1], [0, 0, 1]],
+        dtype=np.intp)[(0 if n_pln > 1 else 2):]
+
+    with nogil:
+        for it in range(n_iter + 1):
+            for phase in range(2):
+                for line in prange(n_pln * n_row, num_threads=num_threads,
+                                   schedule='static'):
+                    pln = line / n_row
+                    row = line % n_row
+                    if (pln + row) % 2 != phase:
+                        continue
+                    for i in range(n_col):
+                        # alternate the direction of propagation along lines
+                        col = i if it % 2 == 0 else n_col - 1 - i
+                        pixel = line * n_col + col
+                        random = _splitmix64(
+                            seed ^ _splitmix64(pixel * (n_iter + 1) + it))
+                        if it == 0:
+                            # random initialization within the window
+                            for k in range(2 * n_candidates):
+                                _try_offset(
+                                    padded, w, var, offsets, distances,
+                                    pixel, pln, row, col,
+                                    _random_offset(_splitmix64(random + 3 * k),
+                                                   0, d_pln, d_pln, pln,
+                                                   n_pln),
+                                    _random_offset(
+                                        _splitmix64(random + 3 * k + 1),
+                                        0, d, d, row, n_row),
+                                    _random_offset(
+                                        _splitmix64(random + 3 * k + 2),
+                                        0, d, d, col, n_col),
+                                    d_pln, d)
+                            continue
+                        # propagation of the candidates of the neighbours
+                        for neighbour in range(steps.shape[0]):
+                            if (not 0 <= pln + steps[neighbour, 0] < n_pln or
+                                    not 0 <= row + steps[neighbour, 1] < n_row
+                                    or not 0 <= col + steps[neighbour, 2]
+                                    < n_col):
+                                continue
+                            k = pixel + (steps[neighbour, 0] * n_row +
+                                         steps[neighbour, 1]) * n_col + \
+                                steps[neighbour, 2]
+                            for best in range(n_candidates):
+                                # unused candidates are the last ones
+                                if distances[k, best] == INFINITY:
+                                    break
+                                _try_offset(padded, w, var, offsets,
+                                            distances, pixel, pln, row, col,
+                                            offsets[k, best, 0],
+                                            offsets[k, best, 1],
+                                            offsets[k, best, 2], d_pln, d)
+                        # random search around the best candidate, the first
+                        if distances[pixel, 0] == INFINITY:
+                            continue
+                        center_pln = offsets[pixel, 0, 0]
+                        center_row = offsets[pixel, 0, 1]
+                        center_col = offsets[pixel, 0, 2]
+                        radius = d
+                        k = 0
+                        while radius >= 1:
+                            _try_offset(
+                                padded, w, var, offsets, distances,
+                                pixel, pln, row, col,
+                                _random_offset(
+                                    _splitmix64(random + 3 * k),
+                                    center_pln, radius, d_pln, pln, n_pln),
+                                _random_offset(
+                                    _splitmix64(random + 3 * k + 1),
+                                    center_row, radius, d, row, n_row),
+                                _random_offset(
+                                    _splitmix64(random + 3 * k + 2),
+                                    center_col, radius, d, col, n_col),
+                                d_pln, d)
+                            radius = radius / 2
+                            k = k + 1
+
+        # weighted average over the pixel itself and its candidates
+        for line in prange(n_pln * n_row, num_threads=num_threads,
+                           schedule='static'):
+            pln = line / n_row
+            row = line % n_row
+            for col in range(n_col):
+                pixel = line * n_col + col
+                # the distance of a patch to itself is at most 0
+                weight_sum = 1
+                for i in range(n_channels):
+                    result[pln, row, col, i] = padded[pln + offset_pln,
+                                                      row + offset,
+                                                      col + offset, i]
+                for k in range(n_candidates):
+                    distance = distances[pixel, k]
+                    # exp of large numbers is close to zero
+                    if distance > DISTANCE_CUTOFF:
+                        continue
+                    weight = _fast_exp(-max(0.0, distance))
+                    weight_sum = weight_sum + weight
+                    for i in range(n_channels):
+                        result[pln, row, col, i] += weight * padded[
+                            pln + offsets[pixel, k, 0] + offset_pln,
+                            row + offsets[pixel, k, 1] + offset,
+                            col + offsets[pixel, k, 2] + offset, i]
+                for i in range(n_channels):
+                    result[pln, row, col, i] /= weight_sum
+
+    return np.asarray(result)
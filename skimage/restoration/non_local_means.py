@@ -6,14 +6,16 @@ from ._nl_means_denoising import (
     _nl_means_denoising_2d,
     _nl_means_denoising_3d,
     _fast_nl_means_denoising_2d,
-    _fast_nl_means_denoising_3d)
+    _fast_nl_means_denoising_3d,
+    _patchmatch_nl_means_denoising)
 
 
 @utils.channel_as_last_axis()
 @utils.deprecate_multichannel_kwarg(multichannel_position=4)
 def denoise_nl_means(image, patch_size=7, patch_distance=11, h=0.1,
                      multichannel=False, fast_mode=True, sigma=0., *,
-                     preserve_range=None, channel_axis=None):
+                     preserve_range=None, channel_axis=None, num_threads=1,
+                     n_candidates=None):
     """Perform non-local means denoising on 2-D or 3-D grayscale images, and
     2-D RGB images.
 
@@ -55,6 +57,16 @@ def denoise_nl_means(image, patch_size=7, patch_distance=11, h=0.1,
 
         .. versionadded:: 0.19
            ``channel_axis`` was added in 0.19.
+    num_threads : int or None, optional
+        Number of OpenMP threads over which the rows (the planes of 3-D
+        images) are distributed. If None, the OpenMP default, usually the
+        number of cores, is used.
+    n_candidates : int or None, optional
+        If given, each pixel is averaged over the `n_candidates` most similar
+        patches found within `patch_distance` by an approximate nearest
+        neighbour search, instead of all of them. The cost of the search
+        does not depend on `patch_distance`. `fast_mode` is then ignored.
+        See the Notes section for more details.
 
     Returns
     -------
@@ -116,6 +128,19 @@ def denoise_nl_means(image, patch_size=7, patch_distance=11, h=0.1,
     ``h = 0.8 * sigma`` when `fast_mode` is `True`, or ``h = 0.6 * sigma`` when
     `fast_mode` is `False`.
 
+    With `n_candidates`, the most similar patches of each pixel are searched
+    with PatchMatch [5]_: starting from random candidates, each pixel is
+    proposed the candidates of its neighbours and random candidates around
+    its best one, over a few iterations. Patch distances and weights are
+    those of the original algorithm, and the complexity is about::
+
+        image.size * patch_size ** image.ndim * n_candidates * image.ndim
+
+    independent of `patch_distance`. Storing the candidates takes
+    ``10 * n_candidates`` bytes per pixel. As only a few patches are
+    averaged, providing `sigma` is recommended, with ``h`` around ``sigma``;
+    a few tens of candidates give results close to the original algorithm.
+
     References
     ----------
     .. [1] A. Buades, B. Coll, & J-M. Morel. A non-local algorithm for image
@@ -135,6 +160,10 @@ def denoise_nl_means(image, patch_size=7, patch_distance=11, h=0.1,
     .. [4] A. Buades, B. Coll, & J-M. Morel. Non-Local Means Denoising.
            Image Processing On Line, 2011, vol. 1, pp. 208-212.
            :DOI:`10.5201/ipol.2011.bcm_nlm`
+    .. [5] C. Barnes, E. Shechtman, A. Finkelstein, and D. B. Goldman.
+           PatchMatch: A Randomized Correspondence Algorithm for Structural
+           Image Editing. ACM Transactions on Graphics 28(3) (2009).
+           :DOI:`10.1145/1531326.1531330`
 
     Examples
     --------
@@ -162,9 +191,28 @@ def denoise_nl_means(image, patch_size=7, patch_distance=11, h=0.1,
 
     image = convert_to_float(image, preserve_range)
 
-    kwargs = dict(s=patch_size, d=patch_distance, h=h, var=sigma * sigma)
+    if num_threads is None:
+        # OpenMP default
+        num_threads = 0
+    kwargs = dict(s=patch_size, d=patch_distance, h=h, var=sigma * sigma,
+                  num_threads=num_threads)
     if not image.flags.c_contiguous:
         image = np.ascontiguousarray(image)
+
+    if n_candidates is not None:
+        if n_candidates < 1:
+            raise ValueError('`n_candidates` must be a positive integer.')
+        # shifts are stored as int16; none can exceed the image size
+        kwargs['d'] = min(patch_distance, max(image.shape[:-1]))
+        if channel_axis is not None:  # 2-D images
+            result = _patchmatch_nl_means_denoising(
+                image[np.newaxis], n_candidates=n_candidates, **kwargs)
+            return np.squeeze(result[0])
+        else:  # 3-D grayscale
+            result = _patchmatch_nl_means_denoising(
+                image[..., np.newaxis], n_candidates=n_candidates, **kwargs)
+            return result[..., 0]
+
     if channel_axis is not None:  # 2-D images
         if fast_mode:
             return _fast_nl_means_denoising_2d(image, **kwargs)
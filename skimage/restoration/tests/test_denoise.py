@@ -366,6 +366,64 @@ def test_denoise_bilateral_nan():
     assert_equal(img, out)
 
 
+@pytest.mark.parametrize('channel_axis', [None, -1])
+def test_denoise_bilateral_grid(channel_axis):
+    img = astro_gray if channel_axis is None else astro
+    noise = 0.05 * np.random.default_rng(0).standard_normal(img.shape)
+    noisy = np.clip(img + noise, 0, 1)
+    window = restoration.denoise_bilateral(noisy, sigma_color=0.1,
+                                           sigma_spatial=5,
+                                           channel_axis=channel_axis)
+    grid = restoration.denoise_bilateral(noisy, sigma_color=0.1,
+                                         sigma_spatial=5,
+                                         channel_axis=channel_axis,
+                                         method='grid')
+    assert grid.shape == img.shape
+    assert np.abs(grid - img).mean() < 0.75 * np.abs(noisy - img).mean()
+    if channel_axis is None:
+        assert np.abs(grid - window).mean() < 0.5 * np.abs(noisy - img).mean()
+
+
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+def test_denoise_bilateral_grid_3d(dtype):
+    # two halves of a noisy volume, which should not be blurred together
+    img = np.zeros((20, 30, 40), dtype=dtype)
+    img[:, :, 20:] = 1
+    noisy = img + 0.1 * np.random.default_rng(0).standard_normal(img.shape)
+    noisy = noisy.astype(dtype)
+    denoised = restoration.denoise_bilateral(noisy, sigma_color=0.2,
+                                             sigma_spatial=3, method='grid')
+    assert denoised.dtype == dtype
+    assert denoised.shape == img.shape
+    assert np.abs(denoised - img).mean() < 0.25 * np.abs(noisy - img).mean()
+
+
+def test_denoise_bilateral_grid_constant():
+    img = np.full((10, 10, 10), 0.5)
+    out = restoration.denoise_bilateral(img, method='grid')
+    assert_equal(out, img)
+
+
+@pytest.mark.parametrize('channel_axis', [None, -1])
+def test_denoise_bilateral_grid_nan(channel_axis):
+    rng = np.random.default_rng(0)
+    shape = (30, 40) if channel_axis is None else (30, 40, 3)
+    img = rng.random(shape)
+    img[5, 5] = np.nan
+    img[20, 10] = np.inf
+    out = restoration.denoise_bilateral(img, sigma_color=0.1, sigma_spatial=2,
+                                        channel_axis=channel_axis,
+                                        method='grid')
+    assert np.all(np.isnan(out[5, 5]))
+    assert np.all(np.isnan(out[20, 10]))
+    assert np.isnan(out).sum() == 2 * np.prod(shape[2:], dtype=int)
+
+
+def test_denoise_bilateral_invalid_method():
+    with testing.raises(ValueError):
+        restoration.denoise_bilateral(astro_gray, method='permutohedral')
+
+
 @pytest.mark.parametrize('fast_mode', [False, True])
 def test_denoise_nl_means_2d(fast_mode):
     img = np.zeros((40, 40))
@@ -551,6 +609,83 @@ def test_denoise_nl_means_3d_dtype(fast_mode):
         img_f64, patch_distance=2, fast_mode=fast_mode).dtype == img_f64.dtype
 
 
+@pytest.mark.parametrize('fast_mode', [False, True])
+@pytest.mark.parametrize('channel_axis', [None, -1])
+def test_denoise_nl_means_num_threads(fast_mode, channel_axis):
+    rng = np.random.default_rng(0)
+    img = rng.random((14, 13, 8))
+    kwargs = dict(patch_size=3, patch_distance=3, h=0.2, fast_mode=fast_mode,
+                  channel_axis=channel_axis)
+    expected = restoration.denoise_nl_means(img, **kwargs)
+    for num_threads in [2, None]:
+        denoised = restoration.denoise_nl_means(img, num_threads=num_threads,
+                                                **kwargs)
+        assert_equal(denoised, expected)
+
+
+@pytest.mark.parametrize('dtype', ['float64', 'float32'])
+def test_denoise_nl_means_candidates_2d(dtype):
+    img = np.copy(astro[:50, :50]).astype(dtype)
+    sigma = 0.1
+    imgn = img + sigma * np.random.standard_normal(img.shape)
+    imgn = imgn.astype(dtype)
+    psnr_noisy = peak_signal_noise_ratio(img, imgn)
+    denoised = restoration.denoise_nl_means(imgn, 3, 7, h=sigma, sigma=sigma,
+                                            channel_axis=-1, n_candidates=16)
+    assert denoised.dtype == dtype
+    assert denoised.shape == img.shape
+    assert_(peak_signal_noise_ratio(img, denoised) > psnr_noisy)
+
+    denoised_gray = restoration.denoise_nl_means(
+        imgn[..., 0], 3, 7, h=sigma, sigma=sigma, n_candidates=16)
+    assert denoised_gray.shape == img.shape[:2]
+
+
+def test_denoise_nl_means_candidates_3d():
+    img = np.zeros((12, 12, 8))
+    img[5:-5, 5:-5, 2:-2] = 1.
+    sigma = 0.3
+    imgn = img + sigma * np.random.randn(*img.shape)
+    psnr_noisy = peak_signal_noise_ratio(img, imgn)
+    denoised = restoration.denoise_nl_means(imgn, 3, 4, h=sigma, sigma=sigma,
+                                            channel_axis=None, n_candidates=8)
+    assert denoised.shape == img.shape
+    assert_(peak_signal_noise_ratio(img, denoised) > psnr_noisy)
+
+
+@pytest.mark.parametrize('channel_axis', [None, -1])
+def test_denoise_nl_means_candidates_num_threads(channel_axis):
+    rng = np.random.default_rng(0)
+    img = rng.random((14, 13, 8))
+    kwargs = dict(patch_size=3, patch_distance=5, h=0.2, sigma=0.1,
+                  channel_axis=channel_axis, n_candidates=4)
+    expected = restoration.denoise_nl_means(img, **kwargs)
+    for num_threads in [2, None]:
+        denoised = restoration.denoise_nl_means(img, num_threads=num_threads,
+                                                **kwargs)
+        assert_equal(denoised, expected)
+
+
+@pytest.mark.parametrize('n_candidates', [8, 12])
+def test_denoise_nl_means_candidates_all(n_candidates):
+    # with as many candidates as patches in the search window (or more,
+    # leaving some unused) and a large h, all patches are averaged, as in
+    # the original algorithm
+    rng = np.random.default_rng(0)
+    img = rng.random((10, 11))
+    denoised = restoration.denoise_nl_means(img, 3, 1, h=100., sigma=0.1,
+                                            n_candidates=n_candidates,
+                                            fast_mode=False)
+    expected = restoration.denoise_nl_means(img, 3, 1, h=100., sigma=0.1,
+                                            fast_mode=False)
+    assert_almost_equal(denoised, expected, decimal=2)
+
+
+def test_denoise_nl_means_candidates_invalid():
+    with testing.raises(ValueError):
+        restoration.denoise_nl_means(astro_gray[:20, :20], n_candidates=0)
+
+
 @pytest.mark.parametrize(
     'img, multichannel, convert2ycbcr',
     [(astro_gray, False, False),
@@ -1,24 +1,34 @@
-from ._expand_labels import expand_labels
-from .random_walker_segmentation import random_walker
-from .active_contour_model import active_contour
-from ._felzenszwalb import felzenszwalb
-from .slic_superpixels import slic
-from ._quickshift import quickshift
-from .boundaries import find_boundaries, mark_boundaries
-from ._clear_border import clear_border
-from ._join import join_segmentations, relabel_sequential
-from ._watershed import watershed
-from ._chan_vese import chan_vese
-from .morphsnakes import (morphological_geodesic_active_contour,
-                          morphological_chan_vese, inverse_gaussian_gradient,
-                          circle_level_set,
-                          disk_level_set, checkerboard_level_set)
-from ..morphology import flood, flood_fill
+from .._shared import lazy
+
+__getattr__, __dir__ = lazy.attach(
+    __name__,
+    submodules={'random_walker_segmentation', 'active_contour_model',
+                'slic_superpixels', 'boundaries', 'morphsnakes'},
+    submod_attrs={
+        '_expand_labels': ['expand_labels'],
+        'random_walker_segmentation': ['random_walker', 'RandomWalker'],
+        'active_contour_model': ['active_contour'],
+        '_felzenszwalb': ['felzenszwalb'],
+        'slic_superpixels': ['slic'],
+        '_quickshift': ['quickshift'],
+        'boundaries': ['find_boundaries', 'mark_boundaries'],
+        '_clear_border': ['clear_border'],
+        '_join': ['join_segmentations', 'relabel_sequential'],
+        '_watershed': ['watershed'],
+        '_chan_vese': ['chan_vese'],
+        'morphsnakes': ['morphological_geodesic_active_contour',
+                        'morphological_chan_vese', 'inverse_gaussian_gradient',
+                        'circle_level_set', 'disk_level_set',
+                        'checkerboard_level_set'],
+        '.morphology': ['flood', 'flood_fill'],
+    }
+)
 
 
 __all__ = [
     'expand_labels',
     'random_walker',
+    'RandomWalker',
     'active_contour',
     'felzenszwalb',
     'slic',
@@ -1,5 +1,5 @@
 import numpy as np
-from ..util._map_array import map_array, ArrayMap
+from ..util._map_array import map_array, ArrayMap, _unique_values
 
 
 def join_segmentations(s1, s2):
@@ -119,7 +119,7 @@ def relabel_sequential(label_field, offset=1):
     if np.min(label_field) < 0:
         raise ValueError("Cannot relabel array that contains negative values.")
     offset = int(offset)
-    in_vals = np.unique(label_field)
+    in_vals = _unique_values(label_field)
     if in_vals[0] == 0:
         # always map 0 to 0
         out_vals = np.concatenate(
@@ -0,0 +1,73 @@
+#cython: cdivision=True
+#cython: boundscheck=False
+#cython: nonecheck=False
+#cython: wraparound=False
+
+cimport numpy as cnp
+from .._shared.fused_numerics cimport np_floats
+
+cnp.import_array()
+
+
+ctypedef fused index_t:
+    cnp.int32_t
+    cnp.int64_t
+
+
+def _csr_matmat(index_t[::1] indptr, index_t[::1] indices,
+                np_floats[::1] data, np_floats[:, ::1] x,
+                np_floats[:, ::1] out):
+    """Product of a CSR matrix with a block of a few vectors.
+
+    The vectors are processed by groups of up to four, each row of the
+    matrix being read once per group, with the products of the group
+    accumulated in registers (in double precision).
+
+    Parameters
+    ----------
+    indptr, indices, data : arrays
+        The CSR matrix, of shape (M, N).
+    x : (K, N) array
+        The vectors, as rows.
+    out : (K, M) array
+        Output: the products, as rows.
+    """
+    cdef Py_ssize_t n_rows = out.shape[1]
+    cdef Py_ssize_t k = x.shape[0]
+    cdef Py_ssize_t i, j, c = 0, col
+    cdef np_floats value
+    cdef double a0, a1, a2, a3
+
+    with nogil:
+        while k - c >= 4:
+            for i in range(n_rows):
+                a0 = a1 = a2 = a3 = 0
+                for j in range(indptr[i], indptr[i + 1]):
+                    col = indices[j]
+                    value = data[j]
+                    a0 += value * x[c, col]
+                    a1 += value * x[c + 1, col]
+                    a2 += value * x[c + 2, col]
+                    a3 += value * x[c + 3, col]
+                out[c, i] = a0
+                out[c + 1, i] = a1
+                out[c + 2, i] = a2
+                out[c + 3, i] = a3
+            c += 4
+        if k - c >= 2:
+            for i in range(n_rows):
+                a0 = a1 = 0
+                for j in range(indptr[i], indptr[i + 1]):
+                    col = indices[j]
+                    value = data[j]
+                    a0 += value * x[c, col]
+                    a1 += value * x[c + 1, col]
+                out[c, i] = a0
+                out[c + 1, i] = a1
+            c += 2
+        if k - c == 1:
+            for i in range(n_rows):
+                a0 = 0
+                for j in range(indptr[i], indptr[i + 1]):
+                    a0 += data[j] * x[c, indices[j]]
+                out[c, i] = a0
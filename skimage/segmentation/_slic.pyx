@@ -3,6 +3,7 @@
 #cython: nonecheck=False
 #cython: wraparound=False
 from libc.float cimport DBL_MAX
+from cython.parallel cimport prange
 
 import numpy as np
 cimport numpy as cnp
@@ -13,6 +14,154 @@ from .._shared.fused_numerics cimport np_floats
 cnp.import_array()
 
 
+cdef inline void _add_to_cells(Py_ssize_t[:, ::1] windows, Py_ssize_t k,
+                               Py_ssize_t step_z, Py_ssize_t step_y,
+                               Py_ssize_t step_x, Py_ssize_t n_cells_y,
+                               Py_ssize_t n_cells_x,
+                               Py_ssize_t[::1] cell_end,
+                               Py_ssize_t[::1] cell_segments,
+                               bint fill) nogil:
+    """Count segment `k` in the cells its window intersects, or insert it.
+    """
+    cdef Py_ssize_t cell_z, cell_y, cell_x, cell
+    if (windows[k, 0] >= windows[k, 1] or windows[k, 2] >= windows[k, 3]
+            or windows[k, 4] >= windows[k, 5]):
+        return
+    for cell_z in range(windows[k, 0] // step_z,
+                        (windows[k, 1] - 1) // step_z + 1):
+        for cell_y in range(windows[k, 2] // step_y,
+                            (windows[k, 3] - 1) // step_y + 1):
+            for cell_x in range(windows[k, 4] // step_x,
+                                (windows[k, 5] - 1) // step_x + 1):
+                cell = (cell_z * n_cells_y + cell_y) * n_cells_x + cell_x
+                if fill:
+                    cell_segments[cell_end[cell]] = k
+                cell_end[cell] += 1
+
+
+cdef void _sum_segments(np_floats[:, :, :, ::1] image_zyx,
+                        cnp.uint8_t[:, :, ::1] mask, bint use_mask,
+                        Py_ssize_t[:, :, ::1] nearest_segments,
+                        np_floats[:, ::1] segments,
+                        Py_ssize_t[::1] n_segment_elems,
+                        Py_ssize_t start_label) nogil:
+    """Sum the coordinates and features of the pixels of each segment."""
+    cdef Py_ssize_t mask_label = start_label - 1
+    cdef Py_ssize_t n_features = segments.shape[1]
+    cdef Py_ssize_t z, y, x, k, c
+
+    n_segment_elems[:] = 0
+    segments[:, :] = 0
+    for z in range(nearest_segments.shape[0]):
+        for y in range(nearest_segments.shape[1]):
+            for x in range(nearest_segments.shape[2]):
+
+                if use_mask:
+                    if not mask[z, y, x]:
+                        continue
+
+                    if nearest_segments[z, y, x] == mask_label:
+                        continue
+
+                k = nearest_segments[z, y, x] - start_label
+                n_segment_elems[k] += 1
+                segments[k, 0] += z
+                segments[k, 1] += y
+                segments[k, 2] += x
+                for c in range(3, n_features):
+                    segments[k, c] += image_zyx[z, y, x, c - 3]
+
+
+cdef void _sum_window(np_floats[:, :, :, ::1] image_zyx,
+                      Py_ssize_t[:, :, ::1] nearest_segments,
+                      np_floats[:, ::1] segments,
+                      Py_ssize_t[::1] n_segment_elems,
+                      Py_ssize_t[:, ::1] windows, Py_ssize_t k,
+                      Py_ssize_t start_label) nogil:
+    """Sum the coordinates and features of the pixels of segment `k`.
+
+    The pixels are those of its window, summed in the same order as in
+    `_sum_segments`.
+    """
+    cdef Py_ssize_t n_features = segments.shape[1]
+    cdef Py_ssize_t z, y, x, c
+
+    n_segment_elems[k] = 0
+    segments[k, :] = 0
+    for z in range(windows[k, 0], windows[k, 1]):
+        for y in range(windows[k, 2], windows[k, 3]):
+            for x in range(windows[k, 4], windows[k, 5]):
+                if nearest_segments[z, y, x] != k + start_label:
+                    continue
+                n_segment_elems[k] += 1
+                segments[k, 0] += z
+                segments[k, 1] += y
+                segments[k, 2] += x
+                for c in range(3, n_features):
+                    segments[k, c] += image_zyx[z, y, x, c - 3]
+
+
+cdef void _max_color_distances(np_floats[:, :, :, ::1] image_zyx,
+                               cnp.uint8_t[:, :, ::1] mask, bint use_mask,
+                               Py_ssize_t[:, :, ::1] nearest_segments,
+                               np_floats[:, ::1] segments,
+                               np_floats[::1] max_dist_color,
+                               Py_ssize_t start_label) nogil:
+    """Update the maximum color distance of each segment to its pixels."""
+    cdef Py_ssize_t mask_label = start_label - 1
+    cdef Py_ssize_t n_features = segments.shape[1]
+    cdef Py_ssize_t z, y, x, k, c
+    cdef np_floats dist_color, t
+
+    for z in range(nearest_segments.shape[0]):
+        for y in range(nearest_segments.shape[1]):
+            for x in range(nearest_segments.shape[2]):
+
+                if use_mask:
+                    if not mask[z, y, x]:
+                        continue
+
+                    if nearest_segments[z, y, x] == mask_label:
+                        continue
+
+                k = nearest_segments[z, y, x] - start_label
+                dist_color = 0
+
+                for c in range(3, n_features):
+                    t = image_zyx[z, y, x, c - 3] - segments[k, c]
+                    dist_color += t * t
+
+                # The reference implementation seems to only change
+                # the color if it increases from previous iteration
+                if max_dist_color[k] < dist_color:
+                    max_dist_color[k] = dist_color
+
+
+cdef void _max_window_color_distance(np_floats[:, :, :, ::1] image_zyx,
+                                     Py_ssize_t[:, :, ::1] nearest_segments,
+                                     np_floats[:, ::1] segments,
+                                     np_floats[::1] max_dist_color,
+                                     Py_ssize_t[:, ::1] windows,
+                                     Py_ssize_t k,
+                                     Py_ssize_t start_label) nogil:
+    """Update the maximum color distance of segment `k` to its pixels."""
+    cdef Py_ssize_t n_features = segments.shape[1]
+    cdef Py_ssize_t z, y, x, c
+    cdef np_floats dist_color, t
+
+    for z in range(windows[k, 0], windows[k, 1]):
+        for y in range(windows[k, 2], windows[k, 3]):
+            for x in range(windows[k, 4], windows[k, 5]):
+                if nearest_segments[z, y, x] != k + start_label:
+                    continue
+                dist_color = 0
+                for c in range(3, n_features):
+                    t = image_zyx[z, y, x, c - 3] - segments[k, c]
+                    dist_color += t * t
+                if max_dist_color[k] < dist_color:
+                    max_dist_color[k] = dist_color
+
+
 def _slic_cython(np_floats[:, :, :, ::1] image_zyx,
                  cnp.uint8_t[:, :, ::1] mask,
                  np_floats[:, ::1] segments,
@@ -21,7 +170,8 @@ def _slic_cython(np_floats[:, :, :, ::1] image_zyx,
                  np_floats[::1] spacing,
                  bint slic_zero,
                  Py_ssize_t start_label=1,
-                 bint ignore_color=False):
+                 bint ignore_color=False,
+                 int num_threads=1):
     """Helper function for SLIC segmentation.
 
     Parameters
@@ -47,6 +197,8 @@ def _slic_cython(np_floats[:, :, :, ::1] image_zyx,
     ignore_color : bool
         True to update centroid positions without considering pixels
         color.
+    num_threads : int, optional
+        Number of OpenMP threads, 0 for the OpenMP default.
 
     Returns
     -------
@@ -74,6 +226,14 @@ def _slic_cython(np_floats[:, :, :, ::1] image_zyx,
     and get back a contiguous block of memory. This is better both for
     performance and for readability.
 
+    The pixels are assigned to segments cell by cell of the initial grid
+    of segments, the cells being distributed over the threads. Each cell
+    is compared with the segments whose search window intersects it, in
+    increasing order, so that the result does not depend on the number of
+    threads. The centers are then updated in parallel over the segments,
+    each one summing the pixels of its window in raster order, as the
+    sequential update does.
+
     """
 
     if np_floats is cnp.float32_t:
@@ -107,9 +267,28 @@ def _slic_cython(np_floats[:, :, :, ::1] image_zyx,
         = np.empty((depth, height, width), dtype=dtype)
     cdef Py_ssize_t[::1] n_segment_elems = np.empty(n_segments, dtype=np.intp)
 
+    # cells of the grid, and search window of each segment as
+    # [z_min, z_max, y_min, y_max, x_min, x_max]
+    cdef Py_ssize_t n_cells_z = (depth + step_z - 1) // step_z
+    cdef Py_ssize_t n_cells_y = (height + step_y - 1) // step_y
+    cdef Py_ssize_t n_cells_x = (width + step_x - 1) // step_x
+    cdef Py_ssize_t n_cells = n_cells_z * n_cells_y * n_cells_x
+    cdef Py_ssize_t[:, ::1] windows = np.empty((n_segments, 6), dtype=np.intp)
+    # segments whose window intersects each cell, in increasing order:
+    # those of cell j are cell_segments[cell_start[j]:cell_start[j + 1]]
+    cdef Py_ssize_t[::1] cell_start = np.empty(n_cells + 1, dtype=np.intp)
+    cdef Py_ssize_t[::1] cell_end = np.empty(n_cells, dtype=np.intp)
+    # a window spans at most 6 cells along each axis
+    cdef Py_ssize_t[::1] cell_segments = np.empty(
+        n_segments * min(n_cells_z, 6) * min(n_cells_y, 6)
+        * min(n_cells_x, 6), dtype=np.intp)
+
     cdef Py_ssize_t i, c, k, x, y, z, x_min, x_max, y_min, y_max, z_min, z_max
-    cdef bint change
+    cdef Py_ssize_t cell, j, cell_z, cell_y, cell_x
+    cdef Py_ssize_t z0, z1, y0, y1, x0, x1
+    cdef Py_ssize_t n_changed, n_stale
     cdef np_floats dist_center, cx, cy, cz, dx, dy, dz, t
+    cdef np_floats no_distance = DBL_MAX
 
     cdef np_floats sz, sy, sx
     sz = spacing[0]
@@ -126,83 +305,126 @@ def _slic_cython(np_floats[:, :, :, ::1] image_zyx,
 
     with nogil:
         for i in range(max_iter):
-            change = False
-            distance[:, :, :] = DBL_MAX
 
-            # assign pixels to segments
+            # compute windows, and list the segments of each cell
+            cell_end[:] = 0
             for k in range(n_segments):
-
                 # segment coordinate centers
                 cz = segments[k, 0]
                 cy = segments[k, 1]
                 cx = segments[k, 2]
+                if cz != cz or cy != cy or cx != cx:
+                    # empty segment, whose center is NaN
+                    windows[k, :] = 0
+                    continue
+                windows[k, 0] = <Py_ssize_t>max(cz - 2 * step_z, 0)
+                windows[k, 1] = <Py_ssize_t>min(cz + 2 * step_z + 1, depth)
+                windows[k, 2] = <Py_ssize_t>max(cy - 2 * step_y, 0)
+                windows[k, 3] = <Py_ssize_t>min(cy + 2 * step_y + 1, height)
+                windows[k, 4] = <Py_ssize_t>max(cx - 2 * step_x, 0)
+                windows[k, 5] = <Py_ssize_t>min(cx + 2 * step_x + 1, width)
+                _add_to_cells(windows, k, step_z, step_y, step_x, n_cells_y,
+                              n_cells_x, cell_end, cell_segments, False)
+            cell_start[0] = 0
+            for cell in range(n_cells):
+                cell_start[cell + 1] = cell_start[cell] + cell_end[cell]
+                cell_end[cell] = cell_start[cell]
+            for k in range(n_segments):
+                _add_to_cells(windows, k, step_z, step_y, step_x, n_cells_y,
+                              n_cells_x, cell_end, cell_segments, True)
+
+            # assign pixels to segments
+            n_changed = 0
+            n_stale = 0
+            for cell in prange(n_cells, schedule='dynamic',
+                               num_threads=num_threads):
+                cell_z = cell // (n_cells_y * n_cells_x)
+                cell_y = (cell // n_cells_x) % n_cells_y
+                cell_x = cell % n_cells_x
+                z0 = cell_z * step_z
+                z1 = min(z0 + step_z, depth)
+                y0 = cell_y * step_y
+                y1 = min(y0 + step_y, height)
+                x0 = cell_x * step_x
+                x1 = min(x0 + step_x, width)
+                for z in range(z0, z1):
+                    for y in range(y0, y1):
+                        for x in range(x0, x1):
+                            distance[z, y, x] = no_distance
+
+                for j in range(cell_start[cell], cell_start[cell + 1]):
+                    k = cell_segments[j]
+
+                    # segment coordinate centers
+                    cz = segments[k, 0]
+                    cy = segments[k, 1]
+                    cx = segments[k, 2]
+
+                    # intersection of the window with the cell
+                    z_min = max(windows[k, 0], z0)
+                    z_max = min(windows[k, 1], z1)
+                    y_min = max(windows[k, 2], y0)
+                    y_max = min(windows[k, 3], y1)
+                    x_min = max(windows[k, 4], x0)
+                    x_max = min(windows[k, 5], x1)
+
+                    for z in range(z_min, z_max):
+                        dz = sz * (cz - z)
+                        dz = dz * dz
+                        for y in range(y_min, y_max):
+                            dy = sy * (cy - y)
+                            dy = dy * dy
+                            for x in range(x_min, x_max):
+
+                                if use_mask and not mask[z, y, x]:
+                                    continue
 
-                # compute windows
-                z_min = <Py_ssize_t>max(cz - 2 * step_z, 0)
-                z_max = <Py_ssize_t>min(cz + 2 * step_z + 1, depth)
-                y_min = <Py_ssize_t>max(cy - 2 * step_y, 0)
-                y_max = <Py_ssize_t>min(cy + 2 * step_y + 1, height)
-                x_min = <Py_ssize_t>max(cx - 2 * step_x, 0)
-                x_max = <Py_ssize_t>min(cx + 2 * step_x + 1, width)
-
-                for z in range(z_min, z_max):
-                    dz = sz * (cz - z)
-                    dz *= dz
-                    for y in range(y_min, y_max):
-                        dy = sy * (cy - y)
-                        dy *= dy
-                        for x in range(x_min, x_max):
-
-                            if use_mask and not mask[z, y, x]:
-                                continue
-
-                            dx = sx * (cx - x)
-                            dx *= dx
-                            dist_center = (dz + dy + dx) * spatial_weight
-
-                            if not ignore_color:
-                                dist_color = 0
-                                for c in range(3, n_features):
-                                    t = (image_zyx[z, y, x, c - 3]
-                                         - segments[k, c])
-                                    dist_color += t * t
-
-                                if slic_zero:
-                                    dist_color /= max_dist_color[k]
-                                dist_center += dist_color
-
-                            if distance[z, y, x] > dist_center:
-                                nearest_segments[z, y, x] = k + start_label
-                                distance[z, y, x] = dist_center
-                                change = True
+                                dx = sx * (cx - x)
+                                dx = dx * dx
+                                dist_center = (dz + dy + dx) * spatial_weight
+
+                                if not ignore_color:
+                                    dist_color = 0
+                                    for c in range(3, n_features):
+                                        t = (image_zyx[z, y, x, c - 3]
+                                             - segments[k, c])
+                                        dist_color = dist_color + t * t
+
+                                    if slic_zero:
+                                        dist_color = (dist_color
+                                                      / max_dist_color[k])
+                                    dist_center = dist_center + dist_color
+
+                                if distance[z, y, x] > dist_center:
+                                    nearest_segments[z, y, x] = \
+                                        k + start_label
+                                    distance[z, y, x] = dist_center
+                                    n_changed += 1
+
+                # pixels out of all the windows keep their previous label
+                for z in range(z0, z1):
+                    for y in range(y0, y1):
+                        for x in range(x0, x1):
+                            if (distance[z, y, x] == no_distance
+                                    and nearest_segments[z, y, x]
+                                    != mask_label):
+                                n_stale += 1
 
             # stop if no pixel changed its segment
-            if not change:
+            if n_changed == 0:
                 break
 
             # recompute segment centers
 
-            # sum features for all segments
-            n_segment_elems[:] = 0
-            segments[:, :] = 0
-            for z in range(depth):
-                for y in range(height):
-                    for x in range(width):
-
-                        if use_mask:
-                            if not mask[z, y, x]:
-                                continue
-
-                            if nearest_segments[z, y, x] == mask_label:
-                                continue
-
-                        k = nearest_segments[z, y, x] - start_label
-                        n_segment_elems[k] += 1
-                        segments[k, 0] += z
-                        segments[k, 1] += y
-                        segments[k, 2] += x
-                        for c in range(3, n_features):
-                            segments[k, c] += image_zyx[z, y, x, c - 3]
+            if num_threads == 1 or n_stale > 0:
+                _sum_segments(image_zyx, mask, use_mask, nearest_segments,
+                              segments, n_segment_elems, start_label)
+            else:
+                # all the pixels of a segment are in its window
+                for k in prange(n_segments, schedule='dynamic',
+                                num_threads=num_threads):
+                    _sum_window(image_zyx, nearest_segments, segments,
+                                n_segment_elems, windows, k, start_label)
 
             # divide by number of elements per segment to obtain mean
             for k in range(n_segments):
@@ -211,28 +433,17 @@ def _slic_cython(np_floats[:, :, :, ::1] image_zyx,
 
             # If in SLICO mode, update the color distance maxima
             if slic_zero:
-                for z in range(depth):
-                    for y in range(height):
-                        for x in range(width):
-
-                            if use_mask:
-                                if not mask[z, y, x]:
-                                    continue
-
-                                if nearest_segments[z, y, x] == mask_label:
-                                    continue
-
-                            k = nearest_segments[z, y, x] - start_label
-                            dist_color = 0
-
-                            for c in range(3, n_features):
-                                t = image_zyx[z, y, x, c - 3] - segments[k, c]
-                                dist_color += t * t
-
-                            # The reference implementation seems to only change
-                            # the color if it increases from previous iteration
-                            if max_dist_color[k] < dist_color:
-                                max_dist_color[k] = dist_color
+                if num_threads == 1 or n_stale > 0:
+                    _max_color_distances(image_zyx, mask, use_mask,
+                                         nearest_segments, segments,
+                                         max_dist_color, start_label)
+                else:
+                    for k in prange(n_segments, schedule='dynamic',
+                                    num_threads=num_threads):
+                        _max_window_color_distance(image_zyx,
+                                                   nearest_segments,
+                                                   segments, max_dist_color,
+                                                   windows, k, start_label)
 
     return np.asarray(nearest_segments)
 
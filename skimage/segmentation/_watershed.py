@@ -34,6 +34,10 @@ from ..morphology._util import (_validate_connectivity,
 from ..util import crop, regular_seeds
 
 
+# rows by which the tiles flooded concurrently are extended on either side
+_TILE_OVERLAP = 32
+
+
 def _validate_inputs(image, markers, mask, connectivity):
     """Ensure that all inputs to watershed have matching shapes and types.
 
@@ -73,7 +77,8 @@ def _validate_inputs(image, markers, mask, connectivity):
             raise ValueError(message)
     if markers is None:
         markers_bool = local_minima(image, connectivity=connectivity) * mask
-        footprint = ndi.generate_binary_structure(markers_bool.ndim, connectivity)
+        footprint = ndi.generate_binary_structure(markers_bool.ndim,
+                                                  connectivity)
         markers = ndi.label(markers_bool, structure=footprint)[0]
     elif not isinstance(markers, (np.ndarray, list, tuple)):
         # not array-like, assume int
@@ -92,8 +97,120 @@ def _validate_inputs(image, markers, mask, connectivity):
             mask.astype(np.int8))
 
 
+def _flood(image, markers, mask, connectivity, offset, compactness,
+           watershed_line, levels=None):
+    """Run the priority flood on validated inputs.
+
+    `markers` is modified in place to hold the labels. If `levels` is given,
+    it receives the flood level at which each pixel was labeled.
+    """
+    # pad the image, markers, and mask so that we can use the mask to
+    # keep from running off the edges
+    pad_width = [(p, p) for p in offset]
+    image = np.pad(image, pad_width, mode='constant')
+    mask = np.pad(mask, pad_width, mode='constant').ravel()
+    output = np.pad(markers, pad_width, mode='constant')
+
+    flat_neighborhood = _offsets_to_raveled_neighbors(
+        image.shape, connectivity, center=offset)
+    marker_locations = np.flatnonzero(output)
+    image_strides = np.array(image.strides, dtype=np.intp) // image.itemsize
+    if levels is not None:
+        padded_levels = np.zeros(image.shape)
+
+    _watershed_cy.watershed_raveled(image.ravel(),
+                                    marker_locations, flat_neighborhood,
+                                    mask, image_strides, compactness,
+                                    output.ravel(),
+                                    watershed_line,
+                                    None if levels is None
+                                    else padded_levels.ravel())
+
+    markers[...] = crop(output, pad_width)
+    if levels is not None:
+        levels[...] = crop(padded_levels, pad_width)
+    return markers
+
+
+def _flood_tiles(image, markers, mask, connectivity, offset, compactness,
+                 watershed_line, num_workers, overlap):
+    """Flood horizontal tiles of the image concurrently.
+
+    The image is split along its first axis into `num_workers` tiles, each
+    extended by `overlap` rows on both sides and flooded independently on
+    a thread. Neighboring tiles both flood the rows around their common
+    boundary; labels on which they disagree there are "disputed". The
+    basins of disputed labels, and any pixel of the mask that no tile
+    reached, are flooded again in one serial pass, from their markers and
+    from the undisputed labels bordering them. These bordering pixels enter
+    the second pass at the flood level at which their tile labeled them, so
+    that they compete for the disputed basins in the same order as in the
+    serial flood.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    rows = image.shape[0]
+    n_tiles = min(num_workers, max(1, rows // (2 * overlap)))
+    if n_tiles < 2:
+        return _flood(image, markers, mask, connectivity, offset,
+                      compactness, watershed_line)
+    bounds = np.linspace(0, rows, n_tiles + 1).astype(int)
+    starts = np.maximum(bounds[:-1] - overlap, 0)
+    stops = np.minimum(bounds[1:] + overlap, rows)
+
+    levels = np.zeros(image.shape)
+
+    def flood_tile(i):
+        tile_markers = markers[starts[i]:stops[i]].copy()
+        tile_levels = np.zeros(tile_markers.shape)
+        _flood(image[starts[i]:stops[i]], tile_markers,
+               mask[starts[i]:stops[i]], connectivity, offset, compactness,
+               watershed_line, levels=tile_levels)
+        core = slice(bounds[i] - starts[i], bounds[i + 1] - starts[i])
+        levels[bounds[i]:bounds[i + 1]] = tile_levels[core]
+        return tile_markers
+
+    with ThreadPoolExecutor(max_workers=n_tiles) as executor:
+        tiles = list(executor.map(flood_tile, range(n_tiles)))
+
+    output = np.concatenate([tile[bounds[i] - starts[i]:
+                                  bounds[i + 1] - starts[i]]
+                             for i, tile in enumerate(tiles)])
+
+    disputed = []
+    for i in range(n_tiles - 1):
+        # rows flooded by both tile i and tile i + 1
+        upper = tiles[i][starts[i + 1] - starts[i]:]
+        lower = tiles[i + 1][:stops[i] - starts[i + 1]]
+        differ = upper != lower
+        disputed += [upper[differ], lower[differ]]
+    disputed = np.unique(np.concatenate(disputed))
+    disputed = disputed[disputed != 0]
+
+    redo = np.isin(output, disputed)
+    redo |= (output == 0)
+    redo &= mask.astype(bool)
+    if not redo.any():
+        markers[...] = output
+        return markers
+
+    # seed the second pass with the markers of the disputed basins and the
+    # labels on the rim of the region to flood again
+    footprint = np.ones([2 * o + 1 for o in offset], dtype=bool)
+    rim = ndi.binary_dilation(redo, structure=footprint) & ~redo
+    rim &= output > 0
+    seeds = np.where(rim, output, 0).astype(np.int32)
+    seeds[redo] = markers[redo]
+    image = np.where(rim, levels, image)
+    _flood(image, seeds, (redo | rim).astype(np.int8), connectivity, offset,
+           compactness, watershed_line)
+    output[redo] = seeds[redo]
+    markers[...] = output
+    return markers
+
+
 def watershed(image, markers=None, connectivity=1, offset=None, mask=None,
-              compactness=0, watershed_line=False):
+              compactness=0, watershed_line=False, *, num_workers=1):
     """Find watershed basins in `image` flooded from given `markers`.
 
     Parameters
@@ -121,6 +238,10 @@ def watershed(image, markers=None, connectivity=1, offset=None, mask=None,
     watershed_line : bool, optional
         If watershed_line is True, a one-pixel wide line separates the regions
         obtained by the watershed algorithm. The line has the label 0.
+    num_workers : int, optional
+        Number of threads flooding tiles of the image concurrently. The
+        default, 1, runs the serial algorithm. See Notes for when the tiled
+        result can differ from the serial one.
 
     Returns
     -------
@@ -159,6 +280,28 @@ def watershed(image, markers=None, connectivity=1, offset=None, mask=None,
     distance function to the background for separating overlapping objects
     (see example).
 
+    With ``num_workers > 1``, the image is cut along its first axis into
+    ``num_workers`` tiles, each extended by 32 rows on either side and
+    flooded on its own thread from the markers it contains. Neighboring
+    tiles both flood the 64 rows around their common boundary, and the
+    labels on which they disagree there are disputed. The basins of the
+    disputed labels, and the pixels that no tile reached, are then flooded
+    again in one serial pass. This pass starts from their markers and from
+    the undisputed pixels bordering them, which enter at the flood level at
+    which their tile labeled them. The result does not depend on thread
+    scheduling and equals the serial result when:
+
+    - no two pixels are labeled at the same flood level, as is the case for
+      floating-point images without plateaus; otherwise pixels on a plateau
+      inside a reflooded basin may be split differently between the basins
+      flooding it, because the serial algorithm breaks ties in the order in
+      which pixels were queued, which is not reproduced by the second pass;
+    - the basins no tile disagrees on are flooded within their tiles exactly
+      as in the serial flood.
+
+    ``compactness > 0`` always uses the serial algorithm, as do images with
+    fewer than 64 rows per tile.
+
     References
     ----------
     .. [1] https://en.wikipedia.org/wiki/Watershed_%28image_processing%29
@@ -205,24 +348,11 @@ def watershed(image, markers=None, connectivity=1, offset=None, mask=None,
     connectivity, offset = _validate_connectivity(image.ndim, connectivity,
                                                   offset)
 
-    # pad the image, markers, and mask so that we can use the mask to
-    # keep from running off the edges
-    pad_width = [(p, p) for p in offset]
-    image = np.pad(image, pad_width, mode='constant')
-    mask = np.pad(mask, pad_width, mode='constant').ravel()
-    output = np.pad(markers, pad_width, mode='constant')
-
-    flat_neighborhood = _offsets_to_raveled_neighbors(
-        image.shape, connectivity, center=offset)
-    marker_locations = np.flatnonzero(output)
-    image_strides = np.array(image.strides, dtype=np.intp) // image.itemsize
-
-    _watershed_cy.watershed_raveled(image.ravel(),
-                                    marker_locations, flat_neighborhood,
-                                    mask, image_strides, compactness,
-                                    output.ravel(),
-                                    watershed_line)
-
-    output = crop(output, pad_width, copy=True)
-
-    return output
+    if num_workers > 1 and compactness == 0:
+        # the compact watershed measures distances to the original markers,
+        # which the second pass of the tiled flood does not know
+        return _flood_tiles(image, markers, mask, connectivity, offset,
+                            compactness, watershed_line, num_workers,
+                            overlap=_TILE_OVERLAP)
+    return _flood(image, markers, mask, connectivity, offset, compactness,
+                  watershed_line)
@@ -84,7 +84,8 @@ def watershed_raveled(cnp.float64_t[::1] image,
                       cnp.intp_t[::1] strides,
                       cnp.double_t compactness,
                       DTYPE_INT32_t[::1] output,
-                      DTYPE_BOOL_t wsl):
+                      DTYPE_BOOL_t wsl,
+                      cnp.float64_t[::1] levels=None):
     """Perform watershed algorithm using a raveled image and neighborhood.
 
     Parameters
@@ -118,6 +119,12 @@ def watershed_raveled(cnp.float64_t[::1] image,
     wsl : bool
         Parameter indicating whether the watershed line is calculated.
         If wsl is set to True, the watershed line is calculated.
+    levels : array of float, optional
+        If given, receives for each labeled pixel the flood level at which it
+        was labeled: its priority when it came off the heap, or, when pixels
+        are labeled as they are pushed, the larger of its value and the
+        level of the pixel that pushed it. Pixels are labeled in increasing
+        order of level, up to ties.
     """
     cdef Heapitem elem
     cdef Heapitem new_elem
@@ -127,6 +134,7 @@ def watershed_raveled(cnp.float64_t[::1] image,
     cdef Py_ssize_t index = 0
     cdef Py_ssize_t neighbor_index = 0
     cdef DTYPE_BOOL_t compact = (compactness > 0)
+    cdef bint record_levels = levels is not None
 
     cdef Heap *hp = <Heap *> heap_from_numpy2()
 
@@ -138,6 +146,8 @@ def watershed_raveled(cnp.float64_t[::1] image,
             elem.index = index
             elem.source = index
             heappush(hp, &elem)
+            if record_levels:
+                levels[index] = image[index]
 
         while hp.items > 0:
             heappop(hp, &elem)
@@ -160,6 +170,8 @@ def watershed_raveled(cnp.float64_t[::1] image,
                     if _diff_neighbors(output, structure, mask, elem.index):
                         continue
                 output[elem.index] = output[elem.source]
+                if record_levels and elem.index != elem.source:
+                    levels[elem.index] = elem.value
 
             for i in range(nneighbors):
                 # get the flattened address of the neighbor
@@ -188,6 +200,9 @@ def watershed_raveled(cnp.float64_t[::1] image,
                     # This results in a very significant performance gain, see:
                     # https://github.com/scikit-image/scikit-image/issues/2636
                     output[neighbor_index] = output[elem.index]
+                    if record_levels:
+                        levels[neighbor_index] = max(new_elem.value,
+                                                     levels[elem.index])
                 new_elem.age = age
                 new_elem.index = neighbor_index
                 new_elem.source = elem.source
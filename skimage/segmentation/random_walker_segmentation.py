@@ -41,8 +41,9 @@ except ImportError:
     amg_loaded = False
 
 from ..util import img_as_float
+from ._random_walker_cy import _csr_matmat
 
-from scipy.sparse.linalg import cg, spsolve
+from scipy.sparse.linalg import spsolve, splu
 
 
 def _make_graph_edges_3d(n_x, n_y, n_z):
@@ -161,7 +162,134 @@ def _build_linear_system(data, spacing, labels, nlabels, mask,
     return lap_sparse, rhs
 
 
-def _solve_linear_system(lap_sparse, B, tol, mode):
+def _row_dots(a, b):
+    """Dot products of the rows of `a` and `b`."""
+    return np.array([np.dot(x, y) for x, y in zip(a, b)], dtype=np.float64)
+
+
+def _matmat(A, X):
+    """Products of a sparse matrix with the rows of a (K, N) array."""
+    if (sparse.isspmatrix_csr(A) and A.dtype == X.dtype
+            and A.dtype in (np.float32, np.float64)
+            and A.indptr.dtype == A.indices.dtype):
+        out = np.empty((X.shape[0], A.shape[0]), dtype=X.dtype)
+        _csr_matmat(A.indptr, A.indices, A.data, np.ascontiguousarray(X),
+                    out)
+        return out
+    return np.ascontiguousarray((A @ X.T).T)
+
+
+def _cg(A, B, tol, M=None, maxiter=None, x0=None, b_norm=None):
+    """Solve ``A x = b`` with the conjugate gradient, for many `b` at once.
+
+    The systems are iterated together, so that each iteration multiplies
+    the sparse matrix with a block of vectors, reading it once rather than
+    once per system. Each system stops as soon as it has converged.
+
+    Parameters
+    ----------
+    A : (N, N) sparse matrix
+        Symmetric positive definite matrix.
+    B : (K, N) ndarray
+        Right-hand sides, as rows.
+    tol : float
+        Relative tolerance: a system has converged when the norm of its
+        residual is at most `tol` times the norm of its right-hand side.
+    M : callable, optional
+        Preconditioner, applied to a (K', N) array of residuals.
+    maxiter : int, optional
+        Maximum number of iterations, ``10 * N`` by default.
+    x0 : (K, N) ndarray, optional
+        Initial guess, zero by default.
+    b_norm : (K,) ndarray, optional
+        Norms to which `tol` is relative, those of the rows of `B` by
+        default.
+
+    Returns
+    -------
+    X : (K, N) ndarray
+        The solutions, as rows.
+    info : (K,) ndarray of int
+        0 for the systems that converged, else the number of iterations.
+    """
+    k, n = B.shape
+    if maxiter is None:
+        maxiter = 10 * n
+    if M is None:
+        def M(r):
+            return r
+    if b_norm is None:
+        b_norm = np.sqrt(_row_dots(B, B))
+
+    if x0 is None:
+        X = np.zeros_like(B)
+        R = B.copy()
+    else:
+        X = np.array(x0, dtype=B.dtype)
+        R = B - _matmat(A, X)
+    threshold = tol * b_norm
+    info = np.zeros(k, dtype=int)
+
+    # arrays of the systems still iterated
+    active = np.flatnonzero(np.sqrt(_row_dots(R, R)) > threshold)
+    Xa = X[active]
+    Ra = R[active]
+    Za = M(Ra)
+    Pa = np.array(Za, dtype=B.dtype)
+    rz = _row_dots(Ra, Za)
+    for _ in range(maxiter):
+        if not active.size:
+            break
+        Q = _matmat(A, Pa)
+        alpha = (rz / _row_dots(Pa, Q)).astype(B.dtype)[:, np.newaxis]
+        Q *= alpha
+        Ra -= Q
+        np.multiply(Pa, alpha, out=Q)
+        Xa += Q
+        done = np.sqrt(_row_dots(Ra, Ra)) <= threshold[active]
+        if done.any():
+            X[active[done]] = Xa[done]
+            keep = ~done
+            active = active[keep]
+            Xa, Ra, Pa, rz = Xa[keep], Ra[keep], Pa[keep], rz[keep]
+            if not active.size:
+                break
+        Za = M(Ra)
+        rz_new = _row_dots(Ra, Za)
+        Pa *= (rz_new / rz).astype(B.dtype)[:, np.newaxis]
+        Pa += Za
+        rz = rz_new
+    X[active] = Xa
+    info[active] = maxiter
+    return X, info
+
+
+def _jacobi(A):
+    """Jacobi preconditioner of `A`, applied to the rows of an array."""
+    inv_diagonal = 1 / A.diagonal()
+
+    def M(r):
+        return inv_diagonal * r
+
+    return M
+
+
+def _amg(A):
+    """Multigrid preconditioner of `A`, applied to the rows of an array."""
+    ml = ruge_stuben_solver(A.tocsr())
+    preconditioner = ml.aspreconditioner(cycle='V')
+
+    def M(r):
+        return np.ascontiguousarray(preconditioner.matmat(r.T).T)
+
+    return M
+
+
+def _check_mode(mode):
+    if mode not in ('cg_mg', 'cg', 'bf', 'cg_j', None):
+        raise ValueError(
+            "{mode} is not a valid mode. Valid modes are 'cg_mg',"
+            " 'cg', 'cg_j', 'bf' and None".format(mode=mode))
 
     if mode is None:
         mode = 'cg_j'
@@ -169,37 +297,41 @@ def _solve_linear_system(lap_sparse, B, tol, mode):
     if mode == 'cg_mg' and not amg_loaded:
         warn('"cg_mg" not available, it requires pyamg to be installed. '
              'The "cg_j" mode will be used instead.',
-             stacklevel=2)
+             stacklevel=3)
         mode = 'cg_j'
+    elif mode == 'cg' and UmfpackContext is None:
+        warn('"cg" mode may be slow because UMFPACK is not available. '
+             'Consider building Scipy with UMFPACK or use a '
+             'preconditioned version of CG ("cg_j" or "cg_mg" modes).',
+             stacklevel=3)
+    return mode
+
+
+def _warn_convergence():
+    warn("Conjugate gradient convergence to tolerance not achieved. "
+         "Consider decreasing beta to improve system conditionning.",
+         stacklevel=3)
+
+
+def _solve_linear_system(lap_sparse, B, tol, mode):
 
     if mode == 'bf':
         X = spsolve(lap_sparse, B.toarray()).T
     else:
         maxiter = None
         if mode == 'cg':
-            if UmfpackContext is None:
-                warn('"cg" mode may be slow because UMFPACK is not available. '
-                     'Consider building Scipy with UMFPACK or use a '
-                     'preconditioned version of CG ("cg_j" or "cg_mg" modes).',
-                     stacklevel=2)
             M = None
         elif mode == 'cg_j':
-            M = sparse.diags(1.0 / lap_sparse.diagonal())
+            M = _jacobi(lap_sparse)
         else:
             # mode == 'cg_mg'
-            lap_sparse = lap_sparse.tocsr()
-            ml = ruge_stuben_solver(lap_sparse)
-            M = ml.aspreconditioner(cycle='V')
+            M = _amg(lap_sparse)
             maxiter = 30
-        cg_out = [
-            cg(lap_sparse, B[:, i].toarray(),
-               tol=tol, atol=0, M=M, maxiter=maxiter)
-            for i in range(B.shape[1])]
-        if np.any([info > 0 for _, info in cg_out]):
-            warn("Conjugate gradient convergence to tolerance not achieved. "
-                 "Consider decreasing beta to improve system conditionning.",
-                 stacklevel=2)
-        X = np.asarray([x for x, _ in cg_out])
+        # all labels are solved together, see `_cg`
+        X, info = _cg(lap_sparse.tocsr(), B.T.toarray(), tol, M=M,
+                      maxiter=maxiter)
+        if np.any(info > 0):
+            _warn_convergence()
 
     return X
 
@@ -259,11 +391,103 @@ def _preprocess(labels):
     return labels, nlabels, mask, inds_isolated_seeds, isolated_values
 
 
+def _check_spacing(spacing, ndim):
+    if spacing is None:
+        return np.ones(3)
+    elif len(spacing) == ndim:
+        if len(spacing) == 2:
+            # Need a dummy spacing for singleton 3rd dim
+            spacing = np.r_[spacing, 1.]
+        return np.asarray(spacing)
+    raise ValueError('Input argument `spacing` incorrect, should be an '
+                     'iterable with one number per spatial dimension.')
+
+
+def _prepare_data(data, multichannel, dtype):
+    """Coerce `data` to a 4-D float array, channels last.
+
+    This algorithm expects 4-D arrays of floats, where the first three
+    dimensions are spatial and the final denotes channels. 2-D images have a
+    singleton placeholder dimension added for the third spatial dimension,
+    and single channel images likewise have a singleton added for channels.
+
+    Returns
+    -------
+    data : (M, N, P, C) ndarray
+        The coerced data.
+    shape : tuple of int
+        The spatial shape of the input data.
+    """
+    if not multichannel:
+        if data.ndim not in (2, 3):
+            raise ValueError('For non-multichannel input, data must be of '
+                             'dimension 2 or 3.')
+        shape = data.shape
+        data = np.atleast_3d(img_as_float(data))[..., np.newaxis]
+    else:
+        if data.ndim not in (3, 4):
+            raise ValueError('For multichannel input, data must have 3 or 4 '
+                             'dimensions.')
+        shape = data.shape[:-1]
+        data = img_as_float(data)
+        if data.ndim == 3:  # 2D multispectral, needs singleton in 3rd axis
+            data = data[:, :, np.newaxis, :]
+    if dtype is not None:
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64):
+            raise ValueError("dtype must be float32 or float64.")
+        data = data.astype(dtype, copy=False)
+    return data, shape
+
+
+def _trivial_output(labels, return_full_prob):
+    """Output when there are no unlabeled pixels to determine."""
+    if return_full_prob:
+        # Return the concatenation of the masks of each unique label
+        return np.concatenate([np.atleast_3d(labels == lab)
+                               for lab in np.unique(labels) if lab > 0],
+                              axis=-1)
+    return labels
+
+
+def _format_output(X, labels, labels_shape, labels_dtype, nlabels,
+                   inds_isolated_seeds, isolated_values, prob_tol,
+                   return_full_prob):
+    """Build the output of the random walker from the probabilities `X`.
+
+    `X` is a (nlabels, M) array, of the probabilities of the M unlabeled
+    pixels, in C order.
+    """
+    if X.min() < -prob_tol or X.max() > 1 + prob_tol:
+        warn('The probability range is outside [0, 1] given the tolerance '
+             '`prob_tol`. Consider decreasing `beta` and/or decreasing '
+             '`tol`.', stacklevel=3)
+
+    # Put back labels of isolated seeds
+    labels[inds_isolated_seeds] = isolated_values
+    labels = labels.reshape(labels_shape)
+
+    mask = labels == 0
+    mask[inds_isolated_seeds] = False
+
+    if return_full_prob:
+        out = np.zeros((nlabels,) + labels_shape)
+        for lab, (label_prob, prob) in enumerate(zip(out, X), start=1):
+            label_prob[mask] = prob
+            label_prob[labels == lab] = 1
+    else:
+        X = np.argmax(X, axis=0) + 1
+        out = labels.astype(labels_dtype)
+        out[mask] = X
+
+    return out
+
+
 @utils.channel_as_last_axis(multichannel_output=False)
 @utils.deprecate_multichannel_kwarg(multichannel_position=6)
 def random_walker(data, labels, beta=130, mode='cg_j', tol=1.e-3, copy=True,
                   multichannel=False, return_full_prob=False, spacing=None,
-                  *, prob_tol=1e-3, channel_axis=None):
+                  *, prob_tol=1e-3, channel_axis=None, dtype=None):
     """Random walker algorithm for segmentation from markers.
 
     Random walker algorithm is implemented for gray-level or multichannel
@@ -335,6 +559,15 @@ def random_walker(data, labels, beta=130, mode='cg_j', tol=1.e-3, copy=True,
 
         .. versionadded:: 0.19
            ``channel_axis`` was added in 0.19.
+    dtype : {np.float32, np.float64}, optional
+        Floating point type of the Laplacian and of the solution of the
+        conjugate gradient modes. By default, that of `data` once converted
+        to floats. ``float32`` halves the memory used by the linear system,
+        and the memory traffic of the iterative solvers, but can be
+        inaccurate for ill-conditioned systems, e.g. with a large `beta`.
+        Mode 'bf' always builds and factorizes the system in double
+        precision, as single precision is not accurate enough for a direct
+        solver.
 
     Returns
     -------
@@ -350,6 +583,7 @@ def random_walker(data, labels, beta=130, mode='cg_j', tol=1.e-3, copy=True,
 
     See Also
     --------
+    RandomWalker : random walker segmentation, for successive markers
     skimage.morphology.watershed : watershed segmentation
         A segmentation algorithm based on mathematical morphology
         and "flooding" of regions from markers.
@@ -396,7 +630,9 @@ def random_walker(data, labels, beta=130, mode='cg_j', tol=1.e-3, copy=True,
 
     where x_m = 1 on markers of the given phase, and 0 on other markers.
     This linear system is solved in the algorithm using a direct method for
-    small images, and an iterative method for larger images.
+    small images, and an iterative method for larger images. The iterative
+    methods solve the systems of all the labels together, with a block
+    conjugate gradient.
 
     References
     ----------
@@ -425,47 +661,15 @@ def random_walker(data, labels, beta=130, mode='cg_j', tol=1.e-3, copy=True,
            [1, 1, 1, 1, 1, 1, 1, 1, 1, 1]], dtype=int32)
 
     """
-    # Parse input data
-    if mode not in ('cg_mg', 'cg', 'bf', 'cg_j', None):
-        raise ValueError(
-            "{mode} is not a valid mode. Valid modes are 'cg_mg',"
-            " 'cg', 'cg_j', 'bf' and None".format(mode=mode))
-
-    # Spacing kwarg checks
-    if spacing is None:
-        spacing = np.ones(3)
-    elif len(spacing) == labels.ndim:
-        if len(spacing) == 2:
-            # Need a dummy spacing for singleton 3rd dim
-            spacing = np.r_[spacing, 1.]
-        spacing = np.asarray(spacing)
-    else:
-        raise ValueError('Input argument `spacing` incorrect, should be an '
-                         'iterable with one number per spatial dimension.')
-
-    # This algorithm expects 4-D arrays of floats, where the first three
-    # dimensions are spatial and the final denotes channels. 2-D images have
-    # a singleton placeholder dimension added for the third spatial dimension,
-    # and single channel images likewise have a singleton added for channels.
-    # The following block ensures valid input and coerces it to the correct
-    # form.
+    mode = _check_mode(mode)
     multichannel = channel_axis is not None
-    if not multichannel:
-        if data.ndim not in (2, 3):
-            raise ValueError('For non-multichannel input, data must be of '
-                             'dimension 2 or 3.')
-        if data.shape != labels.shape:
-            raise ValueError('Incompatible data and labels shapes.')
-        data = np.atleast_3d(img_as_float(data))[..., np.newaxis]
-    else:
-        if data.ndim not in (3, 4):
-            raise ValueError('For multichannel input, data must have 3 or 4 '
-                             'dimensions.')
-        if data.shape[:-1] != labels.shape:
-            raise ValueError('Incompatible data and labels shapes.')
-        data = img_as_float(data)
-        if data.ndim == 3:  # 2D multispectral, needs singleton in 3rd axis
-            data = data[:, :, np.newaxis, :]
+    data, shape = _prepare_data(data, multichannel, dtype)
+    if mode == 'bf':
+        # single precision is not accurate enough for the direct solver
+        data = data.astype(np.float64, copy=False)
+    if shape != labels.shape:
+        raise ValueError('Incompatible data and labels shapes.')
+    spacing = _check_spacing(spacing, labels.ndim)
 
     labels_shape = labels.shape
     labels_dtype = labels.dtype
@@ -479,12 +683,7 @@ def random_walker(data, labels, beta=130, mode='cg_j', tol=1.e-3, copy=True,
     if isolated_values is None:
         # No non isolated zero valued areas in labels were
         # found. Returning provided labels.
-        if return_full_prob:
-            # Return the concatenation of the masks of each unique label
-            return np.concatenate([np.atleast_3d(labels == lab)
-                                   for lab in np.unique(labels) if lab > 0],
-                                  axis=-1)
-        return labels
+        return _trivial_output(labels, return_full_prob)
 
     # Build the linear system (lap_sparse, B)
     lap_sparse, B = _build_linear_system(data, spacing, labels, nlabels, mask,
@@ -495,27 +694,281 @@ def random_walker(data, labels, beta=130, mode='cg_j', tol=1.e-3, copy=True,
     # first at pixel j by anisotropic diffusion.
     X = _solve_linear_system(lap_sparse, B, tol, mode)
 
-    if X.min() < -prob_tol or X.max() > 1 + prob_tol:
-        warn('The probability range is outside [0, 1] given the tolerance '
-             '`prob_tol`. Consider decreasing `beta` and/or decreasing '
-             '`tol`.')
+    return _format_output(X, labels, labels_shape, labels_dtype, nlabels,
+                          inds_isolated_seeds, isolated_values, prob_tol,
+                          return_full_prob)
 
-    # Build the output according to return_full_prob value
-    # Put back labels of isolated seeds
-    labels[inds_isolated_seeds] = isolated_values
-    labels = labels.reshape(labels_shape)
 
-    mask = labels == 0
-    mask[inds_isolated_seeds] = False
+def _dirichlet_matrix(lap_sparse, unlabeled):
+    """Laplacian with identity rows and columns for the fixed pixels.
 
-    if return_full_prob:
-        out = np.zeros((nlabels,) + labels_shape)
-        for lab, (label_prob, prob) in enumerate(zip(out, X), start=1):
-            label_prob[mask] = prob
-            label_prob[labels == lab] = 1
-    else:
-        X = np.argmax(X, axis=0) + 1
-        out = labels.astype(labels_dtype)
-        out[mask] = X
+    Returns ``D L D + I - D``, where ``D`` is the diagonal matrix of the
+    indicator of the `unlabeled` pixels.
+    """
+    u = unlabeled.astype(lap_sparse.dtype)
+    D = sparse.diags(u)
+    A = (D @ lap_sparse @ D + sparse.diags(1 - u)).tocsr()
+    A.eliminate_zeros()
+    return A
 
-    return out
+
+class RandomWalker:
+    """Random walker segmentation of an image, for successive markers.
+
+    The graph of the image is built once, and the state of the solver is
+    kept from a segmentation to the next, so that segmenting the image again
+    after adding or removing a few markers, as in interactive annotation,
+    is much cheaper than a new call to :func:`random_walker`:
+
+    - the probabilities of the previous segmentation are the initial guess
+      of the conjugate gradient;
+    - the LU factorization ('bf' mode) or the multigrid hierarchy ('cg_mg'
+      mode) of a previous segmentation preconditions the conjugate gradient,
+      and is only computed again if the conjugate gradient does not
+      converge in a few iterations.
+
+    Parameters
+    ----------
+    data : array_like
+        Image to be segmented in phases, see :func:`random_walker`.
+    beta : float, optional
+        Penalization coefficient for the random walker motion
+        (the greater `beta`, the more difficult the diffusion).
+    mode : {'cg', 'cg_j', 'cg_mg', 'bf'}, optional
+        Mode for solving the linear system, see :func:`random_walker`.
+    tol : float, optional
+        Tolerance to achieve when solving the linear system using
+        the conjugate gradient based modes ('cg', 'cg_j' and 'cg_mg').
+    spacing : iterable of floats, optional
+        Spacing between voxels in each spatial dimension. If `None`, then
+        the spacing between pixels/voxels in each dimension is assumed 1.
+    prob_tol : float, optional
+        Tolerance on the resulting probability to be in the interval [0, 1].
+        If the tolerance is not satisfied, a warning is displayed.
+    channel_axis : int or None, optional
+        If None, the image is assumed to be a grayscale (single channel) image.
+        Otherwise, this parameter indicates which axis of the array corresponds
+        to channels.
+    dtype : {np.float32, np.float64}, optional
+        Floating point type of the Laplacian and of the solution of the
+        conjugate gradient modes. By default, that of `data` once converted
+        to floats. Mode 'bf' always works in double precision, see
+        :func:`random_walker`.
+
+    See Also
+    --------
+    random_walker
+
+    Notes
+    -----
+    :func:`random_walker` solves a linear system restricted to the unlabeled
+    pixels, whose size changes with the markers. To keep the solver state,
+    the system is here of the size of the image: the rows and columns of
+    the Laplacian ``L`` of the labeled (and inactive) pixels are replaced by
+    those of the identity, and their values moved to the right-hand side::
+
+        A = D L D + I - D
+
+    where ``D`` is the diagonal matrix of the indicator of the unlabeled
+    pixels. Changing the label of m pixels changes ``A`` by a matrix of rank
+    at most 2 m, so that the conjugate gradient preconditioned by the
+    previous LU factorization converges in at most 2 m + 1 iterations (in
+    exact arithmetic).
+
+    Examples
+    --------
+    >>> np.random.seed(0)
+    >>> a = np.zeros((10, 10)) + 0.2 * np.random.rand(10, 10)
+    >>> a[5:8, 5:8] += 1
+    >>> walker = RandomWalker(a)
+    >>> b = np.zeros_like(a, dtype=np.int32)
+    >>> b[3, 3] = 1  # Marker for first phase
+    >>> b[6, 6] = 2  # Marker for second phase
+    >>> np.array_equal(walker(b), random_walker(a, b))
+    True
+    >>> b[1, 8] = 3  # Marker for a third phase
+    >>> walker(b)[:3]
+    array([[1, 1, 1, 1, 1, 1, 3, 3, 3, 3],
+           [1, 1, 1, 1, 1, 1, 3, 3, 3, 3],
+           [1, 1, 1, 1, 1, 1, 3, 3, 3, 3]], dtype=int32)
+    """
+
+    # maximum number of conjugate gradient iterations preconditioned by the
+    # factorization of a previous system
+    _max_reuse_iter = 100
+
+    def __init__(self, data, beta=130, mode='cg_j', tol=1.e-3, spacing=None,
+                 *, prob_tol=1e-3, channel_axis=None, dtype=None):
+        self.mode = _check_mode(mode)
+        self.tol = tol
+        self.prob_tol = prob_tol
+
+        data = np.asarray(data)
+        multichannel = channel_axis is not None
+        if multichannel:
+            data = np.moveaxis(data, channel_axis, -1)
+        data, self.shape = _prepare_data(data, multichannel, dtype)
+        if self.mode == 'bf':
+            # single precision is not accurate enough for the direct solver
+            data = data.astype(np.float64, copy=False)
+        spacing = _check_spacing(spacing, len(self.shape))
+        self._laplacian = _build_laplacian(data, spacing, mask=None,
+                                           beta=beta,
+                                           multichannel=multichannel)
+        self.dtype = self._laplacian.dtype
+
+        # Laplacian of the last subgraph of active pixels
+        self._masked_laplacian = None
+        # probabilities of the last segmentation, for each label value
+        self._probabilities = {}
+        # factorization or multigrid preconditioner, with the active and
+        # unlabeled pixels of the system it was computed for
+        self._preconditioner = None
+        self._preconditioner_mask = None
+        self._preconditioner_unlabeled = None
+
+    def _subgraph_laplacian(self, mask):
+        """Laplacian of the graph restricted to the `mask` pixels."""
+        if mask is None:
+            return self._laplacian
+        if (self._masked_laplacian is None
+                or not np.array_equal(self._masked_laplacian[0], mask)):
+            lap = self._laplacian
+            weights = lap - sparse.diags(lap.diagonal())
+            D = sparse.diags(mask.astype(self.dtype))
+            weights = D @ weights @ D
+            lap = weights - sparse.diags(np.ravel(weights.sum(axis=1)))
+            self._masked_laplacian = mask, lap.tocsr()
+        return self._masked_laplacian[1]
+
+    def _changed_pixels(self, mask, unlabeled):
+        """Number of pixels of the system changed since the preconditioner.
+
+        None if the preconditioner cannot be reused.
+        """
+        if self._preconditioner is None:
+            return None
+        old_mask = self._preconditioner_mask
+        if old_mask is None or mask is None:
+            if old_mask is not mask:
+                return None
+        elif not np.array_equal(old_mask, mask):
+            return None
+        return np.count_nonzero(self._preconditioner_unlabeled != unlabeled)
+
+    def _set_preconditioner(self, A, mask, unlabeled):
+        if self.mode == 'bf':
+            self._preconditioner = splu(A.tocsc()).solve
+        else:
+            self._preconditioner = _amg(A)
+        self._preconditioner_mask = mask
+        self._preconditioner_unlabeled = unlabeled
+
+    def _lu_rows(self, r):
+        """LU preconditioner, applied to the rows of `r`."""
+        return np.ascontiguousarray(self._preconditioner(r.T).T)
+
+    def _solve_bf(self, A, B, x0, b_norm, mask, unlabeled):
+        changed = self._changed_pixels(mask, unlabeled)
+        if changed is not None:
+            if changed == 0:
+                return self._preconditioner(B.T).T
+            maxiter = 2 * changed + 10
+            if maxiter <= self._max_reuse_iter:
+                tol = np.sqrt(np.finfo(self.dtype).eps)
+                X, info = _cg(A, B, tol, M=self._lu_rows, maxiter=maxiter,
+                              x0=x0, b_norm=b_norm)
+                if not np.any(info):
+                    return X
+        self._set_preconditioner(A, mask, unlabeled)
+        return self._preconditioner(B.T).T
+
+    def _solve_cg_mg(self, A, B, x0, b_norm, mask, unlabeled):
+        fresh = self._changed_pixels(mask, unlabeled) is None
+        if fresh:
+            self._set_preconditioner(A, mask, unlabeled)
+        X, info = _cg(A, B, self.tol, M=self._preconditioner, maxiter=30,
+                      x0=x0, b_norm=b_norm)
+        if np.any(info) and not fresh:
+            self._set_preconditioner(A, mask, unlabeled)
+            X, info = _cg(A, B, self.tol, M=self._preconditioner,
+                          maxiter=30, x0=X, b_norm=b_norm)
+        return X, info
+
+    def _solve(self, labels, mask, label_values):
+        """Probabilities of all the pixels, as a (nlabels, N) array."""
+        lap = self._subgraph_laplacian(mask)
+        unlabeled = labels == 0
+        if mask is not None:
+            unlabeled &= mask
+        seeds = np.flatnonzero(labels > 0)
+
+        # fixed values of the labeled and inactive pixels
+        Xs = np.zeros((label_values.size, labels.size), dtype=self.dtype)
+        Xs[labels[seeds] - 1, seeds] = 1
+        A = _dirichlet_matrix(lap, unlabeled)
+        B = -_matmat(lap, Xs)
+        B[:, ~unlabeled] = Xs[:, ~unlabeled]
+        B_unlabeled = B[:, unlabeled]
+        b_norm = np.sqrt(_row_dots(B_unlabeled, B_unlabeled))
+
+        # initial guess: the previous probabilities, for the same labels
+        x0 = np.zeros_like(Xs)
+        for x, value in zip(x0, label_values):
+            if value in self._probabilities:
+                x[:] = self._probabilities[value]
+        x0[:, ~unlabeled] = Xs[:, ~unlabeled]
+
+        if self.mode == 'bf':
+            X = self._solve_bf(A, B, x0, b_norm, mask, unlabeled)
+        else:
+            if self.mode == 'cg_mg':
+                X, info = self._solve_cg_mg(A, B, x0, b_norm, mask,
+                                            unlabeled)
+            else:
+                M = _jacobi(A) if self.mode == 'cg_j' else None
+                X, info = _cg(A, B, self.tol, M=M, x0=x0, b_norm=b_norm)
+            if np.any(info > 0):
+                _warn_convergence()
+
+        self._probabilities = dict(zip(label_values, X))
+        return X[:, unlabeled]
+
+    def __call__(self, labels, return_full_prob=False):
+        """Segment the image from the markers `labels`.
+
+        Parameters
+        ----------
+        labels : array of ints
+            Array of seed markers, of the spatial shape of the image, see
+            :func:`random_walker`. Labels keep their meaning from a call to
+            the next: the probabilities computed for a label value are the
+            initial guess for the same value at the next call.
+        return_full_prob : bool, optional
+            If True, the probability that a pixel belongs to each of the
+            labels will be returned, instead of only the most likely
+            label.
+
+        Returns
+        -------
+        output : ndarray
+            The segmentation, as returned by :func:`random_walker`.
+        """
+        labels = np.array(labels)
+        if labels.shape != self.shape:
+            raise ValueError('Incompatible data and labels shapes.')
+        labels_shape = labels.shape
+        labels_dtype = labels.dtype
+        label_values = np.unique(labels[labels > 0])
+
+        (labels, nlabels, mask,
+         inds_isolated_seeds, isolated_values) = _preprocess(labels)
+
+        if isolated_values is None:
+            return _trivial_output(labels, return_full_prob)
+
+        X = self._solve(labels.ravel(),
+                        None if mask is None else mask.ravel(), label_values)
+        return _format_output(X, labels, labels_shape, labels_dtype, nlabels,
+                              inds_isolated_seeds, isolated_values,
+                              self.prob_tol, return_full_prob)
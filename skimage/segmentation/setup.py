@@ -15,6 +15,7 @@ def configuration(parent_package='', top_path=None):
             '_felzenszwalb_cy.pyx',
             '_quickshift_cy.pyx',
             '_slic.pyx',
+            '_random_walker_cy.pyx',
             ], working_path=base_path)
     config.add_extension('_watershed_cy', sources=['_watershed_cy.c'],
                          include_dirs=[get_numpy_include_dirs()])
@@ -24,6 +25,9 @@ def configuration(parent_package='', top_path=None):
                          include_dirs=[get_numpy_include_dirs()])
     config.add_extension('_slic', sources=['_slic.c'],
                          include_dirs=[get_numpy_include_dirs()])
+    config.add_extension('_random_walker_cy',
+                         sources=['_random_walker_cy.c'],
+                         include_dirs=[get_numpy_include_dirs()])
 
     return config
 
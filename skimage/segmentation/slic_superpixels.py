@@ -112,7 +112,7 @@ def slic(image, n_segments=100, compactness=10., max_iter=10, sigma=0,
          spacing=None, multichannel=True, convert2lab=None,
          enforce_connectivity=True, min_size_factor=0.5, max_size_factor=3,
          slic_zero=False, start_label=None, mask=None, *,
-         channel_axis=-1):
+         channel_axis=-1, num_threads=1, dtype=None):
     """Segments image using k-means clustering in Color-(x,y,z) space.
 
     Parameters
@@ -152,7 +152,9 @@ def slic(image, n_segments=100, compactness=10., max_iter=10, sigma=0,
         Whether the input should be converted to Lab colorspace prior to
         segmentation. The input image *must* be RGB. Highly recommended.
         This option defaults to ``True`` when ``channel_axis` is not None *and*
-        ``image.shape[-1] == 3``.
+        ``image.shape[-1] == 3``. Set it to ``False`` to segment an image
+        already in the Lab colorspace, e.g. converted with
+        :func:`skimage.color.rgb2lab`, without converting it again.
     enforce_connectivity : bool, optional
         Whether the generated segments are connected or not
     min_size_factor : float, optional
@@ -182,6 +184,17 @@ def slic(image, n_segments=100, compactness=10., max_iter=10, sigma=0,
 
         .. versionadded:: 0.19
            ``channel_axis`` was added in 0.19.
+    num_threads : int or None, optional
+        Number of OpenMP threads over which the assignment of the pixels to
+        the segments, done cell by cell of the initial grid of segments, and
+        the update of the segment centers are distributed. If None, the
+        OpenMP default, usually the number of cores, is used. The result
+        does not depend on the number of threads.
+    dtype : {np.float32, np.float64}, optional
+        Floating point type of the computation, including the Lab
+        conversion. By default, that of the image once converted to floats,
+        i.e. ``float64`` for integer images. ``float32`` halves the memory
+        traffic of the distance and feature buffers.
 
     Returns
     -------
@@ -195,6 +208,8 @@ def slic(image, n_segments=100, compactness=10., max_iter=10, sigma=0,
         dimension is not of length 3.
     ValueError
         If ``start_label`` is not 0 or 1.
+    ValueError
+        If ``dtype`` is not float32 or float64.
 
     Notes
     -----
@@ -243,7 +258,12 @@ def slic(image, n_segments=100, compactness=10., max_iter=10, sigma=0,
     """
 
     image = img_as_float(image)
-    float_dtype = utils._supported_float_type(image.dtype)
+    if dtype is None:
+        float_dtype = utils._supported_float_type(image.dtype)
+    else:
+        float_dtype = np.dtype(dtype)
+        if float_dtype not in (np.float32, np.float64):
+            raise ValueError("dtype must be float32 or float64.")
     image = image.astype(float_dtype, copy=False)
 
     use_mask = mask is not None
@@ -324,15 +344,19 @@ def slic(image, n_segments=100, compactness=10., max_iter=10, sigma=0,
 
     image = np.ascontiguousarray(image * ratio, dtype=dtype)
 
+    if num_threads is None:
+        # OpenMP default
+        num_threads = 0
+
     if update_centroids:
         # Step 2 of the algorithm [3]_
         _slic_cython(image, mask, segments, step, max_iter, spacing,
                      slic_zero, ignore_color=True,
-                     start_label=start_label)
+                     start_label=start_label, num_threads=num_threads)
 
     labels = _slic_cython(image, mask, segments, step, max_iter,
                           spacing, slic_zero, ignore_color=False,
-                          start_label=start_label)
+                          start_label=start_label, num_threads=num_threads)
 
     if enforce_connectivity:
         if use_mask:
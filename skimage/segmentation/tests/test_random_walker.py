@@ -1,5 +1,5 @@
 import numpy as np
-from skimage.segmentation import random_walker
+from skimage.segmentation import random_walker, RandomWalker
 from skimage.transform import resize
 from skimage._shared._warnings import expected_warnings
 from skimage._shared import testing
@@ -582,3 +582,109 @@ def test_umfpack_import():
     except ImportError:
         assert UmfpackContext is None
     return
+
+
+def test_dtype_float32():
+    data, labels = make_2d_syntheticdata(70, 100)
+    labels_64 = random_walker(data, labels, beta=90)
+    labels_32 = random_walker(data, labels, beta=90, dtype=np.float32)
+    np.testing.assert_array_equal(labels_32, labels_64)
+    with testing.raises(ValueError):
+        random_walker(data, labels, dtype=np.int32)
+
+
+def test_dtype_float32_bf():
+    # an ill-conditioned system, which a single precision factorization
+    # solves inaccurately
+    rng = np.random.default_rng(0)
+    data = np.zeros((60, 70, 3))
+    data[:, 35:] = 1
+    data += 0.3 * rng.standard_normal(data.shape)
+    labels = np.zeros(data.shape[:2], dtype=int)
+    labels[:, :3] = 1
+    labels[:, -3:] = 2
+    expected = random_walker(data, labels, beta=1000, mode='bf',
+                             channel_axis=-1, return_full_prob=True)
+    prob = random_walker(data, labels, beta=1000, mode='bf',
+                         channel_axis=-1, return_full_prob=True,
+                         dtype=np.float32)
+    np.testing.assert_allclose(prob, expected, atol=1e-5)
+    walker = RandomWalker(data, beta=1000, mode='bf', channel_axis=-1,
+                          dtype=np.float32)
+    np.testing.assert_allclose(walker(labels, return_full_prob=True),
+                               expected, atol=1e-5)
+
+
+@testing.parametrize('mode', ['cg_j', 'bf'])
+def test_many_labels(mode):
+    # the conjugate gradient iterates on blocks of up to 4 labels
+    data, _ = make_2d_syntheticdata(70, 100)
+    labels = np.zeros(data.shape, dtype=int)
+    for lab, (x, y) in enumerate([(5, 5), (5, 95), (65, 5), (65, 95),
+                                  (35, 50)], start=1):
+        labels[x, y] = lab
+    prob = random_walker(data, labels, beta=10, mode=mode, tol=1e-9,
+                         return_full_prob=True)
+    expected = random_walker(data, labels, beta=10, mode='bf',
+                             return_full_prob=True)
+    np.testing.assert_allclose(prob, expected, atol=1e-6)
+    np.testing.assert_allclose(prob.sum(axis=0), 1, atol=1e-6)
+
+
+@testing.parametrize('mode', ['cg', 'cg_j', 'cg_mg', 'bf'])
+def test_random_walker_class(mode):
+    data, labels = make_2d_syntheticdata(70, 100)
+    labels = labels.astype(int)
+    with expected_warnings(['"cg" mode|' + PYAMG_MISSING_WARNING]):
+        walker = RandomWalker(data, beta=10, mode=mode, tol=1e-9)
+
+    # successive markers, as in interactive annotation
+    markers = [labels.copy()]
+    labels[10:20, 10:20] = -1
+    markers.append(labels.copy())
+    labels[60, 90] = 3
+    labels[46:50, 33:38] = -2
+    markers.append(labels.copy())
+    labels[60, 90] = 0
+    labels[5, 5] = 3
+    markers.append(labels.copy())
+    labels[labels < 0] = 0
+    markers.append(labels.copy())
+
+    for labels in markers:
+        expected = random_walker(data, labels, beta=10, mode='bf',
+                                 return_full_prob=True)
+        prob = walker(labels, return_full_prob=True)
+        np.testing.assert_allclose(prob, expected, atol=1e-6)
+        np.testing.assert_array_equal(
+            walker(labels), random_walker(data, labels, beta=10, mode='bf'))
+
+
+def test_random_walker_class_3d_multichannel():
+    data, labels = make_3d_syntheticdata(20)
+    data = np.stack([data, 2 * data], axis=0)
+    walker = RandomWalker(data, beta=10, mode='bf', channel_axis=0,
+                          dtype=np.float32)
+    for seed in [(2, 2, 2), (17, 17, 2)]:
+        labels[seed] = 1
+        expected = random_walker(data, labels, beta=10, mode='bf',
+                                 channel_axis=0, return_full_prob=True)
+        np.testing.assert_allclose(walker(labels, return_full_prob=True),
+                                   expected, atol=1e-3)
+
+
+def test_random_walker_class_trivial_and_bad_inputs():
+    np.random.seed(0)
+    img = np.random.random((10, 10))
+    walker = RandomWalker(img)
+    labels = np.ones((10, 10))
+    with expected_warnings(["Returning provided labels"]):
+        pass_through = walker(labels)
+    np.testing.assert_array_equal(pass_through, labels)
+
+    with testing.raises(ValueError):
+        walker(np.zeros((10, 11)))
+    with testing.raises(ValueError):
+        RandomWalker(img, mode='bad')
+    with testing.raises(ValueError):
+        RandomWalker(img, spacing=(1,))
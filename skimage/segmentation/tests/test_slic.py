@@ -500,3 +500,53 @@ def test_dtype_support(dtype):
 
     # Simply run the function to assert that it runs without error
     slic(img, start_label=1)
+
+
+@pytest.mark.parametrize('slic_zero', [False, True])
+@pytest.mark.parametrize('use_mask', [False, True])
+def test_num_threads(slic_zero, use_mask):
+    rnd = np.random.RandomState(0)
+    img = rnd.rand(64, 80, 3)
+    msk = None
+    if use_mask:
+        msk = np.zeros(img.shape[:2], dtype=bool)
+        msk[5:-5, 10:-10] = True
+    ref = slic(img, n_segments=30, slic_zero=slic_zero, mask=msk,
+               start_label=1)
+    for num_threads in [None, 2, 3]:
+        seg = slic(img, n_segments=30, slic_zero=slic_zero, mask=msk,
+                   start_label=1, num_threads=num_threads)
+        assert_equal(seg, ref)
+
+
+def test_dtype_float32():
+    rnd = np.random.RandomState(0)
+    img = np.zeros((20, 21, 3))
+    img[:10, :10, 0] = 1
+    img[10:, :10, 1] = 1
+    img[10:, 10:, 2] = 1
+    img += 0.01 * rnd.normal(size=img.shape)
+    np.clip(img, 0, 1, out=img)
+    seg = slic(img, n_segments=4, sigma=0, enforce_connectivity=False,
+               start_label=0, dtype=np.float32)
+    assert_equal(len(np.unique(seg)), 4)
+    assert_equal(seg[:10, :10], 0)
+    assert_equal(seg[10:, :10], 2)
+    assert_equal(seg[:10, 10:], 1)
+    assert_equal(seg[10:, 10:], 3)
+
+
+def test_invalid_dtype():
+    img = np.random.rand(10, 10, 3)
+    with testing.raises(ValueError):
+        slic(img, dtype=np.int32)
+
+
+def test_convert2lab_false_on_lab():
+    from skimage.color import rgb2lab
+    rnd = np.random.RandomState(0)
+    img = rnd.rand(32, 40, 3)
+    ref = slic(img, n_segments=20, start_label=1)
+    seg = slic(rgb2lab(img), n_segments=20, start_label=1,
+               convert2lab=False)
+    assert_equal(seg, ref)
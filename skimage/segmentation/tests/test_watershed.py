@@ -537,5 +537,51 @@ def test_connectivity():
         assert np.sum(labels_c2 == lab) == area
 
 
+@pytest.mark.parametrize("num_workers", [2, 3, 5])
+@pytest.mark.parametrize("kwargs", [{}, {'connectivity': 2},
+                                    {'watershed_line': True},
+                                    {'compactness': 1e-3}])
+def test_watershed_num_workers(num_workers, kwargs):
+    # without ties between flood levels, the tiled flood matches the serial
+    # one exactly
+    rng = np.random.default_rng(0)
+    image = ndi.gaussian_filter(rng.random((400, 150)), 3)
+    mask = ndi.gaussian_filter(rng.random(image.shape), 8) > 0.49
+    for markers in (None, 60):
+        for m in (None, mask):
+            expected = watershed(image, markers, mask=m, **kwargs)
+            result = watershed(image, markers, mask=m,
+                               num_workers=num_workers, **kwargs)
+            np.testing.assert_array_equal(result, expected)
+
+
+def test_watershed_num_workers_3d():
+    rng = np.random.default_rng(1)
+    image = ndi.gaussian_filter(rng.random((200, 40, 40)), 3)
+    np.testing.assert_array_equal(watershed(image, 40, num_workers=3),
+                                  watershed(image, 40))
+
+
+def test_watershed_num_workers_plateaus():
+    # with ties, the result may differ from the serial one, but it is still
+    # deterministic and labels every pixel of the mask
+    image = np.round(ndi.gaussian_filter(
+        np.random.default_rng(2).random((300, 120)), 2) * 40)
+    mask = image > image.min()
+    expected = watershed(image, 30, mask=mask)
+    result = watershed(image, 30, mask=mask, num_workers=4)
+    np.testing.assert_array_equal(result,
+                                  watershed(image, 30, mask=mask,
+                                            num_workers=4))
+    np.testing.assert_array_equal(result > 0, mask)
+    np.testing.assert_array_equal(np.unique(result), np.unique(expected))
+    assert np.mean(result == expected) > 0.9
+
+    # too few rows per tile: serial algorithm
+    small = image[:100]
+    np.testing.assert_array_equal(watershed(small, 10, num_workers=4),
+                                  watershed(small, 10))
+
+
 if __name__ == "__main__":
     np.testing.run_module_suite()
@@ -1,20 +1,30 @@
-from .hough_transform import (hough_line, hough_line_peaks,
-                              probabilistic_hough_line, hough_circle,
-                              hough_circle_peaks, hough_ellipse)
-from .radon_transform import (radon, iradon, iradon_sart,
-                              order_angles_golden_ratio)
-from .finite_radon_transform import frt2, ifrt2
-from .integral import integral_image, integrate
-from ._geometric import (estimate_transform,
-                         matrix_transform, EuclideanTransform,
-                         SimilarityTransform, AffineTransform,
-                         ProjectiveTransform, FundamentalMatrixTransform,
-                         EssentialMatrixTransform, PolynomialTransform,
-                         PiecewiseAffineTransform)
-from ._warps import (swirl, resize, rotate, rescale,
-                     downscale_local_mean, warp, warp_coords, warp_polar)
-from .pyramids import (pyramid_reduce, pyramid_expand,
-                       pyramid_gaussian, pyramid_laplacian)
+from .._shared import lazy
+
+__getattr__, __dir__ = lazy.attach(
+    __name__,
+    submodules={'hough_transform', 'radon_transform', 'finite_radon_transform',
+                'integral', 'pyramids'},
+    submod_attrs={
+        'hough_transform': ['hough_line', 'hough_line_peaks',
+                            'probabilistic_hough_line', 'hough_circle',
+                            'hough_circle_peaks', 'hough_ellipse'],
+        'radon_transform': ['radon', 'iradon', 'iradon_sart',
+                            'order_angles_golden_ratio'],
+        'finite_radon_transform': ['frt2', 'ifrt2'],
+        'integral': ['integral_image', 'integrate'],
+        '_geometric': ['estimate_transform', 'matrix_transform',
+                       'EuclideanTransform', 'SimilarityTransform',
+                       'AffineTransform', 'ProjectiveTransform',
+                       'FundamentalMatrixTransform',
+                       'EssentialMatrixTransform', 'PolynomialTransform',
+                       'PiecewiseAffineTransform'],
+        '_warps': ['swirl', 'resize', 'rotate', 'rescale',
+                   'downscale_local_mean', 'warp', 'warp_coords',
+                   'warp_polar', 'WarpPlan'],
+        'pyramids': ['pyramid_reduce', 'pyramid_expand', 'pyramid_gaussian',
+                     'pyramid_laplacian', 'pyramid_gaussian_tiled'],
+    }
+)
 
 
 __all__ = ['hough_circle',
@@ -34,6 +44,7 @@ __all__ = ['hough_circle',
            'warp',
            'warp_coords',
            'warp_polar',
+           'WarpPlan',
            'estimate_transform',
            'matrix_transform',
            'EuclideanTransform',
@@ -52,4 +63,5 @@ __all__ = ['hough_circle',
            'pyramid_reduce',
            'pyramid_expand',
            'pyramid_gaussian',
-           'pyramid_laplacian']
+           'pyramid_laplacian',
+           'pyramid_gaussian_tiled']
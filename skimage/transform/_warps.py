@@ -2,6 +2,7 @@ import numpy as np
 from numpy.lib import NumpyVersion
 import scipy
 from scipy import ndimage as ndi
+from scipy import sparse
 
 from ._geometric import (SimilarityTransform, AffineTransform,
                          ProjectiveTransform)
@@ -19,9 +20,162 @@ HOMOGRAPHY_TRANSFORMS = (
     ProjectiveTransform
 )
 
+_BIQUADRATIC_WARNING = (
+    "Bi-quadratic interpolation behavior has changed due "
+    "to a bug in the implementation of scikit-image. "
+    "The new version now serves as a wrapper "
+    "around SciPy's interpolation functions, which itself "
+    "is not verified to be a correct implementation. Until "
+    "skimage's implementation is fixed, we recommend "
+    "to use bi-linear or bi-cubic interpolation instead.")
+
+
+def _extend_indices(indices, size, mode):
+    """Map sample indices outside ``[0, size)`` back into the image.
+
+    `mode` is one of the non-constant ndimage boundary modes.
+    """
+    if mode == 'nearest':
+        return np.clip(indices, 0, size - 1)
+    if mode in ('wrap', 'grid-wrap'):
+        return np.mod(indices, size)
+    if mode == 'reflect':
+        period = 2 * size
+        indices = np.mod(indices, period)
+        return np.where(indices >= size, period - 1 - indices, indices)
+    if mode == 'mirror':
+        if size == 1:
+            return np.zeros_like(indices)
+        period = 2 * size - 2
+        indices = np.mod(indices, period)
+        return np.where(indices >= size, period - indices, indices)
+    raise ValueError(f"Unsupported mode: {mode!r}")
+
+
+def _resize_weights(input_size, output_size, order, sigma, mode,
+                    truncate=4.0):
+    """Weights of a 1D resampling by interpolation of a smoothed signal.
+
+    Parameters
+    ----------
+    input_size, output_size : int
+        Number of samples along the axis before and after resampling.
+    order : {0, 1}
+        Nearest-neighbor or linear interpolation.
+    sigma : float
+        Standard deviation of the Gaussian anti-aliasing filter, in input
+        samples. No filtering is done if it is zero.
+    mode : str
+        Non-constant ndimage boundary mode.
+    truncate : float, optional
+        Truncate the Gaussian at this many standard deviations, as in
+        `scipy.ndimage.gaussian_filter`.
+
+    Returns
+    -------
+    weights : (output_size, input_size) sparse matrix
+        Weight of each input sample in each output sample. The product with
+        a signal is the same as ``ndi.gaussian_filter`` followed by
+        ``ndi.zoom(..., grid_mode=True)``, but it only touches the
+        ``2 * radius + 2`` input samples around each output sample.
+    """
+    coords = (input_size / output_size) * (np.arange(output_size) + 0.5) - 0.5
+    if order == 0:
+        samples = np.floor(coords + 0.5).astype(np.intp)[:, np.newaxis]
+        interpolation = np.ones(samples.shape)
+    else:
+        lower = np.floor(coords)
+        fraction = coords - lower
+        lower = lower.astype(np.intp)
+        samples = np.stack([lower, lower + 1], axis=1)
+        interpolation = np.stack([1 - fraction, fraction], axis=1)
+    samples = _extend_indices(samples, input_size, mode)
+
+    if sigma > 1e-15:
+        # same kernel as ndi.gaussian_filter, centered on each interpolation
+        # sample: the taps of each output sample are computed directly, as a
+        # (input_size, input_size) smoothing matrix would be much larger
+        # than the result when the image is reduced a lot
+        radius = int(truncate * sigma + 0.5)
+        offsets = np.arange(-radius, radius + 1)
+        kernel = np.exp(-0.5 / sigma ** 2 * offsets ** 2)
+        kernel /= kernel.sum()
+        samples = _extend_indices(samples[..., np.newaxis] + offsets,
+                                  input_size, mode)
+        interpolation = interpolation[..., np.newaxis] * kernel
+    # taps falling on the same input sample are summed
+    rows = np.repeat(np.arange(output_size), samples[0].size)
+    return sparse.csr_matrix(
+        (interpolation.ravel(), (rows, samples.ravel())),
+        shape=(output_size, input_size)
+    )
+
+
+def _resize_polyphase(image, output_shape, order, mode, sigma):
+    """Resize a float image with one sparse 1D resampling per axis.
+
+    Parameters
+    ----------
+    image : ndarray of float32 or float64
+        Input image, also giving the precision of the computation.
+    output_shape : tuple of int
+        Shape of the output, with as many dimensions as `image`.
+    order : {0, 1}
+        Nearest-neighbor or linear interpolation.
+    mode : str
+        Non-constant ndimage boundary mode.
+    sigma : array of float
+        Standard deviation of the anti-aliasing filter along each axis.
+
+    Returns
+    -------
+    resized : ndarray
+        Resized image, of the same dtype as `image`.
+    """
+    # shrink the data as early as possible: axes reduced the most go first
+    axes = sorted(range(image.ndim),
+                  key=lambda ax: output_shape[ax] / image.shape[ax])
+    for axis in axes:
+        input_size = image.shape[axis]
+        output_size = int(round(output_shape[axis]))
+        if input_size == output_size and sigma[axis] <= 1e-15:
+            continue
+        weights = _resize_weights(input_size, output_size, order,
+                                  sigma[axis], mode)
+        image = _apply_weights(image, weights.astype(image.dtype), axis)
+    return np.ascontiguousarray(image)
+
+
+def _apply_weights(image, weights, axis):
+    """Multiply an image by a (M, N) weight matrix along an axis of size N.
+    """
+    moved = np.moveaxis(image, axis, 0)
+    out = weights @ moved.reshape(moved.shape[0], -1)
+    return np.moveaxis(out.reshape((weights.shape[0],) + moved.shape[1:]),
+                       0, axis)
+
+
+def _resize_output(image, dtype, scale):
+    """Cast a resized image to the `dtype` requested from `resize`.
+
+    With ``dtype=np.uint8``, values are multiplied by 255 if `scale` is set,
+    then rounded and clipped to [0, 255].
+    """
+    if dtype is None:
+        return image
+    if dtype == np.uint8:
+        image = image.astype(np.float32 if image.dtype.kind != 'f'
+                             else image.dtype)
+        if scale:
+            image *= 255
+        np.rint(image, out=image)
+        np.clip(image, 0, 255, out=image)
+    return image.astype(dtype, copy=False)
+
 
 def resize(image, output_shape, order=None, mode='reflect', cval=0, clip=True,
-           preserve_range=False, anti_aliasing=None, anti_aliasing_sigma=None):
+           preserve_range=False, anti_aliasing=None, anti_aliasing_sigma=None,
+           *, dtype=None):
     """Resize image to match a certain size.
 
     Performs interpolation to up-size or down-size N-dimensional images. Note
@@ -74,6 +228,13 @@ def resize(image, output_shape, order=None, mode='reflect', cval=0, clip=True,
         By default, this value is chosen as (s - 1) / 2 where s is the
         down-scaling factor, where s > 1. For the up-size case, s < 1, no
         anti-aliasing is performed prior to rescaling.
+    dtype : {None, np.float32, np.float64, np.uint8}, optional
+        Data type of the output. By default, it is a floating point type
+        chosen as in `img_as_float` (with ``order=0``, the type of the input
+        is kept). With ``np.uint8``, the output is scaled to [0, 255] unless
+        `preserve_range` is set, then rounded and clipped to that range. The
+        ``np.float32`` and ``np.uint8`` outputs are computed in single
+        precision.
 
     Notes
     -----
@@ -83,6 +244,11 @@ def resize(image, output_shape, order=None, mode='reflect', cval=0, clip=True,
     symmetric, the result would be [0, 1, 2, 2, 1, 0, 0], while for reflect it
     would be [0, 1, 2, 1, 0, 1, 2].
 
+    With linear interpolation (and nearest-neighbor interpolation of floating
+    point images) and a mode other than 'constant', the anti-aliasing filter
+    and the interpolation are combined into precomputed 1D weights, applied
+    in a single pass per axis at the output sampling positions only.
+
     Examples
     --------
     >>> from skimage import data
@@ -116,11 +282,18 @@ def resize(image, output_shape, order=None, mode='reflect', cval=0, clip=True,
              "from version 0.19 a ValueError will be raised instead of this "
              "warning.", FutureWarning, stacklevel=2)
 
+    if dtype is not None:
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64, np.uint8):
+            raise ValueError(f"Unsupported output dtype: {dtype}; expected "
+                             f"float32, float64 or uint8.")
+
     factors = (np.asarray(input_shape, dtype=float) /
                np.asarray(output_shape, dtype=float))
 
     # Translate modes used by np.pad to those used by scipy.ndimage
     ndi_mode = _to_ndimage_mode(mode)
+    sigma = np.zeros(len(factors))
     if anti_aliasing:
         if anti_aliasing_sigma is None:
             anti_aliasing_sigma = np.maximum(0, (factors - 1) / 2)
@@ -133,6 +306,29 @@ def resize(image, output_shape, order=None, mode='reflect', cval=0, clip=True,
             elif np.any((anti_aliasing_sigma > 0) & (factors <= 1)):
                 warn("Anti-aliasing standard deviation greater than zero but "
                      "not down-sampling along all axes")
+        sigma = anti_aliasing_sigma
+
+    if (mode != 'constant' and image.dtype != bool
+            and (order in (None, 1)
+                 or (order == 0 and image.dtype.kind == 'f'))):
+        scale = not preserve_range
+        if dtype == np.uint8 and image.dtype == np.uint8:
+            # resample the uint8 values directly
+            image = image.astype(np.float32)
+            scale = False
+        else:
+            image = convert_to_float(image, preserve_range)
+            if dtype is not None:
+                image = image.astype(
+                    np.float64 if dtype == np.float64 else np.float32,
+                    copy=False
+                )
+        order = 1 if order is None else order
+        out = _resize_polyphase(image, output_shape, order, ndi_mode, sigma)
+        _clip_warp_output(image, out, order, mode, cval, clip)
+        return _resize_output(out, dtype, scale)
+
+    if anti_aliasing:
         image = ndi.gaussian_filter(image, anti_aliasing_sigma,
                                     cval=cval, mode=ndi_mode)
 
@@ -195,7 +391,8 @@ def resize(image, output_shape, order=None, mode='reflect', cval=0, clip=True,
 
         _clip_warp_output(image, out, order, mode, cval, clip)
 
-    return out
+    return _resize_output(out, dtype,
+                          not preserve_range and out.dtype.kind == 'f')
 
 
 @utils.channel_as_last_axis()
@@ -693,8 +890,63 @@ def _clip_warp_output(input_image, output_image, order, mode, cval, clip):
             output_image[cval_mask] = cval
 
 
+def _homography_matrix(inverse_map):
+    """Return the matrix of `inverse_map` if it is a homography, else None.
+    """
+    if isinstance(inverse_map, np.ndarray) and inverse_map.shape == (3, 3):
+        # inverse_map is a transformation matrix as numpy array
+        return inverse_map
+
+    elif isinstance(inverse_map, HOMOGRAPHY_TRANSFORMS):
+        # inverse_map is a homography
+        return inverse_map.params
+
+    elif (hasattr(inverse_map, '__name__') and
+          inverse_map.__name__ == 'inverse' and
+          get_bound_method_class(inverse_map) in HOMOGRAPHY_TRANSFORMS):
+        # inverse_map is the inverse of a homography
+        return np.linalg.inv(inverse_map.__self__.params)
+
+    return None
+
+
+def _warp_homography(image, matrix, output_shape, order, mode, cval,
+                     num_threads=1):
+    """Warp a 2-D (grayscale or color) float image with `_warp_fast`."""
+    matrix = matrix.astype(image.dtype)
+    ctype = 'float32_t' if image.dtype == np.float32 else 'float64_t'
+    if num_threads is None:
+        # OpenMP default
+        num_threads = 0
+    if image.ndim == 2:
+        return _warp_fast[ctype](image, matrix, output_shape=output_shape,
+                                 order=order, mode=mode, cval=cval,
+                                 num_threads=num_threads)
+    elif image.ndim == 3:
+        dims = []
+        for dim in range(image.shape[2]):
+            dims.append(_warp_fast[ctype](image[..., dim], matrix,
+                                          output_shape=output_shape,
+                                          order=order, mode=mode,
+                                          cval=cval,
+                                          num_threads=num_threads))
+        return np.dstack(dims)
+    return None
+
+
+def _map_coordinates(image, coords, order, mode, cval):
+    """Interpolate `image` at `coords` with `ndi.map_coordinates`."""
+    # Pre-filtering not necessary for order 0, 1 interpolation
+    prefilter = order > 1
+
+    ndi_mode = _to_ndimage_mode(mode)
+    return ndi.map_coordinates(image, coords, prefilter=prefilter,
+                               mode=ndi_mode, order=order, cval=cval)
+
+
 def warp(image, inverse_map, map_args={}, output_shape=None, order=None,
-         mode='constant', cval=0., clip=True, preserve_range=False):
+         mode='constant', cval=0., clip=True, preserve_range=False, *,
+         num_threads=1):
     """Warp an image according to a given coordinate transformation.
 
     Parameters
@@ -764,6 +1016,11 @@ def warp(image, inverse_map, map_args={}, output_shape=None, order=None,
         image is converted according to the conventions of `img_as_float`.
         Also see
         https://scikit-image.org/docs/dev/user_guide/data_types.html
+    num_threads : int or None, optional
+        Number of threads over which the rows of the output are distributed
+        by the fast routine used for homographies (see Notes). If None, the
+        OpenMP default, usually the number of cores, is used. Other
+        transforms are not affected.
 
     Returns
     -------
@@ -855,49 +1112,15 @@ def warp(image, inverse_map, map_args={}, output_shape=None, order=None,
 
     if order == 2:
         # When fixing this issue, make sure to fix the branches further
-        # below in this function
-        warn("Bi-quadratic interpolation behavior has changed due "
-             "to a bug in the implementation of scikit-image. "
-             "The new version now serves as a wrapper "
-             "around SciPy's interpolation functions, which itself "
-             "is not verified to be a correct implementation. Until "
-             "skimage's implementation is fixed, we recommend "
-             "to use bi-linear or bi-cubic interpolation instead.")
+        # below in this function and in WarpPlan
+        warn(_BIQUADRATIC_WARNING)
 
     if order in (1, 3) and not map_args:
         # use fast Cython version for specific interpolation orders and input
-
-        matrix = None
-
-        if isinstance(inverse_map, np.ndarray) and inverse_map.shape == (3, 3):
-            # inverse_map is a transformation matrix as numpy array
-            matrix = inverse_map
-
-        elif isinstance(inverse_map, HOMOGRAPHY_TRANSFORMS):
-            # inverse_map is a homography
-            matrix = inverse_map.params
-
-        elif (hasattr(inverse_map, '__name__') and
-              inverse_map.__name__ == 'inverse' and
-              get_bound_method_class(inverse_map) in HOMOGRAPHY_TRANSFORMS):
-            # inverse_map is the inverse of a homography
-            matrix = np.linalg.inv(inverse_map.__self__.params)
-
+        matrix = _homography_matrix(inverse_map)
         if matrix is not None:
-            matrix = matrix.astype(image.dtype)
-            ctype = 'float32_t' if image.dtype == np.float32 else 'float64_t'
-            if image.ndim == 2:
-                warped = _warp_fast[ctype](image, matrix,
-                                           output_shape=output_shape,
-                                           order=order, mode=mode, cval=cval)
-            elif image.ndim == 3:
-                dims = []
-                for dim in range(image.shape[2]):
-                    dims.append(_warp_fast[ctype](image[..., dim], matrix,
-                                                  output_shape=output_shape,
-                                                  order=order, mode=mode,
-                                                  cval=cval))
-                warped = np.dstack(dims)
+            warped = _warp_homography(image, matrix, output_shape, order,
+                                      mode, cval, num_threads)
 
     if warped is None:
         # use ndi.map_coordinates
@@ -933,18 +1156,143 @@ def warp(image, inverse_map, map_args={}, output_shape=None, order=None,
 
             coords = warp_coords(coord_map, output_shape)
 
-        # Pre-filtering not necessary for order 0, 1 interpolation
-        prefilter = order > 1
-
-        ndi_mode = _to_ndimage_mode(mode)
-        warped = ndi.map_coordinates(image, coords, prefilter=prefilter,
-                                     mode=ndi_mode, order=order, cval=cval)
+        warped = _map_coordinates(image, coords, order, mode, cval)
 
     _clip_warp_output(image, warped, order, mode, cval, clip)
 
     return warped
 
 
+class WarpPlan:
+    """Precomputed warp of 2-D images of a given shape.
+
+    A plan performs the same warp as :func:`warp`, for any number of images
+    with the same number of rows and columns. The work that does not depend
+    on the image is done once: the coordinate map of a general transform is
+    evaluated once and stored, while homographies (e.g.
+    `SimilarityTransform`, `AffineTransform` and `ProjectiveTransform`) only
+    store their matrix, from which the fast warping routine derives the
+    source coordinates of each row on the fly.
+
+    Parameters
+    ----------
+    inverse_map : transformation object, callable or ndarray
+        Inverse coordinate map ``cr = f(cr, **kwargs)``, which transforms
+        coordinates in the output images into their corresponding coordinates
+        in the input image. See :func:`warp`.
+    input_shape : tuple
+        Shape of the input images ``(rows, cols[, ...])``. Only the rows and
+        columns are fixed by the plan.
+    output_shape : tuple (rows, cols), optional
+        Shape of the output images. By default the shape of the input images
+        is preserved.
+    map_args : dict, optional
+        Keyword arguments passed to `inverse_map`.
+    order, mode, cval, clip, preserve_range, num_threads
+        See :func:`warp`.
+
+    Examples
+    --------
+    >>> from skimage import data
+    >>> from skimage.transform import PolynomialTransform, warp
+    >>> image = data.camera()
+    >>> tform = PolynomialTransform(np.array([[2, 1, 0.001, 0, 0, 0],
+    ...                                       [0, 0, 1, 0, 0, 0]]))
+    >>> plan = WarpPlan(tform, image.shape)
+    >>> frames = [image, image[::-1]]
+    >>> warped = [plan(frame) for frame in frames]
+    >>> np.allclose(warped[0], warp(image, tform))
+    True
+    """
+
+    def __init__(self, inverse_map, input_shape, output_shape=None, *,
+                 map_args={}, order=None, mode='constant', cval=0.,
+                 clip=True, preserve_range=False, num_threads=1):
+        input_shape = tuple(safe_as_int(input_shape))
+        if np.prod(input_shape) == 0:
+            raise ValueError("Cannot warp empty image with dimensions",
+                             input_shape)
+        if output_shape is None:
+            output_shape = input_shape
+        self.input_shape = input_shape
+        self.output_shape = tuple(safe_as_int(output_shape))
+        self.order = order
+        self.mode = mode
+        self.cval = cval
+        self.clip = clip
+        self.preserve_range = preserve_range
+        self.num_threads = num_threads
+
+        self._matrix = None
+        self._coords = None
+        if isinstance(inverse_map, np.ndarray) and inverse_map.shape != (3, 3):
+            # coordinates given directly
+            self._coords = inverse_map
+            return
+        if not map_args:
+            self._matrix = _homography_matrix(inverse_map)
+        if self._matrix is not None:
+            inverse_map = ProjectiveTransform(matrix=self._matrix)
+        if len(input_shape) not in (2, 3):
+            raise ValueError("Only 2-D images (grayscale or color) are "
+                             "supported, when providing a callable "
+                             "`inverse_map`.")
+        self._inverse_map = inverse_map
+        self._map_args = map_args
+
+    def _get_coords(self):
+        """Coordinate map of the warp, computed on first use."""
+        if self._coords is None:
+            def coord_map(*args):
+                return self._inverse_map(*args, **self._map_args)
+
+            self._coords = warp_coords(coord_map, self.output_shape[:2])
+        return self._coords
+
+    def __call__(self, image):
+        """Warp an image.
+
+        Parameters
+        ----------
+        image : ndarray
+            Input image, with the rows and columns of ``input_shape``.
+
+        Returns
+        -------
+        warped : ndarray
+            The warped input image.
+        """
+        if image.shape[:2] != self.input_shape[:2]:
+            raise ValueError(f"Image shape {image.shape} does not match the "
+                             f"input shape {self.input_shape} of the plan.")
+        order = _validate_interpolation_order(image.dtype, self.order)
+        if order > 0:
+            image = convert_to_float(image, self.preserve_range)
+        if order == 2:
+            warn(_BIQUADRATIC_WARNING)
+        mode, cval = self.mode, self.cval
+
+        warped = None
+        if order in (1, 3) and self._matrix is not None:
+            warped = _warp_homography(image, self._matrix,
+                                      self.output_shape[:2], order, mode,
+                                      cval, self.num_threads)
+        if warped is None:
+            coords = self._get_coords()
+            if coords.shape[0] == image.ndim:
+                warped = _map_coordinates(image, coords, order, mode, cval)
+            else:
+                # the 2-D coordinate map is shared by all channels
+                warped = np.stack(
+                    [_map_coordinates(image[..., ch], coords, order, mode,
+                                      cval)
+                     for ch in range(image.shape[-1])], axis=-1)
+
+        _clip_warp_output(image, warped, order, mode, cval, self.clip)
+
+        return warped
+
+
 def _linear_polar_mapping(output_coords, k_angle, k_radius, center):
     """Inverse mapping function to convert from cartesian to polar coordinates
 
@@ -4,6 +4,7 @@
 #cython: wraparound=False
 import numpy as np
 cimport numpy as cnp
+from cython.parallel cimport prange
 from .._shared.interpolation cimport (nearest_neighbour_interpolation,
                                       bilinear_interpolation,
                                       biquadratic_interpolation,
@@ -68,8 +69,27 @@ cdef inline void _transform_projective(np_floats x, np_floats y, np_floats* H,
     y_[0] = (H[3] * x + H[4] * y + H[5]) / z_
 
 
+cdef inline void _warp_row(
+        Py_ssize_t tfr, Py_ssize_t out_c, np_floats* H, np_floats* img,
+        Py_ssize_t rows, Py_ssize_t cols, char mode_c, np_floats cval,
+        np_floats* out_row,
+        void (*transform_func)(np_floats, np_floats, np_floats*,
+                               np_floats*, np_floats*) nogil,
+        void (*interp_func)(np_floats*, Py_ssize_t, Py_ssize_t,
+                            np_floats, np_floats, char, np_floats,
+                            np_floats*) nogil) nogil:
+    """Warp one output row; rows are independent and may run in parallel.
+    """
+    cdef Py_ssize_t tfc
+    cdef np_floats r, c
+    for tfc in range(out_c):
+        transform_func(tfc, tfr, H, &c, &r)
+        interp_func(img, rows, cols, r, c, mode_c, cval, &out_row[tfc])
+
+
 def _warp_fast(np_floats[:, :] image, np_floats[:, :] H, output_shape=None,
-               int order=1, mode='constant', np_floats cval=0):
+               int order=1, mode='constant', np_floats cval=0,
+               int num_threads=1):
     """Projective transformation (homography).
 
     Perform a projective transformation (homography) of a floating
@@ -110,6 +130,10 @@ def _warp_fast(np_floats[:, :] image, np_floats[:, :] H, output_shape=None,
     cval : string, optional (default 0)
         Used in conjunction with mode 'C' (constant), the value
         outside the image boundaries.
+    num_threads : int, optional
+        Number of OpenMP threads over which the output rows are distributed.
+        If 0, the OpenMP default is used. Without OpenMP support, the rows
+        are processed serially.
 
     Notes
     -----
@@ -144,8 +168,7 @@ def _warp_fast(np_floats[:, :] image, np_floats[:, :] H, output_shape=None,
 
     cdef np_floats[:, ::1] out = np.zeros((out_r, out_c), dtype=dtype)
 
-    cdef Py_ssize_t tfr, tfc
-    cdef np_floats r, c
+    cdef Py_ssize_t tfr
     cdef Py_ssize_t rows = img.shape[0]
     cdef Py_ssize_t cols = img.shape[1]
 
@@ -175,10 +198,9 @@ def _warp_fast(np_floats[:, :] image, np_floats[:, :] H, output_shape=None,
         raise ValueError("Unsupported interpolation order", order)
 
     with nogil:
-        for tfr in range(out_r):
-            for tfc in range(out_c):
-                transform_func(tfc, tfr, &M[0, 0], &c, &r)
-                interp_func(&img[0, 0], rows, cols, r, c,
-                            mode_c, cval, &out[tfr, tfc])
+        for tfr in prange(out_r, num_threads=num_threads, schedule='static'):
+            _warp_row(tfr, out_c, &M[0, 0], &img[0, 0], rows, cols,
+                      mode_c, cval, &out[tfr, 0], transform_func,
+                      interp_func)
 
     return np.asarray(out)
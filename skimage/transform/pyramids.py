@@ -1,9 +1,14 @@
+import itertools
+import json
 import math
+import os
+
 import numpy as np
 from scipy import ndimage as ndi
 from ..transform import resize
+from ._warps import _apply_weights, _resize_output, _resize_weights
 from .._shared import utils
-from .._shared.utils import convert_to_float
+from .._shared.utils import convert_to_float, _to_ndimage_mode
 
 
 def _smooth(image, sigma, mode, cval, multichannel=None):
@@ -359,3 +364,237 @@ def pyramid_laplacian(image, max_layer=-1, downscale=2, sigma=None, order=1,
         current_shape = np.asarray(resized_image.shape)
 
         yield resized_image - smoothed_image
+
+
+class _ChunkedArray:
+    """Array stored as a directory of uncompressed chunks.
+
+    The layout is that of a zarr (format 2) array without compressor: a
+    ``.zarray`` metadata file and one file per chunk, named by the chunk
+    indices joined with dots and holding the raw C-ordered bytes of the full
+    chunk, padded at the border of the array.
+    """
+
+    def __init__(self, path, shape, chunks, dtype):
+        self.path = path
+        self.shape = tuple(int(s) for s in shape)
+        self.chunks = tuple(int(c) for c in chunks)
+        self.dtype = np.dtype(dtype)
+        os.makedirs(path, exist_ok=True)
+        metadata = {
+            'zarr_format': 2,
+            'shape': self.shape,
+            'chunks': self.chunks,
+            'dtype': self.dtype.str,
+            'compressor': None,
+            'fill_value': 0,
+            'order': 'C',
+            'filters': None,
+            'dimension_separator': '.',
+        }
+        with open(os.path.join(path, '.zarray'), 'w') as f:
+            json.dump(metadata, f, indent=4)
+
+    def _chunk_file(self, chunk_index):
+        # chunk indices along the trailing channel axes are always 0
+        chunk_index = tuple(chunk_index)
+        chunk_index += (0,) * (len(self.shape) - len(chunk_index))
+        return os.path.join(self.path, '.'.join(map(str, chunk_index)))
+
+    def write_chunk(self, chunk_index, data):
+        """Write the chunk at `chunk_index` (indices along the leading axes).
+        """
+        chunk = np.zeros(self.chunks, dtype=self.dtype)
+        chunk[tuple(slice(0, s) for s in data.shape)] = data
+        chunk.tofile(self._chunk_file(chunk_index))
+
+    def read(self, indices):
+        """Read the samples at the given indices along the leading axes.
+
+        Parameters
+        ----------
+        indices : sequence of array of int
+            Sorted indices along each leading axis; trailing axes are read
+            entirely.
+
+        Returns
+        -------
+        region : ndarray
+            ``array[np.ix_(*indices)]``.
+        """
+        n_axes = len(indices)
+        region = np.empty(tuple(len(i) for i in indices) +
+                          self.shape[n_axes:], dtype=self.dtype)
+        # positions within `indices` falling into each chunk, per axis
+        groups = []
+        for idx, chunk_size in zip(indices, self.chunks):
+            chunk_ids = idx // chunk_size
+            groups.append([(k, np.flatnonzero(chunk_ids == k))
+                           for k in np.unique(chunk_ids)])
+        for group in itertools.product(*groups):
+            chunk = np.memmap(self._chunk_file(k for k, _ in group),
+                              dtype=self.dtype, mode='r', shape=self.chunks)
+            local = [idx[positions] - k * chunk_size
+                     for idx, (k, positions), chunk_size
+                     in zip(indices, group, self.chunks)]
+            region[np.ix_(*[positions for _, positions in group])] = \
+                chunk[np.ix_(*local)]
+            del chunk
+        return region
+
+
+def pyramid_gaussian_tiled(image, path, max_layer=-1, downscale=2, sigma=None,
+                           order=1, mode='reflect', preserve_range=False, *,
+                           channel_axis=None, tile_shape=512, dtype=None):
+    """Write the Gaussian pyramid of an image to disk, tile by tile.
+
+    The layers are the same as those of `pyramid_gaussian`, but each one is
+    computed one tile at a time from the layer written before, so that
+    neither the input nor any layer has to fit in memory: `image` can be a
+    memory-mapped array, e.g. from ``np.load(filename, mmap_mode='r')``.
+
+    Parameters
+    ----------
+    image : ndarray
+        Input image, possibly memory-mapped. It is only read tile by tile.
+    path : str
+        Directory in which the pyramid is written, as a zarr (format 2) group
+        with one uncompressed array per layer, named ``'0'``, ``'1'``, etc.
+        The chunks of the arrays are the tiles. Layer 0 is a copy of `image`
+        converted to `dtype`, with channels along the last axis.
+    max_layer : int, optional
+        Number of layers for the pyramid. 0th layer is the original image.
+        Default is -1 which builds all possible layers.
+    downscale : float, optional
+        Downscale factor.
+    sigma : float, optional
+        Sigma for Gaussian filter. Default is `2 * downscale / 6.0` which
+        corresponds to a filter mask twice the size of the scale factor that
+        covers more than 99% of the Gaussian distribution.
+    order : {0, 1}, optional
+        Order of the interpolation of downsampling: nearest-neighbor or
+        linear.
+    mode : {'reflect', 'wrap'}, optional
+        How the array borders are handled, as in `pyramid_gaussian`.
+    preserve_range : bool, optional
+        Whether to keep the original range of values. Otherwise, the input
+        image is converted according to the conventions of `img_as_float`.
+        Also see https://scikit-image.org/docs/dev/user_guide/data_types.html
+    channel_axis : int or None, optional
+        If None, the image is assumed to be a grayscale (single channel) image.
+        Otherwise, this parameter indicates which axis of the array corresponds
+        to channels.
+    tile_shape : int or tuple of int, optional
+        Shape of the tiles along the spatial axes.
+    dtype : {None, np.float32, np.float64, np.uint8}, optional
+        Data type of the stored layers, see `skimage.transform.resize`. By
+        default, it is the floating point type of `pyramid_gaussian`.
+
+    Returns
+    -------
+    shapes : list of tuple
+        Shape of each layer written.
+
+    Notes
+    -----
+    Each tile of a layer is computed from the samples of the previous layer
+    it depends on, with the combined weights of the Gaussian filter and of
+    the interpolation along each axis, so that memory use is proportional to
+    the tile size. When stored as uint8, the layers are computed from the
+    rounded values of the previous layer.
+
+    The layers can be opened with zarr, e.g. ``zarr.open(path)['1']``.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> image = np.random.random((1000, 800))
+    >>> with tempfile.TemporaryDirectory() as path:
+    ...     shapes = pyramid_gaussian_tiled(image, path, tile_shape=256)
+    >>> shapes[:3]
+    [(1000, 800), (500, 400), (250, 200)]
+    """
+    _check_factor(downscale)
+    if mode not in ('reflect', 'wrap'):
+        raise ValueError(f"Unsupported mode: {mode!r}; expected 'reflect' or "
+                         f"'wrap'.")
+    if order not in (0, 1):
+        raise ValueError("Only interpolation orders 0 and 1 are supported.")
+    if sigma is None:
+        # automatically determine sigma which covers > 99% of distribution
+        sigma = 2 * downscale / 6.0
+    if dtype is not None:
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64, np.uint8):
+            raise ValueError(f"Unsupported dtype: {dtype}; expected float32, "
+                             f"float64 or uint8.")
+
+    if channel_axis is not None:
+        image = np.moveaxis(image, channel_axis, -1)
+        n_spatial = image.ndim - 1
+    else:
+        n_spatial = image.ndim
+    tile_shape = tuple(int(t) for t in
+                       np.broadcast_to(tile_shape, (n_spatial,)))
+    channel_shape = image.shape[n_spatial:]
+
+    # image tile converted as pyramid_gaussian does, then to dtype
+    def convert(tile):
+        if tile.dtype == np.uint8 and dtype == np.uint8:
+            return tile
+        return _resize_output(convert_to_float(tile, preserve_range), dtype,
+                              not preserve_range)
+
+    if dtype is None:
+        dtype = convert(image[(slice(0, 1),) * image.ndim]).dtype
+    work_dtype = np.float64 if dtype == np.float64 else np.float32
+
+    group = {'zarr_format': 2}
+    os.makedirs(path, exist_ok=True)
+    with open(os.path.join(path, '.zgroup'), 'w') as f:
+        json.dump(group, f)
+
+    shape = image.shape[:n_spatial]
+    layer = _ChunkedArray(os.path.join(path, '0'), image.shape,
+                          tile_shape + channel_shape, dtype)
+    n_tiles = np.ceil(np.divide(shape, tile_shape)).astype(int)
+    for tile_index in np.ndindex(*n_tiles):
+        start = np.multiply(tile_index, tile_shape)
+        tile = image[tuple(slice(a, a + t)
+                           for a, t in zip(start, tile_shape))]
+        layer.write_chunk(tile_index, convert(np.asarray(tile)))
+    shapes = [image.shape]
+
+    while len(shapes) - 1 != max_layer:
+        out_shape = tuple(math.ceil(d / float(downscale)) for d in shape)
+        # no change to previous pyramid layer
+        if out_shape == shape:
+            break
+        # smoothing as in `_smooth`, interpolation as in `resize`
+        weights = [
+            _resize_weights(n_in, n_out, order, 0, _to_ndimage_mode(mode))
+            @ _resize_weights(n_in, n_in, 1, sigma, mode)
+            for n_in, n_out in zip(shape, out_shape)
+        ]
+        next_layer = _ChunkedArray(os.path.join(path, str(len(shapes))),
+                                   out_shape + channel_shape,
+                                   tile_shape + channel_shape, dtype)
+        n_tiles = np.ceil(np.divide(out_shape, tile_shape)).astype(int)
+        for tile_index in np.ndindex(*n_tiles):
+            tile_weights = []
+            indices = []
+            for w, i, t in zip(weights, tile_index, tile_shape):
+                w = w[i * t:(i + 1) * t]
+                needed = np.unique(w.indices)
+                tile_weights.append(w[:, needed].astype(work_dtype))
+                indices.append(needed)
+            tile = layer.read(indices).astype(work_dtype)
+            for axis, w in enumerate(tile_weights):
+                tile = _apply_weights(tile, w, axis)
+            next_layer.write_chunk(tile_index,
+                                   _resize_output(tile, dtype, False))
+        layer = next_layer
+        shape = out_shape
+        shapes.append(out_shape + channel_shape)
+
+    return shapes
@@ -1,4 +1,7 @@
+import json
 import math
+import os
+
 import pytest
 import numpy as np
 from skimage import data
@@ -209,3 +212,68 @@ def test_pyramid_gaussian_dtype_support(dtype, expected):
     pyramid = pyramids.pyramid_gaussian(img)
 
     assert np.all([im.dtype == expected for im in pyramid])
+
+
+def _read_layer(path, layer):
+    """Assemble a layer written by `pyramid_gaussian_tiled`."""
+    layer_path = os.path.join(path, str(layer))
+    with open(os.path.join(layer_path, '.zarray')) as f:
+        metadata = json.load(f)
+    shape, chunks = metadata['shape'], metadata['chunks']
+    out = np.empty(shape, dtype=metadata['dtype'])
+    n_chunks = [math.ceil(s / c) for s, c in zip(shape, chunks)]
+    for chunk_index in np.ndindex(*n_chunks):
+        filename = os.path.join(layer_path, '.'.join(map(str, chunk_index)))
+        chunk = np.fromfile(filename, dtype=metadata['dtype']).reshape(chunks)
+        region = tuple(slice(i * c, min((i + 1) * c, s))
+                       for i, c, s in zip(chunk_index, chunks, shape))
+        out[region] = chunk[tuple(slice(0, r.stop - r.start)
+                                  for r in region)]
+    return out
+
+
+@pytest.mark.parametrize('mode', ['reflect', 'wrap'])
+@pytest.mark.parametrize('order', [0, 1])
+def test_pyramid_gaussian_tiled(tmp_path, mode, order):
+    img = np.random.default_rng(0).random((101, 77, 3))
+    expected = list(pyramids.pyramid_gaussian(img, order=order, mode=mode,
+                                              channel_axis=-1))
+
+    shapes = pyramids.pyramid_gaussian_tiled(img, tmp_path, order=order,
+                                             mode=mode, channel_axis=-1,
+                                             tile_shape=(16, 24))
+    assert shapes == [layer.shape for layer in expected]
+    for i, layer in enumerate(expected):
+        assert_almost_equal(_read_layer(tmp_path, i), layer, decimal=12)
+
+
+def test_pyramid_gaussian_tiled_memmap(tmp_path):
+    img = (np.random.default_rng(0).random((3, 60, 50)) * 255).astype(np.uint8)
+    np.save(tmp_path / 'image.npy', img)
+    img = np.load(tmp_path / 'image.npy', mmap_mode='r')
+    expected = list(pyramids.pyramid_gaussian(np.moveaxis(img, 0, -1),
+                                              max_layer=2, channel_axis=-1,
+                                              preserve_range=True))
+
+    path = tmp_path / 'pyramid'
+    shapes = pyramids.pyramid_gaussian_tiled(img, path, max_layer=2,
+                                             channel_axis=0, tile_shape=16,
+                                             dtype=np.uint8)
+    assert shapes == [(60, 50, 3), (30, 25, 3), (15, 13, 3)]
+    assert_array_equal(_read_layer(path, 0), expected[0])
+    for i in range(1, 3):
+        layer = _read_layer(path, i)
+        assert layer.dtype == np.uint8
+        # each layer is computed from the rounded previous one
+        assert np.abs(layer - expected[i]).max() <= 1
+    assert not os.path.exists(path / '3')
+
+
+def test_pyramid_gaussian_tiled_invalid(tmp_path):
+    img = np.zeros((8, 8))
+    with testing.raises(ValueError):
+        pyramids.pyramid_gaussian_tiled(img, tmp_path, mode='constant')
+    with testing.raises(ValueError):
+        pyramids.pyramid_gaussian_tiled(img, tmp_path, order=3)
+    with testing.raises(ValueError):
+        pyramids.pyramid_gaussian_tiled(img, tmp_path, dtype=np.int16)
@@ -17,10 +17,11 @@ from skimage.transform._warps import (_stackcopy,
                                       _log_polar_mapping, warp,
                                       warp_coords, rotate, resize,
                                       rescale, warp_polar, swirl,
-                                      downscale_local_mean)
+                                      downscale_local_mean, WarpPlan)
 from skimage.transform._geometric import (AffineTransform,
                                           ProjectiveTransform,
-                                          SimilarityTransform)
+                                          SimilarityTransform,
+                                          PolynomialTransform)
 
 
 np.random.seed(0)
@@ -374,6 +375,74 @@ def test_resize_dtype():
     assert resize(x_f32, (10, 10), preserve_range=True).dtype == x_f32.dtype
 
 
+@pytest.mark.parametrize('order', [0, 1])
+@pytest.mark.parametrize('mode', ['reflect', 'symmetric', 'edge', 'wrap'])
+@pytest.mark.parametrize('output_shape', [(7, 13), (31, 9), (40, 50), (2, 3)])
+def test_resize_polyphase(order, mode, output_shape):
+    from scipy import ndimage as ndi
+
+    rng = np.random.default_rng(0)
+    image = rng.random((23, 29))
+    ndi_mode = {'reflect': 'mirror', 'symmetric': 'reflect',
+                'edge': 'nearest', 'wrap': 'grid-wrap'}[mode]
+    factors = np.divide(image.shape, output_shape)
+    sigma = np.maximum(0, (factors - 1) / 2)
+    smoothed = ndi.gaussian_filter(image, sigma, mode=ndi_mode)
+    expected = ndi.zoom(smoothed, 1 / factors, order=order, mode=ndi_mode,
+                        grid_mode=True)
+
+    resized = resize(image, output_shape, order=order, mode=mode,
+                     anti_aliasing=True)
+    assert_almost_equal(resized, expected, decimal=12)
+
+
+def test_resize_polyphase_large_factor():
+    from scipy import ndimage as ndi
+
+    # a large reduction, whose weights must not grow with input_size ** 2
+    rng = np.random.default_rng(0)
+    image = rng.random((2, 100000))
+    sigma = (0, (100 - 1) / 2)
+    smoothed = ndi.gaussian_filter(image, sigma, mode='mirror')
+    expected = ndi.zoom(smoothed, (1, 1 / 100), order=1, mode='mirror',
+                        grid_mode=True)
+    resized = resize(image, (2, 1000), order=1, anti_aliasing=True)
+    assert_almost_equal(resized, expected, decimal=12)
+
+
+def test_resize_output_dtype():
+    rng = np.random.default_rng(0)
+    image = rng.random((40, 30, 3))
+    expected = resize(image, (15, 20))
+
+    resized = resize(image, (15, 20), dtype=np.float32)
+    assert resized.dtype == np.float32
+    assert_almost_equal(resized, expected, decimal=5)
+    resized = resize(image.astype(np.float32), (15, 20), dtype=np.float64)
+    assert resized.dtype == np.float64
+    assert_almost_equal(resized, expected, decimal=5)
+
+    resized = resize(image, (15, 20), dtype=np.uint8)
+    assert resized.dtype == np.uint8
+    assert np.abs(resized - expected * 255).max() <= 0.5 + 1e-3
+
+    image_u8 = (image * 255).astype(np.uint8)
+    expected = resize(image_u8, (15, 20), preserve_range=True)
+    resized = resize(image_u8, (15, 20), dtype=np.uint8)
+    assert resized.dtype == np.uint8
+    assert np.abs(resized - expected).max() <= 0.5 + 1e-3
+    # slower paths, not using the polyphase engine
+    resized = resize(image_u8, (15, 20), order=3, dtype=np.uint8)
+    assert resized.dtype == np.uint8
+    expected = resize(image_u8, (15, 20), mode='constant',
+                      preserve_range=True)
+    resized = resize(image_u8, (15, 20), mode='constant', dtype=np.uint8)
+    assert np.abs(resized - expected).max() <= 0.5 + 1e-3
+
+    with pytest.raises(ValueError):
+        resize(image, (15, 20), dtype=np.int16)
+
+
 def test_swirl():
     image = img_as_float(checkerboard())
 
@@ -715,3 +784,60 @@ def test_order_0_warp_dtype(dtype):
     assert rotate(img, 45, order=0).dtype == dtype
     assert warp_polar(img, order=0).dtype == dtype
     assert swirl(img, order=0).dtype == dtype
+
+
+@pytest.mark.parametrize('inverse_map', [
+    SimilarityTransform(scale=1.2, rotation=0.3, translation=(4, -2)),
+    ProjectiveTransform(np.array([[1, 0.1, 3], [0.01, 1, 2], [0, 0.001, 1]])),
+    SimilarityTransform(rotation=0.2).inverse,
+    np.array([[1, 0.1, 3], [0, 1, 2], [0, 0, 1.]]),
+    PolynomialTransform(np.array([[2, 1, 0.001, 0, 0, 0],
+                                  [0, 0, 1, 0, 0, 0]])),
+])
+@pytest.mark.parametrize('order', [0, 1, 3])
+@pytest.mark.parametrize('channels', [None, 3])
+def test_warp_plan(inverse_map, order, channels):
+    image = astronaut()[:60, :50]
+    if channels is None:
+        image = image[..., 0]
+    plan = WarpPlan(inverse_map, image.shape, (40, 70), order=order,
+                    mode='reflect')
+    for frame in [image, image[::-1], img_as_float(image[:, ::-1])]:
+        expected = warp(frame, inverse_map, output_shape=(40, 70),
+                        order=order, mode='reflect')
+        warped = plan(frame)
+        assert warped.dtype == expected.dtype
+        assert warped.shape == expected.shape
+        np.testing.assert_allclose(warped, expected, atol=1e-10)
+
+
+def test_warp_plan_coordinates():
+    image = np.random.rand(20, 30)
+    coords = np.mgrid[:10, :15] * 2.0
+    plan = WarpPlan(coords, image.shape)
+    assert_almost_equal(plan(image), image[::2, ::2])
+    assert_almost_equal(plan(image), warp(image, coords))
+
+
+def test_warp_plan_shape_mismatch():
+    plan = WarpPlan(SimilarityTransform(rotation=0.1), (20, 30))
+    with testing.raises(ValueError):
+        plan(np.zeros((30, 20)))
+    with testing.raises(ValueError):
+        WarpPlan(SimilarityTransform(rotation=0.1), (0, 30))
+
+
+@pytest.mark.parametrize('num_threads', [2, 4, None])
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+def test_warp_num_threads(num_threads, dtype):
+    image = img_as_float(astronaut()).astype(dtype)
+    tform = ProjectiveTransform(np.array([[1, 0.1, 3],
+                                          [0.01, 1, 2],
+                                          [0, 0.001, 1]]))
+    for order in (1, 3):
+        expected = warp(image, tform, order=order, output_shape=(301, 257))
+        warped = warp(image, tform, order=order, output_shape=(301, 257),
+                      num_threads=num_threads)
+        assert_equal(warped, expected)
+    plan = WarpPlan(tform, image.shape, num_threads=num_threads)
+    assert_equal(plan(image), warp(image, tform))
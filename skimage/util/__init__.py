@@ -1,21 +1,32 @@
 import functools
 import warnings
 import numpy as np
-from .dtype import (img_as_float32, img_as_float64, img_as_float,
-                    img_as_int, img_as_uint, img_as_ubyte,
-                    img_as_bool, dtype_limits)
-from .shape import view_as_blocks, view_as_windows
-from .noise import random_noise
-from .apply_parallel import apply_parallel
 
-from .arraycrop import crop
-from .compare import compare_images
-from ._regular_grid import regular_grid, regular_seeds
-from .unique import unique_rows
-from ._invert import invert
-from ._montage import montage
-from ._map_array import map_array
-from ._label import label_points
+from .._shared import lazy
+
+__getattr__, __dir__ = lazy.attach(
+    __name__,
+    submodules={'dtype', 'shape', 'noise', 'arraycrop', 'compare', 'unique'},
+    submod_attrs={
+        'dtype': ['img_as_float32', 'img_as_float64', 'img_as_float',
+                  'img_as_int', 'img_as_uint', 'img_as_ubyte', 'img_as_bool',
+                  'dtype_limits', 'set_float_policy', 'float_policy'],
+        'shape': ['view_as_blocks', 'view_as_windows'],
+        'noise': ['random_noise'],
+        'arraycrop': ['crop'],
+        'compare': ['compare_images'],
+        '_regular_grid': ['regular_grid', 'regular_seeds'],
+        'unique': ['unique_rows'],
+        '_invert': ['invert'],
+        '_montage': ['montage'],
+        '_map_array': ['map_array'],
+        '_label': ['label_points'],
+    }
+)
+
+# imported eagerly: a lazily attached attribute would be shadowed by the
+# submodule of the same name once the submodule is imported
+from .apply_parallel import apply_parallel
 
 
 @functools.wraps(np.pad)
@@ -34,6 +45,8 @@ __all__ = ['img_as_float32',
            'img_as_ubyte',
            'img_as_bool',
            'dtype_limits',
+           'set_float_policy',
+           'float_policy',
            'view_as_blocks',
            'view_as_windows',
            'pad',
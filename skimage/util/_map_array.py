@@ -1,8 +1,44 @@
 import numpy as np
-from ._remap import _map_array
+from ._remap import _build_table, _insert_unique, _map_array
 
 
-def map_array(input_arr, input_vals, output_vals, out=None):
+def _map_table(input_vals, output_vals):
+    """Hash table mapping `input_vals` to `output_vals`, see `_remap`."""
+    # at most half full, for short probe sequences
+    capacity = 1 << max(4, (2 * len(input_vals) - 1).bit_length())
+    keys = np.zeros(capacity, dtype=input_vals.dtype)
+    values = np.zeros(capacity, dtype=output_vals.dtype)
+    used = np.zeros(capacity, dtype=np.uint8)
+    _build_table(input_vals, output_vals, keys, values, used)
+    return keys, values, used
+
+
+def _unique_values(arr):
+    """Sorted unique values of an integer array, in O(N) + O(K log K).
+
+    Unlike `np.unique`, the array is not sorted: its values are inserted in
+    a hash table, so that only the K distinct values are sorted.
+    """
+    if not np.issubdtype(arr.dtype, np.integer):
+        return np.unique(arr)
+    arr = arr.reshape(-1)
+    capacity = 1024
+    keys = np.zeros(capacity, dtype=arr.dtype)
+    used = np.zeros(capacity, dtype=np.uint8)
+    start, count = _insert_unique(arr, 0, keys, used, 0)
+    while start < arr.size:
+        # grow the table, then resume the insertions
+        inserted = keys[used.view(bool)]
+        capacity *= 4
+        keys = np.zeros(capacity, dtype=arr.dtype)
+        used = np.zeros(capacity, dtype=np.uint8)
+        _, count = _insert_unique(inserted, 0, keys, used, 0)
+        start, count = _insert_unique(arr, start, keys, used, count)
+    return np.sort(keys[used.view(bool)])
+
+
+def map_array(input_arr, input_vals, output_vals, out=None, *,
+              num_threads=1):
     """Map values from input array from input_vals to output_vals.
 
     Parameters
@@ -15,12 +51,23 @@ def map_array(input_arr, input_vals, output_vals, out=None):
         The values to map to.
     out: array, same shape as `input_arr`
         The output array. Will be created if not provided. It should
-        have the same dtype as `output_vals`.
+        have the same dtype as `output_vals`. It can be `input_arr` itself,
+        to map the values in place.
+    num_threads : int or None, optional
+        The number of OpenMP threads over which the elements of `input_arr`
+        are distributed. If None, the OpenMP default, usually the number of
+        cores, is used.
 
     Returns
     -------
     out : array, same shape as `input_arr`
         The array of mapped values.
+
+    Notes
+    -----
+    Values of `input_arr` missing from `input_vals` are mapped to 0. The
+    mapping is looked up in a hash table of `input_vals`, so that memory use
+    does not depend on the magnitude of the values.
     """
 
     if not np.issubdtype(input_arr.dtype, np.integer):
@@ -54,7 +101,10 @@ def map_array(input_arr, input_vals, output_vals, out=None):
     # ensure all arrays have matching types before sending to Cython
     input_vals = input_vals.astype(input_arr.dtype, copy=False)
     output_vals = output_vals.astype(out.dtype, copy=False)
-    _map_array(input_arr, out_view, input_vals, output_vals)
+    if num_threads is None:
+        num_threads = 0
+    _map_array(input_arr, out_view, *_map_table(input_vals, output_vals),
+               num_threads)
     return out
 
 
@@ -107,7 +157,6 @@ class ArrayMap:
         self.in_values = in_values
         self.out_values = out_values
         self._max_str_lines = 4
-        self._array = None
 
     def __len__(self):
         """Return one more than the maximum label value being remapped."""
@@ -155,9 +204,9 @@ class ArrayMap:
     def __call__(self, arr):
         return self.__getitem__(arr)
 
-    def __getitem__(self, index):
-        scalar = np.isscalar(index)
-        if scalar:
+    def _index_array(self, index):
+        """Array of the values selected by an index, as in `__getitem__`."""
+        if np.isscalar(index):
             index = np.array([index])
         elif isinstance(index, slice):
             start = index.start or 0  # treat None or 0 the same way
@@ -166,22 +215,41 @@ class ArrayMap:
                     else len(self))
             step = index.step
             index = np.arange(start, stop, step)
+        else:
+            index = np.asarray(index)
         if index.dtype == bool:
             index = np.flatnonzero(index)
+        return index
 
-        out = map_array(
-            index,
-            self.in_values.astype(index.dtype, copy=False),
-            self.out_values,
-        )
+    def __getitem__(self, index):
+        scalar = np.isscalar(index)
+        index = self._index_array(index)
+
+        if not np.issubdtype(index.dtype, np.integer):
+            raise TypeError(
+                'The dtype of an array to be remapped should be integer.'
+            )
+        out = np.empty(index.shape, dtype=self.out_values.dtype)
+        # the table is rebuilt at each lookup, as `in_values` and
+        # `out_values` are public and may be modified in place
+        _map_array(index.reshape(-1), out.reshape(-1),
+                   *_map_table(self.in_values.astype(index.dtype, copy=False),
+                               self.out_values))
 
         if scalar:
             out = out[0]
         return out
 
     def __setitem__(self, indices, values):
-        if self._array is None:
-            self._array = self.__array__()
-        self._array[indices] = values
-        self.in_values = np.flatnonzero(self._array)
-        self.out_values = self._array[self.in_values]
+        indices = self._index_array(indices)
+        values = np.broadcast_to(values, indices.shape)
+        in_values = np.concatenate([self.in_values, indices.ravel()])
+        out_values = np.concatenate([
+            self.out_values, values.ravel().astype(self.out_values.dtype)
+        ])
+        # as with array indexing, the last assignment to a value is kept
+        in_values, last = np.unique(in_values[::-1], return_index=True)
+        out_values = out_values[::-1][last]
+        nonzero = out_values != 0
+        self.in_values = in_values[nonzero]
+        self.out_values = out_values[nonzero]
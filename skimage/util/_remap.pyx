@@ -1,24 +1,99 @@
-# distutils: language = c++
+#cython: cdivision=True
+#cython: boundscheck=False
+#cython: nonecheck=False
+#cython: wraparound=False
 
-from libcpp.unordered_map cimport unordered_map
-cimport cython
+"""Hash table of integer keys, with open addressing and linear probing.
+
+A table of capacity C (a power of two) is made of three arrays of length C:
+``keys``, ``values`` and ``used``, the latter flagging the occupied slots.
+Values of unused slots are 0, which is thus the value of missing keys.
+"""
+
+cimport numpy as cnp
+from cython.parallel cimport prange
 from .._shared.fused_numerics cimport np_numeric, np_anyint
 
-@cython.boundscheck(False)  # Deactivate bounds checking
-@cython.wraparound(False)   # Deactivate negative indexing
+cnp.import_array()
+
+
+cdef inline Py_ssize_t _find(np_anyint key, np_anyint[::1] keys,
+                             cnp.uint8_t[::1] used) nogil:
+    """Slot holding `key`, or the free slot where it should be inserted."""
+    cdef Py_ssize_t mask = keys.shape[0] - 1
+    # Fibonacci hashing, folding the high bits onto the low ones
+    cdef cnp.uint64_t h = <cnp.uint64_t>key * 0x9E3779B97F4A7C15ULL
+    cdef Py_ssize_t slot = <Py_ssize_t>((h ^ (h >> 32)) & mask)
+    while used[slot] and keys[slot] != key:
+        slot = (slot + 1) & mask
+    return slot
+
+
+def _build_table(np_anyint[:] inval, np_numeric[:] outval,
+                 np_anyint[::1] keys, np_numeric[::1] values,
+                 cnp.uint8_t[::1] used):
+    """Insert ``inval[i] -> outval[i]`` into an empty table.
+
+    The table must have at least twice as many slots as `inval` has
+    elements. For repeated keys, the last value is kept.
+    """
+    cdef Py_ssize_t i, slot
+    with nogil:
+        for i in range(inval.shape[0]):
+            slot = _find(inval[i], keys, used)
+            used[slot] = 1
+            keys[slot] = inval[i]
+            values[slot] = outval[i]
+
+
 def _map_array(np_anyint[:] inarr, np_numeric[:] outarr,
-               np_anyint[:] inval, np_numeric[:] outval):
-    # build the map from the input and output vectors
-    cdef size_t i, n_map, n_array
-    cdef unordered_map[np_anyint, np_numeric] lut
-    n_map = inval.shape[0]
-    for i in range(n_map):
-        lut[inval[i]] = outval[i]
-    # apply the map to the array
-    n_array = inarr.shape[0]
-    # The prange option gave some compilation warnings
-    #  "Unsigned index type not allowed before OpenMP 3.0"
-    # and didn't seem to be any faster
-    # for i in prange(n_array, nogil=True): #
-    for i in range(n_array):
-        outarr[i] = lut[inarr[i]]
+               np_anyint[::1] keys, np_numeric[::1] values,
+               cnp.uint8_t[::1] used, Py_ssize_t num_threads=1):
+    """Look up each element of `inarr` in the table, writing to `outarr`.
+
+    `outarr` may be `inarr` itself. `num_threads` is the number of OpenMP
+    threads, 0 for the OpenMP default.
+    """
+    cdef Py_ssize_t i
+    for i in prange(inarr.shape[0], nogil=True, num_threads=num_threads,
+                    schedule='static'):
+        outarr[i] = values[_find(inarr[i], keys, used)]
+
+
+def _insert_unique(np_anyint[:] arr, Py_ssize_t start, np_anyint[::1] keys,
+                   cnp.uint8_t[::1] used, Py_ssize_t count):
+    """Insert the values of ``arr[start:]`` as keys, while the load allows.
+
+    Parameters
+    ----------
+    arr : (N,) array of int
+        Values to insert.
+    start : int
+        Index of the first value to insert.
+    keys, used : (C,) arrays
+        Table, with `count` keys already inserted.
+    count : int
+        Number of keys in the table.
+
+    Returns
+    -------
+    stop : int
+        Index of the first value not inserted: N, unless the table reached
+        half its capacity, in which case it should be grown.
+    count : int
+        Number of keys in the table.
+    """
+    cdef Py_ssize_t i = start, slot
+    cdef Py_ssize_t n = arr.shape[0]
+    cdef Py_ssize_t max_count = keys.shape[0] // 2
+    with nogil:
+        while i < n:
+            slot = _find(arr[i], keys, used)
+            if not used[slot]:
+                if count == max_count:
+                    break
+                used[slot] = 1
+                keys[slot] = arr[i]
+                count += 1
+            i += 1
+    return i, count
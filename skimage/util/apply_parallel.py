@@ -56,12 +56,187 @@ def _ensure_dask_array(array, chunks=None):
     return da.from_array(array, chunks=chunks)
 
 
+def _cpu_count():
+    try:
+        # since apply_parallel is in the critical import path, we lazy
+        # import multiprocessing just when we need it.
+        from multiprocessing import cpu_count
+        return cpu_count()
+    except NotImplementedError:
+        return 4
+
+
+def _normalize_chunks(chunks, shape):
+    """Convert `chunks` to a tuple of chunk lengths along each axis.
+
+    Examples
+    --------
+    >>> _normalize_chunks(4, (10, 4))
+    ((4, 4, 2), (4,))
+    >>> _normalize_chunks(((2, 3), 4), (5, 8))
+    ((2, 3), (4, 4))
+    """
+    if numpy.isscalar(chunks):
+        chunks = (chunks,) * len(shape)
+    if len(chunks) != len(shape):
+        raise ValueError(f"chunks {chunks} do not match the array dimension "
+                         f"{len(shape)}")
+    normalized = []
+    for axis, (c, n) in enumerate(zip(chunks, shape)):
+        if numpy.isscalar(c):
+            c = int(c)
+            if c == -1 or c >= n:
+                c = max(n, 1)
+            if c <= 0:
+                raise ValueError("chunk sizes must be positive")
+            lens = (c,) * (n // c)
+            if n % c:
+                lens += (n % c,)
+            normalized.append(lens)
+        else:
+            lens = tuple(int(x) for x in c)
+            if sum(lens) != n:
+                raise ValueError(f"chunks {lens} along axis {axis} do not sum "
+                                 f"to the array length {n}")
+            normalized.append(lens)
+    return tuple(normalized)
+
+
+def _normalize_depth(depth, ndim):
+    if isinstance(depth, dict):
+        depth = tuple(depth.get(axis, 0) for axis in range(ndim))
+    elif numpy.isscalar(depth):
+        depth = (depth,) * ndim
+    if len(depth) != ndim:
+        raise ValueError(f"depth {depth} does not match the array dimension "
+                         f"{ndim}")
+    depth = tuple(int(d) for d in depth)
+    if any(d < 0 for d in depth):
+        raise ValueError("depth must be non-negative")
+    return depth
+
+
+# dask boundary modes and the numpy.pad modes producing the same halo
+_dask_to_pad_mode = {'reflect': 'symmetric',
+                     'periodic': 'wrap',
+                     'nearest': 'edge'}
+
+
+def _call_function(function, arr, extra_arguments, extra_keywords,
+                   copy=False):
+    # module level so that it can be pickled by the 'processes' backend
+    if copy:
+        # the function should not be able to modify the input; copying here
+        # rather than on submission keeps at most one copy per worker alive
+        arr = arr.copy()
+    return function(arr, *extra_arguments, **extra_keywords)
+
+
+def _apply_chunked(function, array, chunks, depth, mode, extra_arguments,
+                   extra_keywords, dtype, backend, num_workers):
+    """Run `function` over overlapping chunks without dask.
+
+    Each chunk is extended by `depth` along every axis, padded according to
+    `mode` where it touches the array border, passed to `function`, and the
+    halo is cropped from the result before it is written into a single
+    preallocated output array.
+
+    Returns
+    -------
+    out : ndarray
+        The combined result.
+    n_chunks : int
+        The number of chunks `function` was called on.
+    """
+    from concurrent.futures import (ProcessPoolExecutor, ThreadPoolExecutor,
+                                    as_completed)
+    from itertools import product
+
+    array = numpy.asarray(array)
+    ndim = array.ndim
+    chunks = _normalize_chunks(chunks, array.shape)
+    depth = _normalize_depth(depth, ndim)
+
+    if mode is None or mode == 'none':
+        # chunks are extended only as far as the array itself reaches
+        padded = array
+        offset = (0,) * ndim
+    else:
+        if isinstance(mode, str):
+            if mode not in _dask_to_pad_mode:
+                raise ValueError(f"Unsupported boundary mode: {mode}")
+            pad_kwargs = {'mode': _dask_to_pad_mode[mode]}
+        else:
+            pad_kwargs = {'mode': 'constant', 'constant_values': mode}
+        # pad once up front so that every chunk receives a full halo
+        padded = numpy.pad(array, [(d, d) for d in depth], **pad_kwargs)
+        offset = depth
+
+    starts = [numpy.concatenate(([0], numpy.cumsum(c)[:-1])).astype(int)
+              for c in chunks]
+
+    def _chunk_slices(index):
+        core, src, crop = [], [], []
+        for axis, i in enumerate(index):
+            start = int(starts[axis][i])
+            stop = start + chunks[axis][i]
+            lo = max(start + offset[axis] - depth[axis], 0)
+            hi = min(stop + offset[axis] + depth[axis], padded.shape[axis])
+            core.append(slice(start, stop))
+            src.append(slice(lo, hi))
+            crop_start = start + offset[axis] - lo
+            crop.append(slice(crop_start, crop_start + stop - start))
+        return tuple(core), tuple(src), tuple(crop)
+
+    tasks = [_chunk_slices(index)
+             for index in product(*(range(len(c)) for c in chunks))]
+
+    if num_workers is None:
+        num_workers = _cpu_count()
+    num_workers = max(1, min(num_workers, len(tasks)))
+    if backend == 'threads':
+        executor_class = ThreadPoolExecutor
+    else:
+        executor_class = ProcessPoolExecutor
+
+    out = None
+    if dtype is not None:
+        out = numpy.empty(array.shape, dtype=dtype)
+
+    with executor_class(max_workers=num_workers) as executor:
+        futures = {}
+        for core, src, crop in tasks:
+            future = executor.submit(_call_function, function, padded[src],
+                                     extra_arguments, extra_keywords,
+                                     copy=backend == 'threads')
+            futures[future] = (core, src, crop)
+        for future in as_completed(futures):
+            core, src, crop = futures[future]
+            result = numpy.asarray(future.result())
+            expected_shape = tuple(s.stop - s.start for s in src)
+            if result.shape != expected_shape:
+                raise ValueError(
+                    f"function returned an array of shape {result.shape} for "
+                    f"a chunk of shape {expected_shape}; apply_parallel "
+                    f"requires the output to have the same shape as the "
+                    f"input")
+            if out is None:
+                out = numpy.empty(array.shape, dtype=result.dtype)
+            out[core] = result[crop]
+
+    if out is None:
+        # zero-sized array: no chunk was run
+        out = numpy.empty(array.shape, dtype=dtype or array.dtype)
+    return out, len(tasks)
+
+
 @utils.channel_as_last_axis(channel_arg_positions=(1,))
 @utils.deprecate_multichannel_kwarg()
 def apply_parallel(function, array, chunks=None, depth=0, mode=None,
                    extra_arguments=(), extra_keywords={}, *, dtype=None,
                    compute=None, channel_axis=None,
-                   multichannel=False):
+                   multichannel=False, backend=None, num_workers=None,
+                   return_num_chunks=False):
     """Map a function in parallel across an array.
 
     Split an array into possibly overlapping chunks of a given depth and
@@ -121,12 +296,29 @@ def apply_parallel(function, array, chunks=None, depth=0, mode=None,
 
         .. versionadded:: 0.18
            ``multichannel`` was added in 0.18.
+    backend : {'dask', 'threads', 'processes'} or None, optional
+        How the chunks are scheduled. 'dask' uses ``dask.array.map_overlap``.
+        'threads' and 'processes' do not require dask: the chunks and their
+        halos are cut from the array directly, `function` is run on a
+        thread or process pool and each result is written into a single
+        preallocated output array. The 'processes' backend requires
+        `function` to be picklable. If None (default), 'dask' is used when
+        it is installed and 'threads' otherwise.
+    num_workers : int or None, optional
+        Number of threads or processes used by the 'threads' and
+        'processes' backends. If None, the number of available CPUs is
+        used. Ignored by the 'dask' backend.
+    return_num_chunks : bool, optional
+        If True, also return the number of chunks `function` was applied to.
 
     Returns
     -------
     out : ndarray or dask Array
         Returns the result of the applying the operation.
         Type is dependent on the ``compute`` argument.
+    num_chunks : int
+        Number of chunks `function` was applied to. Only returned if
+        `return_num_chunks` is True.
 
     Notes
     -----
@@ -137,27 +329,38 @@ def apply_parallel(function, array, chunks=None, depth=0, mode=None,
     For example region selection to preview a result or storing large data
     to disk instead of loading in memory.
 
+    The 'threads' backend is most effective when `function` releases the
+    GIL, as most of the compiled routines in scikit-image do. Unlike the
+    'dask' backend, it never calls `function` on placeholder data to infer
+    the output dtype; the dtype of the first computed chunk is used instead.
+
     """
-    try:
-        # Importing dask takes time. since apply_parallel is on the
-        # minimum import path of skimage, we lazy attempt to import dask
-        import dask.array as da
-    except ImportError:
-        raise RuntimeError("Could not import 'dask'.  Please install "
-                           "using 'pip install dask'")
+    if backend not in (None, 'dask', 'threads', 'processes'):
+        raise ValueError(f"Unknown backend: {backend}")
 
-    if compute is None:
-        compute = not isinstance(array, da.Array)
+    if backend in (None, 'dask'):
+        try:
+            # Importing dask takes time. since apply_parallel is on the
+            # minimum import path of skimage, we lazy attempt to import dask
+            import dask.array as da
+        except ImportError:
+            if backend == 'dask' or compute is False:
+                raise RuntimeError("Could not import 'dask'.  Please install "
+                                   "using 'pip install dask'")
+            backend = 'threads'
+        else:
+            if backend is None:
+                backend = 'dask'
+
+    if backend == 'dask':
+        if compute is None:
+            compute = not isinstance(array, da.Array)
+    elif compute is False:
+        raise ValueError("compute=False requires the 'dask' backend")
 
     if chunks is None:
         shape = array.shape
-        try:
-            # since apply_parallel is in the critical import path, we lazy
-            # import multiprocessing just when we need it.
-            from multiprocessing import cpu_count
-            ncpu = cpu_count()
-        except NotImplementedError:
-            ncpu = 4
+        ncpu = _cpu_count() if num_workers is None else num_workers
         if channel_axis is not None:
             chunks = _get_chunks(shape[:-1], ncpu) + (shape[-1],)
         else:
@@ -174,6 +377,14 @@ def apply_parallel(function, array, chunks=None, depth=0, mode=None,
         # depth is only used along the non-channel axes
         depth = (depth,) * (len(array.shape) - 1) + (0,)
 
+    if backend != 'dask':
+        res, num_chunks = _apply_chunked(function, array, chunks, depth, mode,
+                                         extra_arguments, extra_keywords,
+                                         dtype, backend, num_workers)
+        if return_num_chunks:
+            return res, num_chunks
+        return res
+
     def wrapped_func(arr):
         return function(arr, *extra_arguments, **extra_keywords)
 
@@ -183,4 +394,6 @@ def apply_parallel(function, array, chunks=None, depth=0, mode=None,
     if compute:
         res = res.compute()
 
+    if return_num_chunks:
+        return res, darr.npartitions
     return res
@@ -1,10 +1,12 @@
+import contextlib
+
 import numpy as np
 from warnings import warn
 
 
 __all__ = ['img_as_float32', 'img_as_float64', 'img_as_float',
            'img_as_int', 'img_as_uint', 'img_as_ubyte',
-           'img_as_bool', 'dtype_limits']
+           'img_as_bool', 'dtype_limits', 'set_float_policy', 'float_policy']
 
 # For integers Numpy uses `_integer_types` basis internally, and builds a leaky
 # `np.XintYY` abstraction on top of it. This leads to situations when, for
@@ -458,6 +460,122 @@ def img_as_float(image, force_copy=False):
     return _convert(image, np.floating, force_copy)
 
 
+_float_policies = ('preserve', 'float32', 'float64')
+_float_policy = 'preserve'
+
+
+def set_float_policy(policy):
+    """Set the floating point precision used by filters converting to float.
+
+    Filters supporting a floating point policy, such as
+    :func:`skimage.filters.gaussian` and the edge filters of
+    :mod:`skimage.filters`, compute their result, including any intermediate
+    buffers, in the precision chosen by the policy unless their ``dtype``
+    argument is given.
+
+    Parameters
+    ----------
+    policy : {'preserve', 'float32', 'float64'}
+        With 'preserve' (the default), single and half precision inputs are
+        processed in ``float32`` and all other inputs in ``float64``. With
+        'float32' or 'float64', all inputs are processed in that precision.
+
+    Returns
+    -------
+    previous : str
+        The policy in effect before the call.
+
+    See also
+    --------
+    float_policy : set the policy temporarily.
+    """
+    global _float_policy
+    if policy not in _float_policies:
+        raise ValueError(f"Unknown float policy {policy!r}; expected one of "
+                         f"{_float_policies}.")
+    previous = _float_policy
+    _float_policy = policy
+    return previous
+
+
+@contextlib.contextmanager
+def float_policy(policy):
+    """Context manager setting the floating point policy temporarily.
+
+    Parameters
+    ----------
+    policy : {'preserve', 'float32', 'float64'}
+        The policy used within the context, see :func:`set_float_policy`.
+
+    Examples
+    --------
+    >>> from skimage.filters import sobel
+    >>> image = np.zeros((5, 5), dtype=np.uint8)
+    >>> with float_policy('float32'):
+    ...     edges = sobel(image)
+    >>> edges.dtype
+    dtype('float32')
+    """
+    previous = set_float_policy(policy)
+    try:
+        yield
+    finally:
+        set_float_policy(previous)
+
+
+def _float_dtype(input_dtype, dtype=None):
+    """Return the floating point dtype in which to process an image.
+
+    Parameters
+    ----------
+    input_dtype : dtype
+        The dtype of the input image.
+    dtype : {None, np.float32, np.float64}, optional
+        The precision requested by the caller. If None, the precision is
+        chosen according to the current float policy.
+
+    Returns
+    -------
+    float_dtype : dtype
+        Either ``float32`` or ``float64``.
+    """
+    if dtype is not None:
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64):
+            raise ValueError(f"dtype must be float32 or float64, got {dtype}.")
+        return dtype
+    if _float_policy == 'preserve':
+        if np.dtype(input_dtype) in (np.float16, np.float32):
+            return np.dtype(np.float32)
+        return np.dtype(np.float64)
+    return np.dtype(_float_policy)
+
+
+def _as_float_dtype(image, dtype=None, preserve_range=False):
+    """Convert an image to the floating point dtype given by `_float_dtype`.
+
+    Parameters
+    ----------
+    image : array-like
+        Input image.
+    dtype : {None, np.float32, np.float64}, optional
+        See `_float_dtype`.
+    preserve_range : bool, optional
+        Whether to keep the original range of values. Otherwise, the image
+        is rescaled according to the conventions of ``img_as_float``.
+
+    Returns
+    -------
+    image : ndarray of float32 or float64
+        The converted image; the input itself if it already has that dtype.
+    """
+    image = np.asanyarray(image)
+    float_dtype = _float_dtype(image.dtype, dtype)
+    if preserve_range:
+        return image.astype(float_dtype, copy=False)
+    return _convert(image, float_dtype.type)
+
+
 def img_as_uint(image, force_copy=False):
     """Convert an image to 16-bit unsigned integer format.
 
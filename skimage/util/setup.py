@@ -12,12 +12,8 @@ def configuration(parent_package='', top_path=None):
     config = Configuration('util', parent_package, top_path)
 
     cython(['_remap.pyx'], working_path=base_path)
-    # note: the extra compiler flag -std=c++0x is needed to access the
-    # std::unordered_map container on some earlier gcc compilers. See:
-    # https://stackoverflow.com/a/3973692/224254
-    config.add_extension('_remap', sources='_remap.cpp',
-                         include_dirs=[get_numpy_include_dirs()],
-                         language='c++', extra_compile_args=['-std=c++0x'])
+    config.add_extension('_remap', sources='_remap.c',
+                         include_dirs=[get_numpy_include_dirs()])
 
     return config
 
@@ -7,9 +7,16 @@ from skimage.filters import threshold_local, gaussian
 from skimage.util.apply_parallel import apply_parallel
 
 import pytest
-da = pytest.importorskip('dask.array')
 
+try:
+    import dask.array as da
+except ImportError:
+    da = None
 
+requires_dask = pytest.mark.skipif(da is None, reason="dask is not installed")
+
+
+@requires_dask
 def test_apply_parallel():
     # data
     a = np.arange(144).reshape(12, 12).astype(float)
@@ -39,6 +46,7 @@ def test_apply_parallel():
     assert_array_almost_equal(result3, expected3)
 
 
+@requires_dask
 def test_apply_parallel_lazy():
     # data
     a = np.arange(144).reshape(12, 12).astype(float)
@@ -65,6 +73,7 @@ def test_apply_parallel_lazy():
     assert_array_almost_equal(result2.compute(), expected1)
 
 
+@requires_dask
 def test_no_chunks():
     a = np.ones(1 * 4 * 8 * 9).reshape(1, 4, 8, 9)
 
@@ -77,6 +86,7 @@ def test_no_chunks():
     assert_array_almost_equal(result, expected)
 
 
+@requires_dask
 def test_apply_parallel_wrap():
     def wrapped(arr):
         return gaussian(arr, 1, mode='wrap')
@@ -87,6 +97,7 @@ def test_apply_parallel_wrap():
     assert_array_almost_equal(result, expected)
 
 
+@requires_dask
 def test_apply_parallel_nearest():
     def wrapped(arr):
         return gaussian(arr, 1, mode='nearest')
@@ -98,6 +109,7 @@ def test_apply_parallel_nearest():
     assert_array_almost_equal(result, expected)
 
 
+@requires_dask
 @pytest.mark.parametrize('dtype', (np.float32, np.float64))
 @pytest.mark.parametrize('chunks', (None, (128, 128, 3)))
 @pytest.mark.parametrize('depth', (0, 8, (8, 8, 0)))
@@ -115,6 +127,7 @@ def test_apply_parallel_rgb(depth, chunks, dtype):
     assert_array_almost_equal(cat_ycbcr_expected, cat_ycbcr)
 
 
+@requires_dask
 @pytest.mark.parametrize('chunks', (None, (128, 128, 3)))
 @pytest.mark.parametrize('depth', (0, 8, (8, 8, 0)))
 def test_apply_parallel_rgb_channel_axis(depth, chunks):
@@ -134,3 +147,100 @@ def test_apply_parallel_rgb_channel_axis(depth, chunks):
     cat_ycbcr = np.moveaxis(cat_ycbcr, 0, -1)
 
     assert_array_almost_equal(cat_ycbcr_expected, cat_ycbcr)
+
+
+def _gauss_reflect(arr):
+    return gaussian(arr, 1, mode='reflect')
+
+
+@pytest.mark.parametrize('backend', ('threads', 'processes'))
+@pytest.mark.parametrize('chunks', (None, 5, (6, 4), ((3, 9), (7, 5))))
+@pytest.mark.parametrize('mode', (None, 'reflect', 'wrap', 'edge', 0))
+def test_apply_parallel_backend_matches_dask(backend, chunks, mode):
+    a = np.random.default_rng(0).random((12, 12))
+    expected_mode = {None: 'reflect', 'wrap': 'wrap', 'edge': 'nearest',
+                     'reflect': 'reflect', 0: 'constant'}[mode]
+    expected = gaussian(a, 1, mode=expected_mode)
+    result = apply_parallel(gaussian, a, chunks=chunks, depth=5, mode=mode,
+                            extra_arguments=(1,),
+                            extra_keywords={'mode': 'reflect'},
+                            backend=backend, num_workers=2)
+    assert isinstance(result, np.ndarray)
+    assert_array_almost_equal(result, expected)
+
+
+def test_apply_parallel_threads_num_chunks():
+    a = np.arange(144).reshape(12, 12).astype(float)
+    result, num_chunks = apply_parallel(_gauss_reflect, a, chunks=(6, 4),
+                                        depth=5, backend='threads',
+                                        return_num_chunks=True)
+    assert num_chunks == 6
+    assert_array_almost_equal(result, _gauss_reflect(a))
+
+    # halo sizes may differ per axis
+    expected = threshold_local(a, 3, mode='reflect')
+    result, num_chunks = apply_parallel(threshold_local, a, chunks=3,
+                                        depth={0: 5, 1: 5}, mode='reflect',
+                                        extra_arguments=(3,),
+                                        extra_keywords={'mode': 'reflect'},
+                                        backend='threads',
+                                        return_num_chunks=True)
+    assert num_chunks == 16
+    assert_array_almost_equal(result, expected)
+
+
+def test_apply_parallel_threads_dtype():
+    a = np.arange(64, dtype=np.uint8).reshape(8, 8)
+
+    def to_float(arr):
+        return arr / 2
+
+    result = apply_parallel(to_float, a, chunks=4, backend='threads')
+    assert result.dtype == np.float64
+    assert_array_almost_equal(result, a / 2)
+
+    result = apply_parallel(to_float, a, chunks=4, dtype=np.float32,
+                            backend='threads')
+    assert result.dtype == np.float32
+    assert_array_almost_equal(result, a / 2)
+
+
+def test_apply_parallel_threads_input_unchanged():
+    a = np.arange(64, dtype=float).reshape(8, 8)
+    expected = a.copy()
+
+    def add_in_place(arr):
+        arr += 1
+        return arr
+
+    result = apply_parallel(add_in_place, a, chunks=4, depth=1,
+                            backend='threads')
+    assert_array_almost_equal(a, expected)
+    assert_array_almost_equal(result, expected + 1)
+
+
+@pytest.mark.parametrize('channel_axis', (0, -1))
+def test_apply_parallel_threads_channel_axis(channel_axis):
+    cat = img_as_float(data.chelsea())
+    expected = color.rgb2ycbcr(cat)
+    cat = np.moveaxis(cat, -1, channel_axis)
+    result, num_chunks = apply_parallel(color.rgb2ycbcr, cat, chunks=None,
+                                        depth=8, channel_axis=channel_axis,
+                                        backend='threads', num_workers=4,
+                                        return_num_chunks=True)
+    assert num_chunks == 4
+    assert_array_almost_equal(np.moveaxis(result, channel_axis, -1),
+                              expected)
+
+
+def test_apply_parallel_threads_errors():
+    a = np.ones((8, 8))
+    with pytest.raises(ValueError):
+        apply_parallel(_gauss_reflect, a, backend='spark')
+    with pytest.raises(ValueError):
+        apply_parallel(_gauss_reflect, a, backend='threads', compute=False)
+    with pytest.raises(ValueError):
+        apply_parallel(_gauss_reflect, a, chunks=((3, 3), 8),
+                       backend='threads')
+    with pytest.raises(ValueError):
+        apply_parallel(lambda arr: arr[1:], a, chunks=4, backend='threads')
@@ -4,7 +4,8 @@ import numpy as np
 import itertools
 from skimage import (img_as_float, img_as_float32, img_as_float64,
                      img_as_int, img_as_uint, img_as_ubyte)
-from skimage.util.dtype import _convert
+from skimage.util import set_float_policy, float_policy
+from skimage.util.dtype import _convert, _as_float_dtype
 
 from skimage._shared._warnings import expected_warnings
 from skimage._shared import testing
@@ -191,3 +192,30 @@ def test_subclass_conversion():
         x = x.astype(dtype)
         y = _convert(x, np.floating)
         assert y.dtype == x.dtype
+
+
+def test_float_policy():
+    image = np.arange(4, dtype=np.uint8)
+    assert _as_float_dtype(image).dtype == np.float64
+    assert _as_float_dtype(image.astype(np.float16)).dtype == np.float32
+    assert _as_float_dtype(image.astype(np.float32)).dtype == np.float32
+
+    previous = set_float_policy('float32')
+    try:
+        assert previous == 'preserve'
+        assert _as_float_dtype(image).dtype == np.float32
+        assert _as_float_dtype(image, np.float64).dtype == np.float64
+        with float_policy('float64'):
+            out = _as_float_dtype(image.astype(np.float32))
+            assert out.dtype == np.float64
+        assert _as_float_dtype(image).dtype == np.float32
+    finally:
+        set_float_policy(previous)
+
+    assert_equal(_as_float_dtype(image), img_as_float(image))
+    assert_equal(_as_float_dtype(image, preserve_range=True), image)
+
+    with testing.raises(ValueError):
+        set_float_policy('float16')
+    with testing.raises(ValueError):
+        _as_float_dtype(image, np.uint8)
@@ -53,3 +53,53 @@ def test_arraymap_bool_index():
     m[positive] += 1
     assert np.all(m[image] >= 1)
 
+
+def test_arraymap_modified_in_place():
+    m = ArrayMap(np.array([1, 5]), np.array([10, 50]))
+    assert m[1] == 10
+    m.out_values[0] = 99
+    m.in_values[1] = 7
+    assert m[1] == 99
+    assert np.asarray(m)[1] == 99
+    assert_array_equal(m[np.array([5, 7])], [0, 50])
+
+
+@pytest.mark.parametrize('num_threads', [1, 2, None])
+def test_map_array_large_values(num_threads):
+    rng = np.random.default_rng(0)
+    in_values = np.unique(rng.integers(2**62, 2**64, size=1000,
+                                       dtype=np.uint64))
+    out_values = rng.permutation(len(in_values)).astype(np.uint64) + 1
+    indices = rng.integers(0, len(in_values), size=(50, 60))
+    labels = in_values[indices]
+    labels[0, :5] = 7  # missing values map to 0
+    expected = out_values[indices]
+    expected[0, :5] = 0
+
+    out = map_array(labels, in_values, out_values, num_threads=num_threads)
+    assert_array_equal(out, expected)
+    # in place
+    map_array(labels, in_values, out_values, out=labels,
+              num_threads=num_threads)
+    assert_array_equal(labels, expected)
+
+
+def test_arraymap_large_values():
+    m = ArrayMap(np.array([3, 2**60]), np.array([1.5, 2.5]))
+    assert m[2**60] == 2.5
+    m[2**61] = 3.5
+    m[3] = 0  # removes 3 from the map, as with a dense array
+    assert_array_equal(m.in_values, [2**60, 2**61])
+    assert_array_equal(m[np.array([2**61, 3, 2**60])], [3.5, 0, 2.5])
+
+
+def test_unique_values():
+    from skimage.util._map_array import _unique_values
+
+    rng = np.random.default_rng(0)
+    # enough distinct values for the hash table to grow several times
+    labels = rng.integers(-2**40, 2**40, size=(300, 200))
+    labels[:100] = labels[100:200]
+    assert_array_equal(_unique_values(labels), np.unique(labels))
+    labels = labels.astype(float)
+    assert_array_equal(_unique_values(labels), np.unique(labels))